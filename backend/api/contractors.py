@@ -13,6 +13,7 @@ from pydantic import BaseModel, EmailStr
 
 from ..services import get_learning_service, get_database_service
 from ..services.auth import get_current_contractor
+from ..services.logo_storage import get_logo_storage_service, contractor_logo_hash, InvalidLogoError
 from ..models.database import Contractor
 from ..config import settings
 
@@ -515,7 +516,8 @@ async def upload_logo(
 ):
     """
     Upload a business logo (PNG or JPG, max 2MB).
-    Stores as base64-encoded string in database.
+    Stores the file and its PDF/email renditions in storage; the contractor
+    row only keeps the content hash.
     """
     # Validate file size (2MB max)
     MAX_SIZE = 2 * 1024 * 1024  # 2MB in bytes
@@ -538,23 +540,27 @@ async def upload_logo(
             detail=f"Invalid file type. Only PNG and JPG are allowed, got {file_type or 'unknown'}"
         )
 
-    # Convert to base64
-    base64_data = base64.b64encode(file_content).decode('utf-8')
-
-    # Create data URI with proper MIME type
-    mime_type = "image/png" if file_type == "png" else "image/jpeg"
-    data_uri = f"data:{mime_type};base64,{base64_data}"
+    try:
+        logo_hash = await get_logo_storage_service().store(file_content, file_type)
+    except InvalidLogoError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Update contractor in database
+    # Update contractor in database (clears any legacy base64 copy)
     db = get_database_service()
     updated = await db.update_contractor(
         contractor_id=contractor.id,
-        logo_data=data_uri
+        logo_hash=logo_hash,
+        logo_data=None
     )
 
     if not updated:
         raise HTTPException(status_code=500, detail="Failed to save logo")
 
+    # Echo the upload back as a data URI, as before
+    base64_data = base64.b64encode(file_content).decode('utf-8')
+    mime_type = "image/png" if file_type == "png" else "image/jpeg"
+    data_uri = f"data:{mime_type};base64,{base64_data}"
+
     return LogoUploadResponse(
         success=True,
         message="Logo uploaded successfully",
@@ -567,15 +573,14 @@ async def get_logo(
     contractor: Contractor = Depends(get_current_contractor),
 ):
     """Get the current contractor's logo."""
-    db = get_database_service()
-    contractor_data = await db.get_contractor(contractor.id)
-
-    if not contractor_data:
-        raise HTTPException(status_code=404, detail="Contractor not found")
+    logo_data = None
+    logo_hash = await contractor_logo_hash(contractor.id, contractor.logo_hash)
+    if logo_hash:
+        logo_data = await get_logo_storage_service().get_original_data_uri(logo_hash)
 
     return {
-        "logo_data": contractor_data.logo_data,
-        "has_logo": contractor_data.logo_data is not None
+        "logo_data": logo_data,
+        "has_logo": logo_data is not None
     }
 
 
@@ -588,6 +593,7 @@ async def delete_logo(
 
     updated = await db.update_contractor(
         contractor_id=contractor.id,
+        logo_hash=None,
         logo_data=None
     )
 
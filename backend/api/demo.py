@@ -19,15 +19,16 @@ import hashlib
 from typing import Optional
 from datetime import datetime
 
-import anthropic
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
 from fastapi.responses import Response
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from ..services import get_transcription_service, get_sanity_check_service, get_pdf_service
+from ..services import get_transcription_service, get_sanity_check_service
 from ..services.quote_generator import QUOTE_GENERATION_TOOL
+from ..services.claude_client import get_async_claude_client
+from ..services.pdf_render_pool import get_pdf_render_pool, PDFRenderBusy
 from ..services.email import email_service
 from ..services.logging import get_api_logger
 from ..services.database import async_session_factory
@@ -164,13 +165,13 @@ async def _generate_demo_quote_with_universal_prompt(transcription: str) -> dict
     - Uses Claude's world knowledge for reasonable pricing
     - Works for ANY type of work (contractors, designers, consultants, etc.)
     """
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    client = get_async_claude_client()
 
     # Get the universal demo prompt
     prompt = get_demo_quote_prompt(transcription)
 
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=settings.claude_model,
             max_tokens=settings.claude_max_tokens,
             tools=[QUOTE_GENERATION_TOOL],
@@ -213,13 +214,13 @@ async def _regenerate_demo_quote_with_clarifications(
     This generates a more accurate quote by incorporating the user's answers
     to the clarifying questions from the original quote.
     """
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    client = get_async_claude_client()
 
     # Get the regeneration prompt with clarifications
     prompt = get_demo_regenerate_prompt(transcription, clarifications)
 
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=settings.claude_model,
             max_tokens=settings.claude_max_tokens,
             tools=[QUOTE_GENERATION_TOOL],
@@ -409,8 +410,6 @@ async def generate_demo_pdf(
     Uses the generic demo contractor profile unless overridden.
     """
     try:
-        pdf_service = get_pdf_service()
-
         # Use provided contractor name or default
         demo_contractor = DEMO_CONTRACTOR.copy()
         if body.contractor_name:
@@ -423,7 +422,7 @@ async def generate_demo_pdf(
         quote_data["quote_number"] = f"DEMO-{datetime.now().strftime('%Y%m%d%H%M')}"
 
         # DISC-129: Generate PDF with premium demo template and watermark
-        pdf_bytes = pdf_service.generate_quote_pdf(
+        pdf_bytes = await get_pdf_render_pool().render(
             quote_data=quote_data,
             contractor=demo_contractor,
             terms=DEMO_TERMS,
@@ -442,6 +441,8 @@ async def generate_demo_pdf(
             "watermarked": True,
         }
 
+    except PDFRenderBusy:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating demo PDF: {str(e)}")
 
@@ -458,8 +459,6 @@ async def download_demo_pdf(
     For demo, always generates a sample PDF since we don't persist demo quotes.
     """
     try:
-        pdf_service = get_pdf_service()
-
         # Create a sample quote for download
         sample_quote = {
             "quote_number": f"DEMO-{datetime.now().strftime('%Y%m%d%H%M')}",
@@ -477,7 +476,7 @@ async def download_demo_pdf(
         }
 
         # DISC-129: Use premium demo template for download endpoint too
-        pdf_bytes = pdf_service.generate_quote_pdf(
+        pdf_bytes = await get_pdf_render_pool().render(
             quote_data=sample_quote,
             contractor=DEMO_CONTRACTOR,
             terms=DEMO_TERMS,
@@ -494,6 +493,8 @@ async def download_demo_pdf(
             }
         )
 
+    except PDFRenderBusy:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating demo PDF: {str(e)}")
 
@@ -17,7 +17,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from ..services.auth import get_current_user, get_db
-from ..services import get_db_service, get_pdf_service
+from ..services import get_db_service
+from ..services.pdf_render_pool import PDFRenderBusy
+from ..services.pdf_cache import get_pdf_cache_service, invoice_pdf_job
 from ..services.analytics import analytics_service
 from ..models.database import Invoice, Quote, Contractor, PricingReflection
 from ..services.database import async_session_factory
@@ -530,59 +532,9 @@ async def generate_invoice_pdf(
     terms = await db_service.get_terms(contractor.id)
 
     try:
-        pdf_service = get_pdf_service()
-
-        # Build invoice data dict
-        invoice_dict = {
-            "id": invoice.id,
-            "invoice_number": invoice.invoice_number,
-            "customer_name": invoice.customer_name,
-            "customer_address": invoice.customer_address,
-            "customer_phone": invoice.customer_phone,
-            "customer_email": invoice.customer_email,
-            "job_description": invoice.description,
-            "line_items": invoice.line_items,
-            "subtotal": invoice.subtotal,
-            "tax_percent": invoice.tax_percent,
-            "tax_amount": invoice.tax_amount,
-            "total": invoice.total,
-            "invoice_date": invoice.invoice_date.strftime("%B %d, %Y") if invoice.invoice_date else None,
-            "due_date": invoice.due_date.strftime("%B %d, %Y") if invoice.due_date else None,
-            "terms_text": invoice.terms_text,
-            "notes": invoice.notes,
-            "status": invoice.status,
-        }
-
-        contractor_dict = {
-            "business_name": contractor.business_name,
-            "owner_name": contractor.owner_name,
-            "email": contractor.email,
-            "phone": contractor.phone,
-            "address": contractor.address,
-            "logo_data": contractor.logo_data,
-        }
-
-        terms_dict = {}
-        if terms:
-            terms_dict = {
-                "deposit_percent": terms.deposit_percent,
-                "quote_valid_days": terms.quote_valid_days,
-                "labor_warranty_years": terms.labor_warranty_years,
-            }
-
-        # Get contractor's template preferences
-        template = contractor.pdf_template or "modern"
-        accent_color = contractor.pdf_accent_color
-
-        # Generate PDF (reuse quote PDF generator with invoice flag)
-        pdf_bytes = pdf_service.generate_quote_pdf(
-            quote_data=invoice_dict,
-            contractor=contractor_dict,
-            terms=terms_dict,
-            template=template,
-            accent_color=accent_color,
-            is_invoice=True,  # This tells the generator to use "INVOICE" instead of "QUOTE"
-        )
+        # Reuse the quote PDF generator with the invoice flag; cached by content
+        job = invoice_pdf_job(invoice, contractor, terms)
+        pdf_bytes = await get_pdf_cache_service().get_or_render(job)
 
         return Response(
             content=pdf_bytes,
@@ -592,6 +544,8 @@ async def generate_invoice_pdf(
             }
         )
 
+    except PDFRenderBusy:
+        raise
     except Exception as e:
         import traceback
         print(f"Invoice PDF generation error for {invoice_id}: {e}")
@@ -638,6 +592,16 @@ async def send_invoice(
     base_url = "https://quoted.it.com"
     share_url = f"{base_url}/invoice/{invoice.share_token}"
 
+    # Attach the invoice PDF if it can be produced (cached, so usually a lookup)
+    pdf_bytes = None
+    try:
+        terms = await get_db_service().get_terms(contractor.id)
+        pdf_bytes = await get_pdf_cache_service().get_or_render(
+            invoice_pdf_job(invoice, contractor, terms)
+        )
+    except Exception as e:
+        print(f"Sending invoice {invoice_id} without PDF attachment: {e}")
+
     # Send email
     try:
         await email_service.send_invoice_email(
@@ -648,6 +612,7 @@ async def send_invoice(
             due_date=invoice.due_date.strftime('%B %d, %Y') if invoice.due_date else None,
             share_url=share_url,
             message=send_request.message,
+            pdf_bytes=pdf_bytes,
         )
 
         # Update invoice status
@@ -18,6 +18,7 @@ from pydantic import BaseModel
 
 from ..services import get_db_service
 from ..services.auth import get_current_user
+from ..services.quote_stats import ALL_CATEGORIES, QuoteCounts
 from ..services.pricing_confidence import (
     PricingConfidenceService,
     calculate_confidence,
@@ -86,32 +87,24 @@ async def get_learning_progress(current_user: dict = Depends(get_current_user)):
     if not pricing_model:
         raise HTTPException(status_code=400, detail="Pricing model not found")
 
-    # Get all quotes
-    quotes = await db.get_quotes_by_contractor(contractor.id)
-    total_quotes = len(quotes)
+    # Maintained quote/correction counters (DISC-012)
+    quote_stats = await db.get_quote_stats(contractor.id)
+    overall = quote_stats.get(ALL_CATEGORIES, QuoteCounts())
+    total_quotes = overall.quotes
 
     # Count corrections (quotes that were edited)
-    total_corrections = sum(1 for q in quotes if q.was_edited)
+    total_corrections = overall.edits
 
     # Get categories from pricing knowledge
     pricing_knowledge = pricing_model.pricing_knowledge or {}
     categories = pricing_knowledge.get("categories", {})
 
-    # Count quotes per category
-    quote_counts = {}
-    correction_counts = {}
-    for quote in quotes:
-        job_type = quote.job_type
-        if job_type:
-            quote_counts[job_type] = quote_counts.get(job_type, 0) + 1
-            if quote.was_edited:
-                correction_counts[job_type] = correction_counts.get(job_type, 0) + 1
-
     # Build category progress list
     top_categories = []
     for category_key, category_data in categories.items():
-        quotes_count = quote_counts.get(category_key, 0)
-        corrections_count = correction_counts.get(category_key, 0)
+        category_stats = quote_stats.get(category_key, QuoteCounts())
+        quotes_count = category_stats.quotes
+        corrections_count = category_stats.edits
 
         # Calculate confidence score (0-100)
         # Base confidence from stored value (0-1) -> convert to 0-100
@@ -109,13 +109,13 @@ async def get_all_categories(current_user: dict = Depends(get_current_user)):
     print(f"[GET DEBUG] pricing_knowledge keys: {list(pk.keys())}")
     print(f"[GET DEBUG] categories: {list(pk.get('categories', {}).keys())}")
 
-    # Get quotes for statistics
-    quotes = await db.get_quotes_by_contractor(contractor.id)
+    # Maintained per-category counters for statistics (DISC-012)
+    quote_stats = await db.get_quote_stats(contractor.id)
 
     # Get categories with stats
     categories = pricing_brain.get_all_categories(
         pricing_knowledge=pricing_model.pricing_knowledge or {},
-        quotes=quotes,
+        quote_stats=quote_stats,
     )
 
     return categories
@@ -173,36 +173,21 @@ async def update_category(
     if not contractor:
         raise HTTPException(status_code=400, detail="Contractor not found")
 
-    # Get pricing model
-    pricing_model = await db.get_pricing_model(contractor.id)
-    if not pricing_model:
-        raise HTTPException(status_code=400, detail="Pricing model not found")
-
-    try:
-        # Update category
-        updated_pricing_knowledge = pricing_brain.update_category(
-            pricing_knowledge=pricing_model.pricing_knowledge or {},
-            category=category,
-            display_name=update.display_name,
-            learned_adjustments=update.learned_adjustments,
-        )
-
-        # Save to database
-        await db.update_pricing_model(
-            contractor_id=contractor.id,
-            pricing_knowledge=updated_pricing_knowledge,
-        )
-
-        # Return updated category detail
-        category_detail = pricing_brain.get_category_detail(
-            pricing_knowledge=updated_pricing_knowledge,
-            category=category,
-        )
-
-        return category_detail
+    # Update just this category's row (and changed learned adjustments)
+    category_data = await db.update_category(
+        contractor_id=contractor.id,
+        category=category,
+        display_name=update.display_name,
+        learned_adjustments=update.learned_adjustments,
+    )
+    if category_data is None:
+        raise HTTPException(status_code=404, detail=f"Category '{category}' not found")
 
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    # Return updated category detail
+    return pricing_brain.get_category_detail(
+        pricing_knowledge={"categories": {category: category_data}},
+        category=category,
+    )
 
 
 @router.delete("/{category}")
@@ -214,35 +199,17 @@ async def delete_category(category: str, current_user: dict = Depends(get_curren
     Use with caution - this cannot be undone.
     """
     db = get_db_service()
-    pricing_brain = get_pricing_brain_service()
 
     # Get contractor
     contractor = await db.get_contractor_by_user_id(current_user["id"])
     if not contractor:
         raise HTTPException(status_code=400, detail="Contractor not found")
 
-    # Get pricing model
-    pricing_model = await db.get_pricing_model(contractor.id)
-    if not pricing_model:
-        raise HTTPException(status_code=400, detail="Pricing model not found")
-
-    try:
-        # Delete category
-        updated_pricing_knowledge = pricing_brain.delete_category(
-            pricing_knowledge=pricing_model.pricing_knowledge or {},
-            category=category,
-        )
-
-        # Save to database
-        await db.update_pricing_model(
-            contractor_id=contractor.id,
-            pricing_knowledge=updated_pricing_knowledge,
-        )
-
-        return {"success": True, "message": f"Category '{category}' deleted"}
+    # Delete the category row (its learned adjustments cascade)
+    if not await db.delete_category(contractor_id=contractor.id, category=category):
+        raise HTTPException(status_code=404, detail=f"Category '{category}' not found")
 
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    return {"success": True, "message": f"Category '{category}' deleted"}
 
 
 @router.post("/{category}/analyze", response_model=CategoryAnalysis)
@@ -10,13 +10,12 @@ Key flow:
 5. Future quotes are more accurate
 """
 
-import os
-import tempfile
+import json
 from typing import Optional, List
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends, Request
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -26,7 +25,6 @@ from sqlalchemy import select, distinct, func, or_
 from ..services import (
     get_transcription_service,
     get_quote_service,
-    get_pdf_service,
     get_learning_service,
     get_db_service,
     get_sanity_check_service,
@@ -35,7 +33,12 @@ from ..services import (
 from ..services.auth import get_current_user, get_db
 from ..services.billing import BillingService
 from ..services.analytics import analytics_service
-from ..services.email import email_service
+from ..services.quote_context import get_quote_context_service
+from ..services.pdf_render_pool import PDFRenderBusy
+from ..services.pdf_cache import get_pdf_cache_service, quote_pdf_job
+from ..services.quote_stats import ALL_CATEGORIES, QuoteCounts
+from ..services.post_generation import post_generation_tasks
+from ..services.transcription import AudioTooLargeError, iter_audio_chunks
 from ..models.database import Quote
 from ..services.database import async_session_factory
 
@@ -347,6 +350,238 @@ def quote_to_response(quote, has_invoice: bool = False) -> QuoteResponse:
     )
 
 
+async def _load_quote_context(current_user: dict) -> dict:
+    """
+    Load the cached quote generation context for the current user.
+
+    One cache read replaces the contractor / pricing model / terms /
+    correction example queries. Raises 400 if onboarding isn't complete.
+    """
+    contractor_id = current_user.get("contractor_id")
+    context = None
+    if contractor_id:
+        context = await get_quote_context_service().get_context(contractor_id)
+    if not context:
+        raise HTTPException(status_code=400, detail="Please complete onboarding first")
+
+    # LAZY GENERATION: For existing users without pricing_philosophy (grandfathering)
+    # Generate one from their existing data and save it for future quotes
+    pricing_dict = context["pricing_model"]
+    if not pricing_dict.get("pricing_philosophy"):
+        contractor_dict = context["contractor"]
+        onboarding = get_onboarding_service()
+        pricing_philosophy = onboarding.generate_philosophy_from_existing_model(
+            contractor_name=contractor_dict.get("business_name") or contractor_dict.get("owner_name") or "Contractor",
+            primary_trade=contractor_dict.get("primary_trade") or "general_contractor",
+            pricing_model=pricing_dict,
+        )
+        # Save it so we don't regenerate every time (also invalidates the snapshot)
+        await get_db_service().update_pricing_model(
+            contractor_id,
+            pricing_philosophy=pricing_philosophy
+        )
+        print(f"[GRANDFATHER] Generated pricing_philosophy for existing user {contractor_id}")
+        pricing_dict["pricing_philosophy"] = pricing_philosophy
+
+    return context
+
+
+def _raise_if_quote_limit_reached(billing_check: dict) -> None:
+    """Raise 402 if BillingService.check_quote_limit refused a new quote."""
+    if not billing_check["can_generate"]:
+        if billing_check["reason"] == "trial_expired":
+            raise HTTPException(
+                status_code=402,
+                detail={
+                    "error": "trial_expired",
+                    "message": "Your trial has expired. Please upgrade to continue generating quotes.",
+                    "trial_ends_at": billing_check.get("trial_ends_at"),
+                }
+            )
+        elif billing_check["reason"] == "trial_limit_reached":
+            raise HTTPException(
+                status_code=402,
+                detail={
+                    "error": "trial_limit_reached",
+                    "message": f"You've reached your trial limit of {billing_check.get('quotes_used', 0)} quotes. Please upgrade to continue.",
+                }
+            )
+        else:
+            raise HTTPException(
+                status_code=402,
+                detail={
+                    "error": "quota_exceeded",
+                    "message": "Unable to generate quote. Please check your subscription status.",
+                }
+            )
+
+
+async def _check_generated_quote_sanity(
+    session: AsyncSession,
+    contractor_id: str,
+    quote_data: dict,
+    category: str,
+    transcription: str,
+) -> dict:
+    """
+    DISC-034: Pricing sanity check for a freshly generated quote.
+
+    Raises 400 if the quote is blocked (>10x P95); adds sanity_warning to
+    quote_data if it is flagged (>3x P95). Returns the check result.
+    """
+    sanity_check_service = get_sanity_check_service()
+    sanity_result = await sanity_check_service.check_quote_sanity(
+        db=session,
+        contractor_id=contractor_id,
+        quote_total=quote_data.get("subtotal", 0),
+        category=category,
+    )
+
+    # If quote is blocked (>10x P95), return error
+    if not sanity_result["is_sane"]:
+        # Log the blocked quote for pattern analysis
+        await sanity_check_service.log_flagged_quote(
+            db=session,
+            contractor_id=contractor_id,
+            quote_total=quote_data.get("subtotal", 0),
+            category=category,
+            action="block",
+            bounds=sanity_result["bounds"],
+            transcription=transcription,
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "quote_sanity_check_failed",
+                "message": sanity_result["message"],
+                "quote_total": quote_data.get("subtotal", 0),
+                "bounds": sanity_result["bounds"],
+            }
+        )
+
+    # If quote is flagged with warning (>3x P95), add warning to quote
+    if sanity_result["action"] == "warn":
+        quote_data["sanity_warning"] = sanity_result["message"]
+        # Log the warning for pattern analysis
+        await sanity_check_service.log_flagged_quote(
+            db=session,
+            contractor_id=contractor_id,
+            quote_total=quote_data.get("subtotal", 0),
+            category=category,
+            action="warn",
+            bounds=sanity_result["bounds"],
+            transcription=transcription,
+        )
+
+    return sanity_result
+
+
+async def _save_generated_quote(
+    db,
+    session: AsyncSession,
+    current_user: dict,
+    contractor_dict: dict,
+    quote_data: dict,
+    transcription: str,
+    billing_check: dict,
+    input_method: str,
+    category_source: Optional[str] = None,
+) -> Quote:
+    """
+    Save a generated quote, its outbox side effects and the usage counter
+    in one commit on session.
+    """
+    contractor_id = contractor_dict["id"]
+    job_type = quote_data.get("job_type")
+
+    # Side effects run from the outbox after the quote commits
+    post_commit_tasks = post_generation_tasks(
+        contractor_id=contractor_id,
+        user_id=str(current_user["id"]),
+        job_type=job_type,
+        link_customer=bool(quote_data.get("customer_name")),
+        # Track quote generation event (DISC-012: learning stats added by the task)
+        analytics_properties={
+            "contractor_id": str(contractor_id),
+            "job_type": job_type,
+            "subtotal": quote_data.get("subtotal", 0),
+            "has_customer_info": bool(quote_data.get("customer_name")),
+            "confidence": quote_data.get("confidence"),
+            "line_item_count": len(quote_data.get("line_items", [])),
+            # DISC-011: Input method tracking (voice vs text)
+            "input_method": input_method,
+            # DISC-018: Trial warning tracking
+            "warning_level": billing_check.get("warning_level"),
+            "is_grace_quote": billing_check.get("is_grace_quote", False),
+        },
+        # DISC-146: Founder notification for quote creation
+        founder_notification={
+            "business_name": contractor_dict["business_name"],
+            "user_email": current_user.get("email", "unknown"),
+            "quote_total": quote_data.get("subtotal", 0),
+            "customer_name": quote_data.get("customer_name"),
+            "job_type": job_type,
+            "line_item_count": len(quote_data.get("line_items", [])),
+        },
+    )
+
+    # Quote, outbox tasks and usage counter commit together on session's connection
+    async with db.unit_of_work(session):
+        # Save to database (DISC-018: Mark grace quotes)
+        quote = await db.create_quote(
+            contractor_id=contractor_id,
+            transcription=transcription,
+            job_type=job_type,
+            job_description=quote_data.get("job_description"),
+            line_items=quote_data.get("line_items", []),
+            subtotal=quote_data.get("subtotal", 0),
+            customer_name=quote_data.get("customer_name"),
+            customer_address=quote_data.get("customer_address"),
+            customer_phone=quote_data.get("customer_phone"),
+            estimated_days=quote_data.get("estimated_days"),
+            ai_generated_total=quote_data.get("subtotal", 0),
+            is_grace_quote=billing_check.get("is_grace_quote", False),
+            category_source=category_source,
+            post_commit_tasks=post_commit_tasks,
+        )
+
+        # Increment quote usage counter (DISC-018: Track grace quotes separately)
+        # Stays inline: the next request's quota check must see it.
+        # Its commit is the unit of work's single commit.
+        await BillingService.increment_quote_usage(
+            session,
+            current_user["id"],
+            is_grace_quote=billing_check.get("is_grace_quote", False)
+        )
+
+    return quote
+
+
+def _generated_quote_response(quote, billing_check: dict, category_detection: dict) -> dict:
+    """Quote response plus the billing and category info the frontend shows."""
+    response_dict = quote_to_response(quote).dict()
+
+    # DISC-018: Add billing info to response for frontend warnings
+    response_dict["billing_info"] = {
+        "warning_level": billing_check.get("warning_level"),
+        "is_grace_quote": billing_check.get("is_grace_quote", False),
+        "quotes_remaining": billing_check.get("quotes_remaining", 0),
+        "grace_remaining": billing_check.get("grace_remaining", 0),
+    }
+
+    # DISC-068: Add category confidence info for frontend notification
+    category_confidence = category_detection.get("category_confidence", 100)
+    suggested_new_category = category_detection.get("suggested_new_category")
+    response_dict["category_info"] = {
+        "category": category_detection["category"],
+        "confidence": category_confidence,
+        "suggested_new_category": suggested_new_category,
+        "needs_review": category_confidence < 70 or suggested_new_category is not None,
+    }
+
+    return response_dict
+
+
 @router.post("/generate", response_model=QuoteResponse)
 @limiter.limit("30/minute")
 async def generate_quote(
@@ -364,118 +599,37 @@ async def generate_quote(
         # Check billing status first
         billing_check = await BillingService.check_quote_limit(auth_db, current_user["id"])
 
-        if not billing_check["can_generate"]:
-            if billing_check["reason"] == "trial_expired":
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "trial_expired",
-                        "message": "Your trial has expired. Please upgrade to continue generating quotes.",
-                        "trial_ends_at": billing_check.get("trial_ends_at"),
-                    }
-                )
-            elif billing_check["reason"] == "trial_limit_reached":
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "trial_limit_reached",
-                        "message": f"You've reached your trial limit of {billing_check.get('quotes_used', 0)} quotes. Please upgrade to continue.",
-                    }
-                )
-            else:
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "quota_exceeded",
-                        "message": "Unable to generate quote. Please check your subscription status.",
-                    }
-                )
+        _raise_if_quote_limit_reached(billing_check)
+
+        # End the billing check's read transaction so auth_db doesn't hold a
+        # pooled connection through the Claude calls
+        await auth_db.commit()
 
         db = get_db_service()
         quote_service = get_quote_service()
 
-        # Get contractor for this user
-        contractor = await db.get_contractor_by_user_id(current_user["id"])
-        if not contractor:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their pricing model
-        pricing_model = await db.get_pricing_model(contractor.id)
-        if not pricing_model:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their terms
-        terms = await db.get_terms(contractor.id)
-
-        # Convert models to dicts for the quote generator
-        contractor_dict = {
-            "id": contractor.id,
-            "business_name": contractor.business_name,
-            "owner_name": contractor.owner_name,
-            "email": contractor.email,
-            "phone": contractor.phone,
-            "address": contractor.address,
-            "primary_trade": contractor.primary_trade,
-        }
-
-        pricing_dict = {
-            "labor_rate_hourly": pricing_model.labor_rate_hourly,
-            "helper_rate_hourly": pricing_model.helper_rate_hourly,
-            "material_markup_percent": pricing_model.material_markup_percent,
-            "minimum_job_amount": pricing_model.minimum_job_amount,
-            "pricing_knowledge": pricing_model.pricing_knowledge or {},
-            "pricing_notes": pricing_model.pricing_notes,
-        }
-
-        # LAZY GENERATION: For existing users without pricing_philosophy (grandfathering)
-        # Generate one from their existing data and save it for future quotes
-        pricing_philosophy = pricing_model.pricing_philosophy
-        if not pricing_philosophy:
-            onboarding = get_onboarding_service()
-            pricing_philosophy = onboarding.generate_philosophy_from_existing_model(
-                contractor_name=contractor.business_name or contractor.owner_name or "Contractor",
-                primary_trade=contractor.primary_trade or "general_contractor",
-                pricing_model=pricing_dict,
-            )
-            # Save it so we don't regenerate every time
-            await db.update_pricing_model(
-                contractor.id,
-                pricing_philosophy=pricing_philosophy
-            )
-            print(f"[GRANDFATHER] Generated pricing_philosophy for existing user {contractor.id}")
-
-        pricing_dict["pricing_philosophy"] = pricing_philosophy
-
-        terms_dict = None
-        if terms:
-            terms_dict = {
-                "deposit_percent": terms.deposit_percent,
-                "quote_valid_days": terms.quote_valid_days,
-                "labor_warranty_years": terms.labor_warranty_years,
-                "accepted_payment_methods": terms.accepted_payment_methods,
-            }
+        # Contractor, pricing model, terms and corrections from the cached snapshot
+        context = await _load_quote_context(current_user)
+        contractor_dict = context["contractor"]
+        contractor_id = contractor_dict["id"]
+        pricing_dict = context["pricing_model"]
+        terms_dict = context["terms"]
 
         # PASS 1: Detect category from transcription (fast, cheap call)
         # Uses user's existing categories for fuzzy matching, or creates new ones
         # DISC-068: Now returns full category info including confidence
         category_detection = await quote_service.detect_or_create_category(
             quote_request.transcription,
-            pricing_knowledge=pricing_dict.get("pricing_knowledge")
+            pricing_knowledge=pricing_dict.get("pricing_knowledge"),
+            contractor_id=contractor_id,
         )
         detected_job_type = category_detection["category"]
-        category_confidence = category_detection.get("category_confidence", 100)
-        suggested_new_category = category_detection.get("suggested_new_category")
-
-        # PASS 2: Fetch type-specific correction examples for few-shot learning
-        # First try to get examples for this specific job type
-        correction_examples = await db.get_correction_examples(
-            contractor.id,
-            job_type=detected_job_type
-        )
 
-        # If no type-specific corrections, fall back to general corrections
-        if not correction_examples:
-            correction_examples = await db.get_correction_examples(contractor.id)
+        # PASS 2: Type-specific correction examples for few-shot learning,
+        # falling back to general corrections
+        correction_examples = get_quote_context_service().get_correction_examples(
+            context, job_type=detected_job_type
+        )
 
         # PASS 3: Generate quote with type-filtered context
         # AND category-specific learned adjustments injected into the prompt
@@ -506,166 +660,145 @@ async def generate_quote(
         quote_data["job_type"] = detected_job_type
 
         # DISC-034: Pricing sanity check to prevent catastrophic hallucinations
-        sanity_check_service = get_sanity_check_service()
-        sanity_result = await sanity_check_service.check_quote_sanity(
-            db=auth_db,
-            contractor_id=contractor.id,
-            quote_total=quote_data.get("subtotal", 0),
-            category=detected_job_type,
+        await _check_generated_quote_sanity(
+            auth_db, contractor_id, quote_data, detected_job_type, quote_request.transcription
         )
 
-        # If quote is blocked (>10x P95), return error
-        if not sanity_result["is_sane"]:
-            # Log the blocked quote for pattern analysis
-            await sanity_check_service.log_flagged_quote(
-                db=auth_db,
-                contractor_id=contractor.id,
-                quote_total=quote_data.get("subtotal", 0),
-                category=detected_job_type,
-                action="block",
-                bounds=sanity_result["bounds"],
-                transcription=quote_request.transcription,
-            )
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "quote_sanity_check_failed",
-                    "message": sanity_result["message"],
-                    "quote_total": quote_data.get("subtotal", 0),
-                    "bounds": sanity_result["bounds"],
-                }
-            )
-
-        # If quote is flagged with warning (>3x P95), add warning to quote
-        if sanity_result["action"] == "warn":
-            quote_data["sanity_warning"] = sanity_result["message"]
-            # Log the warning for pattern analysis
-            await sanity_check_service.log_flagged_quote(
-                db=auth_db,
-                contractor_id=contractor.id,
-                quote_total=quote_data.get("subtotal", 0),
-                category=detected_job_type,
-                action="warn",
-                bounds=sanity_result["bounds"],
-                transcription=quote_request.transcription,
-            )
-
-        # Save to database (DISC-018: Mark grace quotes)
-        quote = await db.create_quote(
-            contractor_id=contractor.id,
+        quote = await _save_generated_quote(
+            db, auth_db, current_user, contractor_dict, quote_data,
             transcription=quote_request.transcription,
-            job_type=quote_data.get("job_type"),
-            job_description=quote_data.get("job_description"),
-            line_items=quote_data.get("line_items", []),
-            subtotal=quote_data.get("subtotal", 0),
-            customer_name=quote_data.get("customer_name"),
-            customer_address=quote_data.get("customer_address"),
-            customer_phone=quote_data.get("customer_phone"),
-            estimated_days=quote_data.get("estimated_days"),
-            ai_generated_total=quote_data.get("subtotal", 0),
-            is_grace_quote=billing_check.get("is_grace_quote", False),
+            billing_check=billing_check,
+            input_method="text",
+            category_source=category_detection.get("source", "claude"),
         )
 
-        # DISC-091: Link quote to customer record (auto-creates if needed)
-        if quote.customer_name:
-            try:
-                from ..services.customer_service import CustomerService
-                await CustomerService.link_quote_to_customer(auth_db, quote)
-                await auth_db.commit()
-            except Exception as e:
-                print(f"Warning: Failed to link quote to customer: {e}")
+        return _generated_quote_response(quote, billing_check, category_detection)
 
-        # Register the category so future quotes can match against it
-        # This ensures the category list grows with usage, not just edits
-        await db.ensure_category_exists(contractor.id, detected_job_type)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Increment category-level quote count for Pricing Brain tracking
-        await db.increment_category_quote_count(contractor.id, detected_job_type)
 
-        # Increment quote usage counter (DISC-018: Track grace quotes separately)
-        await BillingService.increment_quote_usage(
-            auth_db,
-            current_user["id"],
-            is_grace_quote=billing_check.get("is_grace_quote", False)
-        )
+def _sse(event: str, data) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
-        # Track quote generation event (DISC-012: Include user learning stats)
-        try:
-            # Get user's total quote and edit counts for edit rate tracking
-            all_quotes = await db.get_quotes_by_contractor(contractor.id)
-            user_quote_count = len(all_quotes)
-            user_edit_count = sum(1 for q in all_quotes if q.was_edited)
 
-            # Get category-specific stats
-            category_quotes = [q for q in all_quotes if q.job_type == detected_job_type]
-            category_quote_count = len(category_quotes)
-            category_edit_count = sum(1 for q in category_quotes if q.was_edited)
+@router.post("/generate/stream")
+@limiter.limit("30/minute")
+async def generate_quote_stream(
+    request: Request,
+    quote_request: QuoteRequest,
+    current_user: dict = Depends(get_current_user),
+    auth_db: AsyncSession = Depends(get_db),
+):
+    """
+    Generate a quote from transcribed text, streaming progress as server-sent events.
+
+    Same pipeline and persistence as /generate, but the response starts
+    immediately and reports each stage as it finishes:
+    - status: generation started (sent straight away)
+    - category: detected category and confidence (DISC-068)
+    - line_item: {index, item} as Claude produces each line item
+    - sanity: pricing sanity check result (DISC-034)
+    - quote: the saved quote, same body as /generate
+    - error: {status_code, detail} if a stage fails; nothing is saved
+
+    Billing limits are checked before the stream starts, so they are still
+    402 responses. Confidence sampling needs every sample before it can
+    answer, so this endpoint always makes a single generation call.
+    """
+    billing_check = await BillingService.check_quote_limit(auth_db, current_user["id"])
+    _raise_if_quote_limit_reached(billing_check)
+
+    # auth_db is closed before the stream body runs; the generator opens
+    # its own session for the sanity check and save
+    await auth_db.commit()
 
-            analytics_service.track_event(
-                user_id=str(current_user["id"]),
-                event_name="quote_generated",
-                properties={
-                    "contractor_id": str(contractor.id),
-                    "quote_id": str(quote.id),
-                    "job_type": detected_job_type,
-                    "subtotal": quote_data.get("subtotal", 0),
-                    "has_customer_info": bool(quote_data.get("customer_name")),
-                    "confidence": quote_data.get("confidence"),
-                    "line_item_count": len(quote_data.get("line_items", [])),
-                    # DISC-011: Input method tracking (voice vs text)
-                    "input_method": "text",
-                    # DISC-012: User learning stats for edit rate trend analysis
-                    "user_quote_count": user_quote_count,
-                    "user_edit_count": user_edit_count,
-                    "user_edit_rate": round(user_edit_count / user_quote_count * 100, 2) if user_quote_count > 0 else 0,
-                    "category_quote_count": category_quote_count,
-                    "category_edit_count": category_edit_count,
-                    "category_edit_rate": round(category_edit_count / category_quote_count * 100, 2) if category_quote_count > 0 else 0,
-                    # DISC-018: Trial warning tracking
-                    "warning_level": billing_check.get("warning_level"),
-                    "is_grace_quote": billing_check.get("is_grace_quote", False),
-                }
-            )
-        except Exception as e:
-            print(f"Warning: Failed to track quote generation: {e}")
+    context = await _load_quote_context(current_user)
+    transcription = quote_request.transcription
 
-        # DISC-146: Send founder notification for quote creation (non-blocking)
+    async def events():
+        db = get_db_service()
+        quote_service = get_quote_service()
+        contractor_dict = context["contractor"]
+        contractor_id = contractor_dict["id"]
+        pricing_dict = context["pricing_model"]
+
+        yield _sse("status", {"stage": "started"})
         try:
-            await email_service.send_founder_quote_notification(
-                business_name=contractor.business_name,
-                user_email=current_user.get("email", "unknown"),
-                quote_total=quote_data.get("subtotal", 0),
-                customer_name=quote_data.get("customer_name"),
-                job_type=detected_job_type,
-                line_item_count=len(quote_data.get("line_items", []))
+            # PASS 1: Detect category from transcription
+            category_detection = await quote_service.detect_or_create_category(
+                transcription,
+                pricing_knowledge=pricing_dict.get("pricing_knowledge"),
+                contractor_id=contractor_id,
             )
-        except Exception as e:
-            print(f"Warning: Failed to send founder quote notification: {e}")
+            detected_job_type = category_detection["category"]
+            yield _sse("category", {
+                "category": detected_job_type,
+                "confidence": category_detection.get("category_confidence", 100),
+                "suggested_new_category": category_detection.get("suggested_new_category"),
+            })
 
-        # DISC-018: Add billing info to response for frontend warnings
-        response = quote_to_response(quote)
-        response_dict = response.dict()
-        response_dict["billing_info"] = {
-            "warning_level": billing_check.get("warning_level"),
-            "is_grace_quote": billing_check.get("is_grace_quote", False),
-            "quotes_remaining": billing_check.get("quotes_remaining", 0),
-            "grace_remaining": billing_check.get("grace_remaining", 0),
-        }
+            # PASS 2: Type-specific correction examples
+            correction_examples = get_quote_context_service().get_correction_examples(
+                context, job_type=detected_job_type
+            )
 
-        # DISC-068: Add category confidence info for frontend notification
-        response_dict["category_info"] = {
-            "category": detected_job_type,
-            "confidence": category_confidence,
-            "suggested_new_category": suggested_new_category,
-            "needs_review": category_confidence < 70 or suggested_new_category is not None,
-        }
+            # PASS 3: Stream the quote, forwarding line items as they complete
+            quote_data = None
+            async for kind, payload in quote_service.stream_quote(
+                transcription=transcription,
+                contractor=contractor_dict,
+                pricing_model=pricing_dict,
+                terms=context["terms"],
+                correction_examples=correction_examples,
+                detected_category=detected_job_type,
+            ):
+                if kind == "line_item":
+                    yield _sse("line_item", payload)
+                else:
+                    quote_data = payload
 
-        return response_dict
+            # Same normalization as /generate
+            quote_data["job_type"] = detected_job_type
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+            # Sanity check and save on one short-lived session, then report both
+            async with async_session_factory() as session:
+                sanity_result = await _check_generated_quote_sanity(
+                    session, contractor_id, quote_data, detected_job_type, transcription
+                )
+                quote = await _save_generated_quote(
+                    db, session, current_user, contractor_dict, quote_data,
+                    transcription=transcription,
+                    billing_check=billing_check,
+                    input_method="text",
+                    category_source=category_detection.get("source", "claude"),
+                )
+
+            yield _sse("sanity", {
+                "action": sanity_result["action"],
+                "message": sanity_result.get("message"),
+                "warning": quote_data.get("sanity_warning"),
+            })
+            yield _sse("quote", _generated_quote_response(quote, billing_check, category_detection))
+
+        except HTTPException as e:
+            yield _sse("error", {"status_code": e.status_code, "detail": e.detail})
+        except Exception as e:
+            print(f"[QUOTE STREAM] Generation failed for {contractor_id}: {e}")
+            yield _sse("error", {"status_code": 500, "detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop nginx-style proxies from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 # ============================================================================
@@ -692,26 +825,21 @@ async def get_clarifying_questions(
     - Description is vague or missing key details
     """
     try:
-        db = get_db_service()
         quote_service = get_quote_service()
 
-        # Get contractor for this user
-        contractor = await db.get_contractor_by_user_id(current_user["id"])
-        if not contractor:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their pricing model
-        pricing_model = await db.get_pricing_model(contractor.id)
-        if not pricing_model:
+        # Contractor and pricing model from the cached quote context
+        contractor_id = current_user.get("contractor_id")
+        context = await get_quote_context_service().get_context(contractor_id) if contractor_id else None
+        if not context:
             raise HTTPException(status_code=400, detail="Please complete onboarding first")
 
         contractor_dict = {
-            "primary_trade": contractor.primary_trade,
-            "business_name": contractor.business_name,
+            "primary_trade": context["contractor"]["primary_trade"],
+            "business_name": context["contractor"]["business_name"],
         }
 
         pricing_dict = {
-            "pricing_knowledge": pricing_model.pricing_knowledge or {},
+            "pricing_knowledge": context["pricing_model"]["pricing_knowledge"],
         }
 
         # Generate clarifying questions
@@ -770,85 +898,21 @@ async def generate_quote_with_clarifications(
         # SECURITY FIX (P0-03): Add billing check matching main quote generation flow
         # Previously this endpoint bypassed billing, allowing unlimited quotes
         billing_check = await BillingService.check_quote_limit(auth_db, current_user["id"])
-
-        if not billing_check["can_generate"]:
-            if billing_check["reason"] == "trial_expired":
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "trial_expired",
-                        "message": "Your trial has expired. Please upgrade to continue generating quotes.",
-                        "trial_ends_at": billing_check.get("trial_ends_at"),
-                    }
-                )
-            elif billing_check["reason"] == "trial_limit_reached":
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "trial_limit_reached",
-                        "message": f"You've reached your trial limit of {billing_check.get('quotes_used', 0)} quotes. Please upgrade to continue.",
-                    }
-                )
-            else:
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "quota_exceeded",
-                        "message": "Unable to generate quote. Please check your subscription status.",
-                    }
-                )
+        _raise_if_quote_limit_reached(billing_check)
 
         db = get_db_service()
         quote_service = get_quote_service()
 
-        # Get contractor for this user
-        contractor = await db.get_contractor_by_user_id(current_user["id"])
-        if not contractor:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their pricing model
-        pricing_model = await db.get_pricing_model(contractor.id)
-        if not pricing_model:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their terms
-        terms = await db.get_terms(contractor.id)
-
-        contractor_dict = {
-            "id": contractor.id,
-            "business_name": contractor.business_name,
-            "owner_name": contractor.owner_name,
-            "primary_trade": contractor.primary_trade,
-        }
-
-        pricing_dict = {
-            "labor_rate_hourly": pricing_model.labor_rate_hourly,
-            "helper_rate_hourly": pricing_model.helper_rate_hourly,
-            "material_markup_percent": pricing_model.material_markup_percent,
-            "minimum_job_amount": pricing_model.minimum_job_amount,
-            "pricing_knowledge": pricing_model.pricing_knowledge or {},
-            "pricing_notes": pricing_model.pricing_notes,
-        }
-
-        # LAZY GENERATION: For existing users without pricing_philosophy (grandfathering)
-        pricing_philosophy = pricing_model.pricing_philosophy
-        if not pricing_philosophy:
-            onboarding = get_onboarding_service()
-            pricing_philosophy = onboarding.generate_philosophy_from_existing_model(
-                contractor_name=contractor.business_name or contractor.owner_name or "Contractor",
-                primary_trade=contractor.primary_trade or "general_contractor",
-                pricing_model=pricing_dict,
-            )
-            await db.update_pricing_model(contractor.id, pricing_philosophy=pricing_philosophy)
-            print(f"[GRANDFATHER] Generated pricing_philosophy for existing user {contractor.id}")
-
-        pricing_dict["pricing_philosophy"] = pricing_philosophy
+        # Contractor, pricing model and terms from the cached snapshot
+        context = await _load_quote_context(current_user)
+        contractor_dict = context["contractor"]
+        pricing_dict = context["pricing_model"]
 
         terms_dict = None
-        if terms:
+        if context["terms"]:
             terms_dict = {
-                "deposit_percent": terms.deposit_percent,
-                "quote_valid_days": terms.quote_valid_days,
+                "deposit_percent": context["terms"]["deposit_percent"],
+                "quote_valid_days": context["terms"]["quote_valid_days"],
             }
 
         # Convert clarifications to list of dicts
@@ -872,7 +936,7 @@ async def generate_quote_with_clarifications(
 
         # Save to database
         quote = await db.create_quote(
-            contractor_id=contractor.id,
+            contractor_id=contractor_dict["id"],
             transcription=clarified_request.transcription,
             job_type=quote_data.get("job_type"),
             job_description=quote_data.get("job_description"),
@@ -883,17 +947,15 @@ async def generate_quote_with_clarifications(
             customer_phone=quote_data.get("customer_phone"),
             estimated_days=quote_data.get("estimated_days"),
             ai_generated_total=quote_data.get("subtotal", 0),
+            # DISC-091: Link quote to customer record after commit
+            post_commit_tasks=post_generation_tasks(
+                contractor_id=contractor_dict["id"],
+                user_id=str(current_user["id"]),
+                job_type=None,
+                link_customer=bool(quote_data.get("customer_name")),
+            ),
         )
 
-        # DISC-091: Link quote to customer record (auto-creates if needed)
-        if quote.customer_name:
-            try:
-                from ..services.customer_service import CustomerService
-                await CustomerService.link_quote_to_customer(auth_db, quote)
-                await auth_db.commit()
-            except Exception as e:
-                print(f"Warning: Failed to link quote to customer: {e}")
-
         return quote_to_response(quote)
 
     except HTTPException:
@@ -925,31 +987,25 @@ async def transcribe_audio(
     Useful for interview/chat voice messages.
     """
     try:
-        # Save uploaded file temporarily
-        suffix = os.path.splitext(audio.filename)[1] or ".webm"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            content = await audio.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            transcription_service = get_transcription_service()
-            result = await transcription_service.transcribe(tmp_path)
+        transcription_service = get_transcription_service()
+        result = await transcription_service.transcribe_stream(
+            iter_audio_chunks(audio),
+            filename=audio.filename or "audio.webm",
+            size=audio.size,
+        )
 
-            if not result.get("text"):
-                raise HTTPException(status_code=400, detail="No speech detected in audio")
+        if not result.get("text"):
+            raise HTTPException(status_code=400, detail="No speech detected in audio")
 
-            return TranscriptionResponse(
-                text=result["text"],
-                duration=result.get("duration"),
-            )
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        return TranscriptionResponse(
+            text=result["text"],
+            duration=result.get("duration"),
+        )
 
     except HTTPException:
         raise
+    except AudioTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -970,302 +1026,90 @@ async def generate_quote_from_audio(
     try:
         # Check billing status first
         billing_check = await BillingService.check_quote_limit(auth_db, current_user["id"])
-
-        if not billing_check["can_generate"]:
-            if billing_check["reason"] == "trial_expired":
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "trial_expired",
-                        "message": "Your trial has expired. Please upgrade to continue generating quotes.",
-                        "trial_ends_at": billing_check.get("trial_ends_at"),
-                    }
-                )
-            elif billing_check["reason"] == "trial_limit_reached":
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "trial_limit_reached",
-                        "message": f"You've reached your trial limit. Please upgrade to continue.",
-                    }
-                )
-            else:
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "quota_exceeded",
-                        "message": "Unable to generate quote. Please check your subscription status.",
-                    }
-                )
+        _raise_if_quote_limit_reached(billing_check)
 
         db = get_db_service()
 
-        # Get contractor for this user
-        contractor = await db.get_contractor_by_user_id(current_user["id"])
-        if not contractor:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their pricing model
-        pricing_model = await db.get_pricing_model(contractor.id)
-        if not pricing_model:
-            raise HTTPException(status_code=400, detail="Please complete onboarding first")
-
-        # Get their terms
-        terms = await db.get_terms(contractor.id)
-
-        # Save uploaded file temporarily
-        suffix = os.path.splitext(audio.filename)[1] or ".mp3"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            content = await audio.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            quote_service = get_quote_service()
-            transcription_service = get_transcription_service()
-
-            # Convert models to dicts
-            contractor_dict = {
-                "id": contractor.id,
-                "business_name": contractor.business_name,
-                "owner_name": contractor.owner_name,
-                "email": contractor.email,
-                "phone": contractor.phone,
-                "address": contractor.address,
-                "primary_trade": contractor.primary_trade,
-            }
-
-            pricing_dict = {
-                "labor_rate_hourly": pricing_model.labor_rate_hourly,
-                "helper_rate_hourly": pricing_model.helper_rate_hourly,
-                "material_markup_percent": pricing_model.material_markup_percent,
-                "minimum_job_amount": pricing_model.minimum_job_amount,
-                "pricing_knowledge": pricing_model.pricing_knowledge or {},
-                "pricing_notes": pricing_model.pricing_notes,
-            }
-
-            # LAZY GENERATION: For existing users without pricing_philosophy (grandfathering)
-            pricing_philosophy = pricing_model.pricing_philosophy
-            if not pricing_philosophy:
-                onboarding = get_onboarding_service()
-                pricing_philosophy = onboarding.generate_philosophy_from_existing_model(
-                    contractor_name=contractor.business_name or contractor.owner_name or "Contractor",
-                    primary_trade=contractor.primary_trade or "general_contractor",
-                    pricing_model=pricing_dict,
-                )
-                await db.update_pricing_model(contractor.id, pricing_philosophy=pricing_philosophy)
-                print(f"[GRANDFATHER] Generated pricing_philosophy for existing user {contractor.id}")
-
-            pricing_dict["pricing_philosophy"] = pricing_philosophy
-
-            terms_dict = None
-            if terms:
-                terms_dict = {
-                    "deposit_percent": terms.deposit_percent,
-                    "quote_valid_days": terms.quote_valid_days,
-                    "labor_warranty_years": terms.labor_warranty_years,
-                    "accepted_payment_methods": terms.accepted_payment_methods,
-                }
-
-            # STEP 1: Transcribe the audio first
-            transcription_result = await transcription_service.transcribe(tmp_path)
-            transcription_text = transcription_result.get("text", "")
-
-            if not transcription_text.strip():
-                raise HTTPException(status_code=400, detail="No speech detected in audio")
-
-            # STEP 2: Detect category from transcription (fast, cheap call)
-            # Uses user's existing categories for fuzzy matching, or creates new ones
-            # DISC-068: Now returns full category info including confidence
-            category_detection = await quote_service.detect_or_create_category(
-                transcription_text,
-                pricing_knowledge=pricing_dict.get("pricing_knowledge")
-            )
-            detected_job_type = category_detection["category"]
-            category_confidence = category_detection.get("category_confidence", 100)
-            suggested_new_category = category_detection.get("suggested_new_category")
-
-            # STEP 3: Fetch type-specific correction examples for few-shot learning
-            correction_examples = await db.get_correction_examples(
-                contractor.id,
-                job_type=detected_job_type
-            )
-
-            # Fall back to general corrections if no type-specific ones
-            if not correction_examples:
-                correction_examples = await db.get_correction_examples(contractor.id)
+        # Contractor, pricing model, terms and corrections from the cached snapshot
+        context = await _load_quote_context(current_user)
+        contractor_dict = context["contractor"]
+        contractor_id = contractor_dict["id"]
+        pricing_dict = context["pricing_model"]
+        terms_dict = context["terms"]
 
-            # STEP 4: Generate quote with type-filtered context
-            # AND category-specific learned adjustments injected into the prompt
-            quote_data = await quote_service.generate_quote(
-                transcription=transcription_text,
-                contractor=contractor_dict,
-                pricing_model=pricing_dict,
-                terms=terms_dict,
-                correction_examples=correction_examples,
-                detected_category=detected_job_type,  # For learned adjustments injection
-            )
+        # End the billing check's read transaction so auth_db doesn't hold a
+        # pooled connection through transcription and the Claude calls
+        await auth_db.commit()
 
-            # Add audio metadata
-            quote_data["audio_duration"] = transcription_result.get("duration", 0)
-            quote_data["transcription_confidence"] = transcription_result.get("confidence")
+        quote_service = get_quote_service()
+        transcription_service = get_transcription_service()
 
-            # ALWAYS use detected_job_type for consistency with category keys
-            # Claude's generated job_type might not match the normalized snake_case category key
-            # This ensures quote.job_type matches pricing_knowledge["categories"][key] for counting
-            quote_data["job_type"] = detected_job_type
+        # STEP 1: Transcribe the audio first, streaming the upload to the provider
+        transcription_result = await transcription_service.transcribe_stream(
+            iter_audio_chunks(audio),
+            filename=audio.filename or "audio.mp3",
+            size=audio.size,
+        )
+        transcription_text = transcription_result.get("text", "")
 
-            # DISC-034: Pricing sanity check to prevent catastrophic hallucinations
-            sanity_check_service = get_sanity_check_service()
-            sanity_result = await sanity_check_service.check_quote_sanity(
-                db=auth_db,
-                contractor_id=contractor.id,
-                quote_total=quote_data.get("subtotal", 0),
-                category=detected_job_type,
-            )
+        if not transcription_text.strip():
+            raise HTTPException(status_code=400, detail="No speech detected in audio")
 
-            # If quote is blocked (>10x P95), return error
-            if not sanity_result["is_sane"]:
-                # Log the blocked quote for pattern analysis
-                await sanity_check_service.log_flagged_quote(
-                    db=auth_db,
-                    contractor_id=contractor.id,
-                    quote_total=quote_data.get("subtotal", 0),
-                    category=detected_job_type,
-                    action="block",
-                    bounds=sanity_result["bounds"],
-                    transcription=transcription_text,
-                )
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "error": "quote_sanity_check_failed",
-                        "message": sanity_result["message"],
-                        "quote_total": quote_data.get("subtotal", 0),
-                        "bounds": sanity_result["bounds"],
-                    }
-                )
+        # STEP 2: Detect category from transcription (fast, cheap call)
+        # Uses user's existing categories for fuzzy matching, or creates new ones
+        # DISC-068: Now returns full category info including confidence
+        category_detection = await quote_service.detect_or_create_category(
+            transcription_text,
+            pricing_knowledge=pricing_dict.get("pricing_knowledge"),
+            contractor_id=contractor_id,
+        )
+        detected_job_type = category_detection["category"]
 
-            # If quote is flagged with warning (>3x P95), add warning to quote
-            if sanity_result["action"] == "warn":
-                quote_data["sanity_warning"] = sanity_result["message"]
-                # Log the warning for pattern analysis
-                await sanity_check_service.log_flagged_quote(
-                    db=auth_db,
-                    contractor_id=contractor.id,
-                    quote_total=quote_data.get("subtotal", 0),
-                    category=detected_job_type,
-                    action="warn",
-                    bounds=sanity_result["bounds"],
-                    transcription=transcription_text,
-                )
+        # STEP 3: Type-specific correction examples for few-shot learning,
+        # falling back to general corrections
+        correction_examples = get_quote_context_service().get_correction_examples(
+            context, job_type=detected_job_type
+        )
 
-            # Save to database (DISC-018: Mark grace quotes)
-            quote = await db.create_quote(
-                contractor_id=contractor.id,
-                transcription=quote_data.get("transcription", ""),
-                job_type=quote_data.get("job_type"),
-                job_description=quote_data.get("job_description"),
-                line_items=quote_data.get("line_items", []),
-                subtotal=quote_data.get("subtotal", 0),
-                customer_name=quote_data.get("customer_name"),
-                customer_address=quote_data.get("customer_address"),
-                customer_phone=quote_data.get("customer_phone"),
-                estimated_days=quote_data.get("estimated_days"),
-                ai_generated_total=quote_data.get("subtotal", 0),
-                is_grace_quote=billing_check.get("is_grace_quote", False),
-            )
+        # STEP 4: Generate quote with type-filtered context
+        # AND category-specific learned adjustments injected into the prompt
+        quote_data = await quote_service.generate_quote(
+            transcription=transcription_text,
+            contractor=contractor_dict,
+            pricing_model=pricing_dict,
+            terms=terms_dict,
+            correction_examples=correction_examples,
+            detected_category=detected_job_type,  # For learned adjustments injection
+        )
 
-            # DISC-091: Link quote to customer record (auto-creates if needed)
-            if quote.customer_name:
-                try:
-                    from ..services.customer_service import CustomerService
-                    await CustomerService.link_quote_to_customer(auth_db, quote)
-                    await auth_db.commit()
-                except Exception as e:
-                    print(f"Warning: Failed to link quote to customer: {e}")
-
-            # Register the category so future quotes can match against it
-            # This ensures the category list grows with usage, not just edits
-            await db.ensure_category_exists(contractor.id, detected_job_type)
-
-            # Increment category-level quote count for Pricing Brain tracking
-            await db.increment_category_quote_count(contractor.id, detected_job_type)
-
-            # Increment quote usage counter (DISC-018: Track grace quotes separately)
-            await BillingService.increment_quote_usage(
-                auth_db,
-                current_user["id"],
-                is_grace_quote=billing_check.get("is_grace_quote", False)
-            )
+        # Add audio metadata
+        quote_data["audio_duration"] = transcription_result.get("duration", 0)
+        quote_data["transcription_confidence"] = transcription_result.get("confidence")
 
-            # Track quote generation event (DISC-012: Include user learning stats)
-            try:
-                # Get user's total quote and edit counts for edit rate tracking
-                all_quotes = await db.get_quotes_by_contractor(contractor.id)
-                user_quote_count = len(all_quotes)
-                user_edit_count = sum(1 for q in all_quotes if q.was_edited)
-
-                # Get category-specific stats
-                category_quotes = [q for q in all_quotes if q.job_type == detected_job_type]
-                category_quote_count = len(category_quotes)
-                category_edit_count = sum(1 for q in category_quotes if q.was_edited)
-
-                analytics_service.track_event(
-                    user_id=str(current_user["id"]),
-                    event_name="quote_generated",
-                    properties={
-                        "contractor_id": str(contractor.id),
-                        "quote_id": str(quote.id),
-                        "job_type": detected_job_type,
-                        "subtotal": quote_data.get("subtotal", 0),
-                        "has_customer_info": bool(quote_data.get("customer_name")),
-                        "confidence": quote_data.get("confidence"),
-                        "line_item_count": len(quote_data.get("line_items", [])),
-                        # DISC-011: Input method tracking (voice vs text)
-                        "input_method": "voice",
-                        # DISC-012: User learning stats for edit rate trend analysis
-                        "user_quote_count": user_quote_count,
-                        "user_edit_count": user_edit_count,
-                        "user_edit_rate": round(user_edit_count / user_quote_count * 100, 2) if user_quote_count > 0 else 0,
-                        "category_quote_count": category_quote_count,
-                        "category_edit_count": category_edit_count,
-                        "category_edit_rate": round(category_edit_count / category_quote_count * 100, 2) if category_quote_count > 0 else 0,
-                        # DISC-018: Trial warning tracking
-                        "warning_level": billing_check.get("warning_level"),
-                        "is_grace_quote": billing_check.get("is_grace_quote", False),
-                    }
-                )
-            except Exception as e:
-                print(f"Warning: Failed to track quote generation: {e}")
-
-            # DISC-018: Add billing info to response for frontend warnings
-            response = quote_to_response(quote)
-            response_dict = response.dict()
-            response_dict["billing_info"] = {
-                "warning_level": billing_check.get("warning_level"),
-                "is_grace_quote": billing_check.get("is_grace_quote", False),
-                "quotes_remaining": billing_check.get("quotes_remaining", 0),
-                "grace_remaining": billing_check.get("grace_remaining", 0),
-            }
+        # ALWAYS use detected_job_type for consistency with category keys
+        # Claude's generated job_type might not match the normalized snake_case category key
+        # This ensures quote.job_type matches pricing_knowledge["categories"][key] for counting
+        quote_data["job_type"] = detected_job_type
 
-            # DISC-068: Add category confidence info for frontend notification
-            response_dict["category_info"] = {
-                "category": detected_job_type,
-                "confidence": category_confidence,
-                "suggested_new_category": suggested_new_category,
-                "needs_review": category_confidence < 70 or suggested_new_category is not None,
-            }
+        # DISC-034: Pricing sanity check to prevent catastrophic hallucinations
+        await _check_generated_quote_sanity(
+            auth_db, contractor_id, quote_data, detected_job_type, transcription_text
+        )
 
-            return response_dict
+        quote = await _save_generated_quote(
+            db, auth_db, current_user, contractor_dict, quote_data,
+            transcription=transcription_text,
+            billing_check=billing_check,
+            input_method="voice",
+            category_source=category_detection.get("source", "claude"),
+        )
 
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return _generated_quote_response(quote, billing_check, category_detection)
 
     except HTTPException:
         raise
+    except AudioTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1914,60 +1758,62 @@ async def update_quote(
     """
     db = get_db_service()
 
-    # Get the original quote
-    quote = await db.get_quote(quote_id)
-    if not quote:
-        raise HTTPException(status_code=404, detail="Quote not found")
-
-    # Verify ownership
-    contractor = await db.get_contractor_by_user_id(current_user["id"])
-    if not contractor or quote.contractor_id != contractor.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    # Load, authorize and save the edit on one connection
+    async with db.unit_of_work():
+        # Get the original quote
+        quote = await db.get_quote(quote_id)
+        if not quote:
+            raise HTTPException(status_code=404, detail="Quote not found")
 
-    # Store original state for learning (this is critical for the learning loop)
-    original_line_items = quote.line_items or []
-    original_subtotal = quote.subtotal or 0
-    original_quote = {
-        "line_items": original_line_items,
-        "subtotal": original_subtotal,
-        "job_description": quote.job_description,
-        "estimated_days": quote.estimated_days,
-    }
+        # Verify ownership
+        contractor = await db.get_contractor_by_user_id(current_user["id"])
+        if not contractor or quote.contractor_id != contractor.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+
+        # Store original state for learning (this is critical for the learning loop)
+        original_line_items = quote.line_items or []
+        original_subtotal = quote.subtotal or 0
+        original_quote = {
+            "line_items": original_line_items,
+            "subtotal": original_subtotal,
+            "job_description": quote.job_description,
+            "estimated_days": quote.estimated_days,
+        }
 
-    # Build update dict
-    update_data = {}
-    if update.line_items is not None:
-        update_data["line_items"] = update.line_items
-        update_data["subtotal"] = sum(item.get("amount", 0) for item in update.line_items)
-        update_data["total"] = update_data["subtotal"]
-    if update.job_description is not None:
-        update_data["job_description"] = update.job_description
-    if update.customer_name is not None:
-        update_data["customer_name"] = update.customer_name
-    if update.customer_address is not None:
-        update_data["customer_address"] = update.customer_address
-    if update.customer_phone is not None:
-        update_data["customer_phone"] = update.customer_phone
-    if update.customer_email is not None:
-        update_data["customer_email"] = update.customer_email
-    if update.estimated_days is not None:
-        update_data["estimated_days"] = update.estimated_days
-    if update.estimated_crew_size is not None:
-        update_data["estimated_crew_size"] = update.estimated_crew_size
-    if update.notes is not None:
-        # Store notes as part of job_description for now
-        pass
-    # DISC-067: Free-form timeline and terms fields
-    if update.timeline_text is not None:
-        update_data["timeline_text"] = update.timeline_text
-    if update.terms_text is not None:
-        update_data["terms_text"] = update.terms_text
+        # Build update dict
+        update_data = {}
+        if update.line_items is not None:
+            update_data["line_items"] = update.line_items
+            update_data["subtotal"] = sum(item.get("amount", 0) for item in update.line_items)
+            update_data["total"] = update_data["subtotal"]
+        if update.job_description is not None:
+            update_data["job_description"] = update.job_description
+        if update.customer_name is not None:
+            update_data["customer_name"] = update.customer_name
+        if update.customer_address is not None:
+            update_data["customer_address"] = update.customer_address
+        if update.customer_phone is not None:
+            update_data["customer_phone"] = update.customer_phone
+        if update.customer_email is not None:
+            update_data["customer_email"] = update.customer_email
+        if update.estimated_days is not None:
+            update_data["estimated_days"] = update.estimated_days
+        if update.estimated_crew_size is not None:
+            update_data["estimated_crew_size"] = update.estimated_crew_size
+        if update.notes is not None:
+            # Store notes as part of job_description for now
+            pass
+        # DISC-067: Free-form timeline and terms fields
+        if update.timeline_text is not None:
+            update_data["timeline_text"] = update.timeline_text
+        if update.terms_text is not None:
+            update_data["terms_text"] = update.terms_text
 
-    # Mark as edited
-    update_data["was_edited"] = True
+        # Mark as edited
+        update_data["was_edited"] = True
 
-    # Update the quote in database
-    updated_quote = await db.update_quote(quote_id, **update_data)
+        # Update the quote in database
+        updated_quote = await db.update_quote(quote_id, **update_data)
 
     # ==========================================
     # THE LEARNING LOOP - This is the magic
@@ -1984,10 +1830,9 @@ async def update_quote(
         }
 
         # Get category-specific correction stats for analytics
-        all_quotes = await db.get_quotes_by_contractor(contractor.id)
-        category_quotes = [q for q in all_quotes if q.job_type == quote.job_type]
-        corrections_for_category = sum(1 for q in category_quotes if q.was_edited)
-        user_total_corrections = sum(1 for q in all_quotes if q.was_edited)
+        quote_stats = await db.get_quote_stats(contractor.id)
+        corrections_for_category = quote_stats.get(quote.job_type, QuoteCounts()).edits
+        user_total_corrections = quote_stats.get(ALL_CATEGORIES, QuoteCounts()).edits
 
         # Fetch existing context for THREE-LAYER learning
         existing_learnings = []
@@ -2023,26 +1868,28 @@ async def update_quote(
         # If there were learnings, apply them to the pricing model
         # Learnings are stored per-category for targeted prompt injection
         if learning_result.get("has_changes") and learning_result.get("learnings"):
-            await db.apply_learnings_to_pricing_model(
-                contractor_id=contractor.id,
-                learnings=learning_result["learnings"],
-                category=quote.job_type,  # Store learnings under this category
-            )
+            # Learnings and the edit details that record them commit together
+            async with db.unit_of_work():
+                await db.apply_learnings_to_pricing_model(
+                    contractor_id=contractor.id,
+                    learnings=learning_result["learnings"],
+                    category=quote.job_type,  # Store learnings under this category
+                )
 
-            # Store edit details on the quote for history and future learning
-            await db.update_quote(
-                quote_id,
-                edit_details={
-                    "original_line_items": original_line_items,
-                    "original_subtotal": original_subtotal,
-                    "corrections": learning_result.get("corrections"),
-                    "learning_note": update.correction_notes,
-                    "learnings_applied": True,
-                    "processed_at": datetime.utcnow().isoformat(),
-                    # DISC-122: Track deleted items for learning
-                    "deleted_items": update.deleted_items or [],
-                }
-            )
+                # Store edit details on the quote for history and future learning
+                await db.update_quote(
+                    quote_id,
+                    edit_details={
+                        "original_line_items": original_line_items,
+                        "original_subtotal": original_subtotal,
+                        "corrections": learning_result.get("corrections"),
+                        "learning_note": update.correction_notes,
+                        "learnings_applied": True,
+                        "processed_at": datetime.utcnow().isoformat(),
+                        # DISC-122: Track deleted items for learning
+                        "deleted_items": update.deleted_items or [],
+                    }
+                )
 
             print(f"[LEARNING] Applied learnings for contractor {contractor.id}")
 
@@ -2057,9 +1904,7 @@ async def update_quote(
         subtotal_change_percent = abs(subtotal_change / original_subtotal * 100) if original_subtotal > 0 else 0
 
         # Get updated quote counts for edit rate tracking
-        all_quotes_updated = await db.get_quotes_by_contractor(contractor.id)
-        user_quote_count = len(all_quotes_updated)
-        user_edit_count = sum(1 for q in all_quotes_updated if q.was_edited)
+        user_stats = (await db.get_quote_stats(contractor.id)).get(ALL_CATEGORIES, QuoteCounts())
 
         analytics_service.track_event(
             user_id=str(current_user["id"]),
@@ -2078,9 +1923,9 @@ async def update_quote(
                 "subtotal_change": round(subtotal_change, 2),
                 "subtotal_change_percent": round(subtotal_change_percent, 2),
                 # DISC-012: Learning system validation metrics
-                "user_quote_count": user_quote_count,
-                "user_edit_count": user_edit_count,
-                "user_edit_rate": round(user_edit_count / user_quote_count * 100, 2) if user_quote_count > 0 else 0,
+                "user_quote_count": user_stats.quotes,
+                "user_edit_count": user_stats.edits,
+                "user_edit_rate": user_stats.edit_rate,
                 "corrections_for_category": corrections_for_category,
                 "user_total_corrections": user_total_corrections,
                 # DISC-122: Track deleted items count
@@ -2126,52 +1971,11 @@ async def generate_pdf(request: Request, quote_id: str, current_user: dict = Dep
     terms = await db.get_terms(contractor.id)
 
     try:
-        pdf_service = get_pdf_service()
-
-        # Convert to dicts
-        quote_dict = {
-            "id": quote.id,
-            "customer_name": quote.customer_name,
-            "customer_address": quote.customer_address,
-            "customer_phone": quote.customer_phone,
-            "job_description": quote.job_description,
-            "line_items": quote.line_items,
-            "subtotal": quote.subtotal,
-            "total": quote.total,
-            "estimated_days": quote.estimated_days,
-        }
-
-        contractor_dict = {
-            "business_name": contractor.business_name,
-            "owner_name": contractor.owner_name,
-            "email": contractor.email,
-            "phone": contractor.phone,
-            "address": contractor.address,
-            "logo_data": contractor.logo_data,  # Include logo for PDF
-        }
-
-        # Build terms dict from contractor defaults
-        terms_dict = {}
-        if terms:
-            terms_dict = {
-                "deposit_percent": terms.deposit_percent,
-                "quote_valid_days": terms.quote_valid_days,
-                "labor_warranty_years": terms.labor_warranty_years,
-            }
-
-        # DISC-028: Get contractor's template preferences
-        template = contractor.pdf_template or "modern"
-        accent_color = contractor.pdf_accent_color
-
-        # DISC-066: Generate PDF in memory to avoid filesystem issues on Railway
-        pdf_bytes = pdf_service.generate_quote_pdf(
-            quote_data=quote_dict,
-            contractor=contractor_dict,
-            terms=terms_dict,
-            watermark=quote.is_grace_quote,  # Add watermark if this is a grace quote
-            template=template,  # DISC-028: Use contractor's template
-            accent_color=accent_color,  # DISC-028: Use contractor's accent color
-        )
+        # DISC-028/DISC-066: Render inputs (incl. template, accent color, grace
+        # watermark) hashed into a content-addressed cache key. Edits change
+        # the key, so repeat downloads of an unchanged quote skip the render.
+        job = quote_pdf_job(quote, contractor, terms)
+        pdf_bytes = await get_pdf_cache_service().get_or_render(job)
 
         # Return PDF directly from memory
         return Response(
@@ -2182,10 +1986,11 @@ async def generate_pdf(request: Request, quote_id: str, current_user: dict = Dep
             }
         )
 
+    except PDFRenderBusy:
+        raise
     except Exception as e:
         import traceback
         print(f"PDF generation error for quote {quote_id}: {e}")
-        print(f"Quote data: {quote_dict}")
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"PDF error: {str(e)}")
 
@@ -2757,81 +2562,85 @@ async def mark_quote_outcome(
 
     db = get_db_service()
 
-    # Get the quote
-    quote = await db.get_quote(quote_id)
-    if not quote:
-        raise HTTPException(status_code=404, detail="Quote not found")
-
-    # Verify ownership
-    contractor = await db.get_contractor_by_user_id(current_user["id"])
-    if not contractor or quote.contractor_id != contractor.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    # Outcome, counters and pricing-model learning on one connection and commit
+    async with db.unit_of_work() as session:
+        # Get the quote
+        quote = await db.get_quote(quote_id)
+        if not quote:
+            raise HTTPException(status_code=404, detail="Quote not found")
 
-    # Check if already has outcome
-    if quote.outcome in ["won", "lost"]:
-        return MarkOutcomeResponse(
-            success=False,
-            quote_id=quote_id,
-            outcome=quote.outcome,
-            message=f"Quote already marked as {quote.outcome}"
-        )
+        # Verify ownership
+        contractor = await db.get_contractor_by_user_id(current_user["id"])
+        if not contractor or quote.contractor_id != contractor.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Build update fields
-    now = datetime.utcnow()
-    update_fields = {
-        "outcome": outcome_request.outcome,
-        "status": outcome_request.outcome,
-    }
+        # Check if already has outcome
+        if quote.outcome in ["won", "lost"]:
+            return MarkOutcomeResponse(
+                success=False,
+                quote_id=quote_id,
+                outcome=quote.outcome,
+                message=f"Quote already marked as {quote.outcome}"
+            )
 
-    if outcome_request.outcome == "won":
-        update_fields["accepted_at"] = now
-    else:
-        update_fields["rejected_at"] = now
+        # Build update fields
+        now = datetime.utcnow()
+        update_fields = {
+            "outcome": outcome_request.outcome,
+            "status": outcome_request.outcome,
+        }
 
-    # Build outcome notes with structured reason
-    notes_parts = []
-    if outcome_request.reason:
-        if outcome_request.outcome == "lost":
-            reason_text = LOSS_REASONS.get(outcome_request.reason, outcome_request.reason)
+        if outcome_request.outcome == "won":
+            update_fields["accepted_at"] = now
         else:
-            reason_text = WIN_FACTORS.get(outcome_request.reason, outcome_request.reason)
-        notes_parts.append(f"Reason: {reason_text}")
-        update_fields["rejection_reason"] = outcome_request.reason  # Store structured key
+            update_fields["rejected_at"] = now
 
-    if outcome_request.notes:
-        notes_parts.append(outcome_request.notes)
+        # Build outcome notes with structured reason
+        notes_parts = []
+        if outcome_request.reason:
+            if outcome_request.outcome == "lost":
+                reason_text = LOSS_REASONS.get(outcome_request.reason, outcome_request.reason)
+            else:
+                reason_text = WIN_FACTORS.get(outcome_request.reason, outcome_request.reason)
+            notes_parts.append(f"Reason: {reason_text}")
+            update_fields["rejection_reason"] = outcome_request.reason  # Store structured key
 
-    if notes_parts:
-        update_fields["outcome_notes"] = " | ".join(notes_parts)
+        if outcome_request.notes:
+            notes_parts.append(outcome_request.notes)
 
-    # Store final price if provided (for learning actual vs quoted)
-    if outcome_request.final_price:
-        current_notes = quote.outcome_notes or ""
-        price_note = f"Final price: ${outcome_request.final_price:,.2f} (quoted: ${quote.subtotal:,.2f})"
-        update_fields["outcome_notes"] = f"{current_notes} | {price_note}" if current_notes else price_note
+        if notes_parts:
+            update_fields["outcome_notes"] = " | ".join(notes_parts)
 
-    # Update the quote
-    await db.update_quote(quote_id, **update_fields)
+        # Store final price if provided (for learning actual vs quoted)
+        if outcome_request.final_price:
+            current_notes = quote.outcome_notes or ""
+            price_note = f"Final price: ${outcome_request.final_price:,.2f} (quoted: ${quote.subtotal:,.2f})"
+            update_fields["outcome_notes"] = f"{current_notes} | {price_note}" if current_notes else price_note
 
-    # DISC-121: Process outcome for learning
-    if quote.job_type:
-        try:
-            if outcome_request.outcome == "won":
-                # Successful quote - boost confidence in pricing
-                await db.apply_acceptance_to_pricing_model(
-                    contractor_id=str(contractor.id),
-                    category=quote.job_type,
-                    signal_type="won",
-                )
-            elif outcome_request.outcome == "lost":
-                # Lost quote - apply confidence penalty
-                await db.apply_loss_to_pricing_model(
-                    contractor_id=str(contractor.id),
-                    category=quote.job_type,
-                    loss_reason=outcome_request.reason,
-                )
-        except Exception as e:
-            print(f"Warning: Failed to process outcome learning: {e}")
+        # Update the quote
+        await db.update_quote(quote_id, **update_fields)
+
+        # DISC-121: Process outcome for learning
+        if quote.job_type:
+            try:
+                # Savepoint: a learning failure must not roll back the outcome
+                async with session.begin_nested():
+                    if outcome_request.outcome == "won":
+                        # Successful quote - boost confidence in pricing
+                        await db.apply_acceptance_to_pricing_model(
+                            contractor_id=str(contractor.id),
+                            category=quote.job_type,
+                            signal_type="won",
+                        )
+                    elif outcome_request.outcome == "lost":
+                        # Lost quote - apply confidence penalty
+                        await db.apply_loss_to_pricing_model(
+                            contractor_id=str(contractor.id),
+                            category=quote.job_type,
+                            loss_reason=outcome_request.reason,
+                        )
+            except Exception as e:
+                print(f"Warning: Failed to process outcome learning: {e}")
 
     # Track analytics
     try:
@@ -10,7 +10,6 @@ Key features:
 """
 
 import secrets
-import os
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -21,10 +20,13 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from ..services.auth import get_current_user
-from ..services import get_db_service, get_pdf_service
+from ..services import get_db_service
+from ..services.pdf_render_pool import PDFRenderBusy
+from ..services.pdf_cache import get_pdf_cache_service, quote_pdf_job
 from ..services.database import DatabaseService
 from ..services.email import email_service
 from ..services.analytics import analytics_service
+from ..services.view_tracking import track_view
 from ..services.billing import BillingService  # INNOV-2: Deposit checkout
 from ..config import settings
 
@@ -132,54 +134,13 @@ async def share_quote_via_email(
         if not contractor or quote.contractor_id != contractor.id:
             raise HTTPException(status_code=403, detail="Not authorized")
 
-        # Generate PDF if not exists
-        pdf_service = get_pdf_service()
-        if not quote.pdf_url or not os.path.exists(quote.pdf_url):
-            # Get terms for PDF generation
-            terms = await db.get_terms(contractor.id)
-
-            quote_dict = {
-                "id": quote.id,
-                "customer_name": quote.customer_name,
-                "customer_address": quote.customer_address,
-                "customer_phone": quote.customer_phone,
-                "job_description": quote.job_description,
-                "line_items": quote.line_items,
-                "subtotal": quote.subtotal,
-                "total": quote.total,
-                "estimated_days": quote.estimated_days,
-            }
-
-            contractor_dict = {
-                "business_name": contractor.business_name,
-                "owner_name": contractor.owner_name,
-                "email": contractor.email,
-                "phone": contractor.phone,
-                "address": contractor.address,
-            }
-
-            terms_dict = {}
-            if terms:
-                terms_dict = {
-                    "deposit_percent": terms.deposit_percent,
-                    "quote_valid_days": terms.quote_valid_days,
-                    "labor_warranty_years": terms.labor_warranty_years,
-                }
-
-            # Generate PDF
-            os.makedirs("./data/pdfs", exist_ok=True)
-            output_path = f"./data/pdfs/{quote_id}.pdf"
-
-            pdf_service.generate_quote_pdf(
-                quote_data=quote_dict,
-                contractor=contractor_dict,
-                terms=terms_dict,
-                output_path=output_path,
-            )
-
-            # Update quote with PDF URL
-            await db.update_quote(quote_id, pdf_url=output_path)
-            quote.pdf_url = output_path
+        # Same content-addressed PDF as the download endpoint. The old
+        # ./data/pdfs/{quote_id}.pdf file was never regenerated after edits,
+        # so customers could be emailed a stale quote.
+        terms = await db.get_terms(contractor.id)
+        pdf_bytes = await get_pdf_cache_service().get_or_render(
+            quote_pdf_job(quote, contractor, terms)
+        )
 
         # Send email
         print(f"Attempting to send quote email to {share_request.recipient_email} for quote {quote_id}")
@@ -192,7 +153,7 @@ async def share_quote_via_email(
                 job_description=quote.job_description or "Project",
                 total=quote.total or quote.subtotal or 0,
                 message=share_request.message,
-                pdf_path=quote.pdf_url,
+                pdf_bytes=pdf_bytes,
             )
             print(f"Email sent successfully. Response: {email_response}")
         except Exception as email_error:
@@ -258,7 +219,7 @@ async def share_quote_via_email(
             quote_id=quote_id,
         )
 
-    except HTTPException:
+    except (HTTPException, PDFRenderBusy):
         raise
     except Exception as e:
         print(f"Error sharing quote via email: {e}")
@@ -374,24 +335,11 @@ async def view_shared_quote(
         if not contractor:
             raise HTTPException(status_code=404, detail="Contractor not found")
 
-        # KI-004 FIX: Track view count in database (not just PostHog)
-        is_first_view = (quote.view_count or 0) == 0
-        new_view_count = (quote.view_count or 0) + 1
-        now = datetime.utcnow()
-
-        # Build update fields
-        update_fields = {
-            "view_count": new_view_count,
-            "last_viewed_at": now,
-        }
-        if is_first_view:
-            update_fields["first_viewed_at"] = now
-            # Update status to "viewed" if currently "sent"
-            if quote.status == "sent":
-                update_fields["status"] = "viewed"
-
-        # Update quote in database
-        quote = await db.update_quote(str(quote.id), **update_fields)
+        # KI-004 FIX: Track view count in database (not just PostHog).
+        # Only the first view writes now; repeat views are batched.
+        is_first_view = await track_view(str(quote.id), quote.view_count)
+        if is_first_view and quote.status == "sent":
+            quote.status = "viewed"
 
         # Wave 3: Send first-view notification email to contractor
         if is_first_view:
@@ -417,7 +365,7 @@ async def view_shared_quote(
                     "contractor_id": str(contractor.id),
                     "job_type": quote.job_type,
                     "total": quote.total or quote.subtotal or 0,
-                    "view_count": quote.view_count,
+                    "view_count": (quote.view_count or 0) + 1,
                     "is_first_view": is_first_view,
                 }
             )
@@ -73,6 +73,11 @@ class Settings(BaseSettings):
     cache_ttl_default: int = 300  # 5 minutes default TTL
     cache_ttl_contractor: int = 600  # 10 minutes for contractor profiles
     cache_ttl_pricing: int = 1800  # 30 minutes for pricing categories
+    cache_ttl_quote_context: int = 900  # 15 minutes for quote generation context
+    cache_ttl_quote_context_local: int = 60  # In-process fallback (no cross-worker invalidation)
+    cache_ttl_principal: int = 300  # Authenticated user/contractor lookup per access token
+    cache_ttl_principal_local: int = 30  # Per-worker LRU tier; bounds cross-worker staleness
+    cache_principal_local_entries: int = 4096
 
     # File Storage (S3 or local for MVP)
     storage_type: str = "local"  # "local" or "s3"
@@ -80,15 +85,81 @@ class Settings(BaseSettings):
     s3_bucket: str = ""
     aws_access_key: str = ""
     aws_secret_key: str = ""
+    storage_max_connections: int = 20  # S3 connection pool and thread pool size (per worker)
+    storage_multipart_threshold_bytes: int = 8 * 1024 * 1024  # Larger uploads use multipart
+    storage_multipart_chunk_bytes: int = 8 * 1024 * 1024  # Part size (S3 minimum is 5 MB)
+    storage_multipart_concurrency: int = 4  # Parts in flight per managed upload
+    storage_stream_chunk_bytes: int = 256 * 1024  # download_stream() chunk size
 
     # Transcription
     transcription_provider: str = "openai"  # "openai" (Whisper) or "deepgram"
     deepgram_api_key: str = ""
+    transcription_max_upload_bytes: int = 100 * 1024 * 1024  # Largest recording accepted
+    transcription_long_audio_bytes: int = 20 * 1024 * 1024  # Bigger uploads are split and run in parallel (provider limit: 25MB)
+    transcription_segment_seconds: float = 120.0  # Target length of each parallel segment
+    transcription_segment_overlap_seconds: float = 2.0
+    transcription_max_parallel_segments: int = 4  # Concurrent segment requests (per worker)
+    transcription_chunk_bytes: int = 256 * 1024  # Read/stream size per chunk
+    transcription_max_connections: int = 20  # Pooled client (per worker)
+    transcription_max_keepalive_connections: int = 10
+    transcription_timeout_seconds: float = 120.0
 
     # Claude model settings
     claude_model: str = "claude-sonnet-4-20250514"
     claude_max_tokens: int = 4096
 
+    # Shared async Claude client connection pool (per worker)
+    claude_max_connections: int = 50
+    claude_max_keepalive_connections: int = 20
+    claude_timeout_seconds: float = 120.0
+    claude_max_retries: int = 2
+
+    # Local category classifier (answers detect_or_create_category before Claude)
+    category_fast_path_enabled: bool = True
+    category_fast_path_min_similarity: float = 0.35  # Cosine similarity to the best category centroid
+    category_fast_path_min_margin: float = 0.10  # Lead over the second-best category
+    category_fast_path_min_examples: int = 3  # Past quotes a category needs before it is answered locally
+    category_fast_path_audit_rate: float = 0.05  # Share of local answers re-checked with Claude in the background
+    category_classifier_max_examples: int = 500  # Most recent quotes used to train a contractor's classifier
+    category_classifier_ttl_seconds: int = 600  # Rebuilt after this long (picks up new quotes)
+
+    # PDF render pool (per uvicorn worker)
+    pdf_render_workers: int = 2  # Worker processes doing ReportLab renders
+    pdf_render_max_queue: int = 8  # Renders allowed to wait before returning 503
+    pdf_render_timeout_seconds: float = 30.0
+    pdf_render_retry_after_seconds: int = 2  # Rough per-render time for Retry-After
+    pdf_cache_memory_entries: int = 64  # Rendered PDFs kept in memory per worker
+    pdf_cache_memory_ttl: int = 3600
+    logo_cache_entries: int = 256  # Logo renditions kept in memory per worker
+
+    # Post-commit task outbox (per uvicorn worker)
+    outbox_workers: int = 4  # Concurrent side-effect tasks per uvicorn worker
+    outbox_poll_interval_seconds: float = 2.0
+    outbox_lease_seconds: int = 120  # Running tasks older than this are re-claimed
+    outbox_max_attempts: int = 5
+    outbox_retry_base_seconds: float = 5.0  # Doubles per attempt
+    outbox_lag_warning_seconds: int = 300  # /health/scheduler degrades past this
+
+    # Shared quote view tracking (per uvicorn worker)
+    share_view_flush_interval_seconds: float = 5.0  # Repeat views are written in batches this often
+
+    # Scheduler email fan-out (reminder and follow-up jobs)
+    scheduler_email_concurrency: int = 4  # Sends in flight per job run
+    scheduler_email_min_interval_seconds: float = 0.0  # Sends only enqueue; the dispatcher paces Resend
+
+    # Email dispatcher (outbound email queue, per uvicorn worker)
+    email_dispatcher_workers: int = 2  # Concurrent provider calls per uvicorn worker
+    email_dispatch_batch_size: int = 100  # Emails per Resend batch request (Resend max: 100)
+    email_dispatch_rate_per_second: float = 0.5  # Resend allows 2 req/sec per account, shared by 4 workers
+    email_dispatch_poll_interval_seconds: float = 2.0
+    email_dispatch_lease_seconds: int = 120  # Claimed emails older than this are re-claimed
+    email_dispatch_max_attempts: int = 6
+    email_dispatch_retry_base_seconds: float = 30.0  # Doubles per attempt
+
+    # Partitioned scheduler jobs (per-contractor work split across workers)
+    scheduler_sharding_enabled: bool = True  # False: one worker runs each job under a single lock
+    scheduler_shards: int = 16  # Shards per run (max 256); each is locked and checkpointed
+
     # Stripe Payment Settings
     stripe_secret_key: str = ""
     stripe_publishable_key: str = ""
@@ -3,6 +3,7 @@ Quoted - Voice to Quote for Contractors
 Main FastAPI application.
 """
 
+import asyncio
 import os
 import logging
 from contextlib import asynccontextmanager
@@ -110,20 +111,62 @@ async def lifespan(app: FastAPI):
     # With --workers 4, each worker runs lifespan, so we use an env var guard
     from .services.scheduler import start_scheduler, stop_scheduler
     scheduler_started = False
+    logo_migration = None
     if os.environ.get("SCHEDULER_STARTED") != "1":
         os.environ["SCHEDULER_STARTED"] = "1"
         start_scheduler()
         scheduler_started = True
         logger.info("Scheduler started (this worker is the scheduler leader)")
+
+        # Move any base64 logos left on contractor rows into storage
+        from .services.logo_storage import migrate_legacy_logos
+        logo_migration = asyncio.create_task(migrate_legacy_logos())
     else:
         logger.info("Scheduler skipped (another worker is the scheduler leader)")
 
+    # Post-commit side effects (every worker drains the shared outbox table)
+    from .services.outbox import start_outbox_workers, stop_outbox_workers
+    start_outbox_workers()
+
+    # Outbound email (every worker drains the shared email_outbox table)
+    from .services.email_dispatcher import start_email_dispatcher, stop_email_dispatcher
+    start_email_dispatcher()
+
+    # Batched view counts for shared quote links
+    from .services.view_tracking import start_view_buffer, stop_view_buffer
+    start_view_buffer()
+
+    # Compile email templates now rather than on the first send
+    from .services.email_templates import get_email_templates
+    get_email_templates()
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
     if scheduler_started:
         stop_scheduler()
+    if logo_migration is not None:
+        logo_migration.cancel()
+    await stop_outbox_workers()
+    await stop_email_dispatcher()
+    await stop_view_buffer()
+
+    # Release pooled Claude connections
+    from .services.claude_client import close_async_claude_client
+    await close_async_claude_client()
+
+    # Release pooled transcription connections
+    from .services.transcription import close_transcription_http_client
+    await close_transcription_http_client()
+
+    # Stop PDF render worker processes
+    from .services.pdf_render_pool import shutdown_pdf_render_pool
+    shutdown_pdf_render_pool()
+
+    # Stop the S3 thread pool
+    from .services.storage import shutdown_storage_executor
+    shutdown_storage_executor()
 
 
 # Create application
@@ -138,6 +181,10 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
+# Saturated PDF render pool -> 503 with Retry-After
+from .services.pdf_render_pool import PDFRenderBusy, pdf_render_busy_handler
+app.add_exception_handler(PDFRenderBusy, pdf_render_busy_handler)
+
 # HTTPS redirect middleware (production only)
 if settings.environment == "production":
     app.add_middleware(HTTPSRedirectMiddleware)
@@ -223,9 +270,18 @@ async def health_full(request: Request, response: Response):
 
 @app.get("/health/scheduler")
 async def health_scheduler():
-    """Health check for background scheduler (Wave 3)."""
-    from .services.health import get_scheduler_health
-    return get_scheduler_health()
+    """Health check for background scheduler (Wave 3), its shards, the task outbox and email queue."""
+    from .services.health import (
+        get_scheduler_health,
+        get_outbox_health,
+        get_sharded_jobs_health,
+        get_email_queue_health,
+    )
+    health = get_scheduler_health()
+    health["shards"] = await get_sharded_jobs_health()
+    health["outbox"] = await get_outbox_health()
+    health["email_queue"] = await get_email_queue_health()
+    return health
 
 
 # Serve frontend static files
@@ -8,9 +8,9 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column, String, Integer, Float, Text, DateTime,
-    Boolean, ForeignKey, JSON, create_engine
+    Boolean, ForeignKey, JSON, UniqueConstraint, Index, create_engine
 )
-from sqlalchemy.orm import relationship, declarative_base, sessionmaker
+from sqlalchemy.orm import relationship, declarative_base, sessionmaker, deferred
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 import uuid
 
@@ -85,7 +85,8 @@ class Contractor(Base):
     address = Column(Text)
     service_area = Column(String(255))
     logo_url = Column(String(500))
-    logo_data = Column(Text)  # Base64-encoded logo image (DISC-016)
+    logo_data = deferred(Column(Text))  # Legacy base64 logo (DISC-016), migrated to logo_hash
+    logo_hash = Column(String(64))  # sha256 of the logo in StorageService (see logo_storage)
 
     # What they do
     primary_trade = Column(String(100))  # e.g., "deck_builder", "painter", "landscaper"
@@ -194,10 +195,85 @@ class PricingModel(Base):
     You prefer to quote slightly high and come in under budget."
     """
 
+    # True once pricing_knowledge["categories"] has moved to pricing_categories
+    # (see services/pricing_store.py); the blob then keeps only global keys
+    categories_normalized = Column(Boolean, default=False)
+
     # Relationship
     contractor = relationship("Contractor", back_populates="pricing_model")
 
 
+class PricingCategory(Base):
+    """
+    One job category of a contractor's pricing knowledge.
+
+    Replaces pricing_knowledge["categories"][key] so learning, acceptance
+    and quote counters update one row instead of rewriting the whole blob.
+    version is an optimistic lock: ORM updates fail with StaleDataError when
+    another request changed the row since it was read.
+    """
+    __tablename__ = "pricing_categories"
+    __table_args__ = (
+        UniqueConstraint("contractor_id", "key", name="uq_pricing_category"),
+    )
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    contractor_id = Column(String, ForeignKey("contractors.id"), nullable=False, index=True)
+    key = Column(String(255), nullable=False)  # snake_case, matches Quote.job_type
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1)
+
+    display_name = Column(String(255))
+    tailored_prompt = Column(Text)  # Category-specific pricing understanding (learning level 2)
+    confidence = Column(Float, default=0.5)
+
+    samples = Column(Integer, default=0)  # Corrections learned from (legacy name)
+    quote_count = Column(Integer, default=0)  # Quotes created in this category
+    correction_count = Column(Integer, default=0)  # DISC-035
+    acceptance_count = Column(Integer, default=0)  # Sent/accepted without edits
+    loss_count = Column(Integer, default=0)  # DISC-121
+
+    # Any other keys of the legacy category dict (last_acceptance_at, loss_reasons, ...)
+    extra = Column(JSON, default=dict)
+
+    statements = relationship(
+        "LearningStatement",
+        back_populates="category",
+        order_by="LearningStatement.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+class LearningStatement(Base):
+    """
+    One learned adjustment of a pricing category, in prompt order.
+
+    The legacy blob held either plain strings or dicts with quality metadata;
+    plain_text marks rows that came from a plain string so the compatibility
+    view hands them back unchanged.
+    """
+    __tablename__ = "learning_statements"
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    category_id = Column(String, ForeignKey("pricing_categories.id", ondelete="CASCADE"), nullable=False, index=True)
+    contractor_id = Column(String, ForeignKey("contractors.id"), nullable=False, index=True)
+    position = Column(Integer, nullable=False, default=0)
+
+    text = Column(Text, nullable=False)
+    quality_score = Column(Float)  # LearningQualityScorer overall score
+    source = Column(String(50))  # correction, fallback, manual
+    outcome_boost = Column(Float)
+    created_at = Column(DateTime)  # When it was learned (set by the learning loop, not the insert)
+    plain_text = Column(Boolean, default=False)
+    extra = Column(JSON, default=dict)
+
+    category = relationship("PricingCategory", back_populates="statements")
+
+
 class ContractorTerms(Base):
     """
     Standard terms and conditions for ONE contractor.
@@ -386,6 +462,11 @@ class Quote(Base):
     # Duplication (DISC-038)
     duplicate_source_quote_id = Column(String(36), nullable=True)  # Quote this was duplicated from
 
+    # Counted in its Pricing Brain category's quote_count (post_generation.register_category)
+    category_counted_at = Column(DateTime, nullable=True)
+    # Who picked job_type: "local" (category classifier fast path) or "claude"
+    category_source = Column(String(20), nullable=True)
+
     # Relationship
     contractor = relationship("Contractor", back_populates="quotes")
     feedback = relationship("QuoteFeedback", back_populates="quote", uselist=False)
@@ -1037,6 +1118,136 @@ class DemoGeneration(Base):
     converted_user_id = Column(String, ForeignKey("users.id"), nullable=True)
 
 
+class QuoteTotalSummary(Base):
+    """
+    DISC-034: Maintained distribution of quote totals for the pricing sanity check.
+
+    One row per (contractor, category) plus one row per contractor with
+    category "*" for all quotes. The histogram uses fixed log-spaced buckets
+    (see services/quote_total_index.py) and is updated in the same transaction
+    as quote create/update/delete, so median/P95 no longer need a full scan.
+    """
+    __tablename__ = "quote_total_summaries"
+    __table_args__ = (
+        UniqueConstraint("contractor_id", "category", name="uq_quote_total_summary"),
+    )
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    contractor_id = Column(String, ForeignKey("contractors.id"), nullable=False, index=True)
+    category = Column(String(255), nullable=False)  # Quote.job_type, or "*" for all
+
+    count = Column(Integer, default=0)
+    buckets = Column(JSON, default=dict)  # {bucket_index: count}, sparse
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class QuoteStats(Base):
+    """
+    DISC-012: Rolling quote counters per contractor and category.
+
+    One row per (contractor, category) plus one row per contractor with
+    category "*" for all quotes. Maintained by DatabaseService in the same
+    transaction as quote create/update/delete (see services/quote_stats.py),
+    so edit and win rates no longer need to load every quote.
+    """
+    __tablename__ = "quote_stats"
+    __table_args__ = (
+        UniqueConstraint("contractor_id", "category", name="uq_quote_stats"),
+    )
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    contractor_id = Column(String, ForeignKey("contractors.id"), nullable=False, index=True)
+    category = Column(String(255), nullable=False)  # Quote.job_type, or "*" for all
+
+    quotes = Column(Integer, default=0)
+    edits = Column(Integer, default=0)  # Quotes with was_edited
+    wins = Column(Integer, default=0)  # outcome == "won"
+    losses = Column(Integer, default=0)  # outcome == "lost"
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class OutboxTask(Base):
+    """
+    Durable post-commit side effect (customer linking, category registration,
+    analytics, notifications) executed by the outbox worker pool.
+
+    Rows are written in the same transaction as the quote they belong to and
+    deleted once the task succeeds. Rows with status "failed" ran out of
+    attempts and stay for inspection (see services/outbox.py).
+    """
+    __tablename__ = "outbox_tasks"
+    __table_args__ = (
+        Index("ix_outbox_tasks_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    task_type = Column(String(100), nullable=False)
+    payload = Column(JSON, default=dict)
+
+    status = Column(String(20), default="pending")  # pending, running, failed
+    attempts = Column(Integer, default=0)
+    run_after = Column(DateTime, default=datetime.utcnow)  # Not before (retry backoff)
+    locked_until = Column(DateTime, nullable=True)  # Lease while running
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class EmailOutboxMessage(Base):
+    """
+    Outbound email waiting for the email dispatcher.
+
+    EmailService writes one row per email (the Resend send params) and
+    returns; dispatcher workers deliver them in Resend batches and delete
+    rows once sent. Rows with status "failed" were rejected by Resend or ran
+    out of attempts and stay for inspection (see services/email_dispatcher.py).
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    params = Column(JSON, nullable=False)  # resend.Emails.send params
+
+    status = Column(String(20), default="pending")  # pending, sending, failed
+    attempts = Column(Integer, default=0)
+    run_after = Column(DateTime, default=datetime.utcnow)  # Not before (retry backoff)
+    locked_until = Column(DateTime, nullable=True)  # Lease while sending
+    claim_token = Column(String(36), nullable=True)  # Identifies the claiming worker's batch
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SchedulerCheckpoint(Base):
+    """
+    Progress of one shard of a partitioned scheduler job.
+
+    One row per (job_name, shard), overwritten each run. A shard whose row
+    has the current run_key and status "done" is skipped, so a run that
+    crashed halfway resumes with the unfinished shards (see services/job_shards.py).
+    """
+    __tablename__ = "scheduler_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("job_name", "shard", name="uq_scheduler_checkpoints_job_shard"),
+    )
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    job_name = Column(String(100), nullable=False)
+    shard = Column(Integer, nullable=False)
+    shard_count = Column(Integer, nullable=False)
+    run_key = Column(String(50), nullable=False)  # Scheduling period this progress belongs to
+    status = Column(String(20), default="running")  # running, done
+    started_at = Column(DateTime, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+
 # Database initialization
 def get_database_url(async_mode: bool = True) -> str:
     """Get database URL from config. Supports SQLite and PostgreSQL."""
@@ -1247,6 +1458,26 @@ async def run_migrations(engine):
             """,
             "alter_sql": "ALTER TABLE contractors ADD COLUMN logo_data TEXT"
         },
+        # Logo content hash - logos live in StorageService (logo_storage)
+        {
+            "table": "contractors",
+            "column": "logo_hash",
+            "check_sql": """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = 'contractors' AND column_name = 'logo_hash'
+            """,
+            "alter_sql": "ALTER TABLE contractors ADD COLUMN logo_hash VARCHAR(64)"
+        },
+        # Categories moved to pricing_categories (services/pricing_store.py)
+        {
+            "table": "pricing_models",
+            "column": "categories_normalized",
+            "check_sql": """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = 'pricing_models' AND column_name = 'categories_normalized'
+            """,
+            "alter_sql": "ALTER TABLE pricing_models ADD COLUMN categories_normalized BOOLEAN DEFAULT FALSE"
+        },
         # Normalized email column for trial abuse prevention (DISC-017)
         {
             "table": "users",
@@ -1305,6 +1536,26 @@ async def run_migrations(engine):
             """,
             "alter_sql": "ALTER TABLE quotes ADD COLUMN duplicate_source_quote_id VARCHAR(36)"
         },
+        # Idempotent category quote counts (post_generation.register_category)
+        {
+            "table": "quotes",
+            "column": "category_counted_at",
+            "check_sql": """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = 'quotes' AND column_name = 'category_counted_at'
+            """,
+            "alter_sql": "ALTER TABLE quotes ADD COLUMN category_counted_at TIMESTAMP"
+        },
+        # Category source, so the classifier never trains on its own predictions
+        {
+            "table": "quotes",
+            "column": "category_source",
+            "check_sql": """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = 'quotes' AND column_name = 'category_source'
+            """,
+            "alter_sql": "ALTER TABLE quotes ADD COLUMN category_source VARCHAR(20)"
+        },
         # Three-layer pricing architecture - global pricing philosophy
         {
             "table": "pricing_models",
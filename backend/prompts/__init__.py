@@ -4,6 +4,8 @@ These are the core prompts that power quote generation and learning.
 """
 
 from .quote_generation import (
+    QuotePrompt,
+    build_quote_prompt,
     get_quote_generation_prompt,
     get_quote_refinement_prompt,
 )
@@ -19,6 +21,8 @@ from .demo_generation import (
 )
 
 __all__ = [
+    "QuotePrompt",
+    "build_quote_prompt",
     "get_quote_generation_prompt",
     "get_quote_refinement_prompt",
     "get_setup_system_prompt",
@@ -2,11 +2,75 @@
 Quote generation prompts for Quoted.
 These prompts synthesize voice transcriptions into structured quotes
 using the contractor's learned pricing model.
+
+The generation prompt is laid out for Anthropic prompt caching: the
+longest-lived content comes first, so consecutive quotes share a prefix.
+1. QUOTE_INSTRUCTIONS: identical for every contractor and request
+2. Contractor context: rates, philosophy, category catalog, terms -
+   changes only when the contractor edits settings or a learning is applied
+3. Request content: category learnings, corrections, voice signals and the
+   transcription - different for every quote
+Blocks 1 and 2 carry cache_control breakpoints.
 """
 
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
 
 from ..services.learning_relevance import select_relevant_learnings
+from ..services.prompt_fragments import get_prompt_fragment_cache
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Static part of the quote generation prompt (with the tool schema, the
+# cached prefix shared by every contractor)
+QUOTE_INSTRUCTIONS = """You are a quoting assistant for professional contractors.
+
+Your job is to take the contractor's voice notes about a job and produce a professional budgetary quote.
+
+IMPORTANT: This is a BUDGETARY quote - a ballpark estimate to help the customer understand general pricing. It is NOT a detailed takeoff or binding contract. Make this clear in the quote.
+
+## Your Task
+
+Based on the voice note, use the generate_quote tool to create a structured budgetary quote. Extract:
+
+1. **Customer Info** (if mentioned): name, address, contact
+2. **Job Description**: Clear, professional summary of the work
+3. **Line Items**: Break down the quote into logical components
+   - When quantities are mentioned (e.g., "two paintings", "three rooms"), extract them separately
+   - Set quantity and unit price, not just total (e.g., Qty: 2 × $500 = $1,000)
+4. **Timeline**: Estimated days and crew size
+5. **Total**: Sum of all line items
+
+## Important Guidelines
+
+1. **Apply the layered pricing context** - philosophy first, then category-specific rules
+2. Use the contractor's actual pricing when available
+3. If pricing isn't clear, use reasonable industry estimates and set confidence to "low"
+4. Round all amounts to whole dollars
+5. Include demolition/removal only if mentioned
+6. Include permit costs only if mentioned
+7. Be conservative - it's better to estimate slightly high than low
+8. Always include at least 2-3 questions if you had to make assumptions
+9. Set confidence based on how much information you have:
+   - "high": Clear scope, contractor has pricing for this type of work
+   - "medium": Some assumptions needed, but reasonable estimates possible
+   - "low": Many unknowns, significant assumptions made"""
+
+
+@dataclass
+class QuotePrompt:
+    """Quote generation prompt as ordered content blocks (cacheable first)."""
+    system: List[Dict[str, Any]]
+    content: List[Dict[str, Any]]
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        return [{"role": "user", "content": self.content}]
+
+    @property
+    def text(self) -> str:
+        """The whole prompt as one string (logging, tests)."""
+        return "\n\n".join(block["text"] for block in self.system + self.content)
 
 
 def get_quote_generation_prompt(
@@ -19,7 +83,35 @@ def get_quote_generation_prompt(
     correction_examples: Optional[list] = None,
     detected_category: Optional[str] = None,
     voice_signals: Optional[Dict[str, Any]] = None,
+    contractor_id: Optional[str] = None,
 ) -> str:
+    """Generate the main quote generation prompt as a single string."""
+    return build_quote_prompt(
+        transcription=transcription,
+        contractor_name=contractor_name,
+        pricing_model=pricing_model,
+        pricing_notes=pricing_notes,
+        job_types=job_types,
+        terms=terms,
+        correction_examples=correction_examples,
+        detected_category=detected_category,
+        voice_signals=voice_signals,
+        contractor_id=contractor_id,
+    ).text
+
+
+def build_quote_prompt(
+    transcription: str,
+    contractor_name: str,
+    pricing_model: dict,
+    pricing_notes: Optional[str] = None,
+    job_types: Optional[list] = None,
+    terms: Optional[dict] = None,
+    correction_examples: Optional[list] = None,
+    detected_category: Optional[str] = None,
+    voice_signals: Optional[Dict[str, Any]] = None,
+    contractor_id: Optional[str] = None,
+) -> QuotePrompt:
     """
     Generate the main quote generation prompt.
 
@@ -38,9 +130,19 @@ def get_quote_generation_prompt(
        The most granular layer - individual lessons from corrections.
 
     This layered approach allows the model to learn at multiple levels of abstraction.
+
+    With contractor_id and a versioned pricing_model (from the quote context
+    snapshot), the category catalog, the category's tailored section and the
+    correction examples are memoized (see services/prompt_fragments.py).
     """
 
     pricing_knowledge = pricing_model.get("pricing_knowledge", {})
+    version = pricing_model.get("version")
+
+    def fragment(category: Optional[str], name: str, render) -> str:
+        if contractor_id and version:
+            return get_prompt_fragment_cache().get(contractor_id, version, category, name, render)
+        return render()
 
     # ============================================================
     # LAYER 1: GLOBAL PRICING PHILOSOPHY
@@ -72,11 +174,10 @@ def get_quote_generation_prompt(
             # Layer 2: Category tailored prompt (deep understanding)
             tailored_str = ""
             if tailored_prompt:
-                tailored_str = f"""
-### Your Pricing Approach for {display_name}
-
-{tailored_prompt}
-"""
+                tailored_str = fragment(
+                    detected_category, "tailored",
+                    lambda: _format_tailored_section(display_name, tailored_prompt),
+                )
 
             # Layer 3: Specific learned adjustments (injections)
             adjustments_str = ""
@@ -168,24 +269,8 @@ The contractor's tone and word choice suggest these pricing adjustments:
 Consider these signals when setting line item prices.
 """
 
-    # Format pricing knowledge for the prompt
-    pricing_knowledge_str = ""
-    if pricing_knowledge:
-        pricing_knowledge_str = f"""
-## Your Learned Pricing Knowledge
-
-{_format_pricing_knowledge(pricing_knowledge)}
-"""
-
-    # Add global rules if they exist
-    global_rules = pricing_knowledge.get("global_rules", [])
-    if global_rules:
-        rules_list = "\n".join(f"- {rule}" for rule in global_rules)
-        pricing_knowledge_str += f"""
-## Global Pricing Rules (Apply to ALL quotes)
-
-{rules_list}
-"""
+    # Format pricing knowledge (category catalog and global rules) for the prompt
+    pricing_knowledge_str = fragment(None, "catalog", lambda: _format_catalog_section(pricing_knowledge))
 
     # Format job types if available
     job_types_str = ""
@@ -207,18 +292,14 @@ Consider these signals when setting line item prices.
 - Labor warranty: {terms.get('labor_warranty_years', 2)} years
 """
 
-    # Format correction examples (the learning context)
+    # Format correction examples (the learning context). Examples come from
+    # the snapshot, picked by category, so the category identifies them
     corrections_str = ""
     if correction_examples:
-        corrections_str = f"""
-## IMPORTANT: Learned From Past Corrections
-
-The contractor has corrected previous quotes. Learn from these examples:
-
-{_format_correction_examples(correction_examples)}
-
-Use these corrections to inform your pricing. If you see a pattern (e.g., contractor always increases demolition costs), apply that learning to this quote.
-"""
+        corrections_str = fragment(
+            detected_category, "corrections",
+            lambda: _format_corrections_section(correction_examples),
+        )
 
     # Handle None values with 'or' to ensure defaults even when key exists but is None
     labor_rate = pricing_model.get('labor_rate_hourly') or 65
@@ -226,18 +307,10 @@ Use these corrections to inform your pricing. If you see a pattern (e.g., contra
     material_markup = pricing_model.get('material_markup_percent') or 20
     minimum_job = pricing_model.get('minimum_job_amount') or 500
 
-    return f"""You are a quoting assistant for {contractor_name}, a professional contractor.
-
-Your job is to take the contractor's voice notes about a job and produce a professional budgetary quote.
-
-IMPORTANT: This is a BUDGETARY quote - a ballpark estimate to help the customer understand general pricing. It is NOT a detailed takeoff or binding contract. Make this clear in the quote.
-
-## Voice Note Transcription
+    contractor_context = f"""## Contractor
 
-"{transcription}"
+You are quoting for {contractor_name}.
 {philosophy_str}
-{category_context_str}
-{voice_signals_str}
 ## Contractor's Base Pricing Information
 
 Labor Rate: ${labor_rate}/hour
@@ -251,39 +324,25 @@ Minimum Job: ${minimum_job}
 
 {job_types_str}
 
-{terms_str}
+{terms_str}"""
 
+    request_context = f"""{category_context_str}
 {corrections_str}
+{voice_signals_str}
+## Voice Note Transcription
 
-## Your Task
-
-Based on the voice note, use the generate_quote tool to create a structured budgetary quote. Extract:
-
-1. **Customer Info** (if mentioned): name, address, contact
-2. **Job Description**: Clear, professional summary of the work
-3. **Line Items**: Break down the quote into logical components
-   - When quantities are mentioned (e.g., "two paintings", "three rooms"), extract them separately
-   - Set quantity and unit price, not just total (e.g., Qty: 2 × $500 = $1,000)
-4. **Timeline**: Estimated days and crew size
-5. **Total**: Sum of all line items
-
-## Important Guidelines
-
-1. **Apply the layered pricing context above** - philosophy first, then category-specific rules
-2. Use the contractor's actual pricing when available
-3. If pricing isn't clear, use reasonable industry estimates and set confidence to "low"
-4. Round all amounts to whole dollars
-5. Include demolition/removal only if mentioned
-6. Include permit costs only if mentioned
-7. Be conservative - it's better to estimate slightly high than low
-8. Always include at least 2-3 questions if you had to make assumptions
-9. Set confidence based on how much information you have:
-   - "high": Clear scope, contractor has pricing for this type of work
-   - "medium": Some assumptions needed, but reasonable estimates possible
-   - "low": Many unknowns, significant assumptions made
+"{transcription}"
 
 Use the generate_quote tool now:"""
 
+    return QuotePrompt(
+        system=[
+            {"type": "text", "text": QUOTE_INSTRUCTIONS, "cache_control": CACHE_CONTROL},
+            {"type": "text", "text": contractor_context.strip(), "cache_control": CACHE_CONTROL},
+        ],
+        content=[{"type": "text", "text": request_context.strip()}],
+    )
+
 
 def get_quote_refinement_prompt(
     original_quote: dict,
@@ -445,6 +504,50 @@ IMPORTANT: Most corrections should have tailored_prompt_update: null and philoso
 Keep learning_statements concise (5-10 max). Quality over quantity:"""
 
 
+def _format_catalog_section(pricing_knowledge: dict) -> str:
+    """Learned pricing knowledge and global rules sections."""
+    section = ""
+    if pricing_knowledge:
+        section = f"""
+## Your Learned Pricing Knowledge
+
+{_format_pricing_knowledge(pricing_knowledge)}
+"""
+
+    # Add global rules if they exist
+    global_rules = pricing_knowledge.get("global_rules", [])
+    if global_rules:
+        rules_list = "\n".join(f"- {rule}" for rule in global_rules)
+        section += f"""
+## Global Pricing Rules (Apply to ALL quotes)
+
+{rules_list}
+"""
+    return section
+
+
+def _format_tailored_section(display_name: str, tailored_prompt: str) -> str:
+    """Layer 2: the category's tailored pricing approach."""
+    return f"""
+### Your Pricing Approach for {display_name}
+
+{tailored_prompt}
+"""
+
+
+def _format_corrections_section(correction_examples: list) -> str:
+    """Correction examples section (few-shot learning context)."""
+    return f"""
+## IMPORTANT: Learned From Past Corrections
+
+The contractor has corrected previous quotes. Learn from these examples:
+
+{_format_correction_examples(correction_examples)}
+
+Use these corrections to inform your pricing. If you see a pattern (e.g., contractor always increases demolition costs), apply that learning to this quote.
+"""
+
+
 def _format_pricing_knowledge(pricing_knowledge: dict) -> str:
     """Format pricing knowledge dict into readable string."""
     lines = []
@@ -22,6 +22,7 @@ Usage:
 """
 
 import functools
+import hashlib
 from typing import Callable, Optional
 from sqlalchemy import text
 
@@ -30,7 +31,7 @@ from .logging import get_logger
 logger = get_logger("quoted.advisory_locks")
 
 
-def _job_name_to_lock_id(job_name: str) -> int:
+def _job_name_to_lock_id(job_name: str, shard: Optional[int] = None) -> int:
     """
     Convert a job name to a Postgres advisory lock ID.
 
@@ -38,18 +39,24 @@ def _job_name_to_lock_id(job_name: str) -> int:
     modulo 2^31 to fit in a signed 32-bit integer range (Postgres accepts both
     32-bit and 64-bit lock IDs).
 
+    Partitioned jobs lock each shard separately ("job_name:shard-N").
+
     Args:
         job_name: Unique identifier for the scheduled job
+        shard: Shard index for partitioned jobs
 
     Returns:
         Integer lock ID for use with pg_try_advisory_lock
     """
-    # Use Python's built-in hash and constrain to positive 32-bit range
-    # The modulo ensures we stay within Postgres's int4 range
-    return abs(hash(job_name)) % (2**31)
+    if shard is not None:
+        job_name = f"{job_name}:shard-{shard}"
+    # Stable across processes: Python's built-in str hash is randomized per
+    # process, which gave every uvicorn worker a different lock ID
+    digest = hashlib.sha256(job_name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % (2**31)
 
 
-async def acquire_job_lock(job_name: str, db_session) -> bool:
+async def acquire_job_lock(job_name: str, db_session, shard: Optional[int] = None) -> bool:
     """
     Try to acquire an advisory lock for a scheduled job.
 
@@ -59,11 +66,14 @@ async def acquire_job_lock(job_name: str, db_session) -> bool:
     Args:
         job_name: Unique identifier for the scheduled job
         db_session: SQLAlchemy async session
+        shard: Shard index for partitioned jobs
 
     Returns:
         True if lock acquired, False if job is already running elsewhere
     """
-    lock_id = _job_name_to_lock_id(job_name)
+    lock_id = _job_name_to_lock_id(job_name, shard)
+    if shard is not None:
+        job_name = f"{job_name}:shard-{shard}"
 
     try:
         result = await db_session.execute(
@@ -85,7 +95,7 @@ async def acquire_job_lock(job_name: str, db_session) -> bool:
         return True
 
 
-async def release_job_lock(job_name: str, db_session) -> None:
+async def release_job_lock(job_name: str, db_session, shard: Optional[int] = None) -> None:
     """
     Release an advisory lock for a scheduled job.
 
@@ -96,8 +106,11 @@ async def release_job_lock(job_name: str, db_session) -> None:
     Args:
         job_name: Unique identifier for the scheduled job
         db_session: SQLAlchemy async session
+        shard: Shard index for partitioned jobs
     """
-    lock_id = _job_name_to_lock_id(job_name)
+    lock_id = _job_name_to_lock_id(job_name, shard)
+    if shard is not None:
+        job_name = f"{job_name}:shard-{shard}"
 
     try:
         await db_session.execute(
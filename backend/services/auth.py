@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..models.database import User, Contractor, PricingModel, ContractorTerms, RefreshToken, Base, generate_uuid
+from .cache import cache_service
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 # Password hashing
@@ -108,6 +109,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
     to_encode.update({"exp": expire})
+    # Per-token id: keys the principal cache (see get_current_user)
+    to_encode.setdefault("jti", generate_uuid())
     encoded_jwt = jwt.encode(
         to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
     )
@@ -321,6 +324,7 @@ async def revoke_all_user_tokens(db: AsyncSession, user_id: str, reason: str = "
         token.revoked_reason = reason
 
     await db.commit()
+    await cache_service.invalidate_principals(user_id)
     return len(tokens)
 
 
@@ -481,6 +485,46 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> Opti
     return user
 
 
+async def _resolve_principal(db: AsyncSession, payload: dict) -> Optional[dict]:
+    """
+    Look up the user behind a decoded access token (None if they don't exist).
+
+    Principals are cached per (user id, token jti) so most authenticated
+    requests skip the user and contractor queries. revoke_all_user_tokens
+    and contractor creation invalidate the user's entries. Tokens issued
+    before jti was added are looked up every time.
+    """
+    user_id: str = payload.get("sub")
+    jti: Optional[str] = payload.get("jti")
+
+    if jti:
+        principal = await cache_service.get_principal(user_id, jti)
+        if principal is not None:
+            return principal
+
+    user = await get_user_by_id(db, user_id)
+    if user is None:
+        return None
+
+    # Also fetch contractor_id for endpoints that need it (P0-05 fix)
+    result = await db.execute(
+        select(Contractor.id).where(Contractor.user_id == user.id)
+    )
+    contractor_id = result.scalar_one_or_none()
+
+    # Return as dict for easier access in endpoints
+    principal = {
+        "id": user.id,
+        "email": user.email,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "contractor_id": str(contractor_id) if contractor_id else None,  # P0-05: Include for follow-up and other endpoints
+    }
+    if jti:
+        await cache_service.set_principal(user_id, jti, principal)
+    return principal
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
@@ -505,31 +549,17 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = await get_user_by_id(db, user_id)
+    user = await _resolve_principal(db, payload)
     if user is None:
         raise credentials_exception
 
-    if not user.is_active:
+    if not user["is_active"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is disabled"
         )
 
-    # Also fetch contractor_id for endpoints that need it (P0-05 fix)
-    result = await db.execute(
-        select(Contractor).where(Contractor.user_id == user.id)
-    )
-    contractor = result.scalar_one_or_none()
-    contractor_id = str(contractor.id) if contractor else None
-
-    # Return as dict for easier access in endpoints
-    return {
-        "id": user.id,
-        "email": user.email,
-        "is_active": user.is_active,
-        "is_verified": user.is_verified,
-        "contractor_id": contractor_id,  # P0-05: Include for follow-up and other endpoints
-    }
+    return user
 
 
 async def get_current_user_optional(
@@ -553,27 +583,14 @@ async def get_current_user_optional(
     if user_id is None:
         return None
 
-    user = await get_user_by_id(db, user_id)
+    user = await _resolve_principal(db, payload)
     if user is None:
         return None
 
-    if not user.is_active:
+    if not user["is_active"]:
         return None
 
-    # Also fetch contractor_id for consistency with get_current_user (P0-05 fix)
-    result = await db.execute(
-        select(Contractor).where(Contractor.user_id == user.id)
-    )
-    contractor = result.scalar_one_or_none()
-    contractor_id = str(contractor.id) if contractor else None
-
-    return {
-        "id": user.id,
-        "email": user.email,
-        "is_active": user.is_active,
-        "is_verified": user.is_verified,
-        "contractor_id": contractor_id,
-    }
+    return user
 
 
 async def get_current_contractor(
@@ -6,6 +6,8 @@ All operations are non-blocking and won't fail the request if cache is down.
 """
 
 import json
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 from datetime import timedelta
 
@@ -62,6 +64,56 @@ async def _get_redis():
         return None
 
 
+class LocalTTLCache:
+    """
+    Small in-process LRU cache with per-entry expiry.
+
+    Used as a fallback tier when Redis is not configured or unreachable.
+    Entries are per worker process, so TTLs should be kept short to bound
+    staleness between workers.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# In-process fallback tier (one per worker)
+_local_cache = LocalTTLCache()
+
+# In-process tier for authenticated principals (one per worker)
+_local_principal_cache = LocalTTLCache(max_entries=settings.cache_principal_local_entries)
+
+
 class CacheService:
     """
     Async Redis cache service with graceful degradation.
@@ -75,6 +127,11 @@ class CacheService:
     PREFIX_PRICING = "pricing:"
     PREFIX_TEMPLATE = "template:"
     PREFIX_QUOTE = "quote:"
+    PREFIX_QUOTE_CONTEXT = "quote_context:"
+    PREFIX_PRINCIPAL = "principal:"
+
+    # Bump when the quote context snapshot shape changes so old entries are ignored
+    QUOTE_CONTEXT_VERSION = 1
 
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -252,6 +309,90 @@ class CacheService:
         """Invalidate cached quote template."""
         return await self.delete(self.template_key(contractor_id, template_name))
 
+    # =========================================================================
+    # Quote Context Snapshot Caching
+    # =========================================================================
+
+    def quote_context_key(self, contractor_id: str) -> str:
+        """Generate versioned cache key for a contractor's quote context."""
+        return f"{self.PREFIX_QUOTE_CONTEXT}v{self.QUOTE_CONTEXT_VERSION}:{contractor_id}"
+
+    async def get_quote_context(self, contractor_id: str) -> Optional[dict]:
+        """
+        Get cached quote context snapshot.
+
+        Reads Redis when available, otherwise the in-process fallback.
+        """
+        key = self.quote_context_key(contractor_id)
+        client = await _get_redis()
+        if client:
+            return await self.get(key)
+        # Stored serialized so callers never share (and mutate) the cached object
+        value = _local_cache.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set_quote_context(self, contractor_id: str, snapshot: dict) -> bool:
+        """Cache quote context snapshot (Redis, or in-process fallback)."""
+        key = self.quote_context_key(contractor_id)
+        client = await _get_redis()
+        if client:
+            return await self.set(key, snapshot, ttl=settings.cache_ttl_quote_context)
+        try:
+            _local_cache.set(key, json.dumps(snapshot), ttl=settings.cache_ttl_quote_context_local)
+            return True
+        except Exception as e:
+            logger.warning(f"Local cache set failed for {key}: {e}")
+            return False
+
+    async def invalidate_quote_context(self, contractor_id: str) -> bool:
+        """Invalidate cached quote context in both tiers."""
+        key = self.quote_context_key(contractor_id)
+        _local_cache.delete(key)
+        await self.delete(key)
+        return True
+
+    # =========================================================================
+    # Authenticated Principal Caching
+    # =========================================================================
+
+    def principal_key(self, user_id: str, jti: str) -> str:
+        """Cache key for the principal behind one access token."""
+        return f"{self.PREFIX_PRINCIPAL}{user_id}:{jti}"
+
+    async def get_principal(self, user_id: str, jti: str) -> Optional[dict]:
+        """
+        Get the cached principal for an access token.
+
+        Checks this worker's LRU first, then Redis (refilling the LRU).
+        """
+        key = self.principal_key(user_id, jti)
+        value = _local_principal_cache.get(key)
+        if value is not None:
+            return dict(value)
+        principal = await self.get(key)
+        if principal is not None:
+            _local_principal_cache.set(key, principal, ttl=settings.cache_ttl_principal_local)
+        return principal
+
+    async def set_principal(self, user_id: str, jti: str, principal: dict) -> bool:
+        """Cache a principal in both tiers."""
+        key = self.principal_key(user_id, jti)
+        _local_principal_cache.set(key, dict(principal), ttl=settings.cache_ttl_principal_local)
+        return await self.set(key, principal, ttl=settings.cache_ttl_principal)
+
+    async def invalidate_principals(self, user_id: str) -> bool:
+        """
+        Drop every cached principal for a user (all of their tokens).
+
+        Call after any write to a cached field (is_active, is_verified,
+        contractor_id). Other workers' LRU tiers expire within
+        cache_ttl_principal_local.
+        """
+        prefix = f"{self.PREFIX_PRINCIPAL}{user_id}:"
+        _local_principal_cache.delete_prefix(prefix)
+        await self.delete_pattern(f"{prefix}*")
+        return True
+
     # =========================================================================
     # Health Check
     # =========================================================================
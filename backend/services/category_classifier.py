@@ -0,0 +1,285 @@
+"""
+Local fast path for quote category detection.
+
+detect_or_create_category used to spend a Claude round trip on every
+generation, even though most voice notes describe work the contractor has
+quoted many times and simply pick one of their existing
+pricing_knowledge["categories"] keys.
+
+This module keeps a per-contractor, per-worker TF-IDF classifier:
+- trained on the contractor's recent quotes (transcription -> job_type),
+  plus each category's key and display name; quotes whose category came
+  from this fast path (category_source "local") are left out, so the
+  classifier never learns from its own predictions
+- one L2-normalized centroid per category; a lookup is a sparse dot
+  product against each centroid (well under a millisecond)
+
+A prediction is only used when it is confident: the best centroid clears
+category_fast_path_min_similarity, leads the runner-up by
+category_fast_path_min_margin, and was trained on at least
+category_fast_path_min_examples quotes. Everything else (new kinds of work,
+ambiguous notes, contractors without history) still goes to Claude.
+
+Classifiers are rebuilt after category_classifier_ttl_seconds, or at once
+when the contractor's category set changes.
+"""
+
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+
+from ..config import settings
+from ..models.database import Quote
+from .logging import get_logger
+
+logger = get_logger("quoted.category_classifier")
+
+# Contractors whose classifier is kept in memory per worker
+MAX_CLASSIFIED_CONTRACTORS = 256
+
+# Confidence reported for fast-path answers: they cleared the similarity and
+# margin thresholds, i.e. the "close match" band of the Claude prompt
+FAST_PATH_CONFIDENCE = 90
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset("""
+about above after again all also and any are around back been before being
+but can could did does doing down each few for from get going got had has
+have here how into its just like make more most need needs new now off once
+only other our out over own same should some such than that the their them
+then there these they this those through too under until very want wants
+was way well were what when where which while who will with would you your
+yeah okay gonna wanna guy guys thing things lot
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords, plurals folded ("decks" -> "deck")."""
+    tokens = []
+    for token in _TOKEN_RE.findall((text or "").lower().replace("_", " ")):
+        if len(token) < 3 or token in _STOPWORDS or token.isdigit():
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return {t: v / norm for t, v in vector.items()} if norm else {}
+
+
+class CategoryClassifier:
+    """TF-IDF centroids for one contractor's categories."""
+
+    def __init__(
+        self,
+        categories: Dict[str, str],
+        examples: Iterable[Tuple[str, str]],
+    ):
+        """
+        Args:
+            categories: category key -> display name
+            examples: (transcription, category key) pairs from past quotes
+        """
+        documents: List[Tuple[str, List[str]]] = [
+            (key, tokenize(f"{key} {display_name}")) for key, display_name in categories.items()
+        ]
+        self.example_counts: Counter = Counter()
+        for transcription, category in examples:
+            if category in categories:
+                documents.append((category, tokenize(transcription)))
+                self.example_counts[category] += 1
+
+        document_frequency: Counter = Counter()
+        for _, tokens in documents:
+            document_frequency.update(set(tokens))
+        total = len(documents)
+        self.idf = {
+            token: math.log((total + 1) / (count + 1)) + 1.0
+            for token, count in document_frequency.items()
+        }
+        # Words never seen in training count as maximally rare, so a note
+        # about unfamiliar work is not scored on its one familiar word
+        self.unseen_idf = math.log(total + 1) + 1.0
+
+        sums: Dict[str, Dict[str, float]] = {key: {} for key in categories}
+        for category, tokens in documents:
+            centroid = sums[category]
+            for token, weight in self.vectorize(tokens).items():
+                centroid[token] = centroid.get(token, 0.0) + weight
+        self.centroids = {key: _normalize(vector) for key, vector in sums.items() if vector}
+        self.display_names = dict(categories)
+
+    def vectorize(self, tokens: List[str]) -> Dict[str, float]:
+        """Sublinear TF-IDF vector (unit length)."""
+        return _normalize({
+            token: (1.0 + math.log(count)) * self.idf.get(token, self.unseen_idf)
+            for token, count in Counter(tokens).items()
+        })
+
+    def scores(self, transcription: str) -> List[Tuple[str, float]]:
+        """(category, cosine similarity) for every category, best first."""
+        query = self.vectorize(tokenize(transcription))
+        ranked = [
+            (category, sum(weight * centroid.get(token, 0.0) for token, weight in query.items()))
+            for category, centroid in self.centroids.items()
+        ]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
+
+    def classify(self, transcription: str) -> Tuple[Optional[str], float, bool]:
+        """
+        Best category for a transcription.
+
+        Returns (category, similarity, confident). category is None when no
+        category shares a term with the transcription.
+        """
+        ranked = self.scores(transcription)
+        if not ranked or ranked[0][1] <= 0:
+            return None, 0.0, False
+        best, similarity = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        confident = (
+            similarity >= settings.category_fast_path_min_similarity
+            and similarity - runner_up >= settings.category_fast_path_min_margin
+            and self.example_counts[best] >= settings.category_fast_path_min_examples
+        )
+        return best, similarity, confident
+
+    def result(self, category: str) -> dict:
+        """A detect_or_create_category result for a fast-path answer."""
+        return {
+            "category": category,
+            "is_new": False,
+            "display_name": self.display_names.get(category) or category.replace("_", " ").title(),
+            "category_confidence": FAST_PATH_CONFIDENCE,
+            "suggested_new_category": None,
+            "source": "local",
+        }
+
+
+def category_names(pricing_knowledge: Optional[dict]) -> Dict[str, str]:
+    """category key -> display name from a pricing_knowledge dict."""
+    categories = (pricing_knowledge or {}).get("categories") or {}
+    return {
+        key: (data.get("display_name") if isinstance(data, dict) else None) or key.replace("_", " ").title()
+        for key, data in categories.items()
+    }
+
+
+class CategoryClassifierCache:
+    """Per-worker LRU of contractor classifiers, with fast-path statistics."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory
+        # contractor_id -> (classifier, category signature, built_at)
+        self._classifiers: "OrderedDict[str, Tuple[CategoryClassifier, frozenset, float]]" = OrderedDict()
+
+        # Since this process started
+        self.lookups = 0
+        self.hits = 0
+        self.fallbacks = 0
+        self.builds = 0
+        # Local prediction vs Claude, when both answered
+        self.compared = 0
+        self.agreed = 0
+        self.audited = 0
+        self.audit_agreed = 0
+
+    async def _load_examples(self, contractor_id: str, categories: Iterable[str]) -> List[Tuple[str, str]]:
+        session_factory = self._session_factory
+        if session_factory is None:
+            from .database import async_session_factory as session_factory
+
+        async with session_factory() as session:
+            result = await session.execute(
+                select(Quote.transcription, Quote.job_type)
+                .where(
+                    Quote.contractor_id == contractor_id,
+                    Quote.job_type.in_(list(categories)),
+                    Quote.transcription.isnot(None),
+                    or_(Quote.category_source.is_(None), Quote.category_source != "local"),
+                )
+                .order_by(Quote.created_at.desc())
+                .limit(settings.category_classifier_max_examples)
+            )
+            return [(transcription, job_type) for transcription, job_type in result.all()]
+
+    async def get(self, contractor_id: str, pricing_knowledge: Optional[dict]) -> Optional[CategoryClassifier]:
+        """The contractor's classifier, (re)built if stale or missing."""
+        categories = category_names(pricing_knowledge)
+        if not categories:
+            return None
+        signature = frozenset(categories.items())
+
+        entry = self._classifiers.get(contractor_id)
+        if entry is not None:
+            classifier, cached_signature, built_at = entry
+            if cached_signature == signature and time.monotonic() - built_at < settings.category_classifier_ttl_seconds:
+                self._classifiers.move_to_end(contractor_id)
+                return classifier
+
+        examples = await self._load_examples(contractor_id, categories)
+        classifier = CategoryClassifier(categories, examples)
+        self._classifiers[contractor_id] = (classifier, signature, time.monotonic())
+        self._classifiers.move_to_end(contractor_id)
+        while len(self._classifiers) > MAX_CLASSIFIED_CONTRACTORS:
+            self._classifiers.popitem(last=False)
+        self.builds += 1
+        return classifier
+
+    def invalidate(self, contractor_id: str) -> None:
+        self._classifiers.pop(contractor_id, None)
+
+    def record_hit(self) -> None:
+        self.lookups += 1
+        self.hits += 1
+
+    def record_fallback(self, predicted: Optional[str], llm_category: Optional[str]) -> None:
+        """A lookup that went to Claude; compares our guess if we had one."""
+        self.lookups += 1
+        self.fallbacks += 1
+        if predicted is not None and llm_category is not None:
+            self.compared += 1
+            self.agreed += predicted == llm_category
+
+    def record_audit(self, predicted: str, llm_category: str) -> None:
+        """Claude's answer for a transcription the fast path already answered."""
+        self.audited += 1
+        self.audit_agreed += predicted == llm_category
+        if predicted != llm_category:
+            logger.info(f"Category fast path disagreed with Claude: {predicted} vs {llm_category}")
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "lookups": self.lookups,
+            "fast_path_hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            # How often the local guess matched Claude on low-confidence lookups
+            "fallback_agreement": round(self.agreed / self.compared, 3) if self.compared else None,
+            # How often sampled fast-path answers matched Claude (its precision)
+            "audited": self.audited,
+            "audit_agreement": round(self.audit_agreed / self.audited, 3) if self.audited else None,
+            "contractors_cached": len(self._classifiers),
+            "builds": self.builds,
+        }
+
+
+# Singleton (one per uvicorn worker)
+_classifier_cache: Optional[CategoryClassifierCache] = None
+
+
+def get_category_classifier_cache() -> CategoryClassifierCache:
+    """Get this process's category classifier cache."""
+    global _classifier_cache
+    if _classifier_cache is None:
+        _classifier_cache = CategoryClassifierCache()
+    return _classifier_cache
@@ -0,0 +1,133 @@
+"""
+Shared async Claude client for Quoted.
+
+Every service that talks to Claude (quote generation, category detection,
+learning, onboarding, Pricing Brain, voice commands, support) used to build
+its own synchronous anthropic.Anthropic client and call messages.create()
+from inside async handlers. Each round trip blocked the uvicorn event loop
+for several seconds, so one worker could only serve one generation at a time.
+
+This module owns a single AsyncAnthropic client per worker process, backed
+by a pooled httpx.AsyncClient, so many Claude calls can be in flight at once
+and TLS connections are reused between requests.
+
+It also keeps per-worker prompt cache usage (PromptCacheStats) for the
+calls that send cache_control breakpoints.
+"""
+
+from typing import Any, Dict, Optional
+
+import anthropic
+import httpx
+
+from ..config import settings
+from .logging import get_logger
+
+logger = get_logger("quoted.claude_client")
+
+# Global client (initialized lazily, one per worker process)
+_async_client: Optional[anthropic.AsyncAnthropic] = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the pooled HTTP transport shared by all Claude calls."""
+    return anthropic.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.claude_max_connections,
+            max_keepalive_connections=settings.claude_max_keepalive_connections,
+            keepalive_expiry=30.0,
+        ),
+        timeout=httpx.Timeout(settings.claude_timeout_seconds, connect=10.0),
+    )
+
+
+def get_async_claude_client() -> anthropic.AsyncAnthropic:
+    """
+    Get the shared AsyncAnthropic client.
+
+    All services should use this instead of constructing their own client,
+    so that connection pooling is shared across the whole worker.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=_build_http_client(),
+            max_retries=settings.claude_max_retries,
+        )
+        logger.info(
+            f"Async Claude client initialized "
+            f"(max_connections={settings.claude_max_connections})"
+        )
+    return _async_client
+
+
+async def close_async_claude_client() -> None:
+    """Close the shared client and release pooled connections (app shutdown)."""
+    global _async_client
+    if _async_client is None:
+        return
+    try:
+        await _async_client.close()
+    except Exception as e:
+        logger.warning(f"Error closing async Claude client: {e}")
+    finally:
+        _async_client = None
+
+
+# =============================================================================
+# Prompt Cache Usage
+# =============================================================================
+
+class PromptCacheStats:
+    """
+    Per-worker prompt cache usage, read from each response's usage block.
+
+    input_tokens in a response only counts tokens after the last cache
+    breakpoint, so a request's hit rate is
+    cache_read / (cache_read + cache_creation + input_tokens).
+    """
+
+    def __init__(self):
+        self._operations: Dict[str, Dict[str, int]] = {}
+
+    def record(self, operation: str, usage: Any) -> Optional[float]:
+        """Record one response's usage; returns its cache hit rate."""
+        if usage is None:
+            return None
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        uncached = getattr(usage, "input_tokens", None) or 0
+        total = read + written + uncached
+        if not total:
+            return None
+
+        stats = self._operations.setdefault(operation, {
+            "requests": 0, "hits": 0, "cache_read_tokens": 0,
+            "cache_write_tokens": 0, "uncached_tokens": 0,
+        })
+        stats["requests"] += 1
+        stats["hits"] += 1 if read else 0
+        stats["cache_read_tokens"] += read
+        stats["cache_write_tokens"] += written
+        stats["uncached_tokens"] += uncached
+
+        hit_rate = read / total
+        logger.info(
+            f"Prompt cache [{operation}]: {read} read, {written} written, "
+            f"{uncached} uncached ({hit_rate:.0%} of input from cache)"
+        )
+        return hit_rate
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for operation, stats in self._operations.items():
+            total = stats["cache_read_tokens"] + stats["cache_write_tokens"] + stats["uncached_tokens"]
+            result[operation] = {
+                **stats,
+                "token_hit_rate": round(stats["cache_read_tokens"] / total, 3) if total else 0.0,
+            }
+        return result
+
+
+prompt_cache_stats = PromptCacheStats()
@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple, Literal
 
+from .learning_dedup import StatementIndex, statement_text
+
 
 @dataclass
 class TransferablePattern:
@@ -286,7 +288,7 @@ class ContractorDNAService:
         self,
         contractor_dna: Dict[str, Any],
         category: str,
-        new_learnings: List[str],
+        new_learnings: List[Any],
         category_confidence: float,
         category_quote_count: int,
     ) -> Dict[str, Any]:
@@ -296,7 +298,8 @@ class ContractorDNAService:
         Args:
             contractor_dna: Current DNA profile
             category: Category where correction happened
-            new_learnings: New learning statements from correction
+            new_learnings: New learning statements from correction (plain
+                strings or learned_adjustments dicts with "text")
             category_confidence: Current confidence in category
             category_quote_count: Number of quotes in category
 
@@ -306,8 +309,17 @@ class ContractorDNAService:
         if contractor_dna is None:
             contractor_dna = self._empty_dna("")
 
+        # Existing patterns, indexed once for the near-duplicate checks in _merge_pattern
+        indexes = {
+            list_key: StatementIndex.from_statements(contractor_dna.get(list_key, []))
+            for list_key in ("universal_patterns", "partial_patterns")
+        }
+
         # Extract transferable patterns from new learnings
         for learning in new_learnings:
+            learning = statement_text(learning)
+            if not learning:
+                continue
             pattern_type, transferability = self._classify_pattern(learning)
 
             if transferability in ["universal", "partial"]:
@@ -326,7 +338,7 @@ class ContractorDNAService:
                 }
 
                 # Merge with existing (avoid duplicates)
-                contractor_dna = self._merge_pattern(contractor_dna, pattern, category)
+                contractor_dna = self._merge_pattern(contractor_dna, pattern, category, indexes)
 
         # Update metadata
         contractor_dna["total_corrections"] = contractor_dna.get("total_corrections", 0) + 1
@@ -447,8 +459,16 @@ class ContractorDNAService:
         dna: Dict[str, Any],
         new_pattern: Dict[str, Any],
         source_category: str,
+        indexes: Optional[Dict[str, StatementIndex]] = None,
     ) -> Dict[str, Any]:
-        """Merge new pattern into existing DNA, avoiding duplicates."""
+        """
+        Merge new pattern into existing DNA, avoiding duplicates.
+
+        A pattern of the same type whose statement is a near-duplicate
+        (learning_dedup) is revalidated instead of added again. indexes are
+        StatementIndex per pattern list, kept in step with the lists; callers
+        merging several patterns pass them so the lists are indexed once.
+        """
         transferability = new_pattern.get("transferability", "partial")
 
         if transferability == "universal":
@@ -458,18 +478,22 @@ class ContractorDNAService:
             target_list = dna.get("partial_patterns", [])
             list_key = "partial_patterns"
 
+        index = (indexes or {}).get(list_key)
+        if index is None:
+            index = StatementIndex.from_statements(target_list)
+
         # Check for duplicates
-        is_duplicate = False
-        for existing in target_list:
-            if (existing.get("statement") == new_pattern.get("statement") and
-                    existing.get("pattern_type") == new_pattern.get("pattern_type")):
-                # Update existing pattern
-                existing["last_validated_at"] = new_pattern.get("last_validated_at")
-                is_duplicate = True
-                break
-
-        if not is_duplicate:
+        statement = new_pattern.get("statement", "")
+        match = index.find(
+            statement,
+            where=lambda position: target_list[position].get("pattern_type") == new_pattern.get("pattern_type"),
+        )
+        if match is not None:
+            # Update existing pattern
+            target_list[match]["last_validated_at"] = new_pattern.get("last_validated_at")
+        else:
             target_list.append(new_pattern)
+            index.add(statement)
 
         dna[list_key] = target_list
 
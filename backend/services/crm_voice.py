@@ -17,9 +17,8 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 from pydantic import BaseModel, Field
 
-import anthropic
-
 from ..config import settings
+from .claude_client import get_async_claude_client
 from .customer_service import CustomerService
 
 
@@ -96,7 +95,7 @@ class CrmVoiceService:
     ]
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_async_claude_client()
         self.model = "claude-sonnet-4-20250514"  # Fast model for intent detection
 
     def is_likely_crm_command(self, text: str) -> bool:
@@ -148,7 +147,7 @@ Voice input: "{transcription}"
 Determine the intent and extract relevant parameters."""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=500,
                 tools=[CRM_INTENT_TOOL],
@@ -0,0 +1,315 @@
+"""
+Candidate index for fuzzy customer matching (DISC-126).
+
+find_customer_matches used to load every Customer row for the contractor and
+run pure-Python Levenshtein against each one, on every /api/customers/match,
+check-customer-match and quote link. For contractors with thousands of
+customers that was tens to hundreds of milliseconds per call.
+
+This module keeps a per-contractor, per-worker in-memory index over the
+fields matching looks at:
+- normalized phone, and its last 7 digits
+- exact normalized name
+- phonetic key (Soundex per name token)
+- trigram postings on normalized_name
+- normalized address (so scoring doesn't re-run the abbreviation regexes)
+
+A lookup returns a short candidate list; only those are scored with the
+existing Levenshtein-based logic. Trigram candidates go through two lower
+bounds on edit distance - the q-gram lemma (each edit destroys at most 3
+trigrams) and the character-bag distance (each edit changes the letter
+counts by at most 2) - so the filter is lossless: any name that could reach
+the 70% similarity floor is still scored.
+
+Freshness: every call runs one cheap aggregate (count, max updated_at) for
+the contractor. New or edited rows are pulled incrementally by updated_at;
+if the count still disagrees (deletes), the index is rebuilt.
+"""
+
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Set, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.database import Customer
+from .logging import get_logger
+
+logger = get_logger("quoted.customer_match_index")
+
+# Names below this similarity never score (mirrors find_customer_matches)
+MIN_NAME_SIMILARITY = 0.70
+
+# Safety cap on fuzzy (trigram) candidates scored per lookup. The distance
+# bounds normally leave far fewer; this only guards pathological inputs.
+MAX_FUZZY_CANDIDATES = 500
+
+# Contractors whose index is kept in memory per worker
+MAX_INDEXED_CONTRACTORS = 256
+
+# Re-read rows updated this close to the last refresh, to cover writes that
+# flushed before our refresh but committed after it
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def soundex(token: str) -> str:
+    """Classic 4-character Soundex code for one word."""
+    letters = re.sub(r"[^a-z]", "", token.lower())
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def phonetic_key(normalized_name: str) -> str:
+    """Phonetic key for a whole normalized name ("jon smyth" -> "J500 S530")."""
+    return " ".join(filter(None, (soundex(t) for t in normalized_name.split())))
+
+
+def trigrams(normalized_name: str) -> Set[str]:
+    """Padded character trigrams of a normalized name."""
+    padded = f"  {normalized_name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class IndexedCustomer:
+    """The subset of a Customer row that matching needs."""
+    id: str
+    name: str
+    normalized_name: str
+    normalized_phone: str
+    address: Optional[str]
+    normalized_address: str
+    trigram_set: frozenset
+    char_counts: Dict[str, int]
+
+
+class CustomerMatchIndex:
+    """In-memory candidate index for one contractor's customers."""
+
+    def __init__(self, normalize_address=None):
+        # Injected to avoid a circular import with CustomerService
+        self._normalize_address = normalize_address or (lambda a: a.lower() if a else "")
+        self.customers: Dict[str, IndexedCustomer] = {}
+        self._by_phone: Dict[str, Set[str]] = {}
+        self._by_phone7: Dict[str, Set[str]] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_phonetic: Dict[str, Set[str]] = {}
+        self._by_trigram: Dict[str, Set[str]] = {}
+
+        # Freshness signature
+        self.row_count = 0
+        self.max_updated_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self.customers)
+
+    @staticmethod
+    def _post(postings: Dict[str, Set[str]], key: str, customer_id: str) -> None:
+        if key:
+            postings.setdefault(key, set()).add(customer_id)
+
+    @staticmethod
+    def _unpost(postings: Dict[str, Set[str]], key: str, customer_id: str) -> None:
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(customer_id)
+            if not ids:
+                del postings[key]
+
+    def _postings_for(self, entry: IndexedCustomer):
+        yield self._by_phone, entry.normalized_phone
+        yield self._by_phone7, entry.normalized_phone[-7:]
+        yield self._by_name, entry.normalized_name
+        yield self._by_phonetic, phonetic_key(entry.normalized_name)
+        for gram in entry.trigram_set:
+            yield self._by_trigram, gram
+
+    def upsert(
+        self,
+        customer_id: str,
+        name: str,
+        normalized_name: Optional[str],
+        normalized_phone: Optional[str],
+        address: Optional[str],
+    ) -> None:
+        """Add or replace one customer in the index."""
+        self.remove(customer_id)
+        normalized_name = normalized_name or ""
+        entry = IndexedCustomer(
+            id=customer_id,
+            name=name,
+            normalized_name=normalized_name,
+            normalized_phone=normalized_phone or "",
+            address=address,
+            normalized_address=self._normalize_address(address) if address else "",
+            trigram_set=frozenset(trigrams(normalized_name)) if normalized_name else frozenset(),
+            char_counts=Counter(normalized_name),
+        )
+        self.customers[customer_id] = entry
+        for postings, key in self._postings_for(entry):
+            self._post(postings, key, customer_id)
+
+    def remove(self, customer_id: str) -> None:
+        entry = self.customers.pop(customer_id, None)
+        if entry is None:
+            return
+        for postings, key in self._postings_for(entry):
+            self._unpost(postings, key, customer_id)
+
+    def candidates(
+        self,
+        normalized_name: Optional[str] = None,
+        normalized_phone: Optional[str] = None,
+    ) -> List[IndexedCustomer]:
+        """
+        Customers that could score >= the match floor for these inputs.
+
+        Phone (exact or last 7 digits) and exact/phonetic name candidates are
+        always included; trigram candidates must pass the length, q-gram and
+        character-bag edit distance bounds.
+        """
+        ids: Set[str] = set()
+
+        if normalized_phone:
+            ids |= self._by_phone.get(normalized_phone, set())
+            ids |= self._by_phone7.get(normalized_phone[-7:], set())
+
+        if normalized_name:
+            ids |= self._by_name.get(normalized_name, set())
+            ids |= self._by_phonetic.get(phonetic_key(normalized_name), set())
+
+            query_grams = trigrams(normalized_name)
+            overlap: Counter = Counter()
+            for gram in query_grams:
+                overlap.update(self._by_trigram.get(gram, ()))
+
+            query_len = len(normalized_name)
+            query_chars = Counter(normalized_name)
+            fuzzy: List[Tuple[int, str]] = []
+            for customer_id, shared in overlap.items():
+                if customer_id in ids:
+                    continue
+                entry = self.customers[customer_id]
+                candidate_len = len(entry.normalized_name)
+                max_len = max(query_len, candidate_len)
+                max_edits = int(max_len * (1 - MIN_NAME_SIMILARITY))
+                if abs(query_len - candidate_len) > max_edits:
+                    continue
+                # q-gram lemma: shared trigrams >= grams - 3 * edits
+                if shared < max(1, min(len(query_grams), max_len + 1) - 3 * max_edits):
+                    continue
+                # Character bag: edits >= (letters that differ) / 2
+                bag_distance = sum(
+                    abs(count - entry.char_counts.get(char, 0))
+                    for char, count in query_chars.items()
+                ) + sum(
+                    count for char, count in entry.char_counts.items()
+                    if char not in query_chars
+                )
+                if bag_distance > 2 * max_edits:
+                    continue
+                fuzzy.append((shared, customer_id))
+
+            fuzzy.sort(reverse=True)
+            ids.update(customer_id for _, customer_id in fuzzy[:MAX_FUZZY_CANDIDATES])
+
+        return [self.customers[customer_id] for customer_id in ids]
+
+    @staticmethod
+    def _row_query(contractor_id: str):
+        return select(
+            Customer.id,
+            Customer.name,
+            Customer.normalized_name,
+            Customer.normalized_phone,
+            Customer.address,
+        ).where(Customer.contractor_id == contractor_id)
+
+    async def refresh(self, db: AsyncSession, contractor_id: str) -> None:
+        """Bring the index up to date with the database (cheap when unchanged)."""
+        result = await db.execute(
+            select(func.count(Customer.id), func.max(Customer.updated_at))
+            .where(Customer.contractor_id == contractor_id)
+        )
+        row_count, max_updated_at = result.one()
+
+        if row_count == self.row_count and max_updated_at == self.max_updated_at:
+            return
+
+        rebuilt = False
+        if self.max_updated_at is not None and row_count >= len(self.customers):
+            # Pull only rows touched since the last refresh
+            query = self._row_query(contractor_id).where(
+                Customer.updated_at >= self.max_updated_at - REFRESH_OVERLAP
+            )
+        else:
+            query = self._row_query(contractor_id)
+            self._reset()
+            rebuilt = True
+
+        for row in (await db.execute(query)).all():
+            self.upsert(row.id, row.name, row.normalized_name, row.normalized_phone, row.address)
+
+        if len(self.customers) != row_count and not rebuilt:
+            # Rows were deleted (or a write slipped past the overlap): rebuild
+            self._reset()
+            for row in (await db.execute(self._row_query(contractor_id))).all():
+                self.upsert(row.id, row.name, row.normalized_name, row.normalized_phone, row.address)
+
+        self.row_count = row_count
+        self.max_updated_at = max_updated_at
+
+    def _reset(self) -> None:
+        normalize_address = self._normalize_address
+        self.__init__(normalize_address)
+
+
+# Per-worker LRU of contractor indexes
+_indexes: "OrderedDict[str, CustomerMatchIndex]" = OrderedDict()
+
+
+async def get_customer_match_index(
+    db: AsyncSession,
+    contractor_id: str,
+    normalize_address=None,
+) -> CustomerMatchIndex:
+    """Get the (refreshed) candidate index for a contractor."""
+    index = _indexes.get(contractor_id)
+    if index is None:
+        index = CustomerMatchIndex(normalize_address)
+        _indexes[contractor_id] = index
+        while len(_indexes) > MAX_INDEXED_CONTRACTORS:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(contractor_id)
+
+    await index.refresh(db, contractor_id)
+    return index
+
+
+def invalidate_customer_match_index(contractor_id: str) -> None:
+    """Drop a contractor's index (e.g. after bulk changes)."""
+    _indexes.pop(contractor_id, None)
@@ -13,6 +13,7 @@ from sqlalchemy import select, func, or_, and_
 from sqlalchemy.orm import selectinload
 
 from ..models.database import Customer, Quote, Contractor
+from .customer_match_index import IndexedCustomer, get_customer_match_index
 
 
 class CustomerService:
@@ -932,6 +933,44 @@ class CustomerService:
             previous_row = current_row
         return previous_row[-1]
 
+    @staticmethod
+    def _bounded_levenshtein(s1: str, s2: str, max_distance: int) -> int:
+        """
+        Levenshtein distance, giving up once it must exceed max_distance.
+
+        Returns the exact distance if <= max_distance, else max_distance + 1.
+        Only cells within max_distance of the diagonal can stay under the
+        bound, and a row whose minimum already exceeds it ends the search.
+        """
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+        if len(s1) - len(s2) > max_distance:
+            return max_distance + 1
+        if not s2:
+            return len(s1)
+
+        over = max_distance + 1
+        previous_row = list(range(len(s2) + 1))
+        for i, c1 in enumerate(s1):
+            lo = max(0, i - max_distance)
+            hi = min(len(s2), i + max_distance + 1)
+            current_row = [over] * (len(s2) + 1)
+            current_row[0] = i + 1 if lo == 0 else over
+            row_min = current_row[0]
+            for j in range(lo, hi):
+                value = min(
+                    previous_row[j + 1] + 1,
+                    current_row[j] + 1,
+                    previous_row[j] + (c1 != s2[j]),
+                )
+                current_row[j + 1] = value
+                if value < row_min:
+                    row_min = value
+            if row_min > max_distance:
+                return over
+            previous_row = current_row
+        return min(previous_row[-1], over)
+
     @staticmethod
     def _name_similarity(name1: str, name2: str) -> float:
         """
@@ -995,8 +1034,14 @@ class CustomerService:
         """
         if not addr1 or not addr2:
             return 0.0
-        n1 = CustomerService._normalize_address(addr1)
-        n2 = CustomerService._normalize_address(addr2)
+        return CustomerService._normalized_similarity(
+            CustomerService._normalize_address(addr1),
+            CustomerService._normalize_address(addr2),
+        )
+
+    @staticmethod
+    def _normalized_similarity(n1: str, n2: str) -> float:
+        """Levenshtein similarity (0.0 to 1.0) of two already-normalized strings."""
         if n1 == n2:
             return 1.0
         if not n1 or not n2:
@@ -1007,6 +1052,74 @@ class CustomerService:
         max_len = max(len(n1), len(n2))
         return 1.0 - (distance / max_len)
 
+    @staticmethod
+    def _score_match(
+        normalized_name: Optional[str],
+        normalized_phone: Optional[str],
+        normalized_addr: Optional[str],
+        candidate: IndexedCustomer,
+    ) -> Tuple[float, List[str]]:
+        """
+        Score one candidate customer against the match inputs.
+
+        Returns (confidence, match_reasons).
+        """
+        confidence = 0.0
+        match_reasons = []
+
+        # Phone match (highest priority - nearly unique identifier)
+        if normalized_phone and candidate.normalized_phone:
+            if normalized_phone == candidate.normalized_phone:
+                confidence = 0.98  # Near-certain match
+                match_reasons.append("phone_exact")
+            elif normalized_phone[-7:] == candidate.normalized_phone[-7:]:
+                # Last 7 digits match (handles area code differences)
+                confidence = max(confidence, 0.85)
+                match_reasons.append("phone_partial")
+
+        # Name match
+        if normalized_name and candidate.normalized_name:
+            if normalized_name == candidate.normalized_name:
+                # Exact normalized name
+                name_conf = 0.90
+                match_reasons.append("name_exact")
+            else:
+                # Fuzzy name match (distances beyond the 70% floor don't score,
+                # so stop computing as soon as we're past it)
+                max_len = max(len(normalized_name), len(candidate.normalized_name))
+                max_edits = int(max_len * 0.30)
+                distance = CustomerService._bounded_levenshtein(
+                    normalized_name, candidate.normalized_name, max_edits
+                )
+                similarity = 1.0 - (distance / max_len)
+                if similarity >= 0.85:
+                    name_conf = similarity * 0.85  # Scale to 0.72 max
+                    match_reasons.append(f"name_similar_{similarity:.0%}")
+                elif similarity >= 0.70:
+                    name_conf = similarity * 0.70  # Scale to 0.49 max
+                    match_reasons.append(f"name_fuzzy_{similarity:.0%}")
+                else:
+                    name_conf = 0.0
+
+            # Combine with phone confidence
+            if confidence > 0:
+                confidence = min(0.99, confidence + name_conf * 0.1)  # Boost if both match
+            else:
+                confidence = name_conf
+
+        # Address boost (secondary signal - doesn't create match alone, so
+        # it's only worth computing when name or phone already matched)
+        if confidence > 0 and normalized_addr and candidate.normalized_address:
+            addr_similarity = CustomerService._normalized_similarity(
+                normalized_addr, candidate.normalized_address
+            )
+            if addr_similarity >= 0.80:
+                # Boost confidence by up to 10% for address match
+                confidence = min(0.99, confidence + addr_similarity * 0.10)
+                match_reasons.append(f"address_match_{addr_similarity:.0%}")
+
+        return confidence, match_reasons
+
     @staticmethod
     async def find_customer_matches(
         db: AsyncSession,
@@ -1050,76 +1163,51 @@ class CustomerService:
         normalized_phone = CustomerService.normalize_phone(phone) if phone else None
         normalized_addr = CustomerService._normalize_address(address) if address else None
 
-        # Get all customers for this contractor
-        result = await db.execute(
-            select(Customer).where(Customer.contractor_id == contractor_id)
+        # Score only the indexed candidates instead of every customer row
+        index = await get_customer_match_index(
+            db, contractor_id, normalize_address=CustomerService._normalize_address
         )
-        all_customers = result.scalars().all()
-
-        for customer in all_customers:
-            confidence = 0.0
-            match_reasons = []
-
-            # Phone match (highest priority - nearly unique identifier)
-            if normalized_phone and customer.normalized_phone:
-                if normalized_phone == customer.normalized_phone:
-                    confidence = 0.98  # Near-certain match
-                    match_reasons.append("phone_exact")
-                elif normalized_phone[-7:] == customer.normalized_phone[-7:]:
-                    # Last 7 digits match (handles area code differences)
-                    confidence = max(confidence, 0.85)
-                    match_reasons.append("phone_partial")
-
-            # Name match
-            if normalized_name and customer.normalized_name:
-                if normalized_name == customer.normalized_name:
-                    # Exact normalized name
-                    name_conf = 0.90
-                    match_reasons.append("name_exact")
-                else:
-                    # Fuzzy name match
-                    similarity = CustomerService._name_similarity(name, customer.name)
-                    if similarity >= 0.85:
-                        name_conf = similarity * 0.85  # Scale to 0.72 max
-                        match_reasons.append(f"name_similar_{similarity:.0%}")
-                    elif similarity >= 0.70:
-                        name_conf = similarity * 0.70  # Scale to 0.49 max
-                        match_reasons.append(f"name_fuzzy_{similarity:.0%}")
-                    else:
-                        name_conf = 0.0
-
-                # Combine with phone confidence
-                if confidence > 0:
-                    confidence = min(0.99, confidence + name_conf * 0.1)  # Boost if both match
-                else:
-                    confidence = name_conf
-
-            # Address boost (secondary signal - doesn't create match alone)
-            if normalized_addr and customer.address:
-                addr_similarity = CustomerService._address_similarity(address, customer.address)
-                if addr_similarity >= 0.80:
-                    # Boost confidence by up to 10% for address match
-                    confidence = min(0.99, confidence + addr_similarity * 0.10)
-                    match_reasons.append(f"address_match_{addr_similarity:.0%}")
+        candidates = index.candidates(normalized_name, normalized_phone)
 
+        scored = []
+        for candidate in candidates:
+            confidence, match_reasons = CustomerService._score_match(
+                normalized_name=normalized_name,
+                normalized_phone=normalized_phone,
+                normalized_addr=normalized_addr,
+                candidate=candidate,
+            )
             # Only include if there's meaningful confidence
             if confidence >= 0.40:
-                matches.append({
-                    "customer_id": customer.id,
-                    "name": customer.name,
-                    "phone": customer.phone,
-                    "email": customer.email,
-                    "address": customer.address,
-                    "confidence": round(confidence, 3),
-                    "match_reasons": match_reasons,
-                    "quote_count": customer.quote_count or 0,
-                    "total_quoted": float(customer.total_quoted or 0),
-                    "last_quote_at": customer.last_quote_at.isoformat() if customer.last_quote_at else None
-                })
+                scored.append((confidence, match_reasons, candidate.id))
 
-        # Sort by confidence descending
-        matches.sort(key=lambda x: x["confidence"], reverse=True)
-        matches = matches[:limit]
+        scored.sort(key=lambda x: x[0], reverse=True)
+        scored = scored[:limit]
+
+        # Load full rows (stats, email) only for the matches we return
+        customers_by_id = {}
+        if scored:
+            result = await db.execute(
+                select(Customer).where(Customer.id.in_([customer_id for _, _, customer_id in scored]))
+            )
+            customers_by_id = {c.id: c for c in result.scalars().all()}
+
+        for confidence, match_reasons, customer_id in scored:
+            customer = customers_by_id.get(customer_id)
+            if customer is None:
+                continue  # Deleted since the index was refreshed
+            matches.append({
+                "customer_id": customer.id,
+                "name": customer.name,
+                "phone": customer.phone,
+                "email": customer.email,
+                "address": customer.address,
+                "confidence": round(confidence, 3),
+                "match_reasons": match_reasons,
+                "quote_count": customer.quote_count or 0,
+                "total_quoted": float(customer.total_quoted or 0),
+                "last_quote_at": customer.last_quote_at.isoformat() if customer.last_quote_at else None
+            })
 
         # Determine recommendation
         if matches and matches[0]["confidence"] >= 0.95:
@@ -6,13 +6,19 @@ This is the single source of truth for data persistence.
 All API endpoints should use these functions instead of in-memory storage.
 """
 
+import copy
+import functools
 import json
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable
 from datetime import datetime
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, attributes
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
 
 from ..config import settings
 from ..models.database import (
@@ -20,8 +26,15 @@ from ..models.database import (
     Quote, JobType, SetupConversation, UserIssue, QuoteFeedback
 )
 from .analytics import analytics_service
+from .cache import cache_service
 from .contractor_dna import get_dna_service
 from .learning_quality import LearningQualityScorer, QualityTier
+from . import learning_dedup
+from .quote_total_index import apply_quote_total_change
+from .outbox import enqueue_task, notify_outbox
+from . import pricing_store
+from .prompt_fragments import get_prompt_fragment_cache
+from .quote_stats import QuoteCounts, apply_quote_stats_change, get_quote_stats, quote_stats_entry
 
 
 # Create async engine and session factory
@@ -36,6 +49,9 @@ engine = create_async_engine(
 )
 async_session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Quote fields that feed get_correction_examples (and so the quote context snapshot)
+CORRECTION_FIELDS = {"was_edited", "edit_details", "line_items", "job_type", "total", "ai_generated_total"}
+
 
 async def get_session() -> AsyncSession:
     """Get a new database session."""
@@ -43,6 +59,42 @@ async def get_session() -> AsyncSession:
         yield session
 
 
+@dataclass
+class _UnitOfWork:
+    """Ambient session shared by DatabaseService calls in one unit of work."""
+    session: AsyncSession
+    after_commit: List[Callable[[], Awaitable[None]]] = field(default_factory=list)
+
+
+_current_unit_of_work: ContextVar[Optional[_UnitOfWork]] = ContextVar(
+    "quoted_unit_of_work", default=None
+)
+
+# Attempts for a pricing category write that lost an optimistic version check
+PRICING_WRITE_ATTEMPTS = 3
+
+
+def _retry_on_version_conflict(method):
+    """
+    Re-run a pricing category read-modify-write that hit StaleDataError.
+
+    Another request changed the same pricing_categories row between our
+    read and our UPDATE; running again reads its change instead of
+    overwriting it. Inside a unit of work the caller owns the transaction,
+    so the conflict is raised to it instead.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        for attempt in range(1, PRICING_WRITE_ATTEMPTS + 1):
+            try:
+                return await method(self, *args, **kwargs)
+            except StaleDataError:
+                if _current_unit_of_work.get() is not None or attempt == PRICING_WRITE_ATTEMPTS:
+                    raise
+                print(f"[PRICING] Version conflict in {method.__name__}, retrying ({attempt}/{PRICING_WRITE_ATTEMPTS})")
+    return wrapper
+
+
 class DatabaseService:
     """
     Unified database service for all Quoted models.
@@ -57,11 +109,106 @@ class DatabaseService:
         """Create a new session."""
         return async_session_factory()
 
+    # ============== UNIT OF WORK ==============
+
+    @asynccontextmanager
+    async def unit_of_work(self, session: Optional[AsyncSession] = None):
+        """
+        Run several DatabaseService calls on one session and one commit.
+
+        Without this, every method checks out its own pooled connection and
+        commits on its own, so a single request can churn the pool 10+ times.
+        Inside the block, methods reuse the ambient session (a contextvar, so
+        concurrent requests never share it), their commits become flushes,
+        and the block commits once on exit or rolls back on error.
+
+        Pass the request's get_db session to share that connection as well.
+        Cache invalidation and outbox wake-ups are deferred until the commit.
+        Don't hold a unit of work open across a Claude call: its transaction
+        keeps the connection checked out.
+
+            async with db.unit_of_work(auth_db):
+                quote = await db.create_quote(...)
+                await BillingService.increment_quote_usage(auth_db, ...)
+        """
+        current = _current_unit_of_work.get()
+        if current is not None:
+            # Nested: join the outer unit of work
+            yield current.session
+            return
+
+        owns_session = session is None
+        if owns_session:
+            session = async_session_factory()
+        unit = _UnitOfWork(session=session)
+        token = _current_unit_of_work.set(unit)
+        try:
+            yield session
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            _current_unit_of_work.reset(token)
+            if owns_session:
+                await session.close()
+
+        for callback in unit.after_commit:
+            try:
+                await callback()
+            except Exception as e:
+                print(f"Warning: post-commit callback failed: {e}")
+
+    @asynccontextmanager
+    async def _session(self):
+        """The ambient unit-of-work session, or a fresh one for this call."""
+        unit = _current_unit_of_work.get()
+        if unit is not None:
+            yield unit.session
+            return
+        async with async_session_factory() as session:
+            yield session
+
+    async def _commit(self, session: AsyncSession) -> None:
+        """Commit, or just flush when the unit of work owns the commit."""
+        unit = _current_unit_of_work.get()
+        if unit is not None and unit.session is session:
+            await session.flush()
+        else:
+            await session.commit()
+
+    def _after_commit(self, callback: Callable[[], Awaitable[None]]) -> bool:
+        """Defer callback to the unit of work's commit; False if there is none."""
+        unit = _current_unit_of_work.get()
+        if unit is None:
+            return False
+        unit.after_commit.append(callback)
+        return True
+
+    async def _invalidate_quote_context(self, contractor_id: str) -> None:
+        """
+        Drop the cached quote context snapshot (see services/quote_context.py).
+
+        Call after committing any write to inputs of quote generation:
+        contractor profile, pricing model, terms or correction examples.
+        Inside a unit of work this waits for its commit.
+
+        Also drops this worker's memoized prompt fragments for the contractor
+        (other workers move on when they read the rebuilt snapshot's version).
+        """
+        async def invalidate() -> None:
+            get_prompt_fragment_cache().invalidate(contractor_id)
+            await cache_service.invalidate_quote_context(contractor_id)
+
+        if self._after_commit(invalidate):
+            return
+        await invalidate()
+
     # ============== USER OPERATIONS ==============
 
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get a user by ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(User).where(User.id == user_id)
             )
@@ -69,7 +216,7 @@ class DatabaseService:
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get a user by email."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(User).where(User.email == email)
             )
@@ -89,7 +236,7 @@ class DatabaseService:
         services: Optional[List[str]] = None,
     ) -> Contractor:
         """Create a new contractor profile."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             contractor = Contractor(
                 user_id=user_id,
                 business_name=business_name,
@@ -101,13 +248,16 @@ class DatabaseService:
                 services=services or [],
             )
             session.add(contractor)
-            await session.commit()
+            await self._commit(session)
             await session.refresh(contractor)
-            return contractor
+        # Cached principals carry contractor_id (None until now)
+        if not self._after_commit(lambda: cache_service.invalidate_principals(user_id)):
+            await cache_service.invalidate_principals(user_id)
+        return contractor
 
     async def get_contractor_by_id(self, contractor_id: str) -> Optional[Contractor]:
         """Get a contractor by ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Contractor).where(Contractor.id == contractor_id)
             )
@@ -115,7 +265,7 @@ class DatabaseService:
 
     async def get_contractor_by_user_id(self, user_id: str) -> Optional[Contractor]:
         """Get a contractor by user ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Contractor).where(Contractor.user_id == user_id)
             )
@@ -127,7 +277,7 @@ class DatabaseService:
         **kwargs
     ) -> Optional[Contractor]:
         """Update a contractor."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Contractor).where(Contractor.id == contractor_id)
             )
@@ -136,14 +286,15 @@ class DatabaseService:
                 return None
 
             for key, value in kwargs.items():
-                # Allow setting logo_data to None (for deletion)
+                # Allow clearing the logo (deletion)
                 if hasattr(contractor, key):
-                    if key == 'logo_data' or value is not None:
+                    if key in ('logo_hash', 'logo_data') or value is not None:
                         setattr(contractor, key, value)
 
             contractor.updated_at = datetime.utcnow()
-            await session.commit()
+            await self._commit(session)
             await session.refresh(contractor)
+            await self._invalidate_quote_context(contractor_id)
             return contractor
 
     # ============== PRICING MODEL OPERATIONS ==============
@@ -160,39 +311,57 @@ class DatabaseService:
         pricing_philosophy: Optional[str] = None,
     ) -> PricingModel:
         """Create a new pricing model for a contractor."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             pricing_model = PricingModel(
                 contractor_id=contractor_id,
                 labor_rate_hourly=labor_rate_hourly,
                 helper_rate_hourly=helper_rate_hourly,
                 material_markup_percent=material_markup_percent,
                 minimum_job_amount=minimum_job_amount,
-                pricing_knowledge=pricing_knowledge or {},
+                pricing_knowledge={},
                 pricing_notes=pricing_notes,
                 pricing_philosophy=pricing_philosophy,
+                categories_normalized=True,
             )
             session.add(pricing_model)
-            await session.commit()
+            # Categories go to pricing_categories, the rest to the blob
+            await pricing_store.replace_knowledge(session, pricing_model, pricing_knowledge or {})
+            await self._commit(session)
             await session.refresh(pricing_model)
+            await pricing_store.attach_view(session, pricing_model)
+            await self._invalidate_quote_context(contractor_id)
             return pricing_model
 
     async def get_pricing_model(self, contractor_id: str) -> Optional[PricingModel]:
-        """Get a contractor's pricing model."""
-        async with async_session_factory() as session:
+        """
+        Get a contractor's pricing model.
+
+        pricing_knowledge is the compatibility view: the blob's global keys
+        plus "categories" composed from pricing_categories (pricing_store.py).
+        """
+        async with self._session() as session:
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
-            return result.scalar_one_or_none()
+            pricing_model = result.scalar_one_or_none()
+            if pricing_model:
+                await pricing_store.attach_view(session, pricing_model)
+            return pricing_model
 
     async def update_pricing_model(
         self,
         contractor_id: str,
         **kwargs
     ) -> Optional[PricingModel]:
-        """Update a pricing model."""
-        from sqlalchemy.orm import attributes
+        """
+        Update a pricing model.
 
-        async with async_session_factory() as session:
+        A pricing_knowledge dict replaces the whole document, as before:
+        its categories are diffed against pricing_categories (only changed
+        rows are written). Prefer update_category / delete_category for
+        single-category edits.
+        """
+        async with self._session() as session:
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
@@ -201,17 +370,78 @@ class DatabaseService:
                 return None
 
             for key, value in kwargs.items():
-                if hasattr(pricing_model, key) and value is not None:
+                if key == 'pricing_knowledge':
+                    if value is not None:
+                        await pricing_store.replace_knowledge(session, pricing_model, value)
+                elif hasattr(pricing_model, key) and value is not None:
                     setattr(pricing_model, key, value)
-                    # JSON columns need flag_modified for SQLAlchemy to detect changes
-                    if key == 'pricing_knowledge':
-                        attributes.flag_modified(pricing_model, 'pricing_knowledge')
 
             pricing_model.updated_at = datetime.utcnow()
-            await session.commit()
+            await self._commit(session)
             await session.refresh(pricing_model)
+            await pricing_store.attach_view(session, pricing_model)
+            await self._invalidate_quote_context(contractor_id)
             return pricing_model
 
+    @_retry_on_version_conflict
+    async def update_category(
+        self,
+        contractor_id: str,
+        category: str,
+        display_name: Optional[str] = None,
+        learned_adjustments: Optional[List[Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Edit one pricing category (Pricing Brain).
+
+        Writes only that category's row and changed statements.
+
+        Returns:
+            The category in the pricing_knowledge["categories"] shape, or
+            None if the contractor has no such category
+        """
+        async with self._session() as session:
+            result = await session.execute(
+                select(PricingModel).where(PricingModel.contractor_id == contractor_id)
+            )
+            pricing_model = result.scalar_one_or_none()
+            if not pricing_model:
+                return None
+
+            row, _ = await pricing_store.get_category(session, pricing_model, category)
+            if row is None:
+                return None
+
+            if display_name is not None:
+                row.display_name = display_name
+            if learned_adjustments is not None:
+                pricing_store.set_statements(row, learned_adjustments)
+
+            await self._commit(session)
+            await self._invalidate_quote_context(contractor_id)
+            return pricing_store.category_to_dict(row)
+
+    @_retry_on_version_conflict
+    async def delete_category(self, contractor_id: str, category: str) -> bool:
+        """Delete one pricing category and its learned adjustments; False if not found."""
+        async with self._session() as session:
+            result = await session.execute(
+                select(PricingModel).where(PricingModel.contractor_id == contractor_id)
+            )
+            pricing_model = result.scalar_one_or_none()
+            if not pricing_model:
+                return False
+
+            row, _ = await pricing_store.get_category(session, pricing_model, category)
+            if row is None:
+                return False
+
+            await session.delete(row)
+            await self._commit(session)
+            await self._invalidate_quote_context(contractor_id)
+            return True
+
+    @_retry_on_version_conflict
     async def apply_learnings_to_pricing_model(
         self,
         contractor_id: str,
@@ -222,15 +452,16 @@ class DatabaseService:
         Apply learnings from quote corrections to the pricing model.
         This is the core of the learning loop.
 
-        Learnings are stored per-category in:
-        pricing_knowledge["categories"][category]["learned_adjustments"]
+        Learnings are stored per-category as learning_statements rows of the
+        category's pricing_categories row (pricing_knowledge["categories"]
+        [category]["learned_adjustments"] in the compatibility view).
 
         Args:
             contractor_id: The contractor's ID
             learnings: Dict with pricing_adjustments, new_pricing_rules, overall_tendency
             category: The category (job_type) this correction applies to
         """
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
@@ -238,12 +469,9 @@ class DatabaseService:
             if not pricing_model:
                 return None
 
-            # Get current pricing knowledge
-            pricing_knowledge = pricing_model.pricing_knowledge or {}
-
-            # Ensure categories structure exists
-            if "categories" not in pricing_knowledge:
-                pricing_knowledge["categories"] = {}
+            # Global keys of the pricing knowledge (categories live in pricing_categories)
+            pricing_knowledge = pricing_store.global_knowledge(pricing_model)
+            original_knowledge = copy.deepcopy(pricing_knowledge)
 
             # Ensure global_rules exists
             if "global_rules" not in pricing_knowledge:
@@ -251,18 +479,11 @@ class DatabaseService:
 
             # If we have a category, store learnings there
             if category:
-                # Initialize category if it doesn't exist
-                if category not in pricing_knowledge["categories"]:
-                    pricing_knowledge["categories"][category] = {
-                        "display_name": category.replace("_", " ").title(),
-                        "tailored_prompt": None,  # Category-specific pricing understanding
-                        "learned_adjustments": [],  # Specific injection learnings
-                        "samples": 0,
-                        "confidence": 0.5,
-                        "correction_count": 0,
-                    }
-
-                cat_data = pricing_knowledge["categories"][category]
+                # Category row (created if it doesn't exist), edited as a dict
+                category_row, _ = await pricing_store.get_category(
+                    session, pricing_model, category, create=True
+                )
+                cat_data = pricing_store.category_to_dict(category_row)
 
                 # Ensure fields exist (for backward compatibility with old data)
                 if "learned_adjustments" not in cat_data:
@@ -336,42 +557,36 @@ class DatabaseService:
                         "outcome_boost": 0.0,
                     }
 
-                # Helper to check if text already exists in adjustments (handles both formats)
-                def text_in_adjustments(text: str, adjustments: list) -> bool:
-                    """Check if text already exists, handling both string and dict formats."""
-                    for adj in adjustments:
-                        if isinstance(adj, dict):
-                            if adj.get("text") == text:
-                                return True
-                        elif adj == text:
-                            return True
-                    return False
-
                 # LEGACY FORMAT: Fall back to append approach if no learning_statements
                 # This handles old format responses during transition
                 if not learning_added_this_correction:
+                    # Existing adjustments (both formats), indexed once for near-duplicate lookups
+                    existing_index = learning_dedup.StatementIndex.from_statements(cat_data["learned_adjustments"])
+
+                    def append_learning(text: str) -> bool:
+                        """Append a scored learning unless it repeats an existing one."""
+                        if existing_index.find(text) is not None:
+                            return False
+                        metadata = create_learning_metadata(text)
+                        if not metadata:
+                            return False
+                        cat_data["learned_adjustments"].append(metadata)
+                        existing_index.add(text)
+                        return True
+
                     for adjustment in learnings.get("pricing_adjustments", []):
                         learning = adjustment.get("learning", "")
-                        if learning and not text_in_adjustments(learning, cat_data["learned_adjustments"]):
-                            metadata = create_learning_metadata(learning)
-                            if metadata:
-                                cat_data["learned_adjustments"].append(metadata)
-                                learning_added_this_correction = True
+                        if learning and append_learning(learning):
+                            learning_added_this_correction = True
 
                     for rule in learnings.get("new_pricing_rules", []):
                         rule_text = rule.get("rule", "")
-                        if rule_text and not text_in_adjustments(rule_text, cat_data["learned_adjustments"]):
-                            metadata = create_learning_metadata(rule_text)
-                            if metadata:
-                                cat_data["learned_adjustments"].append(metadata)
-                                learning_added_this_correction = True
+                        if rule_text and append_learning(rule_text):
+                            learning_added_this_correction = True
 
                     tendency = learnings.get("overall_tendency", "")
-                    if tendency and len(tendency) > 15 and not text_in_adjustments(tendency, cat_data["learned_adjustments"]):
-                        metadata = create_learning_metadata(tendency)
-                        if metadata:
-                            cat_data["learned_adjustments"].append(metadata)
-                            learning_added_this_correction = True
+                    if tendency and len(tendency) > 15 and append_learning(tendency):
+                        learning_added_this_correction = True
 
                 # MANDATORY FALLBACK: EVERY correction MUST produce at least one learning
                 # This ensures rules are never "0" after a correction
@@ -474,7 +689,8 @@ class DatabaseService:
                     except Exception as e:
                         print(f"Warning: Failed to track tailored_prompt update: {e}")
 
-                pricing_knowledge["categories"][category] = cat_data
+                # Writes only the changed columns and statements of this category
+                pricing_store.apply_category_dict(category_row, cat_data)
 
             else:
                 # No category specified - add rules to global_rules
@@ -547,13 +763,15 @@ class DatabaseService:
                 except Exception as e:
                     print(f"Warning: Failed to update contractor DNA: {e}")
 
-            # Update model - must flag_modified for SQLAlchemy to detect JSON mutation
-            pricing_model.pricing_knowledge = pricing_knowledge
+            # The blob is only rewritten when a global key (rules, DNA) changed
+            if pricing_knowledge != original_knowledge:
+                pricing_store.set_global_knowledge(pricing_model, pricing_knowledge)
             pricing_model.updated_at = datetime.utcnow()
-            attributes.flag_modified(pricing_model, 'pricing_knowledge')
 
-            await session.commit()
+            await self._commit(session)
             await session.refresh(pricing_model)
+            await pricing_store.attach_view(session, pricing_model)
+            await self._invalidate_quote_context(contractor_id)
             return pricing_model
 
     def _statements_similar(self, statement1: str, statement2: str, threshold: float = 0.6) -> bool:
@@ -562,6 +780,9 @@ class DatabaseService:
 
         Uses Jaccard similarity on word sets to detect near-duplicate statements.
         This is a simple but effective approach that doesn't require embeddings.
+        Statements stating different amounts or materials are never similar.
+        Word sets are memoized per statement (learning_dedup.py); to check one
+        statement against many, use learning_dedup.StatementIndex instead.
 
         Args:
             statement1: First statement
@@ -571,19 +792,7 @@ class DatabaseService:
         Returns:
             True if statements are similar (should be considered duplicates)
         """
-        # Normalize: lowercase, extract words only
-        words1 = set(word.lower() for word in statement1.split() if len(word) > 2)
-        words2 = set(word.lower() for word in statement2.split() if len(word) > 2)
-
-        if not words1 or not words2:
-            return False
-
-        # Jaccard similarity: intersection / union
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-
-        similarity = intersection / union if union > 0 else 0
-        return similarity >= threshold
+        return learning_dedup.similar(statement1, statement2, threshold)
 
     async def ensure_category_exists(
         self,
@@ -604,7 +813,7 @@ class DatabaseService:
         Returns:
             True if category was newly created, False if it already existed
         """
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
@@ -613,60 +822,63 @@ class DatabaseService:
                 print(f"[SYNC DEBUG] No pricing model found for contractor {contractor_id}")
                 return False
 
-            # Get current pricing knowledge - MUST make a copy to ensure mutation is detected
-            pricing_knowledge = dict(pricing_model.pricing_knowledge) if pricing_model.pricing_knowledge else {}
-            print(f"[SYNC DEBUG] Current pricing_knowledge keys: {list(pricing_knowledge.keys())}")
-
-            # Ensure categories structure exists
-            if "categories" not in pricing_knowledge:
-                pricing_knowledge["categories"] = {}
-
-            # Check if category already exists
-            if category in pricing_knowledge["categories"]:
+            # New categories start with minimal structure
+            # (no learned_adjustments yet - that comes from quote edits)
+            _, created = await pricing_store.get_category(
+                session, pricing_model, category, create=True, display_name=display_name
+            )
+            # Also commits a first-write move of blob categories to rows
+            await self._commit(session)
+            if not created:
                 print(f"[SYNC DEBUG] Category '{category}' already exists")
                 return False
 
-            # Create the new category with minimal structure
-            # (no learned_adjustments yet - that comes from quote edits)
-            pricing_knowledge["categories"][category] = {
-                "display_name": display_name or category.replace("_", " ").title(),
-                "tailored_prompt": None,  # Category-specific pricing understanding
-                "learned_adjustments": [],  # Specific injection learnings
-                "samples": 0,  # Incremented on corrections (legacy)
-                "quote_count": 0,  # Incremented when quotes are created
-                "confidence": 0.5,
-                "correction_count": 0,  # DISC-035
-            }
-            print(f"[SYNC DEBUG] Adding category '{category}', total categories: {len(pricing_knowledge['categories'])}")
-
-            # Update model - assign new dict to ensure SQLAlchemy detects the change
-            pricing_model.pricing_knowledge = pricing_knowledge
-            pricing_model.updated_at = datetime.utcnow()
-            attributes.flag_modified(pricing_model, 'pricing_knowledge')
-
-            await session.commit()
             print(f"[SYNC DEBUG] Committed category '{category}'")
+            await self._invalidate_quote_context(contractor_id)
             return True
 
     async def increment_category_quote_count(
         self,
         contractor_id: str,
         category: str,
+        quote_id: Optional[str] = None,
     ) -> bool:
         """
         Increment the quote_count for a category when a quote is created.
 
         This provides accurate per-category quote tracking that persists
-        in the pricing_knowledge structure.
+        in the category's pricing_categories row: one atomic UPDATE, which
+        never conflicts with concurrent learning on the same category.
+
+        With a quote_id, each quote is counted once: the quote is marked
+        (category_counted_at) in the same transaction as the increment, and
+        a repeat call for an already marked quote changes nothing.
 
         Args:
             contractor_id: The contractor's ID
             category: The category name (snake_case)
+            quote_id: The quote being counted
 
         Returns:
-            True if successful, False if category or pricing model not found
+            True if successful (or already counted), False if category or
+            pricing model not found
         """
-        async with async_session_factory() as session:
+        async with self._session() as session:
+            if quote_id is not None:
+                claimed = await session.execute(
+                    update(Quote)
+                    .where(Quote.id == quote_id, Quote.category_counted_at.is_(None))
+                    .values(category_counted_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                if claimed.rowcount != 1:
+                    return True
+
+            if await pricing_store.increment(session, contractor_id, category, "quote_count"):
+                await self._commit(session)
+                return True
+
+            # No row yet: the contractor is still on the blob, or the category is new
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
@@ -674,38 +886,16 @@ class DatabaseService:
             if not pricing_model:
                 return False
 
-            pricing_knowledge = dict(pricing_model.pricing_knowledge) if pricing_model.pricing_knowledge else {}
-
-            # Ensure categories structure exists
-            if "categories" not in pricing_knowledge:
-                pricing_knowledge["categories"] = {}
-
-            # If category doesn't exist, create it first
-            if category not in pricing_knowledge["categories"]:
-                pricing_knowledge["categories"][category] = {
-                    "display_name": category.replace("_", " ").title(),
-                    "tailored_prompt": None,
-                    "learned_adjustments": [],
-                    "samples": 0,
-                    "quote_count": 0,
-                    "confidence": 0.5,
-                    "correction_count": 0,
-                }
-
-            # Increment quote_count (ensure field exists for existing categories)
-            cat_data = pricing_knowledge["categories"][category]
-            if "quote_count" not in cat_data:
-                cat_data["quote_count"] = 0
-            cat_data["quote_count"] += 1
+            await pricing_store.get_category(session, pricing_model, category, create=True)
+            await session.flush()
+            await pricing_store.increment(session, contractor_id, category, "quote_count")
 
-            pricing_knowledge["categories"][category] = cat_data
-            pricing_model.pricing_knowledge = pricing_knowledge
-            pricing_model.updated_at = datetime.utcnow()
-            attributes.flag_modified(pricing_model, 'pricing_knowledge')
-
-            await session.commit()
+            await self._commit(session)
+            # Quote context is deliberately NOT invalidated here: quote_count isn't
+            # used by the generation prompt, and this runs after every quote.
             return True
 
+    @_retry_on_version_conflict
     async def apply_acceptance_to_pricing_model(
         self,
         contractor_id: str,
@@ -734,7 +924,7 @@ class DatabaseService:
         MAX_CONFIDENCE = 0.95
         MIN_SIGNALS_FOR_CALIBRATION = 5
 
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
@@ -742,40 +932,20 @@ class DatabaseService:
             if not pricing_model:
                 return None
 
-            pricing_knowledge = dict(pricing_model.pricing_knowledge) if pricing_model.pricing_knowledge else {}
-
-            # Ensure categories structure exists
-            if "categories" not in pricing_knowledge:
-                pricing_knowledge["categories"] = {}
-
             # Initialize category if doesn't exist
-            if category not in pricing_knowledge["categories"]:
-                pricing_knowledge["categories"][category] = {
-                    "display_name": category.replace("_", " ").title(),
-                    "tailored_prompt": None,
-                    "learned_adjustments": [],
-                    "samples": 0,
-                    "quote_count": 0,
-                    "confidence": 0.5,
-                    "correction_count": 0,
-                    "acceptance_count": 0,
-                }
-
-            cat_data = pricing_knowledge["categories"][category]
+            category_row, _ = await pricing_store.get_category(
+                session, pricing_model, category, create=True
+            )
 
             # Store old confidence
-            old_confidence = cat_data.get("confidence", 0.5)
-
-            # Ensure acceptance_count exists (backward compatibility)
-            if "acceptance_count" not in cat_data:
-                cat_data["acceptance_count"] = 0
+            old_confidence = category_row.confidence if category_row.confidence is not None else 0.5
 
             # Apply confidence boost
             new_confidence = min(MAX_CONFIDENCE, old_confidence + ACCEPTANCE_CONFIDENCE_BOOST)
 
             # Apply calibration if enough signals
-            acceptance_count = cat_data["acceptance_count"] + 1
-            correction_count = cat_data.get("correction_count", 0)
+            acceptance_count = (category_row.acceptance_count or 0) + 1
+            correction_count = category_row.correction_count or 0
             total_signals = acceptance_count + correction_count
 
             if total_signals >= MIN_SIGNALS_FOR_CALIBRATION:
@@ -783,17 +953,13 @@ class DatabaseService:
                 confidence_ceiling = min(MAX_CONFIDENCE, actual_accuracy + 0.15)
                 new_confidence = min(new_confidence, confidence_ceiling)
 
-            # Update category data
-            cat_data["confidence"] = new_confidence
-            cat_data["acceptance_count"] = acceptance_count
-            cat_data["last_acceptance_at"] = datetime.utcnow().isoformat()
-
-            pricing_knowledge["categories"][category] = cat_data
-            pricing_model.pricing_knowledge = pricing_knowledge
-            pricing_model.updated_at = datetime.utcnow()
-            attributes.flag_modified(pricing_model, 'pricing_knowledge')
+            # Update category row (version-checked against concurrent signals)
+            category_row.confidence = new_confidence
+            category_row.acceptance_count = acceptance_count
+            category_row.extra = {**(category_row.extra or {}), "last_acceptance_at": datetime.utcnow().isoformat()}
 
-            await session.commit()
+            await self._commit(session)
+            await self._invalidate_quote_context(contractor_id)
 
             # Track analytics
             try:
@@ -823,6 +989,7 @@ class DatabaseService:
                 "acceptance_count": acceptance_count,
             }
 
+    @_retry_on_version_conflict
     async def apply_loss_to_pricing_model(
         self,
         contractor_id: str,
@@ -849,7 +1016,7 @@ class DatabaseService:
         LOSS_CONFIDENCE_PENALTY = 0.03
         MIN_CONFIDENCE = 0.20  # Don't drop below 20%
 
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(PricingModel).where(PricingModel.contractor_id == contractor_id)
             )
@@ -857,54 +1024,31 @@ class DatabaseService:
             if not pricing_model:
                 return None
 
-            pricing_knowledge = dict(pricing_model.pricing_knowledge) if pricing_model.pricing_knowledge else {}
-
-            # Ensure categories structure exists
-            if "categories" not in pricing_knowledge:
-                pricing_knowledge["categories"] = {}
-
             # Initialize category if doesn't exist
-            if category not in pricing_knowledge["categories"]:
-                pricing_knowledge["categories"][category] = {
-                    "display_name": category.replace("_", " ").title(),
-                    "tailored_prompt": None,
-                    "learned_adjustments": [],
-                    "samples": 0,
-                    "quote_count": 0,
-                    "confidence": 0.5,
-                    "correction_count": 0,
-                    "acceptance_count": 0,
-                    "loss_count": 0,
-                }
-
-            cat_data = pricing_knowledge["categories"][category]
+            category_row, _ = await pricing_store.get_category(
+                session, pricing_model, category, create=True
+            )
 
             # Store old confidence
-            old_confidence = cat_data.get("confidence", 0.5)
-
-            # Ensure loss_count exists (backward compatibility)
-            if "loss_count" not in cat_data:
-                cat_data["loss_count"] = 0
+            old_confidence = category_row.confidence if category_row.confidence is not None else 0.5
 
             # Apply confidence penalty (don't go below minimum)
             new_confidence = max(MIN_CONFIDENCE, old_confidence - LOSS_CONFIDENCE_PENALTY)
 
-            # Update category data
-            cat_data["confidence"] = new_confidence
-            cat_data["loss_count"] = cat_data.get("loss_count", 0) + 1
-            cat_data["last_loss_at"] = datetime.utcnow().isoformat()
+            # Update category row (version-checked against concurrent signals)
+            category_row.confidence = new_confidence
+            category_row.loss_count = (category_row.loss_count or 0) + 1
+            extra = dict(category_row.extra or {})
+            extra["last_loss_at"] = datetime.utcnow().isoformat()
             if loss_reason:
                 # Track loss reason distribution
-                if "loss_reasons" not in cat_data:
-                    cat_data["loss_reasons"] = {}
-                cat_data["loss_reasons"][loss_reason] = cat_data["loss_reasons"].get(loss_reason, 0) + 1
-
-            pricing_knowledge["categories"][category] = cat_data
-            pricing_model.pricing_knowledge = pricing_knowledge
-            pricing_model.updated_at = datetime.utcnow()
-            attributes.flag_modified(pricing_model, 'pricing_knowledge')
+                loss_reasons = dict(extra.get("loss_reasons") or {})
+                loss_reasons[loss_reason] = loss_reasons.get(loss_reason, 0) + 1
+                extra["loss_reasons"] = loss_reasons
+            category_row.extra = extra
 
-            await session.commit()
+            await self._commit(session)
+            await self._invalidate_quote_context(contractor_id)
 
             # Track analytics
             try:
@@ -916,7 +1060,7 @@ class DatabaseService:
                         "loss_reason": loss_reason,
                         "old_confidence": old_confidence,
                         "new_confidence": new_confidence,
-                        "loss_count": cat_data["loss_count"],
+                        "loss_count": category_row.loss_count,
                     }
                 )
             except Exception as e:
@@ -929,7 +1073,7 @@ class DatabaseService:
                 "category": category,
                 "old_confidence": old_confidence,
                 "new_confidence": new_confidence,
-                "loss_count": cat_data["loss_count"],
+                "loss_count": category_row.loss_count,
                 "loss_reason": loss_reason,
             }
 
@@ -944,7 +1088,7 @@ class DatabaseService:
         **kwargs
     ) -> ContractorTerms:
         """Create terms for a contractor."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             terms = ContractorTerms(
                 contractor_id=contractor_id,
                 deposit_percent=deposit_percent,
@@ -953,13 +1097,14 @@ class DatabaseService:
                 **kwargs
             )
             session.add(terms)
-            await session.commit()
+            await self._commit(session)
             await session.refresh(terms)
+            await self._invalidate_quote_context(contractor_id)
             return terms
 
     async def get_terms(self, contractor_id: str) -> Optional[ContractorTerms]:
         """Get a contractor's terms."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(ContractorTerms).where(ContractorTerms.contractor_id == contractor_id)
             )
@@ -971,7 +1116,7 @@ class DatabaseService:
         **kwargs
     ) -> Optional[ContractorTerms]:
         """Update terms."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(ContractorTerms).where(ContractorTerms.contractor_id == contractor_id)
             )
@@ -983,8 +1128,9 @@ class DatabaseService:
                 if hasattr(terms, key) and value is not None:
                     setattr(terms, key, value)
 
-            await session.commit()
+            await self._commit(session)
             await session.refresh(terms)
+            await self._invalidate_quote_context(contractor_id)
             return terms
 
     # ============== QUOTE OPERATIONS ==============
@@ -1005,14 +1151,22 @@ class DatabaseService:
         ai_generated_total: Optional[float] = None,
         timeline_text: Optional[str] = None,  # DISC-080
         terms_text: Optional[str] = None,  # DISC-080
+        category_source: Optional[str] = None,
+        post_commit_tasks: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
         **kwargs
     ) -> Quote:
         """Create a new quote.
 
         DISC-080: If timeline_text or terms_text not provided, automatically
         populate from contractor's default settings (contractor_terms table).
+
+        category_source: "local" when the category classifier picked job_type,
+        "claude" otherwise; the classifier only trains on non-local quotes.
+
+        post_commit_tasks: (task_type, payload) side effects written to the
+        outbox in the same transaction; each payload gets "quote_id".
         """
-        async with async_session_factory() as session:
+        async with self._session() as session:
             # DISC-080: Fetch contractor's default timeline/terms if not explicitly provided
             if timeline_text is None or terms_text is None:
                 from ..models.database import ContractorTerms
@@ -1041,15 +1195,36 @@ class DatabaseService:
                 estimated_days=estimated_days,
                 timeline_text=timeline_text,  # DISC-080
                 terms_text=terms_text,  # DISC-080
+                category_source=category_source,
             )
             session.add(quote)
-            await session.commit()
+
+            # DISC-034: Keep the sanity check's percentile index current
+            await apply_quote_total_change(
+                session, contractor_id, new=(quote.job_type, quote.total)
+            )
+            # DISC-012: Quote/edit/outcome counters for analytics
+            await apply_quote_stats_change(session, contractor_id, new=quote_stats_entry(quote))
+
+            if post_commit_tasks:
+                await session.flush()  # Assigns quote.id
+                for task_type, payload in post_commit_tasks:
+                    enqueue_task(session, task_type, {**payload, "quote_id": quote.id})
+
+            await self._commit(session)
             await session.refresh(quote)
+
+            if post_commit_tasks and not self._after_commit(self._notify_outbox):
+                notify_outbox()
             return quote
 
+    @staticmethod
+    async def _notify_outbox() -> None:
+        notify_outbox()
+
     async def get_quote(self, quote_id: str) -> Optional[Quote]:
         """Get a quote by ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Quote).where(Quote.id == quote_id)
             )
@@ -1057,7 +1232,7 @@ class DatabaseService:
 
     async def get_quote_by_share_token(self, share_token: str) -> Optional[Quote]:
         """Get a quote by share token (for public access)."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Quote).where(Quote.share_token == share_token)
             )
@@ -1069,7 +1244,7 @@ class DatabaseService:
         **kwargs
     ) -> Optional[Quote]:
         """Update a quote."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Quote).where(Quote.id == quote_id)
             )
@@ -1077,6 +1252,9 @@ class DatabaseService:
             if not quote:
                 return None
 
+            old_total_entry = (quote.job_type, quote.total)
+            old_stats_entry = quote_stats_entry(quote)
+
             for key, value in kwargs.items():
                 if hasattr(quote, key) and value is not None:
                     setattr(quote, key, value)
@@ -1087,13 +1265,29 @@ class DatabaseService:
                 quote.total = quote.subtotal
 
             quote.updated_at = datetime.utcnow()
-            await session.commit()
+
+            # DISC-034: Move the quote between percentile buckets if total/category changed
+            await apply_quote_total_change(
+                session, quote.contractor_id,
+                old=old_total_entry, new=(quote.job_type, quote.total),
+            )
+            # DISC-012: Keep edit/win/loss counters in step (covers outcome marking)
+            await apply_quote_stats_change(
+                session, quote.contractor_id,
+                old=old_stats_entry, new=quote_stats_entry(quote),
+            )
+
+            await self._commit(session)
             await session.refresh(quote)
+
+            # Edited quotes feed correction examples in the quote context
+            if quote.was_edited and CORRECTION_FIELDS.intersection(kwargs):
+                await self._invalidate_quote_context(quote.contractor_id)
             return quote
 
     async def delete_quote(self, quote_id: str) -> bool:
         """Delete a quote by ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Quote).where(Quote.id == quote_id)
             )
@@ -1106,8 +1300,18 @@ class DatabaseService:
                 delete(QuoteFeedback).where(QuoteFeedback.quote_id == quote_id)
             )
 
+            contractor_id = quote.contractor_id
+            was_edited = quote.was_edited
+            old_total_entry = (quote.job_type, quote.total)
+            old_stats_entry = quote_stats_entry(quote)
+
             await session.delete(quote)
-            await session.commit()
+            await apply_quote_total_change(session, contractor_id, old=old_total_entry)
+            await apply_quote_stats_change(session, contractor_id, old=old_stats_entry)
+            await self._commit(session)
+
+            if was_edited:
+                await self._invalidate_quote_context(contractor_id)
             return True
 
     async def get_quotes_by_contractor(
@@ -1117,7 +1321,7 @@ class DatabaseService:
         offset: int = 0,
     ) -> List[Quote]:
         """Get all quotes for a contractor."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(Quote)
                 .where(Quote.contractor_id == contractor_id)
@@ -1127,6 +1331,15 @@ class DatabaseService:
             )
             return list(result.scalars().all())
 
+    async def get_quote_stats(self, contractor_id: str) -> Dict[str, QuoteCounts]:
+        """
+        Get maintained quote/edit/win/loss counters for a contractor.
+
+        Keyed by category, with "*" for all of the contractor's quotes.
+        """
+        async with self._session() as session:
+            return await get_quote_stats(session, contractor_id)
+
     async def get_quote_history_for_learning(
         self,
         contractor_id: str,
@@ -1152,6 +1365,7 @@ class DatabaseService:
         contractor_id: str,
         limit: int = 5,
         job_type: Optional[str] = None,
+        per_job_type: bool = False,
     ) -> List[Dict]:
         """
         Get recent edited quotes formatted for few-shot learning injection.
@@ -1164,11 +1378,15 @@ class DatabaseService:
             contractor_id: The contractor's ID
             limit: Max examples to return (default 5 to avoid token bloat)
             job_type: Optional filter to get examples of specific job type
+            per_job_type: Apply limit per job type instead of overall, so a
+                type whose last edits are older than other types' still
+                gets examples (quote context snapshot)
 
         Returns:
-            List of correction examples with original/final state for prompt injection
+            List of correction examples with original/final state for prompt injection,
+            newest first
         """
-        async with async_session_factory() as session:
+        async with self._session() as session:
             query = (
                 select(Quote)
                 .where(Quote.contractor_id == contractor_id)
@@ -1179,7 +1397,23 @@ class DatabaseService:
             if job_type:
                 query = query.where(Quote.job_type == job_type)
 
-            query = query.order_by(Quote.updated_at.desc()).limit(limit)
+            if per_job_type:
+                ranked = (
+                    select(
+                        Quote.id,
+                        func.row_number().over(
+                            partition_by=Quote.job_type,
+                            order_by=Quote.updated_at.desc(),
+                        ).label("rank"),
+                    )
+                    .where(Quote.contractor_id == contractor_id)
+                    .where(Quote.was_edited == True)
+                    .subquery()
+                )
+                query = query.join(ranked, Quote.id == ranked.c.id).where(ranked.c.rank <= limit)
+                query = query.order_by(Quote.updated_at.desc())
+            else:
+                query = query.order_by(Quote.updated_at.desc()).limit(limit)
 
             result = await session.execute(query)
             quotes = list(result.scalars().all())
@@ -1208,7 +1442,7 @@ class DatabaseService:
         conversation_id: str,
     ) -> Optional[SetupConversation]:
         """Get a setup conversation by ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(SetupConversation).where(SetupConversation.id == conversation_id)
             )
@@ -1221,7 +1455,7 @@ class DatabaseService:
         contractor_id: Optional[str] = None,
     ) -> SetupConversation:
         """Create a setup conversation record."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             conversation = SetupConversation(
                 contractor_id=contractor_id,
                 messages=messages,
@@ -1229,7 +1463,7 @@ class DatabaseService:
                 status="in_progress",
             )
             session.add(conversation)
-            await session.commit()
+            await self._commit(session)
             await session.refresh(conversation)
             return conversation
 
@@ -1242,7 +1476,7 @@ class DatabaseService:
         extracted_data: Optional[Dict] = None,
     ) -> Optional[SetupConversation]:
         """Update a setup conversation."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(SetupConversation).where(SetupConversation.id == conversation_id)
             )
@@ -1261,7 +1495,7 @@ class DatabaseService:
             if extracted_data is not None:
                 conversation.extracted_data = extracted_data
 
-            await session.commit()
+            await self._commit(session)
             await session.refresh(conversation)
             return conversation
 
@@ -1277,7 +1511,7 @@ class DatabaseService:
         **kwargs
     ) -> UserIssue:
         """Create a new user issue."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             issue = UserIssue(
                 title=title,
                 description=description,
@@ -1287,13 +1521,13 @@ class DatabaseService:
                 **kwargs
             )
             session.add(issue)
-            await session.commit()
+            await self._commit(session)
             await session.refresh(issue)
             return issue
 
     async def get_issue(self, issue_id: str) -> Optional[UserIssue]:
         """Get a single issue by ID."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(UserIssue).where(UserIssue.id == issue_id)
             )
@@ -1301,7 +1535,7 @@ class DatabaseService:
 
     async def get_new_issues(self) -> List[UserIssue]:
         """Get all issues with status='new'."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(UserIssue)
                 .where(UserIssue.status == "new")
@@ -1315,7 +1549,7 @@ class DatabaseService:
         category: Optional[str] = None,
     ) -> List[UserIssue]:
         """Get all issues, optionally filtered by status and/or category."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             query = select(UserIssue)
 
             if status:
@@ -1334,7 +1568,7 @@ class DatabaseService:
         **kwargs
     ) -> Optional[UserIssue]:
         """Update an issue."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(UserIssue).where(UserIssue.id == issue_id)
             )
@@ -1347,7 +1581,7 @@ class DatabaseService:
                     setattr(issue, key, value)
 
             issue.updated_at = datetime.utcnow()
-            await session.commit()
+            await self._commit(session)
             await session.refresh(issue)
             return issue
 
@@ -1372,7 +1606,7 @@ class DatabaseService:
         quote_outcome: Optional[str] = None,
     ) -> QuoteFeedback:
         """Create feedback for a quote."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             feedback = QuoteFeedback(
                 quote_id=quote_id,
                 overall_rating=overall_rating,
@@ -1391,13 +1625,13 @@ class DatabaseService:
                 quote_outcome=quote_outcome,
             )
             session.add(feedback)
-            await session.commit()
+            await self._commit(session)
             await session.refresh(feedback)
             return feedback
 
     async def get_quote_feedback(self, quote_id: str) -> Optional[QuoteFeedback]:
         """Get feedback for a specific quote."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(QuoteFeedback).where(QuoteFeedback.quote_id == quote_id)
             )
@@ -1409,7 +1643,7 @@ class DatabaseService:
         **kwargs
     ) -> Optional[QuoteFeedback]:
         """Update quote feedback."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             result = await session.execute(
                 select(QuoteFeedback).where(QuoteFeedback.id == feedback_id)
             )
@@ -1422,13 +1656,13 @@ class DatabaseService:
                     setattr(feedback, key, value)
 
             feedback.updated_at = datetime.utcnow()
-            await session.commit()
+            await self._commit(session)
             await session.refresh(feedback)
             return feedback
 
     async def get_feedback_stats(self, contractor_id: str) -> Dict[str, Any]:
         """Get aggregated feedback statistics for a contractor."""
-        async with async_session_factory() as session:
+        async with self._session() as session:
             # Get all quotes for this contractor
             quotes_result = await session.execute(
                 select(Quote.id).where(Quote.contractor_id == contractor_id)
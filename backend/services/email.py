@@ -1,16 +1,22 @@
 """
 Email service for Quoted using Resend.
 Handles all transactional emails with branded dark premium design.
+
+Emails are queued, not sent inline: every send_* method builds the Resend
+params and hands them to the email dispatcher (services/email_dispatcher.py),
+which delivers them in batches with rate limiting and retries.
+
+Message bodies are Jinja2 templates in backend/templates/email/, compiled
+once per process (services/email_templates.py).
 """
 
 import re
 from typing import Optional, Dict, Any
 import resend
-import asyncio
-from functools import partial
 from datetime import datetime
 
 from ..config import settings
+from .email_templates import format_money, get_email_templates
 from .logging import get_email_logger
 
 logger = get_email_logger()
@@ -67,193 +73,23 @@ class EmailService:
     FROM_EMAIL = "Quoted <hello@quoted.it.com>"
 
     @staticmethod
-    def _get_base_template() -> str:
+    async def _deliver(params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Get the base HTML template for all emails.
-        Dark premium aesthetic matching the brand.
+        Queue an email for the dispatcher (resend.Emails.send params).
+
+        Returns as soon as the email is stored; raises only if it couldn't be.
         """
-        return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700&family=Inter:wght@300;400;500;600&display=swap');
-
-        body {
-            margin: 0;
-            padding: 0;
-            background-color: #0a0a0a;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            color: #ffffff;
-            -webkit-font-smoothing: antialiased;
-        }
-
-        .container {
-            max-width: 600px;
-            margin: 0 auto;
-            background-color: #141414;
-        }
-
-        .header {
-            padding: 40px 40px 20px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .logo {
-            font-family: 'Playfair Display', Georgia, serif;
-            font-size: 28px;
-            font-weight: 600;
-            font-style: italic;
-            color: #ffffff;
-            margin: 0;
-        }
-
-        .tagline {
-            font-size: 13px;
-            color: #a0a0a0;
-            margin: 8px 0 0;
-            letter-spacing: 0.5px;
-        }
-
-        .content {
-            padding: 40px;
-        }
-
-        .content h1 {
-            font-family: 'Playfair Display', Georgia, serif;
-            font-size: 32px;
-            font-weight: 600;
-            margin: 0 0 24px;
-            color: #ffffff;
-            line-height: 1.2;
-        }
-
-        .content p {
-            font-size: 16px;
-            line-height: 1.6;
-            color: #e0e0e0;
-            margin: 0 0 16px;
-        }
-
-        .content .muted {
-            color: #a0a0a0;
-            font-size: 14px;
-        }
-
-        .button {
-            display: inline-block;
-            padding: 14px 32px;
-            background-color: #ffffff;
-            color: #0a0a0a;
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 15px;
-            border-radius: 4px;
-            margin: 24px 0;
-            transition: opacity 0.2s;
-        }
-
-        .button:hover {
-            opacity: 0.9;
-        }
-
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 16px;
-            margin: 24px 0;
-        }
-
-        .stat-box {
-            background-color: #1a1a1a;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-            padding: 20px;
-        }
-
-        .stat-value {
-            font-family: 'Playfair Display', Georgia, serif;
-            font-size: 28px;
-            font-weight: 600;
-            color: #ffffff;
-            margin: 0 0 4px;
-        }
-
-        .stat-label {
-            font-size: 13px;
-            color: #a0a0a0;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        .feature-list {
-            list-style: none;
-            padding: 0;
-            margin: 24px 0;
-        }
-
-        .feature-list li {
-            padding: 12px 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-            color: #e0e0e0;
-            font-size: 15px;
-        }
-
-        .feature-list li:last-child {
-            border-bottom: none;
-        }
-
-        .feature-list li:before {
-            content: "✓ ";
-            color: #a0a0a0;
-            font-weight: 600;
-            margin-right: 8px;
-        }
-
-        .footer {
-            padding: 32px 40px;
-            border-top: 1px solid rgba(255, 255, 255, 0.1);
-            text-align: center;
-        }
-
-        .footer p {
-            font-size: 13px;
-            color: #666666;
-            margin: 8px 0;
-        }
-
-        .footer a {
-            color: #a0a0a0;
-            text-decoration: none;
-        }
-
-        .footer a:hover {
-            color: #ffffff;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1 class="logo">quoted.it</h1>
-            <p class="tagline">Qualify faster. Close more.</p>
-        </div>
-        <div class="content">
-            {content}
-        </div>
-        <div class="footer">
-            <p>&copy; 2025 Quoted. All rights reserved.</p>
-            <p>
-                <a href="https://quoted.it.com/terms">Terms</a> •
-                <a href="https://quoted.it.com/privacy">Privacy</a>
-            </p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        from .email_dispatcher import queue_email
+        message_id = await queue_email(params)
+        return {"id": message_id, "queued": True}
+
+    @staticmethod
+    def _render(template_name: str, /, **context: Any) -> str:
+        """
+        Render an email body template into the branded layout.
+        Dark premium aesthetic matching the brand (templates/email/base.html).
+        """
+        return get_email_templates().render(template_name, **context)
 
     @staticmethod
     async def send_email(
@@ -274,9 +110,9 @@ class EmailService:
             reply_to: Optional reply-to email address
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
-        html = EmailService._get_base_template().format(content=body)
+        html = get_email_templates().wrap(body)
 
         try:
             email_params = {
@@ -288,13 +124,8 @@ class EmailService:
             if reply_to:
                 email_params["reply_to"] = reply_to
 
-            # Use run_in_executor to avoid blocking event loop (P1-04 pattern)
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, email_params)
-            )
-            logger.info(f"Sent email to {to_email}: {subject}")
+            response = await EmailService._deliver(email_params)
+            logger.info(f"Queued email to {to_email}: {subject}")
             return response
         except Exception as e:
             logger.error(f"Failed to send email to {to_email}: {subject}", exc_info=True)
@@ -315,33 +146,13 @@ class EmailService:
             owner_name: Optional owner name for personalization
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
         name = owner_name if owner_name else business_name
-
-        content = f"""
-            <h1>Welcome to Quoted, {name}</h1>
-
-            <p>You're all set up and ready to start turning voice notes into professional quotes.</p>
-
-            <p>Here's what you can do now:</p>
-
-            <ul class="feature-list">
-                <li>Record a voice note describing any job</li>
-                <li>Get a professional budget quote in seconds</li>
-                <li>Edit and send quotes directly to customers</li>
-                <li>Watch Quoted learn your pricing style</li>
-            </ul>
-
-            <a href="https://quoted.it.com/app" class="button">Start Quoting</a>
-
-            <p class="muted">Your 7-day trial starts now. No credit card required.</p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("welcome.html", name=name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": f"Welcome to Quoted, {name}",
@@ -367,42 +178,12 @@ class EmailService:
             trial_end_date: Date when trial ends (formatted string)
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Your Trial Has Started</h1>
-
-            <p>Great! You just generated your first quote. Your 7-day free trial is now active.</p>
-
-            <div class="stats-grid">
-                <div class="stat-box">
-                    <div class="stat-value">7 Days</div>
-                    <div class="stat-label">Trial Period</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">{trial_end_date}</div>
-                    <div class="stat-label">Ends On</div>
-                </div>
-            </div>
-
-            <p>During your trial, you have unlimited access to:</p>
-
-            <ul class="feature-list">
-                <li>Unlimited voice-to-quote conversions</li>
-                <li>AI-powered pricing that learns from you</li>
-                <li>Professional PDF quote generation</li>
-                <li>Quote history and editing</li>
-            </ul>
-
-            <a href="https://quoted.it.com/app" class="button">Continue Quoting</a>
-
-            <p class="muted">We'll send you a reminder before your trial ends.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("trial_starting.html", trial_end_date=trial_end_date)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Your Quoted trial has started",
@@ -430,37 +211,14 @@ class EmailService:
             quotes_generated: Total quotes generated during trial
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Your Trial Ends in {days_left} Days</h1>
-
-            <p>You've generated {quotes_generated} quote{"s" if quotes_generated != 1 else ""} during your trial. Nice work!</p>
-
-            <p>To keep using Quoted after your trial ends:</p>
-
-            <div class="stats-grid">
-                <div class="stat-box">
-                    <div class="stat-value">$9</div>
-                    <div class="stat-label">Per Month</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">Unlimited</div>
-                    <div class="stat-label">Quotes</div>
-                </div>
-            </div>
-
-            <p>Or save with annual billing: <strong>$59/year</strong> (save 45%)</p>
-
-            <a href="https://quoted.it.com/app?upgrade=true" class="button">Subscribe Now</a>
-
-            <p class="muted">Cancel anytime. No questions asked.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "trial_ending.html", days_left=days_left, quotes_generated=quotes_generated
+        )
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": f"Your trial ends in {days_left} days",
@@ -486,38 +244,12 @@ class EmailService:
             quotes_generated: Total quotes generated during trial
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Your Trial Has Ended</h1>
-
-            <p>Hi there! Your 7-day Quoted trial has ended.</p>
-
-            <p>During your trial, you generated {quotes_generated} quote{"s" if quotes_generated != 1 else ""}.
-            {"Great progress!" if quotes_generated > 0 else "Ready to give it another shot?"}</p>
-
-            <p>Subscribe now to continue creating professional quotes with AI:</p>
-
-            <div class="stats-grid">
-                <div class="stat-box">
-                    <div class="stat-value">$9</div>
-                    <div class="stat-label">Per Month</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">$59</div>
-                    <div class="stat-label">Per Year (Save 45%)</div>
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app?upgrade=true" class="button">Subscribe Now</a>
-
-            <p class="muted">Questions? Just reply to this email.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("trial_expired.html", quotes_generated=quotes_generated)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Your Quoted trial has ended",
@@ -547,45 +279,17 @@ class EmailService:
             billing_date: Next billing date (formatted string)
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Subscription Confirmed</h1>
-
-            <p>Thanks for subscribing to Quoted! Your payment has been processed.</p>
-
-            <div class="stats-grid">
-                <div class="stat-box">
-                    <div class="stat-value">{plan_name}</div>
-                    <div class="stat-label">Plan</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">${amount:.2f}</div>
-                    <div class="stat-label">Per Month</div>
-                </div>
-            </div>
-
-            <p>Your next billing date is {billing_date}.</p>
-
-            <p>You now have unlimited access to:</p>
-
-            <ul class="feature-list">
-                <li>Unlimited voice-to-quote conversions</li>
-                <li>AI that learns your pricing patterns</li>
-                <li>Professional quote PDFs</li>
-                <li>Quote history and analytics</li>
-                <li>Priority support</li>
-            </ul>
-
-            <a href="https://quoted.it.com/app" class="button">Go to Dashboard</a>
-
-            <p class="muted">Need help? Reply to this email anytime.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "subscription_confirmation.html",
+            plan_name=plan_name,
+            amount=amount,
+            billing_date=billing_date,
+        )
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Your Quoted subscription is active",
@@ -611,32 +315,12 @@ class EmailService:
             retry_date: Date when payment will be retried (formatted string)
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Payment Failed</h1>
-
-            <p>We couldn't process your payment for this month's subscription.</p>
-
-            <p>This can happen if:</p>
-
-            <ul class="feature-list">
-                <li>Your card has expired</li>
-                <li>There are insufficient funds</li>
-                <li>Your bank declined the charge</li>
-            </ul>
-
-            <p>We'll automatically retry on {retry_date}. To avoid service interruption, please update your payment method.</p>
-
-            <a href="https://quoted.it.com/app?billing=true" class="button">Update Payment Method</a>
-
-            <p class="muted">Questions? Reply to this email and we'll help sort it out.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("payment_failed.html", retry_date=retry_date)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Payment failed - action required",
@@ -664,43 +348,28 @@ class EmailService:
             billing_period: The billing period covered (e.g., "January 2026")
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
         # Calculate plural form
         credits_text = "1 credit" if credits_remaining == 1 else f"{credits_remaining} credits"
         remaining_msg = f"You have {credits_text} remaining." if credits_remaining > 0 else "That was your last credit. Keep referring to earn more!"
 
-        content = f"""
-            <h1>Referral Credit Applied</h1>
-
-            <p>Great news! We just applied one of your referral credits to your subscription.</p>
-
-            <div style="background: linear-gradient(135deg, #1a1a1a 0%, #2a2a2a 100%); padding: 24px; border-radius: 12px; border-left: 4px solid #22c55e; margin: 24px 0;">
-                <div style="font-size: 1.1rem; color: #22c55e; font-weight: 600; margin-bottom: 8px;">This Month is Free</div>
-                <div style="color: #999;">Your subscription for {billing_period} is covered by a referral credit.</div>
-            </div>
-
-            <p>{remaining_msg}</p>
-
-            <p style="color: #999; font-size: 0.9rem;">Every friend you refer who subscribes earns you another free month. Share your referral link from your account settings.</p>
-
-            <a href="https://quoted.it.com/app?tab=referrals" class="button">View Your Referrals</a>
-
-            <p class="muted">Thank you for spreading the word about Quoted!</p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "referral_credit_applied.html",
+            billing_period=billing_period,
+            remaining_msg=remaining_msg,
+        )
         text = f"Referral Credit Applied - Your subscription for {billing_period} is covered by a referral credit. {remaining_msg}"
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": f"Referral credit applied - {billing_period} is free",
                 "html": html,
                 "text": text,
             })
-            logger.info(f"Referral credit notification sent to {to_email}")
+            logger.info(f"Referral credit notification queued for {to_email}")
             return response
         except Exception as e:
             logger.error(f"Failed to send referral credit notification to {to_email}", exc_info=True)
@@ -715,7 +384,8 @@ class EmailService:
         job_description: str,
         total: float,
         message: Optional[str] = None,
-        pdf_path: Optional[str] = None
+        pdf_path: Optional[str] = None,
+        pdf_bytes: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Send quote via email to customer (GROWTH-003).
@@ -729,56 +399,20 @@ class EmailService:
             total: Quote total amount
             message: Optional personal message from contractor
             pdf_path: Optional path to PDF attachment
+            pdf_bytes: Optional PDF attachment content (takes precedence over pdf_path)
 
         Returns:
-            Resend API response
-        """
-        greeting = f"Hi {customer_name}" if customer_name else "Hello"
-        personal_msg = f"<p>{message}</p>" if message else ""
-
-        # Format the total amount and phone number
-        formatted_total = f"${total:,.2f}"
-        formatted_phone = format_phone_number(contractor_phone)
-
-        content = f"""
-            <h1>Quote from {contractor_name}</h1>
-
-            <p>{greeting},</p>
-
-            <p>Thank you for your interest. Here's your quote:</p>
-
-            {personal_msg}
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #a0a0a0; font-size: 13px; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">
-                    Project
-                </div>
-                <div style="color: #e0e0e0; font-size: 16px; margin-bottom: 16px;">
-                    {job_description}
-                </div>
-                <div style="color: #a0a0a0; font-size: 13px; margin-bottom: 4px; text-transform: uppercase; letter-spacing: 0.5px;">
-                    Total Investment
-                </div>
-                <div class="stat-value" style="font-family: 'Playfair Display', Georgia, serif; font-size: 32px; font-weight: 600; color: #ffffff;">
-                    {formatted_total}
-                </div>
-            </div>
-
-            <p>Please review the attached PDF for complete details.</p>
-
-            <p>Questions? Give me a call at <strong>{formatted_phone}</strong></p>
-
-            <p class="muted" style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(255, 255, 255, 0.1);">
-                This quote was generated with Quoted - Voice-to-quote for contractors.<br>
-                <a href="https://quoted.it.com" style="color: #a0a0a0;">Learn more</a>
-            </p>
-        """
-
-        # Escape curly braces in content to prevent format() from interpreting them
-        # This fixes the '\n margin' error when job_description contains CSS-like syntax
-        content = content.replace('{', '{{').replace('}', '}}')
-
-        html = EmailService._get_base_template().replace('{content}', content)
+            Queued email receipt (id of the outbox row)
+        """
+        html = EmailService._render(
+            "quote.html",
+            contractor_name=contractor_name,
+            customer_name=customer_name,
+            message=message,
+            job_description=job_description,
+            total=total,
+            phone=format_phone_number(contractor_phone),
+        )
 
         try:
             email_data = {
@@ -789,23 +423,19 @@ class EmailService:
             }
 
             # Attach PDF if provided
-            if pdf_path:
-                import base64
+            if pdf_bytes is None and pdf_path:
                 with open(pdf_path, "rb") as f:
-                    pdf_content = base64.b64encode(f.read()).decode()
-                    email_data["attachments"] = [{
-                        "filename": "quote.pdf",
-                        "content": pdf_content,
-                    }]
-
-            # Resend SDK is synchronous, so run it in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, email_data)
-            )
+                    pdf_bytes = f.read()
+            if pdf_bytes is not None:
+                import base64
+                email_data["attachments"] = [{
+                    "filename": "quote.pdf",
+                    "content": base64.b64encode(pdf_bytes).decode(),
+                }]
+
+            response = await EmailService._deliver(email_data)
 
-            logger.info(f"Quote email sent successfully to {to_email}")
+            logger.info(f"Quote email queued for {to_email}")
             return response
         except Exception as e:
             logger.error(f"Failed to send quote email to {to_email}", exc_info=True)
@@ -827,38 +457,12 @@ class EmailService:
             quote_id: ID of the first quote generated
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Your first quote is ready! 🎉</h1>
-
-            <p>Congratulations, {contractor_name}! You just created your first quote with Quoted.</p>
-
-            <p>Here's a quick tip to help you get even more from the platform:</p>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    💡 Pro Tip: Edit Anytime
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6;">
-                    Your quotes aren't set in stone. You can edit pricing, add notes, or adjust details before sending to customers.
-                    Just go to "My Quotes" and click any quote to refine it.
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app" class="button">Generate Another Quote</a>
-
-            <p class="muted" style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(255, 255, 255, 0.1);">
-                <strong>Love Quoted? Spread the word!</strong><br>
-                Share your referral link and earn rewards when other contractors join.
-                <a href="https://quoted.it.com/app?tab=referral" style="color: #a0a0a0;">Get your referral code</a>
-            </p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("post_first_quote.html", contractor_name=contractor_name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Your first quote is ready! 🎉",
@@ -883,48 +487,12 @@ class EmailService:
             contractor_name: Name of the contractor/business
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Pro tip: Rush job pricing in Quoted</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p>We wanted to share a couple pro tips to help you quote smarter:</p>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    ⚡ Handling Rush Jobs
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6; margin-bottom: 16px;">
-                    When a customer needs it fast, mention "rush" or "ASAP" in your voice note. Quoted will adjust pricing automatically.
-                    Standard rush markup: 15-25% depending on timeline.
-                </div>
-            </div>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    📊 Material Markup Best Practices
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6;">
-                    Industry standard: 10-20% markup on materials for handling/warranty.
-                    Quoted learns your markup preferences over time as you edit quotes, so your pricing gets smarter with every job.
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app" class="button">Create a Quote</a>
-
-            <p class="muted" style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(255, 255, 255, 0.1);">
-                <strong>Know other contractors who'd love this?</strong><br>
-                Share your referral link and we'll hook you both up with rewards.
-                <a href="https://quoted.it.com/app?tab=referral" style="color: #a0a0a0;">Get your referral code</a>
-            </p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("pro_tips.html", contractor_name=contractor_name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Pro tip: Rush job pricing in Quoted",
@@ -949,44 +517,12 @@ class EmailService:
             contractor_name: Name of the contractor/business
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
-        content = f"""
-            <h1>Did you know? Edit quotes anytime</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p>Just a quick reminder about two powerful features you might not be using yet:</p>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    ✏️ Quote Editing
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6;">
-                    Every quote you generate can be edited before sending. Adjust pricing, add notes, tweak line items—whatever you need.
-                    Go to "My Quotes" and click any quote to make changes.
-                </div>
-            </div>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    🧠 Pricing Brain Learning
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6;">
-                    Every time you edit a quote, Quoted learns from it. Your Pricing Brain adapts to YOUR style—rush markups, material preferences, labor rates.
-                    The more you use it, the smarter it gets.
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app?tab=pricing-brain" class="button">Check Your Pricing Brain</a>
-
-            <p class="muted">Want to see what Quoted has learned about your pricing style? Check your Pricing Brain dashboard.</p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("feature_reminder.html", contractor_name=contractor_name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Did you know? Edit quotes anytime",
@@ -1015,52 +551,17 @@ class EmailService:
             referral_code: User's referral code
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>You've generated {quote_count} quotes! 📊</h1>
-
-            <p>Amazing work, {contractor_name}!</p>
-
-            <p>You've created {quote_count} quote{"s" if quote_count != 1 else ""} with Quoted. That's {quote_count} potential jobs that you quoted faster and more professionally.</p>
-
-            <div class="stats-grid">
-                <div class="stat-box">
-                    <div class="stat-value">{quote_count}</div>
-                    <div class="stat-label">Total Quotes</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">⚡</div>
-                    <div class="stat-label">Getting Smarter</div>
-                </div>
-            </div>
-
-            <p>Your Pricing Brain is learning fast. With {quote_count} quote{"s" if quote_count != 1 else ""} under its belt, it's already adapting to your pricing style.</p>
-
-            <a href="https://quoted.it.com/app" class="button">Keep the Momentum Going</a>
-
-            <div style="background-color: #1a1a1a; border: 1px solid rgba(255, 255, 255, 0.1); border-radius: 8px; padding: 24px; margin: 32px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    💰 Share the Love, Earn Rewards
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6; margin-bottom: 16px;">
-                    Know contractors who waste time on quotes? Share your referral code and you'll both get rewarded when they sign up.
-                </div>
-                <div style="background-color: #0a0a0a; border: 1px solid rgba(255, 255, 255, 0.15); border-radius: 4px; padding: 16px; text-align: center; font-family: 'Courier New', monospace; font-size: 20px; font-weight: 600; color: #ffffff; letter-spacing: 2px;">
-                    {referral_code}
-                </div>
-                <div style="margin-top: 16px; text-align: center;">
-                    <a href="https://quoted.it.com/app?tab=referral" style="color: #a0a0a0; font-size: 14px;">View your referral dashboard →</a>
-                </div>
-            </div>
-
-            <p class="muted">Questions or feedback? Hit reply—we read every message.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "milestone.html",
+            contractor_name=contractor_name,
+            quote_count=quote_count,
+            referral_code=referral_code,
+        )
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": f"You've generated {quote_count} quotes! 📊",
@@ -1085,36 +586,12 @@ class EmailService:
             contractor_name: Name of the contractor/business
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>Quick check-in—everything okay?</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p>We noticed you haven't created a quote in a little while. Just wanted to check in and make sure everything's going smoothly.</p>
-
-            <p>Sometimes contractors get stuck or have questions about the platform. If that's you, we're here to help. Just hit reply to this email.</p>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    💡 Quick Tip: Speed Up Job Walks
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6;">
-                    Use Quoted during job walks to quote on the spot. Just record a quick voice note while you're there, and you can send a professional quote before you leave.
-                    Customers love the fast turnaround.
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app" class="button">Generate a Quote</a>
-
-            <p class="muted">Your pricing data is still here waiting for you whenever you're ready.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("check_in.html", contractor_name=contractor_name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "Quick check-in—everything okay with Quoted?",
@@ -1139,43 +616,12 @@ class EmailService:
             contractor_name: Name of the contractor/business
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
-        content = f"""
-            <h1>We've made some improvements</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p>While you've been away, we've been busy improving Quoted. Here are a few updates you might like:</p>
-
-            <ul class="feature-list">
-                <li><strong>Smarter Pricing Brain</strong> - Now learns faster from your edits and adapts to seasonal pricing changes</li>
-                <li><strong>Faster Quote Generation</strong> - We cut processing time in half—quotes now generate in seconds, not minutes</li>
-                <li><strong>Enhanced PDF Exports</strong> - More professional layouts with better mobile viewing</li>
-            </ul>
-
-            <div class="stat-box" style="margin: 24px 0; background-color: #1a1a1a; border: 1px solid rgba(255, 255, 255, 0.1);">
-                <div style="color: #a0a0a0; font-size: 13px; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">
-                    Your Data is Safe
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6;">
-                    All your pricing data and quote history is still here waiting. Pick up right where you left off.
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app" class="button">Come Back and Try It</a>
-
-            <p class="muted" style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(255, 255, 255, 0.1);">
-                <strong>Know other contractors?</strong><br>
-                Share your referral link and earn rewards when they join.
-                <a href="https://quoted.it.com/app?tab=referral" style="color: #a0a0a0;">Get your referral code</a>
-            </p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("improvements.html", contractor_name=contractor_name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "We've made some improvements you might like",
@@ -1200,42 +646,12 @@ class EmailService:
             contractor_name: Name of the contractor/business
 
         Returns:
-            Resend API response
-        """
-        content = f"""
-            <h1>We miss you!</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p>It's been about a month since we've seen you on Quoted. We genuinely miss having you as part of our community.</p>
-
-            <p>We'd love to know what would bring you back. Was there something that didn't work for you? A feature you needed? Just hit reply and let us know—we read every message.</p>
-
-            <div class="stat-box" style="margin: 24px 0; background-color: #1a1a1a; border: 1px solid rgba(255, 255, 255, 0.1);">
-                <div style="color: #ffffff; font-size: 18px; font-weight: 600; margin-bottom: 12px;">
-                    🎁 Special Welcome Back Offer
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6; margin-bottom: 12px;">
-                    If you'd like to give Quoted another shot, we'll extend your trial by 7 days—no strings attached. Just reply to this email and we'll set it up.
-                </div>
-                <div style="color: #a0a0a0; font-size: 13px;">
-                    Offer expires in 7 days
-                </div>
-            </div>
-
-            <a href="https://quoted.it.com/app" class="button">Reactivate My Account</a>
-
-            <p style="margin-top: 32px; color: #e0e0e0;">Whether you come back or not, thanks for giving Quoted a try. We wish you all the best with your business.</p>
-
-            <p class="muted" style="margin-top: 16px;">
-                If you don't want to receive these emails anymore, you can <a href="https://quoted.it.com/unsubscribe" style="color: #a0a0a0;">unsubscribe here</a>.
-            </p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render("win_back.html", contractor_name=contractor_name)
 
         try:
-            response = resend.Emails.send({
+            response = await EmailService._deliver({
                 "from": EmailService.FROM_EMAIL,
                 "to": to_email,
                 "subject": "We miss you! Here's something special",
@@ -1267,73 +683,25 @@ class EmailService:
             customer_name: Optional related customer name
 
         Returns:
-            Resend API response
-        """
-        due_info = ""
-        if due_date:
-            due_info = f"""
-                <div class="stat-box" style="margin: 16px 0;">
-                    <div style="color: #a0a0a0; font-size: 13px; margin-bottom: 4px; text-transform: uppercase; letter-spacing: 0.5px;">
-                        Due Date
-                    </div>
-                    <div style="color: #ffffff; font-size: 18px; font-weight: 600;">
-                        {due_date.strftime('%B %d, %Y')}
-                    </div>
-                </div>
-            """
-
-        customer_info = ""
-        if customer_name:
-            customer_info = f"""
-                <div style="color: #a0a0a0; font-size: 14px; margin-bottom: 8px;">
-                    Related to: <strong style="color: #e0e0e0;">{customer_name}</strong>
-                </div>
-            """
-
-        description_html = ""
-        if task_description:
-            description_html = f"""
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6; margin: 16px 0; padding: 16px; background-color: #1a1a1a; border-radius: 8px;">
-                    {task_description}
-                </div>
-            """
-
-        content = f"""
-            <h1>Task Reminder ⏰</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p>Just a friendly reminder about this task:</p>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 20px; font-weight: 600; margin-bottom: 12px;">
-                    {task_title}
-                </div>
-                {customer_info}
-                {description_html}
-            </div>
-
-            {due_info}
-
-            <a href="https://quoted.it.com/app?tab=tasks" class="button">View My Tasks</a>
-
-            <p class="muted">You can manage your task reminders in the Tasks section of your dashboard.</p>
+            Queued email receipt (id of the outbox row)
         """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "task_reminder.html",
+            contractor_name=contractor_name,
+            task_title=task_title,
+            task_description=task_description,
+            due_date=due_date,
+            customer_name=customer_name,
+        )
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": EmailService.FROM_EMAIL,
-                    "to": to_email,
-                    "subject": f"⏰ Reminder: {task_title}",
-                    "html": html,
-                })
-            )
-            logger.info(f"Task reminder email sent successfully to {to_email}")
+            response = await EmailService._deliver({
+                "from": EmailService.FROM_EMAIL,
+                "to": to_email,
+                "subject": f"⏰ Reminder: {task_title}",
+                "html": html,
+            })
+            logger.info(f"Task reminder email queued for {to_email}")
             return response
         except Exception as e:
             logger.error(f"Failed to send task reminder email to {to_email}", exc_info=True)
@@ -1358,52 +726,26 @@ class EmailService:
             quote_token: Token for the shared quote link
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
         customer_display = customer_name if customer_name else "Your customer"
-        formatted_total = f"${quote_total:,.2f}"
-
-        content = f"""
-            <h1>Your quote was just viewed! 👀</h1>
-
-            <p>Hey {contractor_name},</p>
-
-            <p><strong>{customer_display}</strong> just opened and viewed your quote.</p>
 
-            <div class="stats-grid" style="margin: 24px 0;">
-                <div class="stat-box">
-                    <div class="stat-value">{formatted_total}</div>
-                    <div class="stat-label">Quote Total</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">Just Now</div>
-                    <div class="stat-label">First Viewed</div>
-                </div>
-            </div>
-
-            <p>This is a great sign! They're actively reviewing your proposal. Consider following up if you don't hear back soon.</p>
-
-            <a href="https://quoted.it.com/app" class="button">View Quote Details</a>
-
-            <p class="muted" style="margin-top: 24px;">
-                <a href="https://quoted.it.com/shared/{quote_token}" style="color: #a0a0a0;">View the quote as your customer sees it →</a>
-            </p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "quote_first_view.html",
+            contractor_name=contractor_name,
+            customer_display=customer_display,
+            quote_total=quote_total,
+            quote_token=quote_token,
+        )
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": EmailService.FROM_EMAIL,
-                    "to": to_email,
-                    "subject": f"👀 {customer_display} just viewed your quote!",
-                    "html": html,
-                })
-            )
-            logger.info(f"Quote first-view email sent successfully to {to_email}")
+            response = await EmailService._deliver({
+                "from": EmailService.FROM_EMAIL,
+                "to": to_email,
+                "subject": f"👀 {customer_display} just viewed your quote!",
+                "html": html,
+            })
+            logger.info(f"Quote first-view email queued for {to_email}")
             return response
         except Exception as e:
             logger.error(f"Failed to send quote first-view email to {to_email}", exc_info=True)
@@ -1417,7 +759,8 @@ class EmailService:
         total: float,
         due_date: Optional[str] = None,
         share_url: Optional[str] = None,
-        message: Optional[str] = None
+        message: Optional[str] = None,
+        pdf_bytes: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Send invoice via email to customer (DISC-071).
@@ -1430,62 +773,106 @@ class EmailService:
             due_date: Optional due date string
             share_url: URL to view invoice online
             message: Optional personal message from contractor
+            pdf_bytes: Optional invoice PDF to attach
 
         Returns:
-            Resend API response
-        """
-        formatted_total = f"${total:,.2f}"
-        personal_msg = f"<p>{message}</p>" if message else ""
-        due_info = f"<p><strong>Due:</strong> {due_date}</p>" if due_date else ""
+            Queued email receipt (id of the outbox row)
+        """
+        html = EmailService._render(
+            "invoice.html",
+            contractor_name=contractor_name,
+            invoice_number=invoice_number,
+            total=total,
+            due_date=due_date,
+            share_url=share_url,
+            message=message,
+        )
 
-        content = f"""
-            <h1>Invoice from {contractor_name}</h1>
-
-            <p>Hello,</p>
-
-            <p>You have received an invoice from {contractor_name}.</p>
-
-            {personal_msg}
+        try:
+            email_data = {
+                "from": EmailService.FROM_EMAIL,
+                "to": to_email,
+                "subject": f"Invoice {invoice_number} from {contractor_name}",
+                "html": html,
+            }
+            if pdf_bytes is not None:
+                import base64
+                email_data["attachments"] = [{
+                    "filename": f"invoice_{invoice_number}.pdf",
+                    "content": base64.b64encode(pdf_bytes).decode(),
+                }]
 
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #a0a0a0; font-size: 13px; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">
-                    Invoice #{invoice_number}
-                </div>
-                <div class="stat-value" style="font-family: 'Playfair Display', Georgia, serif; font-size: 32px; font-weight: 600; color: #ffffff; margin-bottom: 12px;">
-                    {formatted_total}
-                </div>
-                {due_info}
-            </div>
+            response = await EmailService._deliver(email_data)
+            logger.info(f"Invoice email queued for {to_email}")
+            return response
+        except Exception as e:
+            logger.error(f"Failed to send invoice email to {to_email}", exc_info=True)
+            raise
 
-            <a href="{share_url}" class="button">View Invoice</a>
+    @staticmethod
+    async def send_payment_reminder_email(
+        to_email: str,
+        customer_name: str,
+        business_name: str,
+        invoice_number: str,
+        amount: float,
+        due_date: Optional[datetime],
+        invoice_link: str,
+        is_overdue: bool = False,
+        days_overdue: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a payment reminder for an invoice (INNOV-6).
 
-            <p class="muted" style="margin-top: 32px;">Thank you for your business!</p>
+        Args:
+            to_email: Customer's email address
+            customer_name: Customer's name
+            business_name: Name of the contractor/business
+            invoice_number: Invoice number (e.g., INV-0001)
+            amount: Invoice total amount
+            due_date: Invoice due date
+            invoice_link: URL to view the invoice online
+            is_overdue: True once the due date has passed
+            days_overdue: Days past the due date (overdue reminders)
 
-            <p class="muted" style="padding-top: 24px; border-top: 1px solid rgba(255, 255, 255, 0.1);">
-                This invoice was sent via Quoted.<br>
-                <a href="https://quoted.it.com" style="color: #a0a0a0;">Learn more</a>
-            </p>
+        Returns:
+            Queued email receipt (id of the outbox row)
         """
+        due_text = due_date.strftime('%B %d, %Y') if due_date else "soon"
 
-        # Escape curly braces in content to prevent format() issues
-        content = content.replace('{', '{{').replace('}', '}}')
-        html = EmailService._get_base_template().replace('{content}', content)
+        if is_overdue:
+            heading = f"Invoice {invoice_number} is overdue"
+            intro = (
+                f"This is a reminder that invoice #{invoice_number} from {business_name} "
+                f"was due on {due_text}"
+                + (f" ({days_overdue} day{'s' if days_overdue != 1 else ''} ago)." if days_overdue else ".")
+            )
+            subject = f"Overdue: Invoice {invoice_number} from {business_name}"
+        else:
+            heading = f"Invoice {invoice_number} is due {due_text}"
+            intro = f"A friendly reminder that invoice #{invoice_number} from {business_name} is due on {due_text}."
+            subject = f"Reminder: Invoice {invoice_number} from {business_name}"
+
+        html = EmailService._render(
+            "payment_reminder.html",
+            heading=heading,
+            customer_name=customer_name,
+            intro=intro,
+            amount=amount,
+            invoice_link=invoice_link,
+        )
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": EmailService.FROM_EMAIL,
-                    "to": to_email,
-                    "subject": f"Invoice {invoice_number} from {contractor_name}",
-                    "html": html,
-                })
-            )
-            logger.info(f"Invoice email sent successfully to {to_email}")
+            response = await EmailService._deliver({
+                "from": EmailService.FROM_EMAIL,
+                "to": to_email,
+                "subject": subject,
+                "html": html,
+            })
+            logger.info(f"Payment reminder queued for invoice {invoice_number} to {to_email}")
             return response
         except Exception as e:
-            logger.error(f"Failed to send invoice email to {to_email}", exc_info=True)
+            logger.error(f"Failed to send payment reminder to {to_email}", exc_info=True)
             raise
 
     # =========================================================================
@@ -1514,50 +901,27 @@ class EmailService:
             used_referral: Referral code they used (if any)
 
         Returns:
-            Resend API response
-        """
-        referral_info = ""
-        if used_referral:
-            referral_info = f"""
-                <div style="color: #22c55e; font-size: 14px; margin-top: 12px;">
-                    🎉 Used referral code: <strong>{used_referral}</strong>
-                </div>
-            """
-
-        content = f"""
-            <h1>🎉 New Signup!</h1>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 20px; font-weight: 600; margin-bottom: 16px;">
-                    {business_name}
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.8;">
-                    <strong>Owner:</strong> {owner_name or 'Not provided'}<br>
-                    <strong>Email:</strong> {user_email}<br>
-                    <strong>Trade:</strong> {primary_trade or 'Not specified'}<br>
-                    <strong>Their Referral Code:</strong> {referral_code or 'None'}
-                </div>
-                {referral_info}
-            </div>
-
-            <p class="muted">This is an automated notification from Quoted.</p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+            Queued email receipt (id of the outbox row)
+        """
+        html = EmailService._render(
+            "founder_signup.html",
+            business_name=business_name,
+            owner_name=owner_name,
+            user_email=user_email,
+            primary_trade=primary_trade,
+            referral_code=referral_code,
+            used_referral=used_referral,
+        )
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": EmailService.FROM_EMAIL,
-                    "to": settings.founder_email,
-                    "subject": f"[Quoted] New Signup: {business_name}",
-                    "html": html,
-                    "text": f"New Signup: {business_name}\n\nOwner: {owner_name or 'Not provided'}\nEmail: {user_email}\nTrade: {primary_trade or 'Not specified'}\n\nThis is an automated notification from Quoted.",
-                })
-            )
-            logger.info(f"Founder signup notification sent for {user_email}")
+            response = await EmailService._deliver({
+                "from": EmailService.FROM_EMAIL,
+                "to": settings.founder_email,
+                "subject": f"[Quoted] New Signup: {business_name}",
+                "html": html,
+                "text": f"New Signup: {business_name}\n\nOwner: {owner_name or 'Not provided'}\nEmail: {user_email}\nTrade: {primary_trade or 'Not specified'}\n\nThis is an automated notification from Quoted.",
+            })
+            logger.info(f"Founder signup notification queued for {user_email}")
             return response
         except Exception as e:
             logger.error(f"Failed to send founder signup notification for {user_email}", exc_info=True)
@@ -1580,59 +944,30 @@ class EmailService:
             ip_address: Visitor's IP address (optional)
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
-        formatted_total = f"${quote_total:,.2f}"
-        ip_info = f"<br><strong>IP:</strong> {ip_address}" if ip_address else ""
+        formatted_total = format_money(quote_total)
 
         # Truncate long job descriptions
         job_display = job_description[:200] + "..." if len(job_description) > 200 else job_description
 
-        content = f"""
-            <h1>👀 Demo Quote Generated</h1>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #a0a0a0; font-size: 13px; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">
-                    Job Description
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.6; margin-bottom: 16px;">
-                    {job_display}
-                </div>
-            </div>
-
-            <div class="stats-grid" style="margin: 24px 0;">
-                <div class="stat-box">
-                    <div class="stat-value">{formatted_total}</div>
-                    <div class="stat-label">Quote Total</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">{line_item_count}</div>
-                    <div class="stat-label">Line Items</div>
-                </div>
-            </div>
-
-            <p class="muted" style="font-size: 13px;">
-                Visitor info{ip_info}
-            </p>
-
-            <p class="muted">This is an automated notification from Quoted demo page.</p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "founder_demo.html",
+            job_display=job_display,
+            quote_total=quote_total,
+            line_item_count=line_item_count,
+            ip_address=ip_address,
+        )
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": EmailService.FROM_EMAIL,
-                    "to": settings.founder_email,
-                    "subject": f"[Quoted] Demo: {formatted_total} quote generated",
-                    "html": html,
-                    "text": f"Demo Quote Generated\n\nJob: {job_display}\nTotal: {formatted_total}\nLine Items: {line_item_count}\nIP: {ip_address or 'Unknown'}\n\nThis is an automated notification from Quoted.",
-                })
-            )
-            logger.info(f"Founder demo notification sent for {formatted_total} quote")
+            response = await EmailService._deliver({
+                "from": EmailService.FROM_EMAIL,
+                "to": settings.founder_email,
+                "subject": f"[Quoted] Demo: {formatted_total} quote generated",
+                "html": html,
+                "text": f"Demo Quote Generated\n\nJob: {job_display}\nTotal: {formatted_total}\nLine Items: {line_item_count}\nIP: {ip_address or 'Unknown'}\n\nThis is an automated notification from Quoted.",
+            })
+            logger.info(f"Founder demo notification queued for {formatted_total} quote")
             return response
         except Exception as e:
             logger.error(f"Failed to send founder demo notification", exc_info=True)
@@ -1659,54 +994,30 @@ class EmailService:
             line_item_count: Number of line items
 
         Returns:
-            Resend API response
-        """
-        formatted_total = f"${quote_total:,.2f}"
-
-        content = f"""
-            <h1>Quote Created</h1>
-
-            <div class="stat-box" style="margin: 24px 0;">
-                <div style="color: #ffffff; font-size: 20px; font-weight: 600; margin-bottom: 16px;">
-                    {business_name}
-                </div>
-                <div style="color: #e0e0e0; font-size: 15px; line-height: 1.8;">
-                    <strong>For:</strong> {customer_name or 'Not specified'}<br>
-                    <strong>Job:</strong> {job_type or 'Not specified'}<br>
-                </div>
-            </div>
-
-            <div class="stats-grid" style="margin: 24px 0;">
-                <div class="stat-box">
-                    <div class="stat-value">{formatted_total}</div>
-                    <div class="stat-label">Quote Total</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">{line_item_count}</div>
-                    <div class="stat-label">Line Items</div>
-                </div>
-            </div>
-
-            <p class="muted">This is an automated notification from Quoted.</p>
+            Queued email receipt (id of the outbox row)
         """
+        formatted_total = format_money(quote_total)
 
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "founder_quote.html",
+            business_name=business_name,
+            customer_name=customer_name,
+            job_type=job_type,
+            quote_total=quote_total,
+            line_item_count=line_item_count,
+        )
 
         plain_text = f"Quote Created by {business_name}\n\nFor: {customer_name or 'Not specified'}\nJob: {job_type or 'Not specified'}\nTotal: {formatted_total}\nLine Items: {line_item_count}\n\nThis is an automated notification from Quoted."
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": EmailService.FROM_EMAIL,
-                    "to": settings.founder_email,
-                    "subject": f"[Quoted] Quote: {formatted_total} by {business_name}",
-                    "html": html,
-                    "text": plain_text,
-                })
-            )
-            logger.info(f"Founder quote notification sent for {user_email}: {formatted_total}")
+            response = await EmailService._deliver({
+                "from": EmailService.FROM_EMAIL,
+                "to": settings.founder_email,
+                "subject": f"[Quoted] Quote: {formatted_total} by {business_name}",
+                "html": html,
+                "text": plain_text,
+            })
+            logger.info(f"Founder quote notification queued for {user_email}: {formatted_total}")
             return response
         except Exception as e:
             logger.error(f"Failed to send founder quote notification for {user_email}", exc_info=True)
@@ -1731,7 +1042,7 @@ class EmailService:
             days_since_signup: Days since they signed up
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
         greeting = f"Hi {owner_name}," if owner_name else "Hi there,"
 
@@ -1739,76 +1050,49 @@ class EmailService:
             # Early feedback - first impressions
             subject = "Quick question about your first Quoted experience"
             body_intro = "You've had a few days to try Quoted, and I'd love to hear your honest first impressions."
-            questions = """
-                <ul style="color: #e0e0e0; line-height: 2;">
-                    <li>Was the setup process smooth?</li>
-                    <li>Did the AI understand your pricing well?</li>
-                    <li>Any features you wish existed?</li>
-                </ul>
-            """
+            questions = [
+                "Was the setup process smooth?",
+                "Did the AI understand your pricing well?",
+                "Any features you wish existed?",
+            ]
         elif days_since_signup <= 7:
             # Week-in feedback - usage patterns
             subject = "How's Quoted working for your workflow?"
             body_intro = "You've been using Quoted for about a week now. I'm curious how it's fitting into your daily workflow."
-            questions = """
-                <ul style="color: #e0e0e0; line-height: 2;">
-                    <li>How many quotes have you generated?</li>
-                    <li>Is the AI getting better at your pricing?</li>
-                    <li>What's the biggest time-saver so far?</li>
-                </ul>
-            """
+            questions = [
+                "How many quotes have you generated?",
+                "Is the AI getting better at your pricing?",
+                "What's the biggest time-saver so far?",
+            ]
         else:
             # Deeper feedback - value assessment
             subject = "Is Quoted delivering value for you?"
             body_intro = "You've been with us for a few weeks now. I want to make sure Quoted is genuinely helping your business."
-            questions = """
-                <ul style="color: #e0e0e0; line-height: 2;">
-                    <li>Has Quoted changed how you handle quotes?</li>
-                    <li>What would make it indispensable?</li>
-                    <li>Would you recommend it to other contractors?</li>
-                </ul>
-            """
-
-        content = f"""
-            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                {greeting}
-            </p>
-
-            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                {body_intro}
-            </p>
-
-            {questions}
-
-            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                Just hit reply - I read every response personally. Your feedback directly shapes what we build next.
-            </p>
-
-            <p style="color: #a0a0a0; font-size: 14px; margin-top: 32px;">
-                Thanks for being an early user,<br>
-                <strong style="color: #ffffff;">Eddie</strong><br>
-                Founder, Quoted
-            </p>
-        """
-
-        html = EmailService._get_base_template().replace('{content}', content)
+            questions = [
+                "Has Quoted changed how you handle quotes?",
+                "What would make it indispensable?",
+                "Would you recommend it to other contractors?",
+            ]
+
+        html = EmailService._render(
+            "feedback_request.html",
+            greeting=greeting,
+            body_intro=body_intro,
+            questions=questions,
+        )
 
         plain_text = f"{greeting}\n\n{body_intro}\n\nJust hit reply - I read every response personally.\n\nThanks,\nEddie\nFounder, Quoted"
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": "Eddie from Quoted <hello@quoted.it.com>",
-                    "to": to_email,
-                    "reply_to": "eddie@granular.tools",
-                    "subject": subject,
-                    "html": html,
-                    "text": plain_text,
-                })
-            )
-            logger.info(f"Feedback request sent to {to_email} (day {days_since_signup})")
+            response = await EmailService._deliver({
+                "from": "Eddie from Quoted <hello@quoted.it.com>",
+                "to": to_email,
+                "reply_to": "eddie@granular.tools",
+                "subject": subject,
+                "html": html,
+                "text": plain_text,
+            })
+            logger.info(f"Feedback request queued for {to_email} (day {days_since_signup})")
             return response
         except Exception as e:
             logger.error(f"Failed to send feedback request to {to_email}", exc_info=True)
@@ -1837,7 +1121,7 @@ class EmailService:
             offer_extended_trial: Whether to offer extended trial
 
         Returns:
-            Resend API response
+            Queued email receipt (id of the outbox row)
         """
         name = owner_name if owner_name else business_name
         greeting = f"Hi {name}," if name else "Hi there,"
@@ -1845,83 +1129,29 @@ class EmailService:
         if not has_created_quote:
             # User signed up but never created a quote
             subject = f"Hey {name} - quick question"
-            body_content = """
-                <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                    I noticed you signed up for Quoted but haven't created your first quote yet. I wanted to personally reach out and see if there's anything I can help with.
-                </p>
-
-                <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                    A few things I'm curious about:
-                </p>
-
-                <ul style="color: #e0e0e0; line-height: 2;">
-                    <li>Did you run into any issues during setup?</li>
-                    <li>Is there a feature you were hoping to find that we don't have?</li>
-                    <li>Just been busy? (I totally get it - contractor life is hectic)</li>
-                </ul>
-
-                <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                    Seriously - just hit reply and let me know. I read every single response and I genuinely want to make Quoted something that helps your business.
-                </p>
-            """
-
-            if offer_extended_trial:
-                body_content += """
-                <div style="background: linear-gradient(135deg, #1a1a1a 0%, #2a2a2a 100%); padding: 20px; border-radius: 12px; border-left: 4px solid #22c55e; margin: 24px 0;">
-                    <div style="font-size: 1.1rem; color: #22c55e; font-weight: 600; margin-bottom: 8px;">Extended Trial Offer</div>
-                    <div style="color: #e0e0e0;">If you need more time to try things out, just reply to this email and I'll extend your trial - no questions asked.</div>
-                </div>
-                """
         else:
             # User created a quote but hasn't been active
             subject = f"How's Quoted working for you, {name}?"
-            body_content = """
-                <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                    I saw you've been using Quoted and I wanted to check in personally. How's it going?
-                </p>
-
-                <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                    I'm always looking for feedback on how to make this better for contractors. If there's anything that's not working well for you, or something you wish it did differently - I'd love to hear it.
-                </p>
-
-                <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                    Just reply to this email. I read everything personally.
-                </p>
-            """
-
-        content = f"""
-            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
-                {greeting}
-            </p>
-
-            {body_content}
-
-            <p style="color: #a0a0a0; font-size: 14px; margin-top: 32px;">
-                Thanks,<br>
-                <strong style="color: #ffffff;">Eddie</strong><br>
-                <span style="color: #666;">Founder, Quoted</span><br>
-                <span style="color: #666; font-size: 12px;">P.S. - This isn't an automated email. I'm a real person and I actually want to hear from you.</span>
-            </p>
-        """
 
-        html = EmailService._get_base_template().replace('{content}', content)
+        html = EmailService._render(
+            "personal_checkin.html",
+            greeting=greeting,
+            has_created_quote=has_created_quote,
+            offer_extended_trial=offer_extended_trial,
+        )
 
         plain_text = f"{greeting}\n\nI noticed you signed up for Quoted and wanted to reach out personally. Is there anything I can help with? Just reply to this email.\n\nThanks,\nEddie\nFounder, Quoted"
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(resend.Emails.send, {
-                    "from": "Eddie from Quoted <hello@quoted.it.com>",
-                    "to": to_email,
-                    "reply_to": "eddie@granular.tools",
-                    "subject": subject,
-                    "html": html,
-                    "text": plain_text,
-                })
-            )
-            logger.info(f"Personal check-in email sent to {to_email}")
+            response = await EmailService._deliver({
+                "from": "Eddie from Quoted <hello@quoted.it.com>",
+                "to": to_email,
+                "reply_to": "eddie@granular.tools",
+                "subject": subject,
+                "html": html,
+                "text": plain_text,
+            })
+            logger.info(f"Personal check-in email queued for {to_email}")
             return response
         except Exception as e:
             logger.error(f"Failed to send personal check-in email to {to_email}", exc_info=True)
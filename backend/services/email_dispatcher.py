@@ -0,0 +1,427 @@
+"""
+Outbound email dispatcher for Quoted.
+
+Every EmailService.send_* method used to call resend.Emails.send itself,
+one request per email, inline with the request handler or scheduler loop
+that wanted the email. Drips slept between sends to stay under Resend's
+2 requests/sec, so they took longer with every contractor.
+
+Sending is now split in two:
+
+- EmailService only writes the Resend send params to the email_outbox
+  table (queue_email) and returns; handlers never wait on Resend.
+- EmailDispatcher workers (in every uvicorn worker) claim due rows in
+  batches and deliver them with Resend's batch endpoint, up to 100 emails
+  per request. Emails with attachments (batch sends don't support them)
+  go out one request each.
+
+Every provider request goes through resilience.py: the resend rate limiter
+(this process's share of the account limit, paused on HTTP 429), the resend
+circuit breaker and a short in-process retry. Emails that still fail are
+retried with exponential backoff up to email_dispatch_max_attempts, then
+left with status "failed" for inspection; emails Resend rejects as invalid
+fail immediately. A batch Resend rejects as invalid is re-sent one email at
+a time so a single bad address doesn't hold back the others.
+
+Claims hold a lease like the task outbox (services/outbox.py): if the
+process dies mid-send, the rows become claimable again when it expires, so
+delivery is at-least-once. Sent rows are deleted.
+"""
+
+import asyncio
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Optional, Dict, Any, List, Callable
+
+import resend
+from resend.exceptions import (
+    InvalidApiKeyError,
+    MissingApiKeyError,
+    MissingRequiredFieldsError,
+    ResendError,
+    ValidationError,
+)
+from sqlalchemy import select, update, delete, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.database import EmailOutboxMessage
+from .logging import get_logger
+from .resilience import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    RateLimiter,
+    RetryConfig,
+    resend_circuit,
+    resend_rate_limiter,
+    resilient,
+)
+
+logger = get_logger("quoted.email_dispatcher")
+
+# Resend's limit for one batch request
+MAX_BATCH_SIZE = 100
+
+# Seconds to pause the rate limiter after a 429
+RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
+# The request itself is wrong: retrying can't help
+REJECTED_ERRORS = (ValidationError, MissingRequiredFieldsError)
+
+# In-process retry around each provider request; the outbox row's own
+# backoff takes over after that
+DISPATCH_RETRY_CONFIG = RetryConfig(
+    max_attempts=3,
+    initial_delay=1.0,
+    max_delay=10.0,
+    exponential_base=2.0,
+    jitter=True,
+    non_retryable_exceptions=REJECTED_ERRORS + (
+        InvalidApiKeyError,
+        MissingApiKeyError,
+        CircuitBreakerOpen,
+    ),
+)
+
+
+def enqueue_email(session: AsyncSession, params: Dict[str, Any]) -> EmailOutboxMessage:
+    """
+    Add an email (resend.Emails.send params) to the outbox in the caller's transaction.
+
+    Call notify_email_dispatcher() after committing to send it right away.
+    """
+    message = EmailOutboxMessage(params=params)
+    session.add(message)
+    return message
+
+
+async def queue_email(params: Dict[str, Any]) -> str:
+    """Queue an email in its own transaction and wake the dispatcher; return its id."""
+    from .database import async_session_factory
+
+    async with async_session_factory() as session:
+        message = enqueue_email(session, params)
+        await session.commit()
+        message_id = message.id
+    notify_email_dispatcher()
+    return message_id
+
+
+@dataclass
+class ClaimedEmail:
+    """An outbox email leased by this worker."""
+    id: str
+    params: Dict[str, Any]
+    attempts: int
+
+
+class EmailDispatcher:
+    """asyncio workers draining the email outbox into Resend."""
+
+    def __init__(
+        self,
+        session_factory,
+        workers: int = 2,
+        batch_size: int = MAX_BATCH_SIZE,
+        poll_interval: float = 2.0,
+        lease_seconds: int = 120,
+        max_attempts: int = 6,
+        retry_base_seconds: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit: Optional[CircuitBreaker] = None,
+        retry_config: Optional[RetryConfig] = None,
+    ):
+        self._session_factory = session_factory
+        self.workers = workers
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.rate_limiter = rate_limiter or resend_rate_limiter
+
+        self._call = resilient(
+            circuit_breaker=circuit or resend_circuit,
+            retry_config=retry_config or DISPATCH_RETRY_CONFIG,
+        )(self._provider_request)
+
+        self._tasks: List[asyncio.Task] = []
+        self._wake = asyncio.Event()
+        self._sending = 0
+
+        # Since this process started
+        self.sent = 0
+        self.requests = 0
+        self.retried = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(), name=f"email-dispatcher-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info("Email dispatcher started", extra={"workers": self.workers})
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers (new emails were committed)."""
+        self._wake.set()
+
+    async def _worker_loop(self) -> None:
+        while True:
+            try:
+                emails = await self.claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Email outbox claim failed: {e}")
+                emails = []
+
+            if not emails:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self.deliver(emails)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Couldn't record the outcome; the lease expiring retries them
+                logger.error(f"Email outbox bookkeeping failed for {len(emails)} emails: {e}")
+
+    async def claim(self) -> List[ClaimedEmail]:
+        """Lease up to batch_size due emails (empty if there are none)."""
+        now = datetime.utcnow()
+        due = or_(
+            and_(EmailOutboxMessage.status == "pending", EmailOutboxMessage.run_after <= now),
+            and_(EmailOutboxMessage.status == "sending", EmailOutboxMessage.locked_until < now),
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(EmailOutboxMessage.id)
+                .where(due)
+                .order_by(EmailOutboxMessage.run_after)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            ids = result.scalars().all()
+            if not ids:
+                return []
+
+            # Conditional update: rows a concurrent claimer got first (no row
+            # locks on SQLite) are no longer due and keep their token
+            token = str(uuid.uuid4())
+            await session.execute(
+                update(EmailOutboxMessage)
+                .where(EmailOutboxMessage.id.in_(ids), due)
+                .values(
+                    status="sending",
+                    attempts=EmailOutboxMessage.attempts + 1,
+                    locked_until=now + self.lease,
+                    claim_token=token,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(
+                select(EmailOutboxMessage.id, EmailOutboxMessage.params, EmailOutboxMessage.attempts)
+                .where(EmailOutboxMessage.claim_token == token)
+                .order_by(EmailOutboxMessage.run_after)
+            )
+            rows = result.all()
+            await session.commit()
+
+        return [ClaimedEmail(id=row.id, params=dict(row.params or {}), attempts=row.attempts) for row in rows]
+
+    async def deliver(self, emails: List[ClaimedEmail]) -> None:
+        """Send claimed emails (batched where Resend allows) and record outcomes."""
+        self._sending += len(emails)
+        try:
+            batchable = [email for email in emails if not email.params.get("attachments")]
+            single = [email for email in emails if email.params.get("attachments")]
+
+            for start in range(0, len(batchable), MAX_BATCH_SIZE):
+                await self._deliver_batch(batchable[start:start + MAX_BATCH_SIZE])
+            for email in single:
+                await self._deliver_one(email)
+        finally:
+            self._sending -= len(emails)
+
+    async def _deliver_batch(self, emails: List[ClaimedEmail]) -> None:
+        if len(emails) == 1:
+            await self._deliver_one(emails[0])
+            return
+        try:
+            await self._call(resend.Batch.send, [email.params for email in emails])
+        except REJECTED_ERRORS as e:
+            # Resend validates the batch as a whole: find the bad ones
+            logger.warning(f"Resend rejected a batch of {len(emails)}, sending individually: {e}")
+            for email in emails:
+                await self._deliver_one(email)
+            return
+        except Exception as e:
+            await self._record_failure(emails, e)
+            return
+        await self._record_sent(emails)
+
+    async def _deliver_one(self, email: ClaimedEmail) -> None:
+        try:
+            await self._call(resend.Emails.send, email.params)
+        except REJECTED_ERRORS as e:
+            await self._record_failure([email], e, retry=False)
+            return
+        except Exception as e:
+            await self._record_failure([email], e)
+            return
+        await self._record_sent([email])
+
+    async def _provider_request(self, send: Callable, payload: Any) -> Any:
+        """One rate-limited Resend request (the Resend SDK is synchronous)."""
+        await self.rate_limiter.acquire()
+        self.requests += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(send, payload))
+        except ResendError as e:
+            if str(e.code) == "429":
+                self.rate_limiter.backoff(RATE_LIMIT_BACKOFF_SECONDS)
+            raise
+
+    async def _record_sent(self, emails: List[ClaimedEmail]) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(EmailOutboxMessage)
+                .where(EmailOutboxMessage.id.in_([email.id for email in emails]))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        self.sent += len(emails)
+
+    async def _record_failure(
+        self,
+        emails: List[ClaimedEmail],
+        error: Exception,
+        retry: bool = True,
+    ) -> None:
+        error_text = str(error)[:2000]
+        async with self._session_factory() as session:
+            for email in emails:
+                if retry and email.attempts < self.max_attempts:
+                    delay = self.retry_base_seconds * (2 ** (email.attempts - 1))
+                    values = {
+                        "status": "pending",
+                        "run_after": datetime.utcnow() + timedelta(seconds=delay),
+                        "locked_until": None,
+                        "claim_token": None,
+                        "last_error": error_text,
+                    }
+                    self.retried += 1
+                else:
+                    values = {
+                        "status": "failed",
+                        "locked_until": None,
+                        "claim_token": None,
+                        "last_error": error_text,
+                    }
+                    self.failed += 1
+                    logger.error(
+                        f"Email to {email.params.get('to')} failed permanently: {error}",
+                        extra={"email_id": email.id, "attempts": email.attempts},
+                    )
+                await session.execute(
+                    update(EmailOutboxMessage)
+                    .where(EmailOutboxMessage.id == email.id)
+                    .values(**values)
+                )
+            await session.commit()
+        if retry:
+            logger.warning(f"Sending {len(emails)} emails failed, will retry: {error}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._tasks),
+            "sending": self._sending,
+            "sent": self.sent,
+            "requests": self.requests,
+            "retried": self.retried,
+            "failed": self.failed,
+            "rate_limiter": self.rate_limiter.get_status(),
+        }
+
+
+async def get_email_queue_stats(session: AsyncSession) -> Dict[str, Any]:
+    """Email outbox depth and lag across all workers (from the table)."""
+    now = datetime.utcnow()
+    result = await session.execute(
+        select(EmailOutboxMessage.status, func.count(EmailOutboxMessage.id))
+        .group_by(EmailOutboxMessage.status)
+    )
+    by_status: Dict[str, int] = {status: count for status, count in result.all()}
+
+    # Lag: how long the oldest due, unclaimed email has been waiting
+    result = await session.execute(
+        select(func.min(EmailOutboxMessage.run_after)).where(
+            EmailOutboxMessage.status == "pending",
+            EmailOutboxMessage.run_after <= now,
+        )
+    )
+    oldest_due = result.scalar()
+
+    return {
+        "pending": by_status.get("pending", 0),
+        "sending": by_status.get("sending", 0),
+        "failed": by_status.get("failed", 0),
+        "lag_seconds": round((now - oldest_due).total_seconds(), 1) if oldest_due else 0.0,
+    }
+
+
+# Singleton dispatcher (one per uvicorn worker)
+_email_dispatcher: Optional[EmailDispatcher] = None
+
+
+def get_email_dispatcher() -> EmailDispatcher:
+    """Get the email dispatcher for this process."""
+    global _email_dispatcher
+    if _email_dispatcher is None:
+        from .database import async_session_factory
+        resend_rate_limiter.configure(settings.email_dispatch_rate_per_second)
+        _email_dispatcher = EmailDispatcher(
+            session_factory=async_session_factory,
+            workers=settings.email_dispatcher_workers,
+            batch_size=settings.email_dispatch_batch_size,
+            poll_interval=settings.email_dispatch_poll_interval_seconds,
+            lease_seconds=settings.email_dispatch_lease_seconds,
+            max_attempts=settings.email_dispatch_max_attempts,
+            retry_base_seconds=settings.email_dispatch_retry_base_seconds,
+        )
+    return _email_dispatcher
+
+
+def start_email_dispatcher() -> None:
+    """Start sending queued email from this process (call from lifespan)."""
+    get_email_dispatcher().start()
+
+
+async def stop_email_dispatcher() -> None:
+    global _email_dispatcher
+    if _email_dispatcher is not None:
+        await _email_dispatcher.stop()
+        _email_dispatcher = None
+
+
+def notify_email_dispatcher() -> None:
+    """Wake this process's dispatcher after committing new emails (no-op if not started)."""
+    if _email_dispatcher is not None:
+        _email_dispatcher.notify()
@@ -0,0 +1,94 @@
+"""
+Precompiled email templates for Quoted.
+
+Email HTML used to be rebuilt for every message: each send_* method
+assembled its body with f-strings, then _get_base_template() rebuilt the
+~200-line layout string and substituted the body into it. Drips sending to
+thousands of recipients paid that construction cost per recipient (and
+send_email's .format() call tripped over the layout's CSS braces).
+
+Bodies now live in backend/templates/email/ as Jinja2 templates:
+- Every template is compiled once per process, when the EmailTemplates
+  singleton is created; rendering reuses the compiled code.
+- base.html (head, CSS, header, footer) is static. It is rendered once and
+  split around its content slot, so wrapping a body is two string
+  concatenations rather than a layout render per message.
+- Autoescaping is on: names, job descriptions and personal messages are
+  escaped. Pass markupsafe.Markup for values that are already HTML.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, select_autoescape
+from markupsafe import Markup
+
+from .logging import get_logger
+
+logger = get_logger("quoted.email_templates")
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+LAYOUT_TEMPLATE = "base.html"
+
+# Stands in for the content slot when the layout is rendered once
+_CONTENT_SLOT = "\x00content\x00"
+
+
+def format_money(value: Optional[float]) -> str:
+    """$1,234.50 style amounts (the `money` filter)."""
+    return f"${(value or 0):,.2f}"
+
+
+class EmailTemplates:
+    """Compiled email body templates plus the pre-rendered layout."""
+
+    def __init__(self, directory: Path = TEMPLATE_DIR):
+        self.env = Environment(
+            loader=FileSystemLoader(str(directory)),
+            autoescape=select_autoescape(["html"]),
+            undefined=StrictUndefined,  # A missing variable is a bug, not a blank
+            auto_reload=False,  # Templates ship with the code
+            cache_size=-1,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.env.filters["money"] = format_money
+
+        # Compile everything up front so no send pays for it
+        self._templates: Dict[str, Template] = {
+            name: self.env.get_template(name)
+            for name in self.env.list_templates(extensions=["html"])
+            if name != LAYOUT_TEMPLATE
+        }
+
+        layout = self.env.get_template(LAYOUT_TEMPLATE).render(content=Markup(_CONTENT_SLOT))
+        self._layout_head, self._layout_tail = layout.split(_CONTENT_SLOT)
+        logger.info(f"Compiled {len(self._templates)} email templates")
+
+    def wrap(self, body_html: str) -> str:
+        """Put an HTML body (trusted) into the shared layout."""
+        return f"{self._layout_head}{body_html}{self._layout_tail}"
+
+    def render(self, template_name: str, /, **context: Any) -> str:
+        """Render a body template (e.g. "welcome.html") into the layout."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._templates[template_name] = self.env.get_template(template_name)
+        return self.wrap(template.render(**context))
+
+    @property
+    def names(self):
+        return sorted(self._templates)
+
+
+# Singleton pattern
+_email_templates: Optional[EmailTemplates] = None
+
+
+def get_email_templates() -> EmailTemplates:
+    """Get the compiled email templates (compiled on first use)."""
+    global _email_templates
+    if _email_templates is None:
+        _email_templates = EmailTemplates()
+    return _email_templates
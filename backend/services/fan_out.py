@@ -0,0 +1,71 @@
+"""
+Bounded-concurrency fan-out for scheduler jobs.
+
+Reminder and follow-up jobs used to send one email at a time with an
+asyncio.sleep between sends, so a run took (sends x latency) and grew with
+every active contractor. They now load everything they need up front with
+set-based queries, send through fan_out() and write the results back in one
+transaction.
+
+fan_out() keeps at most `concurrency` sends in flight and can space their
+starts by `min_interval` seconds. EmailService sends only queue the email
+now (the email dispatcher paces Resend), so no spacing is configured by
+default.
+The send callable must not touch the job's database session: sessions are
+not safe for concurrent use.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from ..config import settings
+
+T = TypeVar("T")
+
+
+async def fan_out(
+    items: Iterable[T],
+    send: Callable[[T], Awaitable[object]],
+    concurrency: Optional[int] = None,
+    min_interval: Optional[float] = None,
+) -> List[Tuple[T, Optional[Exception]]]:
+    """
+    Run send(item) for every item with bounded concurrency.
+
+    Args:
+        items: Work items (e.g. prepared email payloads)
+        send: Coroutine function called once per item
+        concurrency: Max sends in flight (default: scheduler_email_concurrency)
+        min_interval: Min seconds between send starts
+            (default: scheduler_email_min_interval_seconds)
+
+    Returns:
+        (item, error) pairs in input order; error is None on success
+    """
+    items = list(items)
+    if concurrency is None:
+        concurrency = settings.scheduler_email_concurrency
+    if min_interval is None:
+        min_interval = settings.scheduler_email_min_interval_seconds
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    pace = asyncio.Lock()
+    next_start = 0.0
+
+    async def run(item: T) -> Tuple[T, Optional[Exception]]:
+        nonlocal next_start
+        async with semaphore:
+            if min_interval > 0:
+                async with pace:
+                    delay = next_start - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    next_start = time.monotonic() + min_interval
+            try:
+                await send(item)
+            except Exception as e:
+                return item, e
+            return item, None
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
@@ -364,45 +364,47 @@ class FollowUpService:
     MAX_STEPS = 3
 
     @staticmethod
-    async def process_due_followups(db: AsyncSession) -> int:
+    async def process_due_followups(db: AsyncSession, shard=None) -> int:
         """
         Process all follow-ups that are due.
 
+        Sequences are loaded with their quote and contractor in one joined
+        query; emails are sent with bounded concurrency (fan_out) and the
+        events/sequence updates are committed together afterwards.
+        Partitioned scheduler runs pass a job_shards.Shard to only process
+        that range of contractors.
+
         Returns count of follow-ups sent.
         """
+        from .fan_out import fan_out
+        from .job_shards import shard_filter
+
         now = datetime.utcnow()
 
-        # Get sequences due for follow-up
+        # Get sequences due for follow-up, with their quote and contractor
         result = await db.execute(
-            select(FollowUpSequence).where(
+            select(FollowUpSequence, Quote, Contractor)
+            .outerjoin(Quote, Quote.id == FollowUpSequence.quote_id)
+            .outerjoin(Contractor, Contractor.id == FollowUpSequence.contractor_id)
+            .where(
                 and_(
                     FollowUpSequence.status == "active",
                     FollowUpSequence.next_follow_up_at <= now,
-                    FollowUpSequence.current_step < FollowUpService.MAX_STEPS
+                    FollowUpSequence.current_step < FollowUpService.MAX_STEPS,
+                    shard_filter(shard, FollowUpSequence.contractor_id),
                 )
             )
         )
-        due_sequences = result.scalars().all()
+        due = result.all()
 
-        if not due_sequences:
+        if not due:
             return 0
 
-        sent_count = 0
         email_service = EmailService()
+        outgoing = []
 
-        for sequence in due_sequences:
+        for sequence, quote, contractor in due:
             try:
-                # Get quote and contractor
-                quote_result = await db.execute(
-                    select(Quote).where(Quote.id == sequence.quote_id)
-                )
-                quote = quote_result.scalar_one_or_none()
-
-                contractor_result = await db.execute(
-                    select(Contractor).where(Contractor.id == sequence.contractor_id)
-                )
-                contractor = contractor_result.scalar_one_or_none()
-
                 if not quote or not contractor:
                     sequence.status = "cancelled"
                     continue
@@ -422,80 +424,90 @@ class FollowUpService:
                     sequence.status = "completed"
                     continue
 
-                # Generate and send email
+                # Get customer email
+                customer_email = quote.customer_email
+                if not customer_email:
+                    logger.warning(f"No customer email for quote {quote.id}")
+                    continue
+
+                # Generate email
                 email_content = SmartFollowUpEngine.generate_follow_up_email(
                     quote=quote,
                     contractor=contractor,
                     template_key=recommendation.message_template,
                 )
+                outgoing.append((sequence, quote, contractor, recommendation, email_content))
 
-                # Get customer email
-                customer_email = quote.customer_email
-                if not customer_email:
-                    logger.warning(f"No customer email for quote {quote.id}")
-                    continue
+            except Exception as e:
+                logger.error(f"Error processing follow-up {sequence.id}: {e}")
 
-                # Send the follow-up email
-                await email_service.send_email(
-                    to_email=customer_email,
-                    subject=email_content["subject"],
-                    body=email_content["body"],
-                    reply_to=contractor.email,
+        # Send the follow-up emails
+        results = await fan_out(
+            outgoing,
+            lambda item: email_service.send_email(
+                to_email=item[1].customer_email,
+                subject=item[4]["subject"],
+                body=item[4]["body"],
+                reply_to=item[2].email,
+            ),
+        )
+
+        sent_count = 0
+        for (sequence, quote, contractor, recommendation, email_content), error in results:
+            if error is not None:
+                logger.error(f"Error processing follow-up {sequence.id}: {error}")
+                continue
+
+            # Record the event
+            event = FollowUpEvent(
+                sequence_id=sequence.id,
+                event_type="email_sent",
+                step_number=sequence.current_step,
+                event_data={
+                    "template": recommendation.message_template,
+                    "subject": email_content["subject"],
+                    "to_email": quote.customer_email,
+                    "signal": recommendation.signal.value,
+                    "urgency": recommendation.urgency,
+                    "reasoning": recommendation.reasoning,
+                }
+            )
+            db.add(event)
+
+            # Update sequence
+            sequence.current_step += 1
+            sequence.emails_sent = (sequence.emails_sent or 0) + 1
+            sequence.detected_signal = recommendation.signal.value
+
+            # Calculate next follow-up
+            if sequence.current_step < FollowUpService.MAX_STEPS:
+                next_rec = SmartFollowUpEngine.get_recommendation(
+                    quote,
+                    current_sequence_step=sequence.current_step
                 )
+                sequence.next_follow_up_at = now + timedelta(hours=next_rec.recommended_delay_hours)
+            else:
+                sequence.status = "completed"
+                sequence.completed_at = now
+                sequence.completion_reason = "max_attempts"
 
-                # Record the event
-                event = FollowUpEvent(
-                    sequence_id=sequence.id,
-                    event_type="email_sent",
-                    step_number=sequence.current_step,
-                    event_data={
-                        "template": recommendation.message_template,
-                        "subject": email_content["subject"],
-                        "to_email": customer_email,
+            sent_count += 1
+
+            # Track analytics
+            try:
+                analytics_service.track_event(
+                    user_id=str(contractor.user_id),
+                    event_name="follow_up_sent",
+                    properties={
+                        "quote_id": str(quote.id),
+                        "step": sequence.current_step,
                         "signal": recommendation.signal.value,
                         "urgency": recommendation.urgency,
-                        "reasoning": recommendation.reasoning,
+                        "template": recommendation.message_template,
                     }
                 )
-                db.add(event)
-
-                # Update sequence
-                sequence.current_step += 1
-                sequence.emails_sent = (sequence.emails_sent or 0) + 1
-                sequence.detected_signal = recommendation.signal.value
-
-                # Calculate next follow-up
-                if sequence.current_step < FollowUpService.MAX_STEPS:
-                    next_rec = SmartFollowUpEngine.get_recommendation(
-                        quote,
-                        current_sequence_step=sequence.current_step
-                    )
-                    sequence.next_follow_up_at = now + timedelta(hours=next_rec.recommended_delay_hours)
-                else:
-                    sequence.status = "completed"
-                    sequence.completed_at = now
-                    sequence.completion_reason = "max_attempts"
-
-                sent_count += 1
-
-                # Track analytics
-                try:
-                    analytics_service.track_event(
-                        user_id=str(contractor.user_id),
-                        event_name="follow_up_sent",
-                        properties={
-                            "quote_id": str(quote.id),
-                            "step": sequence.current_step,
-                            "signal": recommendation.signal.value,
-                            "urgency": recommendation.urgency,
-                            "template": recommendation.message_template,
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to track follow_up_sent: {e}")
-
             except Exception as e:
-                logger.error(f"Error processing follow-up {sequence.id}: {e}")
+                logger.error(f"Failed to track follow_up_sent: {e}")
 
         await db.commit()
         return sent_count
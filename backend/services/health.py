@@ -350,11 +350,18 @@ async def check_all_health(
     # Add circuit breaker status
     circuit_breakers = get_circuit_breaker_status()
 
+    from .category_classifier import get_category_classifier_cache
+    from .claude_client import prompt_cache_stats
+    from .prompt_fragments import get_prompt_fragment_cache
+
     return {
         "status": overall_status.value,
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "services": services,
         "circuit_breakers": circuit_breakers,
+        "prompt_cache": prompt_cache_stats.get_stats(),
+        "category_fast_path": get_category_classifier_cache().get_stats(),
+        "prompt_fragments": get_prompt_fragment_cache().get_stats(),
     }
 
 
@@ -400,3 +407,71 @@ def get_scheduler_health() -> Dict[str, Any]:
         "running": True,
         "jobs": status["jobs"],
     }
+
+
+async def get_outbox_health() -> Dict[str, Any]:
+    """
+    Get post-commit task outbox health.
+    Queue depth, retries and lag come from the shared table (all workers);
+    "worker" counts are for the uvicorn worker answering this request.
+    """
+    from .database import async_session_factory
+    from .outbox import get_outbox_pool, get_queue_stats
+
+    try:
+        async with async_session_factory() as session:
+            queue = await get_queue_stats(session)
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+    degraded = queue["lag_seconds"] > settings.outbox_lag_warning_seconds or queue["failed"] > 0
+    return {
+        "status": "degraded" if degraded else "healthy",
+        **queue,
+        "worker": get_outbox_pool().get_stats(),
+    }
+
+
+async def get_email_queue_health() -> Dict[str, Any]:
+    """
+    Get outbound email queue health.
+    Depth and lag come from the shared email_outbox table; "worker" stats
+    (including the Resend rate limiter) are for the answering uvicorn worker.
+    """
+    from .database import async_session_factory
+    from .email_dispatcher import get_email_dispatcher, get_email_queue_stats
+
+    try:
+        async with async_session_factory() as session:
+            queue = await get_email_queue_stats(session)
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+    degraded = queue["lag_seconds"] > settings.outbox_lag_warning_seconds or queue["failed"] > 0
+    return {
+        "status": "degraded" if degraded else "healthy",
+        **queue,
+        "worker": get_email_dispatcher().get_stats(),
+    }
+
+
+async def get_sharded_jobs_health() -> Dict[str, Any]:
+    """
+    Shard progress of partitioned scheduler jobs (latest run per job).
+    "running" shards are in progress or were interrupted and will be resumed.
+    """
+    from .database import async_session_factory
+    from .job_shards import get_shard_progress
+
+    try:
+        async with async_session_factory() as session:
+            jobs = await get_shard_progress(session)
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+    degraded = any(job["errors"] for job in jobs.values())
+    return {
+        "status": "degraded" if degraded else "healthy",
+        "sharding_enabled": settings.scheduler_sharding_enabled,
+        "jobs": jobs,
+    }
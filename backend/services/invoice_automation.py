@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .logging import get_logger
@@ -218,8 +218,9 @@ class InvoiceAutomationService:
 
         Returns True if sent successfully.
         """
-        from ..models.database import Invoice, Contractor
+        from ..models.database import Invoice, Contractor, ContractorTerms
         from .email import EmailService
+        from .pdf_cache import get_pdf_cache_service, invoice_pdf_job
 
         # Get invoice
         result = await db.execute(
@@ -239,6 +240,19 @@ class InvoiceAutomationService:
         if not contractor:
             return False
 
+        # Attach the invoice PDF (content-addressed cache, so re-sends don't re-render)
+        pdf_bytes = None
+        try:
+            terms_result = await db.execute(
+                select(ContractorTerms).where(ContractorTerms.contractor_id == contractor.id)
+            )
+            terms = terms_result.scalar_one_or_none()
+            pdf_bytes = await get_pdf_cache_service().get_or_render(
+                invoice_pdf_job(invoice, contractor, terms)
+            )
+        except Exception as e:
+            logger.warning(f"Sending invoice {invoice.invoice_number} without PDF: {e}")
+
         # Send email
         email_service = EmailService()
         business_name = contractor.business_name or "Your Contractor"
@@ -246,12 +260,12 @@ class InvoiceAutomationService:
         try:
             await email_service.send_invoice_email(
                 to_email=invoice.customer_email,
-                customer_name=invoice.customer_name or "Customer",
-                business_name=business_name,
+                contractor_name=business_name,
                 invoice_number=invoice.invoice_number,
-                amount=invoice.total,
-                due_date=invoice.due_date,
-                invoice_link=f"https://quoted.it.com/invoice/{invoice.share_token}",
+                total=invoice.total,
+                due_date=invoice.due_date.strftime('%B %d, %Y') if invoice.due_date else None,
+                share_url=f"https://quoted.it.com/invoice/{invoice.share_token}",
+                pdf_bytes=pdf_bytes,
             )
 
             # Update invoice status
@@ -267,110 +281,109 @@ class InvoiceAutomationService:
             return False
 
     @staticmethod
-    async def check_payment_reminders(db: AsyncSession) -> int:
+    async def check_payment_reminders(db: AsyncSession, shard=None) -> int:
         """
         Check for invoices needing payment reminders.
 
+        One joined query finds upcoming invoices, one finds invoices that just
+        crossed an overdue threshold; reminders go out with bounded
+        concurrency and the invoice updates commit together.
+        Partitioned scheduler runs pass a job_shards.Shard to only process
+        that range of contractors.
+
         Returns count of reminders sent.
         """
         from ..models.database import Invoice, Contractor
         from .email import EmailService
+        from .fan_out import fan_out
+        from .job_shards import shard_filter
 
         now = datetime.utcnow()
         reminders_sent = 0
 
+        # (invoice, business_name, days_overdue or None)
+        reminders = []
+
         # Find invoices due soon (7 days before)
         reminder_date = now + timedelta(days=InvoiceAutomationService.FIRST_REMINDER_DAYS_BEFORE)
 
         result = await db.execute(
-            select(Invoice)
+            select(Invoice, Contractor.business_name)
+            .outerjoin(Contractor, Contractor.id == Invoice.contractor_id)
             .where(
                 Invoice.status == "sent",
                 Invoice.due_date <= reminder_date,
                 Invoice.due_date > now,
-                Invoice.reminder_sent.is_(None)  # Haven't sent reminder yet
+                Invoice.reminder_sent.is_(None),  # Haven't sent reminder yet
+                Invoice.customer_email.isnot(None),
+                shard_filter(shard, Invoice.contractor_id),
             )
         )
-        due_soon = result.scalars().all()
+        for invoice, business_name in result.all():
+            reminders.append((invoice, business_name, None))
 
-        email_service = EmailService()
+        # Find overdue invoices that just passed one of the thresholds
+        windows = []
+        for days_overdue in InvoiceAutomationService.OVERDUE_REMINDER_DAYS:
+            overdue_date = now - timedelta(days=days_overdue)
+            windows.append((days_overdue, overdue_date - timedelta(days=1), overdue_date))
 
-        for invoice in due_soon:
-            try:
-                # Get contractor
-                contractor_result = await db.execute(
-                    select(Contractor).where(Contractor.id == invoice.contractor_id)
-                )
-                contractor = contractor_result.scalar_one_or_none()
-                business_name = contractor.business_name if contractor else "Your Contractor"
-
-                if invoice.customer_email:
-                    await email_service.send_payment_reminder_email(
-                        to_email=invoice.customer_email,
-                        customer_name=invoice.customer_name or "Customer",
-                        business_name=business_name,
-                        invoice_number=invoice.invoice_number,
-                        amount=invoice.total,
-                        due_date=invoice.due_date,
-                        invoice_link=f"https://quoted.it.com/invoice/{invoice.share_token}",
-                        is_overdue=False,
-                    )
-
-                    invoice.reminder_sent = now
-                    invoice.reminder_count = (invoice.reminder_count or 0) + 1
-                    reminders_sent += 1
-
-                    logger.info(f"Sent payment reminder for invoice {invoice.invoice_number}")
+        result = await db.execute(
+            select(Invoice, Contractor.business_name)
+            .outerjoin(Contractor, Contractor.id == Invoice.contractor_id)
+            .where(
+                Invoice.status == "sent",
+                Invoice.customer_email.isnot(None),
+                shard_filter(shard, Invoice.contractor_id),
+                or_(*(
+                    and_(Invoice.due_date <= end, Invoice.due_date > start)
+                    for _, start, end in windows
+                )),
+            )
+        )
+        for invoice, business_name in result.all():
+            days_overdue = next(
+                days for days, start, end in windows if start < invoice.due_date <= end
+            )
+            reminders.append((invoice, business_name, days_overdue))
 
-            except Exception as e:
-                logger.error(f"Failed to send reminder for invoice {invoice.id}: {e}")
+        if not reminders:
+            return 0
 
-        # Find overdue invoices
-        for days_overdue in InvoiceAutomationService.OVERDUE_REMINDER_DAYS:
-            overdue_date = now - timedelta(days=days_overdue)
+        email_service = EmailService()
 
-            result = await db.execute(
-                select(Invoice)
-                .where(
-                    Invoice.status == "sent",
-                    Invoice.due_date <= overdue_date,
-                    Invoice.due_date > overdue_date - timedelta(days=1),  # Just passed this threshold
-                )
+        async def send(reminder):
+            invoice, business_name, days_overdue = reminder
+            overdue_kwargs = {"days_overdue": days_overdue} if days_overdue is not None else {}
+            await email_service.send_payment_reminder_email(
+                to_email=invoice.customer_email,
+                customer_name=invoice.customer_name or "Customer",
+                business_name=business_name or "Your Contractor",
+                invoice_number=invoice.invoice_number,
+                amount=invoice.total,
+                due_date=invoice.due_date,
+                invoice_link=f"https://quoted.it.com/invoice/{invoice.share_token}",
+                is_overdue=days_overdue is not None,
+                **overdue_kwargs,
             )
-            overdue = result.scalars().all()
-
-            for invoice in overdue:
-                try:
-                    contractor_result = await db.execute(
-                        select(Contractor).where(Contractor.id == invoice.contractor_id)
-                    )
-                    contractor = contractor_result.scalar_one_or_none()
-                    business_name = contractor.business_name if contractor else "Your Contractor"
-
-                    if invoice.customer_email:
-                        await email_service.send_payment_reminder_email(
-                            to_email=invoice.customer_email,
-                            customer_name=invoice.customer_name or "Customer",
-                            business_name=business_name,
-                            invoice_number=invoice.invoice_number,
-                            amount=invoice.total,
-                            due_date=invoice.due_date,
-                            invoice_link=f"https://quoted.it.com/invoice/{invoice.share_token}",
-                            is_overdue=True,
-                            days_overdue=days_overdue,
-                        )
-
-                        invoice.reminder_sent = now
-                        invoice.reminder_count = (invoice.reminder_count or 0) + 1
-                        invoice.status = "overdue"
-                        reminders_sent += 1
-
-                        logger.info(
-                            f"Sent overdue reminder ({days_overdue} days) for invoice {invoice.invoice_number}"
-                        )
-
-                except Exception as e:
-                    logger.error(f"Failed to send overdue reminder for invoice {invoice.id}: {e}")
+
+        for (invoice, _, days_overdue), error in await fan_out(reminders, send):
+            if error is not None:
+                kind = "overdue reminder" if days_overdue is not None else "reminder"
+                logger.error(f"Failed to send {kind} for invoice {invoice.id}: {error}")
+                continue
+
+            invoice.reminder_sent = now
+            invoice.reminder_count = (invoice.reminder_count or 0) + 1
+            reminders_sent += 1
+
+            if days_overdue is None:
+                logger.info(f"Sent payment reminder for invoice {invoice.invoice_number}")
+            else:
+                invoice.status = "overdue"
+                logger.info(
+                    f"Sent overdue reminder ({days_overdue} days) for invoice {invoice.invoice_number}"
+                )
 
         await db.commit()
         return reminders_sent
@@ -0,0 +1,281 @@
+"""
+Partitioned, resumable scheduler jobs for Quoted.
+
+Every uvicorn worker runs the scheduler, and wrap_with_lock() lets exactly
+one of them run a job while the others skip it. For the per-contractor jobs
+(reminders, follow-ups) that left one worker doing all the work.
+
+In partitioning mode a run is split into scheduler_shards shards by
+contractor id, and each shard is a unit of work with its own advisory lock
+("job_name:shard-N"). Every worker whose trigger fires walks the shards,
+starting at a different offset, and takes the ones nobody else holds, so
+shards are processed in parallel across workers.
+
+Progress is checkpointed per shard in scheduler_checkpoints, keyed by the
+run's scheduling period (run_key). Shards already "done" for the current
+period are skipped, so:
+- a worker whose trigger fires later in the period only picks up leftovers
+- after a crash, the resume run started with the scheduler finishes the
+  unfinished shards instead of redoing the whole job
+
+Contractor ids are random UUIDs, so ranges of the leading two hex digits
+split them evenly - an id hash partition that stays a plain, index-friendly
+range condition in SQL. The first and last shard are open-ended, so every
+id (UUID or not) belongs to exactly one shard.
+"""
+
+import functools
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import select, update, and_, true
+from sqlalchemy.exc import IntegrityError
+
+from ..config import settings
+from ..models.database import SchedulerCheckpoint
+from .advisory_locks import acquire_job_lock, release_job_lock
+from .logging import get_logger
+
+logger = get_logger("quoted.job_shards")
+
+MAX_SHARDS = 256  # One per two-hex-digit id prefix
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One contractor-id range of a partitioned job run."""
+    index: int
+    count: int
+
+    @property
+    def bounds(self) -> Tuple[Optional[str], Optional[str]]:
+        """(lower inclusive, upper exclusive) id prefixes; None is open-ended."""
+        lower = f"{self.index * MAX_SHARDS // self.count:02x}" if self.index > 0 else None
+        upper = (
+            f"{(self.index + 1) * MAX_SHARDS // self.count:02x}"
+            if self.index < self.count - 1 else None
+        )
+        return lower, upper
+
+    def where(self, column):
+        """SQL condition selecting rows whose contractor id is in this shard."""
+        lower, upper = self.bounds
+        conditions = []
+        if lower is not None:
+            conditions.append(column >= lower)
+        if upper is not None:
+            conditions.append(column < upper)
+        return and_(true(), *conditions)
+
+    def contains(self, contractor_id: str) -> bool:
+        lower, upper = self.bounds
+        return (lower is None or contractor_id >= lower) and (upper is None or contractor_id < upper)
+
+
+def shard_filter(shard: Optional[Shard], column):
+    """Shard condition for a contractor id column (no-op for unpartitioned runs)."""
+    return shard.where(column) if shard is not None else true()
+
+
+def run_key_for(period_seconds: int, now: Optional[float] = None) -> str:
+    """Identify the scheduling period a run belongs to."""
+    now = time.time() if now is None else now
+    return str(int(now // period_seconds))
+
+
+async def _begin_checkpoint(session_factory, job_name: str, shard: Shard, run_key: str) -> bool:
+    """Mark a shard as running for this run; False if it is already done."""
+    async with session_factory() as db:
+        result = await db.execute(
+            select(SchedulerCheckpoint).where(
+                SchedulerCheckpoint.job_name == job_name,
+                SchedulerCheckpoint.shard == shard.index,
+            )
+        )
+        checkpoint = result.scalar_one_or_none()
+        if (
+            checkpoint is not None
+            and checkpoint.run_key == run_key
+            and checkpoint.shard_count == shard.count
+            and checkpoint.status == "done"
+        ):
+            return False
+
+        if checkpoint is None:
+            checkpoint = SchedulerCheckpoint(job_name=job_name, shard=shard.index)
+            db.add(checkpoint)
+        checkpoint.shard_count = shard.count
+        checkpoint.run_key = run_key
+        checkpoint.status = "running"
+        checkpoint.started_at = datetime.utcnow()
+        checkpoint.completed_at = None
+        checkpoint.last_error = None
+        await db.commit()
+        return True
+
+
+async def _finish_checkpoint(
+    session_factory,
+    job_name: str,
+    shard: Shard,
+    error: Optional[Exception] = None,
+) -> None:
+    if error is None:
+        values = {"status": "done", "completed_at": datetime.utcnow()}
+    else:
+        # Left "running": the next run in this period (or the resume run
+        # after a restart) picks the shard up again
+        values = {"last_error": str(error)[:2000]}
+    async with session_factory() as db:
+        await db.execute(
+            update(SchedulerCheckpoint)
+            .where(
+                SchedulerCheckpoint.job_name == job_name,
+                SchedulerCheckpoint.shard == shard.index,
+            )
+            .values(**values)
+        )
+        await db.commit()
+
+
+async def run_shard(
+    session_factory,
+    job_name: str,
+    func: Callable,
+    shard: Shard,
+    run_key: str,
+) -> Optional[bool]:
+    """
+    Run one shard under its advisory lock, checkpointing the outcome.
+
+    The lock session is left untouched while the shard runs (committing it
+    would hand its connection, and the session-level lock, back to the
+    pool); checkpoints are written through their own sessions.
+
+    Returns True if this call completed the shard, False if it failed,
+    None if it was skipped (held by another worker or already done).
+    """
+    async with session_factory() as lock_db:
+        if not await acquire_job_lock(job_name, lock_db, shard=shard.index):
+            return None
+        try:
+            try:
+                if not await _begin_checkpoint(session_factory, job_name, shard, run_key):
+                    return None
+            except IntegrityError:
+                # Another worker created this shard's checkpoint first (no
+                # advisory locks on SQLite): it is running the shard
+                return None
+
+            try:
+                await func(shard=shard)
+            except Exception as e:
+                logger.error(f"Job '{job_name}' shard {shard.index}/{shard.count} failed: {e}")
+                await _finish_checkpoint(session_factory, job_name, shard, error=e)
+                return False
+
+            await _finish_checkpoint(session_factory, job_name, shard)
+            return True
+        finally:
+            await release_job_lock(job_name, lock_db, shard=shard.index)
+
+
+async def run_sharded(
+    session_factory,
+    job_name: str,
+    func: Callable,
+    period_seconds: int,
+    shard_count: Optional[int] = None,
+    resume_only: bool = False,
+) -> int:
+    """
+    Process every shard of a job run that isn't done or held elsewhere.
+
+    Args:
+        session_factory: Async session factory (locks and checkpoints)
+        job_name: Scheduler job id
+        func: Job coroutine taking a `shard` keyword argument; it must raise
+            on failure, so the shard is checkpointed as failed and retried
+        period_seconds: Scheduling period; one run_key per period
+        shard_count: Shards per run (default: scheduler_shards)
+        resume_only: Only run if this period has unfinished checkpoints
+            (used at startup to finish a run interrupted by a crash)
+
+    Returns:
+        Number of shards completed by this call
+    """
+    count = max(1, min(shard_count or settings.scheduler_shards, MAX_SHARDS))
+    run_key = run_key_for(period_seconds)
+
+    if resume_only:
+        async with session_factory() as db:
+            result = await db.execute(
+                select(SchedulerCheckpoint.id).where(
+                    SchedulerCheckpoint.job_name == job_name,
+                    SchedulerCheckpoint.run_key == run_key,
+                    SchedulerCheckpoint.status != "done",
+                ).limit(1)
+            )
+            if result.first() is None:
+                return 0
+        logger.info(f"Resuming interrupted run of '{job_name}'")
+
+    # Start at a different shard in each worker so they don't queue on the same locks
+    offset = os.getpid() % count
+    completed = 0
+    for i in range(count):
+        shard = Shard(index=(offset + i) % count, count=count)
+        if await run_shard(session_factory, job_name, func, shard, run_key):
+            completed += 1
+
+    if completed:
+        logger.info(f"Job '{job_name}': completed {completed}/{count} shards in this worker")
+    return completed
+
+
+def wrap_sharded(job_name: str, func: Callable, period_seconds: int) -> Callable:
+    """
+    Wrap a shard-aware job for the scheduler (partitioning mode).
+
+    The returned coroutine function runs the job's shards; its `resume`
+    attribute only runs when the current period has unfinished shards.
+    """
+    @functools.wraps(func)
+    async def wrapper():
+        from .database import async_session_factory
+        return await run_sharded(async_session_factory, job_name, func, period_seconds)
+
+    async def resume():
+        from .database import async_session_factory
+        return await run_sharded(
+            async_session_factory, job_name, func, period_seconds, resume_only=True
+        )
+
+    wrapper.resume = resume
+    return wrapper
+
+
+async def get_shard_progress(session) -> dict:
+    """Per-job shard progress of the latest run (for /health/scheduler)."""
+    result = await session.execute(
+        select(
+            SchedulerCheckpoint.job_name,
+            SchedulerCheckpoint.run_key,
+            SchedulerCheckpoint.status,
+            SchedulerCheckpoint.last_error,
+        )
+    )
+    progress: dict = {}
+    for job_name, run_key, status, last_error in result.all():
+        job = progress.setdefault(job_name, {"run_key": run_key, "done": 0, "running": 0, "errors": 0})
+        if int(run_key) > int(job["run_key"]):
+            job.update(run_key=run_key, done=0, running=0, errors=0)
+        elif int(run_key) < int(job["run_key"]):
+            continue  # Shard not reached yet in the latest run
+        job["done" if status == "done" else "running"] += 1
+        if last_error:
+            job["errors"] += 1
+    return progress
@@ -16,11 +16,10 @@ import re
 from typing import Optional
 from datetime import datetime
 
-import anthropic
-
 from ..config import settings
 from ..prompts import get_quote_refinement_prompt
 from .analytics import analytics_service
+from .claude_client import get_async_claude_client
 
 
 class LearningService:
@@ -30,7 +29,7 @@ class LearningService:
     """
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_async_claude_client()
         self.model = settings.claude_model
 
     async def process_correction(
@@ -346,7 +345,7 @@ class LearningService:
     async def _call_claude(self, prompt: str) -> str:
         """Make a call to Claude API."""
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model=self.model,
                 max_tokens=2048,
                 messages=[{"role": "user", "content": prompt}],
@@ -0,0 +1,218 @@
+"""
+Near-duplicate detection for learning statements.
+
+DatabaseService._statements_similar rebuilt both word sets for every pair it
+compared, and the learning loop only caught exact repeats: a category slowly
+filled up with rewordings of the same rule ("Add 15% for second story work"
+/ "Add 15% for second-story work"). ContractorDNAService._merge_pattern had
+the same problem, scanning every DNA pattern for an exact match per new one.
+Comparing every new statement with every existing one is O(n*m) set builds
+per correction once categories hold hundreds of statements.
+
+Each statement is now prepared once:
+- its token set (lowercased words longer than 2 characters, the rule
+  _statements_similar used, so thresholds keep their meaning)
+- a MinHash signature of that set (NUM_PERMUTATIONS hashes)
+Both (and the LSH band keys) are memoized per worker by statement text, so a
+category's existing statements are hashed once per process, not once per correction.
+
+StatementIndex buckets signatures into LSH bands (BANDS bands of ROWS
+values). Only statements sharing a band are compared, with the exact Jaccard
+of their token sets, so there are no false positives. Two statements with
+Jaccard similarity J share a band with probability 1 - (1 - J**ROWS)**BANDS:
+~99% at the default 0.6 threshold and >99.9% from 0.7 up. Identical token
+sets always share every band.
+
+Word overlap alone can't tell "Cedar decking runs $32/sqft" from "Composite
+decking runs $45/sqft", or "Add 15%" from "Add 25%". Statements are only
+near-duplicates if their key facts also match: the same numbers (amounts,
+percentages) and the same material nouns (MATERIAL_WORDS). An updated rate
+is a new learning, not a repeat.
+"""
+
+import hashlib
+import random
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Jaccard similarity at which two statements count as the same learning
+DEFAULT_THRESHOLD = 0.6
+
+BANDS = 20
+ROWS = 3
+NUM_PERMUTATIONS = BANDS * ROWS
+
+# Memoized statements per worker
+MAX_CACHED_STATEMENTS = 8192
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures must agree across workers and restarts
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def statement_text(statement: Any) -> str:
+    """Text of a learned adjustment (plain string or dict) or DNA pattern."""
+    if isinstance(statement, dict):
+        return statement.get("text") or statement.get("statement") or ""
+    return statement if isinstance(statement, str) else ""
+
+
+@lru_cache(maxsize=MAX_CACHED_STATEMENTS)
+def tokens(text: str) -> FrozenSet[str]:
+    """Lowercased words longer than 2 characters."""
+    return frozenset(word.lower() for word in text.split() if len(word) > 2)
+
+
+# Materials whose price differs: statements naming different ones are different facts
+MATERIAL_WORDS = frozenset("""
+composite cedar pine redwood ipe trex azek timbertech hardwood softwood oak maple walnut
+cherry bamboo teak mahogany plywood osb lumber wood vinyl pvc aluminum steel iron metal
+copper brass chrome wrought galvanized concrete brick stone paver flagstone slate granite
+marble quartz quartzite travertine limestone asphalt gravel mulch sod turf tile porcelain
+ceramic mosaic laminate carpet linoleum drywall plaster stucco shingle shake tar
+fiberglass glass cable chain epoxy latex oil enamel stain primer pex cpvc abs cast
+""".split())
+
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@lru_cache(maxsize=MAX_CACHED_STATEMENTS)
+def key_facts(text: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """(numbers, material nouns) a statement states; both must match for a duplicate."""
+    numbers = frozenset(number.replace(",", "") for number in _NUMBER_RE.findall(text))
+    materials = set()
+    for word in _WORD_RE.findall(text.lower()):
+        if word not in MATERIAL_WORDS and word.endswith("s"):
+            word = word[:-1]  # "pavers", "tiles"
+        if word in MATERIAL_WORDS:
+            materials.add(word)
+    return numbers, frozenset(materials)
+
+
+def _token_hash(token: str) -> int:
+    # Not hash(): it is salted per process
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "little")
+
+
+@lru_cache(maxsize=MAX_CACHED_STATEMENTS)
+def signature(text: str) -> Tuple[int, ...]:
+    """MinHash signature of the statement's token set (empty for no tokens)."""
+    hashes = [_token_hash(token) for token in tokens(text)]
+    if not hashes:
+        return ()
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+@lru_cache(maxsize=MAX_CACHED_STATEMENTS)
+def band_keys(text: str) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """LSH bucket keys, (band, band values), of the statement's signature."""
+    sig = signature(text)
+    if not sig:
+        return ()
+    return tuple((band, sig[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS))
+
+
+def jaccard(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    if not tokens1 or not tokens2:
+        return 0.0
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
+
+
+def similar(statement1: str, statement2: str, threshold: float = DEFAULT_THRESHOLD) -> bool:
+    """
+    True if two statements are near-duplicates: exact Jaccard at or above
+    threshold (memoized tokens) and the same key facts.
+    """
+    return (
+        jaccard(tokens(statement1), tokens(statement2)) >= threshold
+        and key_facts(statement1) == key_facts(statement2)
+    )
+
+
+class StatementIndex:
+    """
+    LSH index over a list of statements, for near-duplicate lookups.
+
+    Positions match insertion order, so an index built from a list can be
+    kept in step with it by add()-ing whatever is appended to the list.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._tokens: List[FrozenSet[str]] = []
+        self._facts: List[Tuple[FrozenSet[str], FrozenSet[str]]] = []
+        # (band, band values) -> positions
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    @classmethod
+    def from_statements(cls, statements: Iterable[Any], threshold: float = DEFAULT_THRESHOLD) -> "StatementIndex":
+        index = cls(threshold)
+        for statement in statements:
+            index.add(statement_text(statement))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def add(self, text: str) -> int:
+        """Index a statement; returns its position."""
+        position = len(self._tokens)
+        self._tokens.append(tokens(text))
+        self._facts.append(key_facts(text))
+        buckets = self._buckets
+        for key in band_keys(text):
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [position]
+            else:
+                bucket.append(position)
+        return position
+
+    def find(self, text: str, where: Optional[Callable[[int], bool]] = None) -> Optional[int]:
+        """
+        Position of the most similar indexed statement at or above the
+        threshold with the same key facts, or None.
+
+        where filters candidate positions (e.g. same DNA pattern type).
+        """
+        query = tokens(text)
+        facts = key_facts(text)
+        best, best_similarity = None, self.threshold
+        seen = set()
+        for key in band_keys(text):
+            for position in self._buckets.get(key, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                if self._facts[position] != facts:
+                    continue
+                if where is not None and not where(position):
+                    continue
+                similarity = jaccard(query, self._tokens[position])
+                if similarity >= best_similarity and (best is None or similarity > best_similarity):
+                    best, best_similarity = position, similarity
+        return best
+
+
+def dedupe(statements: Iterable[Any], threshold: float = DEFAULT_THRESHOLD) -> List[Any]:
+    """Statements without near-duplicates of earlier ones, order kept."""
+    index = StatementIndex(threshold)
+    kept = []
+    for statement in statements:
+        text = statement_text(statement)
+        if index.find(text) is None:
+            index.add(text)
+            kept.append(statement)
+    return kept
@@ -14,6 +14,7 @@ Design source: .claude/learning-excellence-outputs/phase3-relevance.md
 import re
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple, Union
 from .learning_quality import LearningQualityScorer, QualityScore
@@ -172,7 +173,7 @@ class LearningRelevanceSelector:
             else:
                 text = learning
                 # For legacy plain strings, estimate quality and use default date
-                quality = self._quality_scorer.score(text).overall_score
+                quality = self._legacy_quality(text)
                 created_at = datetime.utcnow() - timedelta(days=7)  # Assume 1 week old
 
             score = self._score_relevance(
@@ -215,7 +216,7 @@ class LearningRelevanceSelector:
                 created_at = metadata.created_at
             else:
                 text = learning
-                quality = self._quality_scorer.score(text).overall_score
+                quality = self._legacy_quality(text)
                 created_at = datetime.utcnow() - timedelta(days=7)
 
             score = self._score_relevance(
@@ -229,6 +230,10 @@ class LearningRelevanceSelector:
         scored_learnings.sort(key=lambda x: x[1].overall_score, reverse=True)
         return scored_learnings[:max_learnings]
 
+    def _legacy_quality(self, text: str) -> float:
+        """Estimated quality of a plain-string learning (memoized per process)."""
+        return _estimated_quality(self._quality_scorer, text)
+
     def _extract_keywords(self, transcription: str) -> List[str]:
         """Extract domain-relevant keywords from transcription."""
         keywords = []
@@ -330,6 +335,17 @@ class LearningRelevanceSelector:
         return (100.0 if is_foundational else 50.0), is_foundational
 
 
+@lru_cache(maxsize=8192)
+def _estimated_quality(scorer: LearningQualityScorer, text: str) -> float:
+    # Quality depends only on the text, and the same learnings are scored
+    # for every quote in their category
+    return scorer.score(text).overall_score
+
+
+# Shared by select_relevant_learnings (compiles its patterns once)
+_selector: Optional[LearningRelevanceSelector] = None
+
+
 # Convenience function for direct use in quote_generation.py
 def select_relevant_learnings(
     learned_adjustments: List[Union[str, Dict[str, Any]]],
@@ -342,8 +358,10 @@ def select_relevant_learnings(
 
     Drop-in replacement for `learned_adjustments[-7:]` in quote_generation.py
     """
-    selector = LearningRelevanceSelector()
-    return selector.select(
+    global _selector
+    if _selector is None:
+        _selector = LearningRelevanceSelector()
+    return _selector.select(
         learnings=learned_adjustments,
         transcription=transcription,
         category=category,
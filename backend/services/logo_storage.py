@@ -0,0 +1,306 @@
+"""
+Contractor logo storage for Quoted.
+
+Logos used to live in contractors.logo_data as base64 data URIs (DISC-016).
+Every select(Contractor) - get_current_contractor, the share page, scheduler
+loops - dragged the full image across the wire, and every PDF render decoded
+and resized it again.
+
+Logos are now content-addressed blobs in StorageService:
+- logos/{hash}/original.png|jpg  the uploaded file, unchanged
+- logos/{hash}/pdf.png           fits the PDF header box at 2x for print
+- logos/{hash}/email.png         fits an email header at 2x for retina
+
+The contractors row only keeps logo_hash (sha256 of the original bytes).
+Renditions are generated once at upload. A hash never changes content, so
+they are cached per worker without expiry and never need invalidating.
+Blobs are not deleted when a contractor removes their logo: another
+contractor may have uploaded the same file.
+
+Legacy base64 logos are backfilled at startup (migrate_legacy_logos). Until
+then, readers that find logo_hash empty migrate that contractor on read
+(contractor_logo_hash), so the logo never disappears in between.
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import struct
+from typing import Optional, Dict, Tuple
+
+from sqlalchemy import select, update
+
+from ..config import settings
+from ..models.database import Contractor
+from .cache import LocalTTLCache
+from .logging import get_logger
+from .storage import storage_service, StorageService
+
+logger = get_logger("quoted.logo_storage")
+
+# PDF header logo box in points (DISC-127); logos are fitted into it
+PDF_LOGO_BOX = (120, 48)
+
+# Pixels per point in the PDF rendition
+PDF_LOGO_SCALE = 2
+
+# Rendition name -> max (width, height) in pixels
+LOGO_RENDITIONS: Dict[str, Tuple[int, int]] = {
+    "pdf": (PDF_LOGO_BOX[0] * PDF_LOGO_SCALE, PDF_LOGO_BOX[1] * PDF_LOGO_SCALE),
+    "email": (400, 160),
+}
+
+LOGO_CONTENT_TYPES = {"png": "image/png", "jpeg": "image/jpeg"}
+_EXTENSIONS = {"png": "png", "jpeg": "jpg"}
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Effectively "until evicted" - content under a hash never changes
+_CACHE_TTL = 7 * 24 * 3600
+
+
+class InvalidLogoError(ValueError):
+    """Raised when uploaded logo bytes are not a readable PNG or JPEG."""
+
+
+def logo_hash(data: bytes) -> str:
+    """Content hash identifying a logo and its renditions."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def logo_key(digest: str, name: str, image_type: str = "png") -> str:
+    """Storage key for the original ("original") or a rendition of a logo."""
+    ext = _EXTENSIONS[image_type] if name == "original" else "png"
+    return f"{StorageService.LOGOS_PATH}/{digest}/{name}.{ext}"
+
+
+def png_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) from a PNG header, without decoding the image."""
+    if len(data) < 24 or not data.startswith(_PNG_SIGNATURE):
+        return None
+    return struct.unpack(">II", data[16:24])
+
+
+def fit_pdf_logo(width: int, height: int) -> Tuple[float, float]:
+    """
+    Size in points of a logo fitted into PDF_LOGO_BOX, aspect ratio kept.
+
+    Renditions are never upscaled, so a small logo's rendition is smaller
+    than the box; it is still drawn at the full fitted size.
+    """
+    max_width, max_height = PDF_LOGO_BOX
+    scale = min(max_width / width, max_height / height)
+    return width * scale, height * scale
+
+
+def render_renditions(data: bytes) -> Dict[str, bytes]:
+    """
+    Decode a logo once and produce every rendition as PNG.
+
+    CPU-bound; run it off the event loop.
+
+    Raises:
+        InvalidLogoError: If the bytes can't be decoded as an image
+    """
+    from PIL import Image  # Pillow ships with reportlab
+
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    except Exception as e:
+        raise InvalidLogoError(f"Could not read logo image: {e}") from e
+
+    image = image.convert("RGBA")
+    renditions = {}
+    for name, box in LOGO_RENDITIONS.items():
+        scaled = image.copy()
+        # Never upscale: small logos stay sharp at their own size
+        scaled.thumbnail(box, Image.LANCZOS)
+        buffer = io.BytesIO()
+        scaled.save(buffer, format="PNG", optimize=True)
+        renditions[name] = buffer.getvalue()
+    return renditions
+
+
+class LogoStorageService:
+    """Stores logos in StorageService and serves cached renditions by hash."""
+
+    def __init__(self, storage: Optional[StorageService] = None, max_entries: Optional[int] = None):
+        self.storage = storage or storage_service
+        self._memory = LocalTTLCache(max_entries=max_entries or settings.logo_cache_entries)
+
+    async def store(self, data: bytes, image_type: str) -> str:
+        """
+        Store an uploaded logo and its renditions; return its hash.
+
+        Uploading the same file again (any contractor) reuses the stored blobs.
+
+        Raises:
+            InvalidLogoError: If the image can't be decoded
+        """
+        digest = logo_hash(data)
+        if await self.storage.exists_key(logo_key(digest, "pdf")):
+            return digest
+
+        renditions = await asyncio.to_thread(render_renditions, data)
+        await asyncio.gather(
+            self.storage.upload(
+                logo_key(digest, "original", image_type),
+                data,
+                content_type=LOGO_CONTENT_TYPES[image_type],
+            ),
+            *(
+                self.storage.upload(logo_key(digest, name), png, content_type="image/png")
+                for name, png in renditions.items()
+            ),
+        )
+        for name, png in renditions.items():
+            self._memory.set(f"{digest}:{name}", png, ttl=_CACHE_TTL)
+
+        logger.info(f"Stored logo {digest[:12]} ({len(data)} bytes)")
+        return digest
+
+    async def get_rendition(self, digest: str, name: str) -> Optional[bytes]:
+        """PNG bytes for a rendition ("pdf" or "email"), or None if missing."""
+        cache_key = f"{digest}:{name}"
+        png = self._memory.get(cache_key)
+        if png is not None:
+            return png
+
+        png = await self.storage.download_key(logo_key(digest, name))
+        if png is not None:
+            self._memory.set(cache_key, png, ttl=_CACHE_TTL)
+        return png
+
+    async def get_original_data_uri(self, digest: str) -> Optional[str]:
+        """The uploaded file as a data URI (the shape GET /logo always returned)."""
+        for image_type, content_type in LOGO_CONTENT_TYPES.items():
+            data = await self.storage.download_key(logo_key(digest, "original", image_type))
+            if data is not None:
+                return f"data:{content_type};base64,{base64.b64encode(data).decode('utf-8')}"
+        return None
+
+    async def pdf_logo(self, digest: Optional[str]) -> Dict[str, object]:
+        """
+        Contractor-dict fields for the PDF header: the pre-scaled PNG and its
+        size in points. Empty when there is no logo (placeholder is drawn).
+        """
+        if not digest:
+            return {}
+        try:
+            png = await self.get_rendition(digest, "pdf")
+        except Exception as e:
+            logger.warning(f"Logo rendition read failed for {digest[:12]}: {e}")
+            return {}
+        size = png_size(png) if png else None
+        if not size or not all(size):
+            return {}
+        return {"logo_png": png, "logo_size": fit_pdf_logo(*size)}
+
+    async def _store_legacy(self, logo_data: str) -> str:
+        """Store a legacy base64 logo (data URI or bare base64); returns its hash."""
+        data = base64.b64decode(logo_data.split(",", 1)[-1])
+        image_type = "png" if data.startswith(_PNG_SIGNATURE) else "jpeg"
+        return await self.store(data, image_type)
+
+    async def migrate_contractor_logo(self, session_factory, contractor_id: str) -> Optional[str]:
+        """
+        The contractor's logo hash, moving a legacy base64 logo to storage first.
+
+        For readers that find logo_hash empty: the startup backfill may not
+        have reached (or may have failed on) this contractor yet. None if
+        there is no logo or it can't be decoded.
+        """
+        async with session_factory() as session:
+            row = (await session.execute(
+                select(Contractor.logo_hash, Contractor.logo_data).where(Contractor.id == contractor_id)
+            )).first()
+            if row is None or row.logo_hash or not row.logo_data:
+                return row.logo_hash if row is not None else None
+
+            try:
+                digest = await self._store_legacy(row.logo_data)
+            except Exception as e:
+                logger.warning(f"Could not migrate logo for contractor {contractor_id}: {e}")
+                return None
+
+            await session.execute(
+                update(Contractor)
+                .where(Contractor.id == contractor_id, Contractor.logo_hash.is_(None))
+                .values(logo_hash=digest, logo_data=None)
+            )
+            await session.commit()
+            return digest
+
+    async def migrate_legacy_logos(self, session_factory, batch_size: int = 50) -> int:
+        """
+        Move base64 logos left in contractors.logo_data into storage.
+
+        Safe to run from several workers at once: each row is only switched
+        over while its logo_hash is still empty. Returns rows migrated here.
+        """
+        migrated = 0
+        failed: set = set()
+        while True:
+            async with session_factory() as session:
+                query = (
+                    select(Contractor.id, Contractor.logo_data)
+                    .where(Contractor.logo_data.isnot(None), Contractor.logo_hash.is_(None))
+                    .limit(batch_size)
+                )
+                if failed:
+                    query = query.where(Contractor.id.notin_(failed))
+                rows = (await session.execute(query)).all()
+                if not rows:
+                    return migrated
+
+                for contractor_id, logo_data in rows:
+                    try:
+                        digest = await self._store_legacy(logo_data)
+                    except Exception as e:
+                        logger.warning(f"Could not migrate logo for contractor {contractor_id}: {e}")
+                        failed.add(contractor_id)
+                        continue
+
+                    result = await session.execute(
+                        update(Contractor)
+                        .where(Contractor.id == contractor_id, Contractor.logo_hash.is_(None))
+                        .values(logo_hash=digest, logo_data=None)
+                    )
+                    migrated += result.rowcount
+                await session.commit()
+
+
+# Singleton pattern
+_logo_storage_service: Optional[LogoStorageService] = None
+
+
+def get_logo_storage_service() -> LogoStorageService:
+    """Get the logo storage service singleton."""
+    global _logo_storage_service
+    if _logo_storage_service is None:
+        _logo_storage_service = LogoStorageService()
+    return _logo_storage_service
+
+
+async def contractor_logo_hash(contractor_id: Optional[str], logo_hash: Optional[str]) -> Optional[str]:
+    """logo_hash, or the hash of the contractor's legacy logo (migrated on read)."""
+    if logo_hash or not contractor_id:
+        return logo_hash
+    from .database import async_session_factory
+    return await get_logo_storage_service().migrate_contractor_logo(async_session_factory, contractor_id)
+
+
+async def migrate_legacy_logos() -> int:
+    """Backfill logo_hash for rows still holding base64 logos (run at startup)."""
+    from .database import async_session_factory
+    try:
+        migrated = await get_logo_storage_service().migrate_legacy_logos(async_session_factory)
+    except Exception as e:
+        # Rows keep their base64 copy; the next startup tries again
+        logger.error(f"Legacy logo migration failed: {e}")
+        return 0
+    if migrated:
+        logger.info(f"Migrated {migrated} legacy logos to storage")
+    return migrated
@@ -14,14 +14,13 @@ import re
 from typing import Optional
 from datetime import datetime
 
-import anthropic
-
 from ..config import settings
 from ..prompts import (
     get_setup_system_prompt,
     get_setup_initial_message,
     get_pricing_extraction_prompt,
 )
+from .claude_client import get_async_claude_client
 
 
 class OnboardingService:
@@ -31,7 +30,7 @@ class OnboardingService:
     """
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_async_claude_client()
         self.model = settings.claude_model
         self.max_tokens = settings.claude_max_tokens
 
@@ -179,7 +178,7 @@ class OnboardingService:
     ) -> str:
         """Generate a response from Claude."""
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 system=system_prompt,
@@ -0,0 +1,326 @@
+"""
+Durable post-commit task outbox for Quoted.
+
+After the Claude call, quote generation used to await a chain of side
+effects before responding: customer linking, category registration,
+PostHog tracking and the founder notification email, each opening its own
+session. None of them change the quote the user is waiting for.
+
+Those side effects are now written as outbox_tasks rows in the same
+transaction as the quote (so they cannot be lost once the quote exists) and
+executed by a small asyncio worker pool in every uvicorn worker:
+
+- Workers claim due rows with FOR UPDATE SKIP LOCKED plus a conditional
+  UPDATE, so the four uvicorn workers never run the same task twice at once.
+- A claimed task holds a lease (outbox_lease_seconds); if the process dies
+  mid-task, the row becomes claimable again when the lease expires.
+- Failures are retried with exponential backoff up to outbox_max_attempts,
+  then left with status "failed" for inspection.
+- Successful tasks are deleted, so the table only holds outstanding work.
+
+Delivery is at-least-once: handlers should tolerate running twice.
+Queue depth, retries and lag are reported on /health/scheduler.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Callable, Awaitable, List
+
+from sqlalchemy import select, update, delete, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.database import OutboxTask
+from .logging import get_logger
+
+logger = get_logger("quoted.outbox")
+
+TaskHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# task_type -> handler, filled by register_task_handler
+_handlers: Dict[str, TaskHandler] = {}
+
+
+def register_task_handler(task_type: str):
+    """Decorator registering the coroutine that executes a task type."""
+    def decorator(handler: TaskHandler) -> TaskHandler:
+        _handlers[task_type] = handler
+        return handler
+    return decorator
+
+
+def enqueue_task(
+    session: AsyncSession,
+    task_type: str,
+    payload: Dict[str, Any],
+) -> OutboxTask:
+    """
+    Add a task to the outbox inside the caller's transaction.
+
+    The task becomes visible to workers when the caller commits; call
+    notify_outbox() afterwards to have this worker pick it up immediately.
+    """
+    task = OutboxTask(task_type=task_type, payload=payload)
+    session.add(task)
+    return task
+
+
+@dataclass
+class ClaimedTask:
+    """A task leased by this worker."""
+    id: str
+    task_type: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class OutboxWorkerPool:
+    """asyncio workers draining the outbox table."""
+
+    def __init__(
+        self,
+        session_factory,
+        workers: int = 4,
+        poll_interval: float = 2.0,
+        lease_seconds: int = 120,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 5.0,
+    ):
+        self._session_factory = session_factory
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+
+        self._tasks: List[asyncio.Task] = []
+        self._wake = asyncio.Event()
+        self._running = 0
+
+        # Since this process started
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(), name=f"outbox-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info("Outbox workers started", extra={"workers": self.workers})
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers (new tasks were committed)."""
+        self._wake.set()
+
+    async def _worker_loop(self) -> None:
+        while True:
+            try:
+                task = await self.claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox claim failed: {e}")
+                task = None
+
+            if task is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self.run(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Couldn't record the outcome; the lease expiring retries it
+                logger.error(f"Outbox bookkeeping failed for task {task.id}: {e}")
+
+    async def claim(self) -> Optional[ClaimedTask]:
+        """Lease the next due task, or return None if there is none."""
+        now = datetime.utcnow()
+        due = or_(
+            and_(OutboxTask.status == "pending", OutboxTask.run_after <= now),
+            and_(OutboxTask.status == "running", OutboxTask.locked_until < now),
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(OutboxTask.id, OutboxTask.task_type, OutboxTask.payload, OutboxTask.attempts)
+                .where(due)
+                .order_by(OutboxTask.run_after)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            row = result.first()
+            if row is None:
+                return None
+
+            # Conditional update: a concurrent claimer that read the same row
+            # (no row locks on SQLite) sees rowcount 0 and backs off
+            claimed = await session.execute(
+                update(OutboxTask)
+                .where(OutboxTask.id == row.id, OutboxTask.attempts == row.attempts, due)
+                .values(
+                    status="running",
+                    attempts=row.attempts + 1,
+                    locked_until=now + self.lease,
+                )
+            )
+            await session.commit()
+            if claimed.rowcount != 1:
+                return None
+
+        return ClaimedTask(
+            id=row.id,
+            task_type=row.task_type,
+            payload=dict(row.payload or {}),
+            attempts=row.attempts + 1,
+        )
+
+    async def run(self, task: ClaimedTask) -> None:
+        """Execute a claimed task and record the outcome."""
+        handler = _handlers.get(task.task_type)
+        self._running += 1
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for task type '{task.task_type}'")
+            await handler(task.payload)
+        except asyncio.CancelledError:
+            # Shutting down: the lease expires and another worker retries it
+            raise
+        except Exception as e:
+            await self._record_failure(task, e, retry=handler is not None)
+        else:
+            async with self._session_factory() as session:
+                await session.execute(delete(OutboxTask).where(OutboxTask.id == task.id))
+                await session.commit()
+            self.completed += 1
+        finally:
+            self._running -= 1
+
+    async def _record_failure(self, task: ClaimedTask, error: Exception, retry: bool = True) -> None:
+        if retry and task.attempts < self.max_attempts:
+            delay = self.retry_base_seconds * (2 ** (task.attempts - 1))
+            values = {
+                "status": "pending",
+                "run_after": datetime.utcnow() + timedelta(seconds=delay),
+                "locked_until": None,
+                "last_error": str(error)[:2000],
+            }
+            self.retried += 1
+            logger.warning(
+                f"Outbox task {task.task_type} failed, retrying in {delay:.0f}s: {error}",
+                extra={"task_id": task.id, "attempts": task.attempts},
+            )
+        else:
+            values = {
+                "status": "failed",
+                "locked_until": None,
+                "last_error": str(error)[:2000],
+            }
+            self.failed += 1
+            logger.error(
+                f"Outbox task {task.task_type} failed permanently: {error}",
+                extra={"task_id": task.id, "attempts": task.attempts},
+            )
+
+        async with self._session_factory() as session:
+            await session.execute(
+                update(OutboxTask).where(OutboxTask.id == task.id).values(**values)
+            )
+            await session.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._tasks),
+            "running": self._running,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+async def get_queue_stats(session: AsyncSession) -> Dict[str, Any]:
+    """Queue depth, retries and lag across all workers (from the table)."""
+    now = datetime.utcnow()
+    result = await session.execute(
+        select(OutboxTask.status, func.count(OutboxTask.id)).group_by(OutboxTask.status)
+    )
+    by_status: Dict[str, int] = {status: count for status, count in result.all()}
+
+    # Tasks waiting out a backoff after a failed attempt
+    result = await session.execute(
+        select(func.count(OutboxTask.id)).where(
+            OutboxTask.status == "pending",
+            OutboxTask.attempts > 0,
+        )
+    )
+    retrying = result.scalar() or 0
+
+    # Lag: how long the oldest due, unclaimed task has been waiting
+    result = await session.execute(
+        select(func.min(OutboxTask.run_after)).where(
+            OutboxTask.status == "pending",
+            OutboxTask.run_after <= now,
+        )
+    )
+    oldest_due = result.scalar()
+
+    return {
+        "pending": by_status.get("pending", 0),
+        "running": by_status.get("running", 0),
+        "failed": by_status.get("failed", 0),
+        "retrying": retrying,
+        "lag_seconds": round((now - oldest_due).total_seconds(), 1) if oldest_due else 0.0,
+    }
+
+
+# Singleton pool (one per uvicorn worker)
+_outbox_pool: Optional[OutboxWorkerPool] = None
+
+
+def get_outbox_pool() -> OutboxWorkerPool:
+    """Get the outbox worker pool for this process."""
+    global _outbox_pool
+    if _outbox_pool is None:
+        from .database import async_session_factory
+        _outbox_pool = OutboxWorkerPool(
+            session_factory=async_session_factory,
+            workers=settings.outbox_workers,
+            poll_interval=settings.outbox_poll_interval_seconds,
+            lease_seconds=settings.outbox_lease_seconds,
+            max_attempts=settings.outbox_max_attempts,
+            retry_base_seconds=settings.outbox_retry_base_seconds,
+        )
+    return _outbox_pool
+
+
+def start_outbox_workers() -> None:
+    """Start draining the outbox in this process (call from lifespan)."""
+    from . import post_generation  # noqa: F401 - registers task handlers
+    get_outbox_pool().start()
+
+
+async def stop_outbox_workers() -> None:
+    global _outbox_pool
+    if _outbox_pool is not None:
+        await _outbox_pool.stop()
+        _outbox_pool = None
+
+
+def notify_outbox() -> None:
+    """Wake this process's workers after committing new tasks (no-op if not started)."""
+    if _outbox_pool is not None:
+        _outbox_pool.notify()
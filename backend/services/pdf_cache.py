@@ -0,0 +1,241 @@
+"""
+Content-addressed PDF cache for Quoted.
+
+The same quote PDF used to be rendered from scratch on every download, every
+share-by-email and every invoice send. Rendered PDFs are now keyed by a hash
+of everything that affects the output: the quote/invoice dict, contractor
+branding (logo, pdf_template, pdf_accent_color), terms and the watermark
+flag. Editing a quote changes its dict and therefore its key, so there is
+nothing to invalidate - stale entries are simply never looked up again.
+
+Lookup order:
+1. In-process LRU (per worker, small - PDFs are 20-200KB)
+2. StorageService (S3 in production, ./data/pdfs/cache locally)
+3. Render in the PDF process pool, then write back to both tiers
+
+Concurrent requests for the same key share one render.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Optional, Dict
+
+from ..config import settings
+from .cache import LocalTTLCache
+from .logging import get_logger
+from .logo_storage import contractor_logo_hash, get_logo_storage_service
+from .pdf_render_pool import get_pdf_render_pool
+from .storage import storage_service, StorageService
+
+logger = get_logger("quoted.pdf_cache")
+
+# Bump when PDF layout/template code changes so old renders aren't served
+PDF_RENDER_VERSION = 2
+
+CACHE_PREFIX = f"{StorageService.PDFS_PATH}/cache"
+
+
+def pdf_cache_key(job: dict) -> str:
+    """Hash the render inputs (generate_quote_pdf kwargs) into a cache key."""
+    payload = json.dumps(
+        {"v": PDF_RENDER_VERSION, "job": job},
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _terms_dict(terms) -> dict:
+    if not terms:
+        return {}
+    return {
+        "deposit_percent": terms.deposit_percent,
+        "quote_valid_days": terms.quote_valid_days,
+        "labor_warranty_years": terms.labor_warranty_years,
+    }
+
+
+def _contractor_dict(contractor) -> dict:
+    return {
+        "id": contractor.id,
+        "business_name": contractor.business_name,
+        "owner_name": contractor.owner_name,
+        "email": contractor.email,
+        "phone": contractor.phone,
+        "address": contractor.address,
+        # Renditions are content-addressed, so the hash alone keys the cache;
+        # the PNG itself is attached only when a render is needed
+        "logo_hash": contractor.logo_hash,
+    }
+
+
+def quote_pdf_job(quote, contractor, terms=None) -> dict:
+    """
+    Build render inputs for a quote PDF from ORM objects.
+
+    Download and share-by-email both use this, so they hit the same cache entry.
+    The date and number come from the quote (not the render time), so the
+    output is fully determined by the key.
+    """
+    created_at = quote.created_at
+    return {
+        "quote_data": {
+            "id": quote.id,
+            "quote_date": created_at.strftime("%B %d, %Y") if created_at else None,
+            "quote_number": created_at.strftime("%Y%m%d%H%M") if created_at else None,
+            "customer_name": quote.customer_name,
+            "customer_address": quote.customer_address,
+            "customer_phone": quote.customer_phone,
+            "job_description": quote.job_description,
+            "line_items": quote.line_items,
+            "subtotal": quote.subtotal,
+            "total": quote.total,
+            "estimated_days": quote.estimated_days,
+        },
+        "contractor": _contractor_dict(contractor),
+        "terms": _terms_dict(terms),
+        "watermark": bool(quote.is_grace_quote),  # Grace quotes are watermarked
+        "template": contractor.pdf_template or "modern",  # DISC-028
+        "accent_color": contractor.pdf_accent_color,
+    }
+
+
+def invoice_pdf_job(invoice, contractor, terms=None) -> dict:
+    """Build render inputs for an invoice PDF from ORM objects."""
+    invoice_date = invoice.invoice_date or invoice.created_at
+    return {
+        "quote_data": {
+            "id": invoice.id,
+            "invoice_number": invoice.invoice_number,
+            "customer_name": invoice.customer_name,
+            "customer_address": invoice.customer_address,
+            "customer_phone": invoice.customer_phone,
+            "customer_email": invoice.customer_email,
+            "job_description": invoice.description,
+            "line_items": invoice.line_items,
+            "subtotal": invoice.subtotal,
+            "tax_percent": invoice.tax_percent,
+            "tax_amount": invoice.tax_amount,
+            "total": invoice.total,
+            "invoice_date": invoice_date.strftime("%B %d, %Y") if invoice_date else None,
+            "due_date": invoice.due_date.strftime("%B %d, %Y") if invoice.due_date else None,
+            "terms_text": invoice.terms_text,
+            "notes": invoice.notes,
+            "status": invoice.status,
+        },
+        "contractor": _contractor_dict(contractor),
+        "terms": _terms_dict(terms),
+        "template": contractor.pdf_template or "modern",
+        "accent_color": contractor.pdf_accent_color,
+        "is_invoice": True,  # Render "INVOICE" instead of "QUOTE"
+    }
+
+
+class PDFCacheService:
+    """Two-tier (memory + storage) cache in front of the PDF render pool."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._memory = LocalTTLCache(max_entries=max_entries or settings.pdf_cache_memory_entries)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.stats = {"memory_hits": 0, "storage_hits": 0, "renders": 0}
+
+    @staticmethod
+    def storage_key(cache_key: str) -> str:
+        return f"{CACHE_PREFIX}/{cache_key}.pdf"
+
+    async def get_or_render(self, job: dict) -> bytes:
+        """
+        Return the PDF for these render inputs, rendering only on a miss.
+
+        Raises:
+            PDFRenderBusy: If a render is needed and the pool is saturated
+        """
+        job = await self._with_logo_hash(job)
+        key = pdf_cache_key(job)
+
+        pdf_bytes = self._memory.get(key)
+        if pdf_bytes is not None:
+            self.stats["memory_hits"] += 1
+            return pdf_bytes
+
+        # Someone is already fetching/rendering this exact PDF
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            pdf_bytes = await self._load_or_render(key, job)
+            future.set_result(pdf_bytes)
+            return pdf_bytes
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters get the exception; don't warn about it being unretrieved
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    @staticmethod
+    async def _with_logo_hash(job: dict) -> dict:
+        """
+        Fill in logo_hash for a contractor whose legacy base64 logo the
+        startup backfill hasn't moved yet (migrated here), before keying.
+        """
+        contractor = job.get("contractor") or {}
+        if contractor.get("logo_hash") or not contractor.get("id"):
+            return job
+        digest = await contractor_logo_hash(contractor["id"], None)
+        if not digest:
+            return job
+        return {**job, "contractor": {**contractor, "logo_hash": digest}}
+
+    @staticmethod
+    async def _with_logo(job: dict) -> dict:
+        """Attach the pre-scaled logo rendition for the render worker."""
+        contractor = job.get("contractor") or {}
+        logo = await get_logo_storage_service().pdf_logo(contractor.get("logo_hash"))
+        if not logo:
+            return job
+        return {**job, "contractor": {**contractor, **logo}}
+
+    async def _load_or_render(self, key: str, job: dict) -> bytes:
+        storage_key = self.storage_key(key)
+
+        try:
+            pdf_bytes = await storage_service.download_key(storage_key)
+        except Exception as e:
+            logger.warning(f"PDF cache storage read failed for {key}: {e}")
+            pdf_bytes = None
+
+        if pdf_bytes is not None:
+            self.stats["storage_hits"] += 1
+        else:
+            pdf_bytes = await get_pdf_render_pool().render(**await self._with_logo(job))
+            self.stats["renders"] += 1
+            try:
+                await storage_service.upload(storage_key, pdf_bytes, content_type="application/pdf")
+            except Exception as e:
+                # Cache write is best-effort; the caller still gets the PDF
+                logger.warning(f"PDF cache storage write failed for {key}: {e}")
+
+        self._memory.set(key, pdf_bytes, ttl=settings.pdf_cache_memory_ttl)
+        return pdf_bytes
+
+
+# Singleton pattern
+_pdf_cache_service: Optional[PDFCacheService] = None
+
+
+def get_pdf_cache_service() -> PDFCacheService:
+    """Get the PDF cache service singleton."""
+    global _pdf_cache_service
+    if _pdf_cache_service is None:
+        _pdf_cache_service = PDFCacheService()
+    return _pdf_cache_service
@@ -6,7 +6,6 @@ Uses ReportLab for PDF generation with premium styling.
 
 import io
 import os
-import base64
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -758,55 +757,16 @@ class PDFGeneratorService:
 
         contact_text = '<br/>'.join(contact_lines) if contact_lines else ''
 
-        # Create logo - use custom logo if available, otherwise placeholder
-        logo_data = contractor.get('logo_data')
+        # Create logo - use custom logo if available, otherwise placeholder.
+        # logo_png is the pre-scaled "pdf" rendition from logo_storage and
+        # logo_size its size fitted into the 120x48pt box (DISC-127), so there
+        # is nothing to decode or resize.
+        logo_png = contractor.get('logo_png')
         logo = None
-        if logo_data:
-            # Custom logo from base64 data URI
+        if logo_png:
             try:
-                # Extract base64 data from data URI
-                if logo_data.startswith('data:'):
-                    # Format: data:image/png;base64,<base64_data>
-                    base64_str = logo_data.split(',', 1)[1]
-                else:
-                    base64_str = logo_data
-
-                # Decode base64 to binary
-                logo_binary = base64.b64decode(base64_str)
-
-                # DISC-066: Validate image before using (if PIL available)
-                try:
-                    from PIL import Image as PILImage
-                    pil_img = PILImage.open(io.BytesIO(logo_binary))
-                    pil_img.verify()  # Verify it's a valid image
-                except ImportError:
-                    pass  # PIL not installed, skip validation
-                except Exception as pil_e:
-                    print(f"Warning: Logo image validation failed: {pil_e}")
-                    logo = LogoPlaceholder(initial, size=48)
-
-                if logo is None:
-                    # Create BytesIO object for ReportLab
-                    logo_buffer = io.BytesIO(logo_binary)
-                    # DISC-127: Preserve aspect ratio - calculate dimensions from actual image
-                    max_height = 48
-                    max_width = 120  # Allow wider logos
-                    try:
-                        from PIL import Image as PILImage
-                        # Re-open image to get dimensions (verify() closes it)
-                        logo_buffer.seek(0)
-                        pil_img = PILImage.open(io.BytesIO(logo_binary))
-                        orig_width, orig_height = pil_img.size
-                        # Calculate scale to fit within max dimensions while preserving aspect ratio
-                        scale = min(max_width / orig_width, max_height / orig_height)
-                        scaled_width = orig_width * scale
-                        scaled_height = orig_height * scale
-                        logo_buffer.seek(0)
-                        logo = Image(logo_buffer, width=scaled_width, height=scaled_height)
-                    except ImportError:
-                        # PIL not available - use fixed height, let ReportLab handle width
-                        logo_buffer.seek(0)
-                        logo = Image(logo_buffer, height=max_height)
+                width, height = contractor['logo_size']
+                logo = Image(io.BytesIO(logo_png), width=width, height=height)
             except Exception as e:
                 # If logo fails to load, fall back to placeholder
                 print(f"Warning: Failed to load custom logo: {e}")
@@ -869,15 +829,17 @@ class PDFGeneratorService:
         # Date and quote/invoice number
         if is_invoice:
             # For invoices, use invoice_date and invoice_number from data
-            doc_date = quote_data.get('invoice_date', datetime.now().strftime("%B %d, %Y"))
-            doc_num = quote_data.get('invoice_number', datetime.now().strftime("INV-%Y%m%d"))
+            doc_date = quote_data.get('invoice_date') or datetime.now().strftime("%B %d, %Y")
+            doc_num = quote_data.get('invoice_number') or datetime.now().strftime("INV-%Y%m%d")
             due_date = quote_data.get('due_date')
             subtitle = f"#{doc_num}  ·  {doc_date}"
             if due_date:
                 subtitle += f"  ·  Due: {due_date}"
         else:
-            doc_date = datetime.now().strftime("%B %d, %Y")
-            doc_num = quote_data.get('quote_number', datetime.now().strftime("%Y%m%d%H%M"))
+            # quote_pdf_job passes the quote's own date and number, so cached
+            # renders match; the render time is only a fallback
+            doc_date = quote_data.get('quote_date') or datetime.now().strftime("%B %d, %Y")
+            doc_num = quote_data.get('quote_number') or datetime.now().strftime("%Y%m%d%H%M")
             subtitle = f"#{doc_num}  ·  {doc_date}"
 
         elements.append(Paragraph(subtitle, self.styles['QuoteSubtitle']))
@@ -0,0 +1,217 @@
+"""
+Bounded PDF render pool for Quoted.
+
+ReportLab rendering is pure CPU work (layout, fonts, logo decoding) and took
+100ms-1s+ per document. The PDF endpoints called PDFGeneratorService directly
+from async handlers, so every render stalled the uvicorn event loop and all
+other requests on that worker waited behind it.
+
+Renders now run in a small ProcessPoolExecutor owned by each uvicorn worker.
+Jobs are plain picklable dicts in, PDF bytes out. Each worker process keeps
+its own PDFGeneratorService (the service mutates per-render state, so it must
+never be shared between concurrent renders).
+
+The pool is bounded: when running + queued renders reach
+pdf_render_workers + pdf_render_max_queue, new requests fail fast with
+PDFRenderBusy, which the app turns into a 503 with Retry-After instead of
+letting the queue (and response times) grow without limit.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from ..config import settings
+from .logging import get_logger
+
+logger = get_logger("quoted.pdf_render_pool")
+
+
+class PDFRenderBusy(Exception):
+    """Raised when the render pool is saturated and the request should be retried."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"PDF render pool is busy, retry after {retry_after}s")
+
+
+# =============================================================================
+# Worker process side
+# =============================================================================
+
+def _init_worker() -> None:
+    """Warm up the per-process PDF service (fonts, styles) once per worker."""
+    from .pdf_generator import get_pdf_service
+    get_pdf_service()
+
+
+def _render_in_worker(job: dict) -> bytes:
+    """
+    Render one PDF inside a worker process.
+
+    job holds the keyword arguments for PDFGeneratorService.generate_quote_pdf
+    (quote_data, contractor, terms, watermark, template, ...). Renders are
+    always in-memory; output_path is not supported across processes.
+    """
+    from .pdf_generator import get_pdf_service
+    return get_pdf_service().generate_quote_pdf(**job)
+
+
+# =============================================================================
+# Event loop side
+# =============================================================================
+
+class PDFRenderPool:
+    """
+    Per-uvicorn-worker process pool with an admission limit.
+
+    Admission is tracked with a simple in-flight counter. A slot is held
+    until the worker is done with the job, not until the caller stops
+    waiting: a render that timed out still occupies its process. All
+    bookkeeping happens on the event loop thread, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ):
+        self.workers = max(1, workers or settings.pdf_render_workers)
+        self.max_queue = max(0, settings.pdf_render_max_queue if max_queue is None else max_queue)
+        self.timeout_seconds = timeout_seconds or settings.pdf_render_timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum renders admitted at once (running + waiting)."""
+        return self.workers + self.max_queue
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: never fork the uvicorn worker (threads, open sockets,
+            # event loop state). Children only import the PDF code path.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            logger.info(
+                f"PDF render pool started (workers={self.workers}, max_queue={self.max_queue})"
+            )
+        return self._executor
+
+    def _retry_after(self) -> int:
+        """Rough wait estimate: one average render per queued job per worker."""
+        backlog_rounds = max(1, self._in_flight // self.workers)
+        return max(1, int(backlog_rounds * settings.pdf_render_retry_after_seconds))
+
+    async def render(self, **job) -> bytes:
+        """
+        Render a PDF in the pool and return its bytes.
+
+        Accepts the same keyword arguments as PDFGeneratorService.generate_quote_pdf.
+
+        Raises:
+            PDFRenderBusy: If the pool is at capacity
+        """
+        job.pop("output_path", None)
+
+        if self._in_flight >= self.capacity:
+            self._rejected += 1
+            retry_after = self._retry_after()
+            logger.warning(
+                f"PDF render pool saturated ({self._in_flight}/{self.capacity}), "
+                f"rejecting with Retry-After={retry_after}"
+            )
+            raise PDFRenderBusy(retry_after)
+
+        self._in_flight += 1
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                future = self._get_executor().submit(_render_in_worker, job)
+            except BrokenProcessPool:
+                # A worker died (OOM, segfault in a C extension). Start over.
+                logger.error("PDF render pool broken, restarting")
+                self.shutdown()
+                future = self._get_executor().submit(_render_in_worker, job)
+        except BaseException:
+            self._in_flight -= 1
+            raise
+        # Runs when the job finishes, fails or is cancelled before it started
+        future.add_done_callback(lambda _: self._release_from_worker(loop))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+        except BrokenProcessPool:
+            logger.error("PDF render worker crashed, pool will restart on next render")
+            self.shutdown()
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    def _release_from_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Free a slot from the executor's thread."""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # Event loop already closed (shutdown)
+
+    def get_stats(self) -> dict:
+        """Current pool stats for health checks."""
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "rejected": self._rejected,
+            "started": self._executor is not None,
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker processes (app shutdown or broken pool)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+async def pdf_render_busy_handler(request: Request, exc: PDFRenderBusy) -> JSONResponse:
+    """Turn a saturated render pool into a 503 the client can retry."""
+    response = JSONResponse(
+        status_code=503,
+        content={
+            "error": "pdf_render_busy",
+            "message": "PDF generation is busy right now. Please try again shortly.",
+            "retry_after": exc.retry_after,
+        },
+    )
+    response.headers["Retry-After"] = str(exc.retry_after)
+    return response
+
+
+# Singleton pattern
+_pdf_render_pool: Optional[PDFRenderPool] = None
+
+
+def get_pdf_render_pool() -> PDFRenderPool:
+    """Get the PDF render pool singleton (one per uvicorn worker)."""
+    global _pdf_render_pool
+    if _pdf_render_pool is None:
+        _pdf_render_pool = PDFRenderPool()
+    return _pdf_render_pool
+
+
+def shutdown_pdf_render_pool() -> None:
+    """Stop the render pool's worker processes, if it was started."""
+    global _pdf_render_pool
+    if _pdf_render_pool is not None:
+        _pdf_render_pool.shutdown()
+        _pdf_render_pool = None
@@ -0,0 +1,118 @@
+"""
+Post-generation side effects for Quoted, run from the task outbox.
+
+Quote generation enqueues these in the same transaction as the new quote
+(DatabaseService.create_quote(post_commit_tasks=...)) and responds as soon
+as it commits. Every payload gets the new quote's id as "quote_id".
+
+Handlers run at least once, so each is safe to repeat:
+- customer linking skips quotes that are already linked
+- category registration is find-or-create plus a counter bump recorded
+  on the quote, so each quote is counted once
+- analytics and the founder email tolerate the rare duplicate
+"""
+
+from typing import Optional, Dict, Any, List, Tuple
+
+from ..models.database import Quote
+from .analytics import analytics_service
+from .database import async_session_factory, get_db_service
+from .email import email_service
+from .outbox import register_task_handler
+from .quote_stats import ALL_CATEGORIES, QuoteCounts
+
+LINK_CUSTOMER = "quote.link_customer"
+REGISTER_CATEGORY = "quote.register_category"
+TRACK_GENERATED = "quote.track_generated"
+NOTIFY_FOUNDER = "quote.notify_founder"
+
+
+def post_generation_tasks(
+    contractor_id: str,
+    user_id: str,
+    job_type: Optional[str],
+    analytics_properties: Optional[Dict[str, Any]] = None,
+    founder_notification: Optional[Dict[str, Any]] = None,
+    link_customer: bool = False,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Build the (task_type, payload) list for a freshly generated quote.
+
+    Args:
+        contractor_id: Owner of the quote
+        user_id: User who generated it (analytics distinct id)
+        job_type: Detected category, registered in the Pricing Brain
+        analytics_properties: quote_generated properties; learning stats
+            (DISC-012) are added when the event is sent
+        founder_notification: kwargs for send_founder_quote_notification (DISC-146)
+        link_customer: Link/create the customer record (DISC-091)
+    """
+    tasks: List[Tuple[str, Dict[str, Any]]] = []
+    if link_customer:
+        tasks.append((LINK_CUSTOMER, {}))
+    if job_type:
+        tasks.append((REGISTER_CATEGORY, {"contractor_id": contractor_id, "category": job_type}))
+    if analytics_properties is not None:
+        tasks.append((TRACK_GENERATED, {
+            "user_id": user_id,
+            "contractor_id": contractor_id,
+            "job_type": job_type,
+            "properties": analytics_properties,
+        }))
+    if founder_notification is not None:
+        tasks.append((NOTIFY_FOUNDER, {"notification": founder_notification}))
+    return tasks
+
+
+@register_task_handler(LINK_CUSTOMER)
+async def link_customer(payload: Dict[str, Any]) -> None:
+    """DISC-091: Link quote to customer record (auto-creates if needed)."""
+    from .customer_service import CustomerService
+
+    async with async_session_factory() as session:
+        quote = await session.get(Quote, payload["quote_id"])
+        if quote is None or quote.customer_id or not quote.customer_name:
+            return
+        await CustomerService.link_quote_to_customer(session, quote)
+        await session.commit()
+
+
+@register_task_handler(REGISTER_CATEGORY)
+async def register_category(payload: Dict[str, Any]) -> None:
+    """Register the category and bump its Pricing Brain quote count."""
+    db = get_db_service()
+    await db.ensure_category_exists(payload["contractor_id"], payload["category"])
+    await db.increment_category_quote_count(
+        payload["contractor_id"], payload["category"], quote_id=payload["quote_id"]
+    )
+
+
+@register_task_handler(TRACK_GENERATED)
+async def track_generated(payload: Dict[str, Any]) -> None:
+    """Send quote_generated with the contractor's learning stats (DISC-012)."""
+    db = get_db_service()
+    quote_stats = await db.get_quote_stats(payload["contractor_id"])
+    user_stats = quote_stats.get(ALL_CATEGORIES, QuoteCounts())
+    category_stats = quote_stats.get(payload.get("job_type"), QuoteCounts())
+
+    properties = dict(payload["properties"])
+    properties.update({
+        "quote_id": payload["quote_id"],
+        "user_quote_count": user_stats.quotes,
+        "user_edit_count": user_stats.edits,
+        "user_edit_rate": user_stats.edit_rate,
+        "category_quote_count": category_stats.quotes,
+        "category_edit_count": category_stats.edits,
+        "category_edit_rate": category_stats.edit_rate,
+    })
+    analytics_service.track_event(
+        user_id=payload["user_id"],
+        event_name="quote_generated",
+        properties=properties,
+    )
+
+
+@register_task_handler(NOTIFY_FOUNDER)
+async def notify_founder(payload: Dict[str, Any]) -> None:
+    """DISC-146: Founder notification for quote creation."""
+    await email_service.send_founder_quote_notification(**payload["notification"])
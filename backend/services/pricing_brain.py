@@ -11,9 +11,9 @@ what the AI has learned and edit it directly.
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
-import anthropic
-
 from ..config import settings
+from .claude_client import get_async_claude_client
+from .quote_stats import QuoteCounts
 
 
 class PricingBrainService:
@@ -25,60 +25,42 @@ class PricingBrainService:
     """
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_async_claude_client()
         # Use Haiku for cost-efficient analysis
         self.haiku_model = "claude-3-haiku-20240307"
 
     def get_all_categories(
         self,
         pricing_knowledge: Dict[str, Any],
-        quotes: List[Any],
+        quote_stats: Dict[str, QuoteCounts],
     ) -> List[Dict[str, Any]]:
         """
         Get all categories with statistics.
 
         Args:
             pricing_knowledge: The pricing_knowledge dict from PricingModel
-            quotes: List of Quote objects for this contractor
+            quote_stats: Maintained counters by category (DatabaseService.get_quote_stats)
 
         Returns:
             List of category dicts with stats
         """
         categories = pricing_knowledge.get("categories", {})
 
-        # Calculate stats from quotes for backward compatibility / fallback
-        # DISC-121: Also track outcome stats per category
-        quote_counts_from_db = {}
-        outcome_stats = {}  # {category: {won: 0, lost: 0}}
-        for quote in quotes:
-            job_type = quote.job_type
-            if job_type:
-                quote_counts_from_db[job_type] = quote_counts_from_db.get(job_type, 0) + 1
-                # Track outcomes
-                if job_type not in outcome_stats:
-                    outcome_stats[job_type] = {"won": 0, "lost": 0}
-                if hasattr(quote, 'outcome'):
-                    if quote.outcome == "won":
-                        outcome_stats[job_type]["won"] += 1
-                    elif quote.outcome == "lost":
-                        outcome_stats[job_type]["lost"] += 1
-
         result = []
         for category_key, category_data in categories.items():
-            # Use stored quote_count if available, otherwise fall back to dynamic count
+            category_stats = quote_stats.get(category_key, QuoteCounts())
+
+            # Use stored quote_count if available, otherwise fall back to counters
             stored_count = category_data.get("quote_count", 0)
-            db_count = quote_counts_from_db.get(category_key, 0)
-            # Use max of stored and calculated to handle migration
-            quotes_count = max(stored_count, db_count)
+            # Use max of stored and counted to handle migration
+            quotes_count = max(stored_count, category_stats.quotes)
 
             learned_adjustments = category_data.get("learned_adjustments", [])
 
-            # DISC-121: Calculate win rate for category
-            cat_outcomes = outcome_stats.get(category_key, {"won": 0, "lost": 0})
-            won_count = cat_outcomes["won"]
-            lost_count = cat_outcomes["lost"]
-            decided = won_count + lost_count
-            win_rate = round(won_count / decided * 100, 1) if decided > 0 else None
+            # DISC-121: Win rate for category
+            won_count = category_stats.wins
+            lost_count = category_stats.losses
+            win_rate = category_stats.win_rate
 
             result.append({
                 "category": category_key,
@@ -234,7 +216,7 @@ Keep it practical and specific to THIS category. No generic advice.
 Format as plain text, no JSON."""
 
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model=self.haiku_model,
                 max_tokens=200,
                 messages=[{"role": "user", "content": prompt}],
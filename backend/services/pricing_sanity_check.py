@@ -6,6 +6,7 @@ historical data before returning to users.
 
 Strategy:
 1. Calculate category-level median and P95 from historical quotes
+   (maintained incrementally in quote_total_summaries, see quote_total_index)
 2. On new quote generation, check total price against bounds
 3. If >3x P95: Add warning field, log for review
 4. If >10x P95: Block quote, return error asking to re-record
@@ -13,12 +14,12 @@ Strategy:
 Edge case: When category has <5 quotes, use global fallback bounds.
 """
 
-import statistics
 from typing import Optional, Dict, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from ..models.database import Quote
+from .quote_total_index import QuoteTotalHistogram, get_quote_total_histogram
 
 
 class PricingSanityCheckService:
@@ -63,42 +64,47 @@ class PricingSanityCheckService:
             - count: Number of historical quotes
             - source: "category" or "global" (indicates which bounds used)
         """
-        # Query historical quotes for this contractor and category
-        query = select(Quote.total).where(
-            Quote.contractor_id == contractor_id,
-            Quote.total.isnot(None),
-            Quote.total > 0,  # Exclude invalid quotes
-        )
+        # DISC-034: Read the maintained histogram (one row) instead of scanning
+        # every historical total. Contractors without a summary row yet (quotes
+        # predating the index) fall back to the scan until their next quote.
+        histogram = await get_quote_total_histogram(db, contractor_id, category)
+
+        if histogram is None:
+            query = select(Quote.total).where(
+                Quote.contractor_id == contractor_id,
+                Quote.total.isnot(None),
+                Quote.total > 0,  # Exclude invalid quotes
+            )
+
+            if category:
+                query = query.where(Quote.job_type == category)
 
-        if category:
-            query = query.where(Quote.job_type == category)
+            result = await db.execute(query)
+            histogram = QuoteTotalHistogram.from_totals(
+                [row[0] for row in result.fetchall()]
+            )
 
-        result = await db.execute(query)
-        totals = [row[0] for row in result.fetchall()]
+        count = histogram.count
 
         # If insufficient data for category, fall back to global bounds
-        if len(totals) < self.MIN_QUOTES_FOR_CATEGORY_BOUNDS:
+        if count < self.MIN_QUOTES_FOR_CATEGORY_BOUNDS:
             return {
                 "median": (self.GLOBAL_MIN_QUOTE + self.GLOBAL_MAX_QUOTE) / 2,
                 "p95": self.GLOBAL_MAX_QUOTE,
-                "count": len(totals),
+                "count": count,
                 "source": "global",
                 "warning_threshold": self.GLOBAL_MAX_QUOTE * 0.5,  # 50% of max
                 "block_threshold": self.GLOBAL_MAX_QUOTE,
             }
 
-        # Calculate statistics from historical data
-        median = statistics.median(totals)
-
-        # P95 = 95th percentile
-        sorted_totals = sorted(totals)
-        p95_index = int(len(sorted_totals) * 0.95)
-        p95 = sorted_totals[p95_index] if p95_index < len(sorted_totals) else sorted_totals[-1]
+        # Median and P95 from the histogram (within ~1% of the exact values)
+        median = histogram.median()
+        p95 = histogram.p95()
 
         return {
             "median": median,
             "p95": p95,
-            "count": len(totals),
+            "count": count,
             "source": "category",
             "warning_threshold": p95 * self.WARNING_MULTIPLIER,
             "block_threshold": p95 * self.BLOCK_MULTIPLIER,
@@ -0,0 +1,365 @@
+"""
+Normalized storage for pricing categories and their learned adjustments.
+
+Everything a contractor's pricing brain learned used to live in one JSON
+document, PricingModel.pricing_knowledge. Every learning, acceptance, loss,
+ensure_category_exists and even increment_category_quote_count (after every
+quote) read the whole document, changed one category and wrote all of it
+back. Large contractors rewrote tens of KB per quote, and two concurrent
+writes to the same contractor silently dropped one of them.
+
+Categories now live in pricing_categories, one row each, and their
+learned_adjustments in learning_statements:
+- Counters (quote_count) are single atomic UPDATEs of one row.
+- Read-modify-write changes (learning, acceptance, loss, Pricing Brain edits)
+  go through the ORM, whose version column turns a concurrent change of the
+  same category into StaleDataError; DatabaseService retries the operation
+  on fresh data instead of overwriting it.
+- Statements are diffed, so an unchanged statement is never rewritten.
+
+Global keys (global_rules, contractor_dna, ...) stay in the blob.
+
+knowledge_view() composes the old dict shape (blob plus "categories"), and
+DatabaseService.get_pricing_model hands it out as pricing_model.pricing_knowledge,
+so PricingBrainService, the prompts and the quote context snapshot are unchanged.
+
+Contractors move over lazily: their first category write copies the blob's
+categories into rows, strips them from the blob and sets
+PricingModel.categories_normalized. Until then the blob is still read as is.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import attributes
+
+from ..models.database import LearningStatement, PricingCategory, PricingModel
+from .logging import get_logger
+
+logger = get_logger("quoted.pricing_store")
+
+# Category dict keys stored as columns (everything else goes to extra)
+CATEGORY_COLUMNS = (
+    "display_name", "tailored_prompt", "confidence", "samples",
+    "quote_count", "correction_count", "acceptance_count", "loss_count",
+)
+COUNTER_COLUMNS = ("samples", "quote_count", "correction_count", "acceptance_count", "loss_count")
+
+# Learned adjustment dict keys stored as columns
+STATEMENT_COLUMNS = ("text", "quality_score", "source", "outcome_boost", "created_at")
+
+DEFAULT_CONFIDENCE = 0.5
+
+
+def default_display_name(key: str) -> str:
+    return key.replace("_", " ").title()
+
+
+# ============== COMPATIBILITY VIEW ==============
+
+def statement_to_value(statement: LearningStatement) -> Union[str, Dict[str, Any]]:
+    """A learning_statements row as a learned_adjustments entry."""
+    if statement.plain_text:
+        return statement.text
+    value = dict(statement.extra or {})
+    for column in STATEMENT_COLUMNS:
+        field = getattr(statement, column)
+        if field is None:
+            # Readers use .get(key, default): leave unknown values out
+            continue
+        value[column] = field.isoformat() if isinstance(field, datetime) else field
+    return value
+
+
+def category_to_dict(category: PricingCategory) -> Dict[str, Any]:
+    """A pricing_categories row in the legacy pricing_knowledge["categories"] shape."""
+    data = dict(category.extra or {})
+    data.update({
+        "display_name": category.display_name or default_display_name(category.key),
+        "tailored_prompt": category.tailored_prompt,
+        "learned_adjustments": [statement_to_value(s) for s in category.statements],
+        "confidence": category.confidence if category.confidence is not None else DEFAULT_CONFIDENCE,
+    })
+    for column in COUNTER_COLUMNS:
+        data[column] = getattr(category, column) or 0
+    return data
+
+
+def global_knowledge(pricing_model: PricingModel) -> Dict[str, Any]:
+    """Copy of the blob's global keys (without categories)."""
+    knowledge = dict(pricing_model.pricing_knowledge or {})
+    knowledge.pop("categories", None)
+    return knowledge
+
+
+def set_global_knowledge(pricing_model: PricingModel, knowledge: Dict[str, Any]) -> None:
+    """Write the blob's global keys; categories never go back into it."""
+    knowledge = {key: value for key, value in knowledge.items() if key != "categories"}
+    pricing_model.pricing_knowledge = knowledge
+    attributes.flag_modified(pricing_model, "pricing_knowledge")
+
+
+async def load_categories(session: AsyncSession, contractor_id: str) -> Dict[str, PricingCategory]:
+    """key -> row, with statements (selectin-loaded in one extra query)."""
+    result = await session.execute(
+        select(PricingCategory)
+        .where(PricingCategory.contractor_id == contractor_id)
+        .order_by(PricingCategory.created_at, PricingCategory.key)
+    )
+    return {category.key: category for category in result.scalars().all()}
+
+
+async def knowledge_view(session: AsyncSession, pricing_model: PricingModel) -> Dict[str, Any]:
+    """The pricing_knowledge dict readers expect: global keys plus "categories"."""
+    if not pricing_model.categories_normalized:
+        return dict(pricing_model.pricing_knowledge or {})
+    knowledge = global_knowledge(pricing_model)
+    categories = await load_categories(session, pricing_model.contractor_id)
+    knowledge["categories"] = {key: category_to_dict(row) for key, row in categories.items()}
+    return knowledge
+
+
+async def attach_view(session: AsyncSession, pricing_model: PricingModel) -> PricingModel:
+    """
+    Expose knowledge_view() as pricing_model.pricing_knowledge.
+
+    Set as the committed value, so it is never flushed back: blob writes
+    go through set_global_knowledge.
+    """
+    if pricing_model.categories_normalized:
+        attributes.set_committed_value(
+            pricing_model, "pricing_knowledge", await knowledge_view(session, pricing_model)
+        )
+    return pricing_model
+
+
+# ============== WRITES ==============
+
+def _parse_created_at(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _statement_fields(value: Union[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Column values for a learned_adjustments entry, or None to skip it."""
+    if isinstance(value, str):
+        return {"text": value, "plain_text": True, "extra": {}} if value else None
+    if not isinstance(value, dict) or not value.get("text"):
+        return None
+    return {
+        "text": value["text"],
+        "quality_score": value.get("quality_score"),
+        "source": value.get("source"),
+        "outcome_boost": value.get("outcome_boost"),
+        "created_at": _parse_created_at(value.get("created_at")),
+        "plain_text": False,
+        "extra": {k: v for k, v in value.items() if k not in STATEMENT_COLUMNS},
+    }
+
+
+def set_statements(category: PricingCategory, adjustments: List[Union[str, Dict[str, Any]]]) -> None:
+    """
+    Make the category's statements match a learned_adjustments list.
+
+    Statements are matched by text: kept ones are updated in place (only
+    changed columns), missing ones deleted, new ones inserted. Any change
+    also bumps the category's version, so two concurrent rewrites of one
+    list conflict instead of interleaving.
+    """
+    changed = False
+    existing: Dict[str, List[LearningStatement]] = {}
+    for statement in category.statements:
+        existing.setdefault(statement.text, []).append(statement)
+
+    kept = []
+    for value in adjustments or []:
+        fields = _statement_fields(value)
+        if fields is None:
+            continue
+        matches = existing.get(fields["text"])
+        statement = matches.pop(0) if matches else LearningStatement(contractor_id=category.contractor_id)
+        fields["position"] = len(kept)
+        for column, field in fields.items():
+            if getattr(statement, column) != field:
+                setattr(statement, column, field)
+                changed = True
+        kept.append(statement)
+
+    if changed or len(kept) != len(category.statements):
+        category.statements = kept  # delete-orphan removes the rest
+        category.updated_at = datetime.utcnow()
+
+
+def apply_category_dict(category: PricingCategory, data: Dict[str, Any], counters: bool = True) -> None:
+    """
+    Set a row (and its statements) from a legacy category dict.
+
+    counters=False leaves COUNTER_COLUMNS alone: increment() doesn't bump
+    the version, so a counter from a dict read earlier could silently undo
+    an increment committed since.
+    """
+    for column in CATEGORY_COLUMNS:
+        if not counters and column in COUNTER_COLUMNS:
+            continue
+        if column in data and getattr(category, column) != data[column]:
+            setattr(category, column, data[column])
+    extra = {
+        key: value for key, value in data.items()
+        if key not in CATEGORY_COLUMNS and key != "learned_adjustments"
+    }
+    if extra != (category.extra or {}):
+        category.extra = extra
+    if "learned_adjustments" in data:
+        set_statements(category, data["learned_adjustments"])
+
+
+def new_category(contractor_id: str, key: str, display_name: Optional[str] = None) -> PricingCategory:
+    return PricingCategory(
+        contractor_id=contractor_id,
+        key=key,
+        display_name=display_name or default_display_name(key),
+        confidence=DEFAULT_CONFIDENCE,
+        samples=0,
+        quote_count=0,
+        correction_count=0,
+        acceptance_count=0,
+        loss_count=0,
+        extra={},
+        statements=[],  # Initialized, so reading it never lazy-loads (no IO under asyncio)
+    )
+
+
+async def _insert(session: AsyncSession, category: PricingCategory) -> bool:
+    """Insert in a savepoint; False if another request created the key first."""
+    try:
+        async with session.begin_nested():
+            session.add(category)
+        return True
+    except IntegrityError:
+        return False
+
+
+async def normalize(session: AsyncSession, pricing_model: PricingModel) -> Dict[str, PricingCategory]:
+    """
+    Move the contractor's blob categories into rows (once); returns key -> row.
+
+    Safe to race: a category another request already inserted is kept as is.
+    """
+    contractor_id = pricing_model.contractor_id
+    rows = await load_categories(session, contractor_id)
+    if pricing_model.categories_normalized:
+        return rows
+
+    legacy = (pricing_model.pricing_knowledge or {}).get("categories") or {}
+    lost_race = False
+    for key, data in legacy.items():
+        if key in rows or not isinstance(data, dict):
+            continue
+        category = new_category(contractor_id, key)
+        apply_category_dict(category, data)
+        if await _insert(session, category):
+            rows[key] = category
+        else:
+            lost_race = True
+    if lost_race:
+        rows = await load_categories(session, contractor_id)
+
+    set_global_knowledge(pricing_model, global_knowledge(pricing_model))
+    pricing_model.categories_normalized = True
+    logger.info(f"Normalized {len(legacy)} pricing categories for contractor {contractor_id}")
+    return rows
+
+
+async def get_category(
+    session: AsyncSession,
+    pricing_model: PricingModel,
+    key: str,
+    create: bool = False,
+    display_name: Optional[str] = None,
+) -> Tuple[Optional[PricingCategory], bool]:
+    """
+    One category row, optionally created; returns (row, created).
+
+    Normalizes the contractor first if they are still on the blob.
+    """
+    contractor_id = pricing_model.contractor_id
+    if not pricing_model.categories_normalized:
+        category = (await normalize(session, pricing_model)).get(key)
+    else:
+        result = await session.execute(
+            select(PricingCategory).where(
+                PricingCategory.contractor_id == contractor_id,
+                PricingCategory.key == key,
+            )
+        )
+        category = result.scalar_one_or_none()
+
+    if category is not None or not create:
+        return category, False
+
+    category = new_category(contractor_id, key, display_name)
+    if await _insert(session, category):
+        return category, True
+    # Created concurrently
+    result = await session.execute(
+        select(PricingCategory).where(
+            PricingCategory.contractor_id == contractor_id,
+            PricingCategory.key == key,
+        )
+    )
+    return result.scalar_one(), False
+
+
+async def increment(session: AsyncSession, contractor_id: str, key: str, column: str, amount: int = 1) -> bool:
+    """
+    Atomically add to a counter column; False if the row doesn't exist.
+
+    A plain UPDATE: it doesn't bump version, so counters never make a
+    concurrent learning on the same category conflict.
+    """
+    counter = getattr(PricingCategory, column)
+    result = await session.execute(
+        update(PricingCategory)
+        .where(PricingCategory.contractor_id == contractor_id, PricingCategory.key == key)
+        .values({column: func.coalesce(counter, 0) + amount})
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def replace_knowledge(session: AsyncSession, pricing_model: PricingModel, knowledge: Dict[str, Any]) -> None:
+    """
+    Store a complete pricing_knowledge dict (onboarding, full-document writers).
+
+    Only columns and statements that changed are written; rows missing
+    from the dict are deleted, like keys dropped from the old blob.
+    Counters are only taken from the dict for new rows: the caller's copy
+    may predate increments of existing ones.
+    """
+    rows = await normalize(session, pricing_model)
+    categories = (knowledge or {}).get("categories") or {}
+
+    for key, data in categories.items():
+        if not isinstance(data, dict):
+            continue
+        row = rows.get(key)
+        created = row is None
+        if created:
+            row = new_category(pricing_model.contractor_id, key)
+            session.add(row)
+        apply_category_dict(row, data, counters=created)
+
+    for key, row in rows.items():
+        if key not in categories:
+            await session.delete(row)
+
+    set_global_knowledge(pricing_model, knowledge or {})
@@ -0,0 +1,100 @@
+"""
+Memoized quote prompt fragments.
+
+build_quote_prompt rebuilt the same large strings from the full
+pricing_knowledge JSON on every generation: the category catalog
+(_format_pricing_knowledge plus global rules), the tailored section of the
+detected category and the correction examples. For contractors with dozens
+of categories that is most of the prompt assembly time, and none of it
+changes between learnings.
+
+Fragments are cached per worker, keyed by
+(contractor_id, context version, category, fragment name). The version is
+the quote context snapshot's (quote_context.py): the snapshot is rebuilt
+after every write to pricing knowledge, terms or corrections, so a new
+version makes every older fragment unreachable, in every worker.
+DatabaseService also drops the writing contractor's fragments right away
+(apply_learnings_to_pricing_model, update_pricing_model, and category
+edits and deletes through update_category / delete_category) so the memory
+is released.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from .logging import get_logger
+
+logger = get_logger("quoted.prompt_fragments")
+
+# Contractors whose fragments are kept in memory per worker
+MAX_CACHED_CONTRACTORS = 256
+
+
+class PromptFragmentCache:
+    """Per-worker LRU of rendered prompt fragments, one version per contractor."""
+
+    def __init__(self, max_contractors: int = MAX_CACHED_CONTRACTORS):
+        self.max_contractors = max_contractors
+        # contractor_id -> (version, {(category, name): text})
+        self._contractors: "OrderedDict[str, Tuple[str, Dict[Tuple[Optional[str], str], str]]]" = OrderedDict()
+
+        # Since this process started
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(
+        self,
+        contractor_id: str,
+        version: str,
+        category: Optional[str],
+        name: str,
+        render: Callable[[], str],
+    ) -> str:
+        """The cached fragment, or render() it and cache the result."""
+        entry = self._contractors.get(contractor_id)
+        if entry is None or entry[0] != version:
+            # First use, or the contractor's context changed: old fragments are stale
+            entry = (version, {})
+            self._contractors[contractor_id] = entry
+            while len(self._contractors) > self.max_contractors:
+                self._contractors.popitem(last=False)
+        self._contractors.move_to_end(contractor_id)
+
+        fragments = entry[1]
+        key = (category, name)
+        text = fragments.get(key)
+        if text is None:
+            self.misses += 1
+            text = fragments[key] = render()
+        else:
+            self.hits += 1
+        return text
+
+    def invalidate(self, contractor_id: str) -> None:
+        """Drop a contractor's fragments (after a write to their pricing model)."""
+        if self._contractors.pop(contractor_id, None) is not None:
+            self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "contractors": len(self._contractors),
+            "fragments": sum(len(fragments) for _, fragments in self._contractors.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+# Singleton (one per uvicorn worker)
+_fragment_cache: Optional[PromptFragmentCache] = None
+
+
+def get_prompt_fragment_cache() -> PromptFragmentCache:
+    """Get this process's prompt fragment cache."""
+    global _fragment_cache
+    if _fragment_cache is None:
+        _fragment_cache = PromptFragmentCache()
+    return _fragment_cache
@@ -0,0 +1,158 @@
+"""
+Quote context snapshot service for Quoted.
+
+Quote generation needs the same per-contractor inputs on every request:
+contractor profile, pricing model (including philosophy), terms and recent
+correction examples. Loading them took 6+ sequential queries before Claude
+was even called.
+
+This service assembles them into a single JSON snapshot per contractor and
+caches it through CacheService (Redis, with an in-process fallback). The
+DatabaseService methods that write any of these inputs invalidate the
+snapshot, so generation normally costs one cache read.
+"""
+
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+
+from .cache import cache_service
+from .database import get_db_service
+from .logging import get_logger
+
+logger = get_logger("quoted.quote_context")
+
+# Examples injected into the prompt (matches get_correction_examples default).
+# The snapshot keeps this many per job type.
+CORRECTION_EXAMPLES_LIMIT = 5
+
+
+class QuoteContextService:
+    """
+    Builds and caches the per-contractor context used by quote generation.
+
+    Snapshot shape:
+        {
+            "contractor_id": str,
+            "built_at": iso timestamp,
+            "contractor": {...},
+            "pricing_model": {... incl. pricing_knowledge, pricing_philosophy, version},
+            "terms": {...} or None,
+            "correction_examples": {"all": [...], "by_job_type": {job_type: [...]}},
+        }
+    """
+
+    async def get_context(self, contractor_id: str) -> Optional[dict]:
+        """
+        Get the quote context for a contractor.
+
+        Returns None if the contractor or their pricing model doesn't exist
+        (i.e. onboarding isn't complete).
+        """
+        snapshot = await cache_service.get_quote_context(contractor_id)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = await self._build_snapshot(contractor_id)
+        if snapshot is not None:
+            await cache_service.set_quote_context(contractor_id, snapshot)
+        return snapshot
+
+    async def invalidate(self, contractor_id: str) -> None:
+        """Drop the cached snapshot so the next read rebuilds it."""
+        await cache_service.invalidate_quote_context(contractor_id)
+
+    def get_correction_examples(
+        self,
+        context: dict,
+        job_type: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Pick correction examples from a snapshot.
+
+        Mirrors the generate flow: type-specific examples first, falling
+        back to the most recent corrections across all job types.
+        """
+        examples = context.get("correction_examples") or {}
+        if job_type:
+            typed = (examples.get("by_job_type") or {}).get(job_type)
+            if typed:
+                return typed
+        return examples.get("all") or []
+
+    async def _build_snapshot(self, contractor_id: str) -> Optional[dict]:
+        """Load all quote inputs from the database and serialize them."""
+        db = get_db_service()
+
+        contractor = await db.get_contractor_by_id(contractor_id)
+        if not contractor:
+            return None
+
+        pricing_model = await db.get_pricing_model(contractor_id)
+        if not pricing_model:
+            return None
+
+        terms = await db.get_terms(contractor_id)
+        # Newest first, at most CORRECTION_EXAMPLES_LIMIT of each job type;
+        # the newest overall are always among them
+        corrections = await db.get_correction_examples(
+            contractor_id, limit=CORRECTION_EXAMPLES_LIMIT, per_job_type=True
+        )
+
+        by_job_type: Dict[str, List[Dict]] = {}
+        for example in corrections:
+            by_job_type.setdefault(example["job_type"], []).append(example)
+
+        terms_dict = None
+        if terms:
+            terms_dict = {
+                "deposit_percent": terms.deposit_percent,
+                "quote_valid_days": terms.quote_valid_days,
+                "labor_warranty_years": terms.labor_warranty_years,
+                "accepted_payment_methods": terms.accepted_payment_methods,
+            }
+
+        built_at = datetime.utcnow().isoformat()
+        snapshot: Dict[str, Any] = {
+            "contractor_id": contractor_id,
+            "built_at": built_at,
+            "contractor": {
+                "id": contractor.id,
+                "business_name": contractor.business_name,
+                "owner_name": contractor.owner_name,
+                "email": contractor.email,
+                "phone": contractor.phone,
+                "address": contractor.address,
+                "primary_trade": contractor.primary_trade,
+            },
+            "pricing_model": {
+                "labor_rate_hourly": pricing_model.labor_rate_hourly,
+                "helper_rate_hourly": pricing_model.helper_rate_hourly,
+                "material_markup_percent": pricing_model.material_markup_percent,
+                "minimum_job_amount": pricing_model.minimum_job_amount,
+                "pricing_knowledge": pricing_model.pricing_knowledge or {},
+                "pricing_notes": pricing_model.pricing_notes,
+                "pricing_philosophy": pricing_model.pricing_philosophy,
+                # Snapshots are rebuilt after every write to their inputs, so
+                # this identifies one state of them (prompt fragment cache key)
+                "version": built_at,
+            },
+            "terms": terms_dict,
+            "correction_examples": {
+                "all": corrections[:CORRECTION_EXAMPLES_LIMIT],
+                "by_job_type": by_job_type,
+            },
+        }
+        logger.debug(f"Built quote context snapshot for contractor {contractor_id}")
+        return snapshot
+
+
+# Singleton pattern
+_quote_context_service: Optional[QuoteContextService] = None
+
+
+def get_quote_context_service() -> QuoteContextService:
+    """Get the quote context service singleton."""
+    global _quote_context_service
+    if _quote_context_service is None:
+        _quote_context_service = QuoteContextService()
+    return _quote_context_service
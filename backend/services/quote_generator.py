@@ -15,9 +15,10 @@ instead of brittle regex JSON extraction.
 
 import json
 import asyncio
+import random
 import re
 import statistics
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, AsyncIterator
 from datetime import datetime
 from enum import Enum
 
@@ -25,7 +26,9 @@ import anthropic
 from pydantic import BaseModel, Field, validator
 
 from ..config import settings
-from ..prompts import get_quote_generation_prompt
+from ..prompts import build_quote_prompt, QuotePrompt
+from .category_classifier import get_category_classifier_cache
+from .claude_client import get_async_claude_client, prompt_cache_stats
 from .voice_signal_extractor import extract_voice_signals
 
 
@@ -198,9 +201,10 @@ class QuoteGenerationService:
     """
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_async_claude_client()
         self.model = settings.claude_model
         self.max_tokens = settings.claude_max_tokens
+        self._audit_tasks: set = set()
 
     async def generate_quote(
         self,
@@ -234,6 +238,102 @@ class QuoteGenerationService:
             - confidence, questions
             - voice_signals (Learning Excellence)
         """
+        prompt, voice_signals_dict = self._build_quote_prompt(
+            transcription=transcription,
+            contractor=contractor,
+            pricing_model=pricing_model,
+            job_types=job_types,
+            terms=terms,
+            correction_examples=correction_examples,
+            detected_category=detected_category,
+        )
+
+        # Call Claude with tool calling for structured output
+        raw_quote = await self._call_claude_with_tool(prompt)
+
+        return self._finalize_quote(raw_quote, transcription, voice_signals_dict)
+
+    async def stream_quote(
+        self,
+        transcription: str,
+        contractor: dict,
+        pricing_model: dict,
+        job_types: Optional[list] = None,
+        terms: Optional[dict] = None,
+        correction_examples: Optional[list] = None,
+        detected_category: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Generate a quote like generate_quote, yielding progress as Claude streams.
+
+        Yields ("line_item", {"index": i, "item": {...}}) as soon as each line
+        item in the generate_quote tool input is complete, then ("quote",
+        quote_data) with the same validated dict generate_quote returns.
+
+        Streamed line items are Claude's raw output; the final quote is the
+        source of truth (amounts are rounded and the subtotal recalculated).
+        """
+        prompt, voice_signals_dict = self._build_quote_prompt(
+            transcription=transcription,
+            contractor=contractor,
+            pricing_model=pricing_model,
+            job_types=job_types,
+            terms=terms,
+            correction_examples=correction_examples,
+            detected_category=detected_category,
+        )
+
+        emitted = 0
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                tools=[QUOTE_GENERATION_TOOL],
+                tool_choice={"type": "tool", "name": "generate_quote"},
+                system=prompt.system,
+                messages=prompt.messages,
+            ) as stream:
+                async for event in stream:
+                    if event.type != "input_json" or not isinstance(event.snapshot, dict):
+                        continue
+                    line_items = event.snapshot.get("line_items") or []
+                    # The last item may still be partial; everything before it is done
+                    while emitted < len(line_items) - 1:
+                        yield "line_item", {"index": emitted, "item": line_items[emitted]}
+                        emitted += 1
+
+                message = await stream.get_final_message()
+                prompt_cache_stats.record("quote_generation", getattr(message, "usage", None))
+
+        except anthropic.BadRequestError as e:
+            raise Exception(f"Claude tool calling error: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}")
+
+        raw_quote = None
+        for block in message.content:
+            if block.type == "tool_use" and block.name == "generate_quote":
+                raw_quote = block.input
+                break
+        if raw_quote is None:
+            raise Exception("Claude API error: No tool call found in response")
+
+        for index, item in enumerate((raw_quote.get("line_items") or [])[emitted:], start=emitted):
+            yield "line_item", {"index": index, "item": item}
+
+        yield "quote", self._finalize_quote(raw_quote, transcription, voice_signals_dict)
+
+    def _build_quote_prompt(
+        self,
+        transcription: str,
+        contractor: dict,
+        pricing_model: dict,
+        job_types: Optional[list] = None,
+        terms: Optional[dict] = None,
+        correction_examples: Optional[list] = None,
+        detected_category: Optional[str] = None,
+    ) -> Tuple[QuotePrompt, Optional[dict]]:
+        """Build the generation prompt; returns (prompt, voice_signals_dict)."""
         # Learning Excellence: Extract voice signals from transcription
         # Detects difficulty, relationship, timeline, quality, and correction signals
         voice_signals_result = extract_voice_signals(transcription)
@@ -242,7 +342,7 @@ class QuoteGenerationService:
         # Build the prompt with correction examples for learning
         # AND category-specific learned adjustments
         # AND voice signals (Learning Excellence Layer 4)
-        prompt = get_quote_generation_prompt(
+        prompt = build_quote_prompt(
             transcription=transcription,
             contractor_name=contractor.get("business_name", "Contractor"),
             pricing_model=pricing_model,
@@ -252,11 +352,17 @@ class QuoteGenerationService:
             correction_examples=correction_examples,
             detected_category=detected_category,
             voice_signals=voice_signals_dict,
+            contractor_id=contractor.get("id"),
         )
+        return prompt, voice_signals_dict
 
-        # Call Claude with tool calling for structured output
-        raw_quote = await self._call_claude_with_tool(prompt)
-
+    def _finalize_quote(
+        self,
+        raw_quote: dict,
+        transcription: str,
+        voice_signals_dict: Optional[dict],
+    ) -> dict:
+        """Validate Claude's tool input and add generation metadata."""
         # Validate and normalize the response
         quote_data = self._validate_and_normalize_quote(raw_quote)
 
@@ -332,6 +438,7 @@ class QuoteGenerationService:
         self,
         transcription: str,
         pricing_knowledge: Optional[dict] = None,
+        contractor_id: Optional[str] = None,
     ) -> dict:
         """
         Dynamically detect or create a category from the transcription.
@@ -340,9 +447,14 @@ class QuoteGenerationService:
         DISC-068: Now returns confidence score to detect when a new category
         should be created vs. forcing into an existing (wrong) category.
 
+        When contractor_id is given, the contractor's local classifier
+        answers confident matches to existing categories without calling
+        Claude (see category_classifier).
+
         Args:
             transcription: The transcribed voice note
             pricing_knowledge: User's pricing_knowledge dict with categories
+            contractor_id: Contractor whose past quotes train the fast path
 
         Returns:
             dict with:
@@ -351,7 +463,51 @@ class QuoteGenerationService:
             - display_name: Human-readable name (for new categories)
             - category_confidence: 0-100 confidence score for the match
             - suggested_new_category: If confidence < 70, suggested new category name
+            - source: "local" for fast-path answers (absent for Claude's)
         """
+        if not (contractor_id and settings.category_fast_path_enabled):
+            return await self._detect_category_with_claude(transcription, pricing_knowledge)
+
+        cache = get_category_classifier_cache()
+        predicted = None
+        try:
+            classifier = await cache.get(contractor_id, pricing_knowledge)
+            if classifier is not None:
+                predicted, _, confident = classifier.classify(transcription)
+                if confident:
+                    cache.record_hit()
+                    if random.random() < settings.category_fast_path_audit_rate:
+                        self._schedule_category_audit(transcription, pricing_knowledge, predicted)
+                    return classifier.result(predicted)
+        except Exception as e:
+            # The fast path is an optimization; never block on it
+            print(f"[CATEGORY FAST PATH ERROR] {e}")
+
+        result = await self._detect_category_with_claude(transcription, pricing_knowledge)
+        cache.record_fallback(predicted, result.get("category"))
+        return result
+
+    def _schedule_category_audit(
+        self,
+        transcription: str,
+        pricing_knowledge: Optional[dict],
+        predicted: str,
+    ) -> None:
+        """Ask Claude in the background, to measure how often the fast path agrees."""
+        async def audit():
+            result = await self._detect_category_with_claude(transcription, pricing_knowledge)
+            get_category_classifier_cache().record_audit(predicted, result.get("category"))
+
+        task = asyncio.create_task(audit())
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._audit_tasks.discard)
+
+    async def _detect_category_with_claude(
+        self,
+        transcription: str,
+        pricing_knowledge: Optional[dict] = None,
+    ) -> dict:
+        """Category detection by Claude (the detect_or_create_category slow path)."""
         # Get existing categories from user's pricing model
         existing_categories = []
         category_display_names = {}
@@ -430,7 +586,7 @@ Return JSON only:
 
         try:
             # Use haiku for speed and cost - this is just classification
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model="claude-3-haiku-20240307",
                 max_tokens=200,
                 messages=[{"role": "user", "content": detection_prompt}],
@@ -484,26 +640,25 @@ Return JSON only:
         result = await self.detect_or_create_category(transcription, pricing_knowledge)
         return result["category"]
 
-    async def _call_claude_with_tool(self, prompt: str) -> dict:
+    async def _call_claude_with_tool(self, prompt: QuotePrompt) -> dict:
         """
         Make a call to Claude API using tool calling for structured output.
 
         This replaces the old regex-based JSON extraction with Claude's
         native structured outputs, guaranteeing valid JSON matching our schema.
+        The prompt's instruction and contractor blocks are cache breakpoints,
+        so repeat quotes for a contractor only pay full price for the request.
         """
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 tools=[QUOTE_GENERATION_TOOL],
                 tool_choice={"type": "tool", "name": "generate_quote"},
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
+                system=prompt.system,
+                messages=prompt.messages,
             )
+            prompt_cache_stats.record("quote_generation", getattr(message, "usage", None))
 
             # Extract the tool call result
             for block in message.content:
@@ -591,21 +746,15 @@ Return JSON only:
         Returns:
             Tuple of (median_quote, variance_confidence_metrics)
         """
-        # Learning Excellence: Extract voice signals from transcription
-        voice_signals_result = extract_voice_signals(transcription)
-        voice_signals_dict = voice_signals_result.to_dict() if voice_signals_result else None
-
         # Build the prompt once (with voice signals)
-        prompt = get_quote_generation_prompt(
+        prompt, voice_signals_dict = self._build_quote_prompt(
             transcription=transcription,
-            contractor_name=contractor.get("business_name", "Contractor"),
+            contractor=contractor,
             pricing_model=pricing_model,
-            pricing_notes=pricing_model.get("pricing_notes"),
             job_types=job_types,
             terms=terms,
             correction_examples=correction_examples,
             detected_category=detected_category,
-            voice_signals=voice_signals_dict,
         )
 
         # Generate multiple samples concurrently
@@ -654,7 +803,7 @@ Return JSON only:
 
     async def _generate_multiple_samples(
         self,
-        prompt: str,
+        prompt: QuotePrompt,
         num_samples: int = 3,
     ) -> List[dict]:
         """
@@ -899,7 +1048,7 @@ Output a JSON object with this structure:
 Generate exactly {max_questions} high-impact questions."""
 
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model=self.model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}],
@@ -0,0 +1,209 @@
+"""
+Maintained quote counters for Quoted (DISC-012).
+
+Generation and edit analytics, /api/learning/progress and the Pricing Brain
+all need per-contractor and per-category counts of quotes, edits, wins and
+losses. They used to load the contractor's Quote rows (JSON line items and
+all) and count in Python after every request - and, because
+get_quotes_by_contractor defaults to limit=50, silently undercounted anyone
+with more than 50 quotes.
+
+The counts now live in quote_stats, one row per (contractor, category) plus
+a contractor-wide "*" row, updated by DatabaseService in the same
+transaction as quote create/update/delete. Reading them is one small query.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple
+
+from sqlalchemy import select, func, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.database import Quote, QuoteStats
+from .logging import get_logger
+
+logger = get_logger("quoted.quote_stats")
+
+# Category key for "all of this contractor's quotes"
+ALL_CATEGORIES = "*"
+
+# What the counters look at on one quote: (job_type, was_edited, outcome)
+QuoteStatsEntry = Tuple[Optional[str], bool, Optional[str]]
+
+
+@dataclass
+class QuoteCounts:
+    """Counters for one contractor/category."""
+    quotes: int = 0
+    edits: int = 0
+    wins: int = 0
+    losses: int = 0
+
+    @property
+    def edit_rate(self) -> float:
+        """Edited quotes as a percentage of all quotes."""
+        return round(self.edits / self.quotes * 100, 2) if self.quotes > 0 else 0
+
+    @property
+    def win_rate(self) -> Optional[float]:
+        """Won quotes as a percentage of decided quotes (None if none decided)."""
+        decided = self.wins + self.losses
+        return round(self.wins / decided * 100, 1) if decided > 0 else None
+
+    def add(self, entry: QuoteStatsEntry, weight: int = 1) -> None:
+        _, was_edited, outcome = entry
+        self.quotes += weight
+        if was_edited:
+            self.edits += weight
+        if outcome == "won":
+            self.wins += weight
+        elif outcome == "lost":
+            self.losses += weight
+
+
+def quote_stats_entry(quote: Quote) -> QuoteStatsEntry:
+    """The fields of a quote that the counters depend on."""
+    return (quote.job_type, bool(quote.was_edited), quote.outcome)
+
+
+async def _scan_counts(
+    session: AsyncSession,
+    contractor_id: str,
+) -> Dict[str, QuoteCounts]:
+    """Aggregate counters straight from the quotes table."""
+    result = await session.execute(
+        select(
+            Quote.job_type,
+            func.count(Quote.id),
+            func.sum(case((Quote.was_edited == True, 1), else_=0)),
+            func.sum(case((Quote.outcome == "won", 1), else_=0)),
+            func.sum(case((Quote.outcome == "lost", 1), else_=0)),
+        )
+        .where(Quote.contractor_id == contractor_id)
+        .group_by(Quote.job_type)
+    )
+
+    counts: Dict[str, QuoteCounts] = {ALL_CATEGORIES: QuoteCounts()}
+    for job_type, quotes, edits, wins, losses in result.all():
+        row_counts = QuoteCounts(quotes or 0, edits or 0, wins or 0, losses or 0)
+        total = counts[ALL_CATEGORIES]
+        total.quotes += row_counts.quotes
+        total.edits += row_counts.edits
+        total.wins += row_counts.wins
+        total.losses += row_counts.losses
+        if job_type is not None:
+            counts[job_type] = row_counts
+    return counts
+
+
+def _counts_from_row(row: QuoteStats) -> QuoteCounts:
+    return QuoteCounts(row.quotes or 0, row.edits or 0, row.wins or 0, row.losses or 0)
+
+
+async def get_quote_stats(
+    session: AsyncSession,
+    contractor_id: str,
+) -> Dict[str, QuoteCounts]:
+    """
+    Counters for a contractor, keyed by category ("*" for all quotes).
+
+    Contractors whose quotes predate the counters have no rows until their
+    next quote write; for them this falls back to one aggregate query.
+    """
+    result = await session.execute(
+        select(QuoteStats).where(QuoteStats.contractor_id == contractor_id)
+    )
+    rows = result.scalars().all()
+    counts = {row.category: _counts_from_row(row) for row in rows}
+    if ALL_CATEGORIES not in counts:
+        return await _scan_counts(session, contractor_id)
+    return counts
+
+
+async def _get_stats_rows(
+    session: AsyncSession,
+    contractor_id: str,
+    categories,
+) -> Dict[str, QuoteStats]:
+    result = await session.execute(
+        select(QuoteStats)
+        .where(
+            QuoteStats.contractor_id == contractor_id,
+            QuoteStats.category.in_(list(categories)),
+        )
+        .with_for_update()
+    )
+    return {row.category: row for row in result.scalars().all()}
+
+
+async def apply_quote_stats_change(
+    session: AsyncSession,
+    contractor_id: str,
+    old: Optional[QuoteStatsEntry] = None,
+    new: Optional[QuoteStatsEntry] = None,
+) -> None:
+    """
+    Fold one quote's change into the counters.
+
+    Call inside the session that writes the quote, before commit, with
+    quote_stats_entry() snapshots:
+    - create: old=None, new=entry
+    - update: old and new
+    - delete: old=entry, new=None
+
+    Missing rows are initialized from an aggregate of the (already flushed)
+    quotes, so they include this change. The contractor's first maintained
+    write backfills a row for every category they have quoted.
+    """
+    if old == new:
+        return
+
+    deltas: Dict[str, QuoteCounts] = {}
+    for weight, entry in ((-1, old), (1, new)):
+        if entry is None:
+            continue
+        for key in {ALL_CATEGORIES, entry[0]} - {None}:
+            deltas.setdefault(key, QuoteCounts()).add(entry, weight=weight)
+
+    await session.flush()
+
+    rows = await _get_stats_rows(session, contractor_id, deltas)
+    missing = set(deltas) - set(rows)
+    if missing:
+        scanned = await _scan_counts(session, contractor_id)
+        if ALL_CATEGORIES in missing:
+            # First maintained write for this contractor: backfill every
+            # category so readers can trust the rows once "*" exists
+            result = await session.execute(
+                select(QuoteStats.category).where(QuoteStats.contractor_id == contractor_id)
+            )
+            missing |= set(scanned) - set(result.scalars().all())
+        for category in missing:
+            counts = scanned.get(category, QuoteCounts())
+            try:
+                async with session.begin_nested():
+                    session.add(QuoteStats(
+                        contractor_id=contractor_id,
+                        category=category,
+                        quotes=counts.quotes,
+                        edits=counts.edits,
+                        wins=counts.wins,
+                        losses=counts.losses,
+                    ))
+                deltas.pop(category, None)
+            except IntegrityError:
+                # Another request created the row first; apply our delta to it
+                pass
+        if not deltas:
+            return
+        rows = await _get_stats_rows(session, contractor_id, deltas)
+
+    for category, delta in deltas.items():
+        row = rows.get(category)
+        if row is None:
+            continue
+        row.quotes = (row.quotes or 0) + delta.quotes
+        row.edits = (row.edits or 0) + delta.edits
+        row.wins = (row.wins or 0) + delta.wins
+        row.losses = (row.losses or 0) + delta.losses
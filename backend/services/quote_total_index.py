@@ -0,0 +1,219 @@
+"""
+Incremental quote-total percentile index for Quoted (DISC-034).
+
+The pricing sanity check needs the median and P95 of a contractor's quote
+totals per category on every generation. It used to select every historical
+Quote.total and sort it, so the cost grew with each contractor's history.
+
+Totals are now folded into a fixed log-bucket histogram per
+(contractor, category) row in quote_total_summaries, maintained by
+DatabaseService in the same transaction as quote create/update/delete.
+Reading bounds is a single-row lookup.
+
+Buckets grow geometrically by BUCKET_GROWTH, so every estimate is within
+~1% of the true order statistic - far tighter than the 3x/10x sanity
+thresholds it feeds. Do not change BUCKET_GROWTH without clearing the table.
+"""
+
+import math
+from typing import Optional, Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.database import Quote, QuoteTotalSummary
+from .logging import get_logger
+
+logger = get_logger("quoted.quote_total_index")
+
+# Geometric bucket width: each bucket spans [g^i, g^(i+1))
+BUCKET_GROWTH = 1.02
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+# Category key for "all of this contractor's quotes"
+ALL_CATEGORIES = "*"
+
+
+def _is_indexable(total: Optional[float]) -> bool:
+    """Mirror the sanity check filter: only positive totals count."""
+    return total is not None and total > 0
+
+
+class QuoteTotalHistogram:
+    """Sparse fixed-bucket histogram of quote totals."""
+
+    def __init__(self, buckets: Optional[Dict] = None):
+        # JSON round-trips keys as strings
+        self.buckets: Dict[int, int] = {
+            int(k): int(v) for k, v in (buckets or {}).items() if int(v) > 0
+        }
+
+    @staticmethod
+    def bucket_for(value: float) -> int:
+        return math.floor(math.log(value) / _LOG_GROWTH)
+
+    @staticmethod
+    def bucket_value(index: int) -> float:
+        """Representative value for a bucket (geometric midpoint)."""
+        return BUCKET_GROWTH ** (index + 0.5)
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, value: float, weight: int = 1) -> None:
+        index = self.bucket_for(value)
+        new_count = self.buckets.get(index, 0) + weight
+        if new_count > 0:
+            self.buckets[index] = new_count
+        else:
+            self.buckets.pop(index, None)
+
+    def remove(self, value: float) -> None:
+        self.add(value, weight=-1)
+
+    def value_at_rank(self, rank: int) -> float:
+        """Estimated value of the rank-th smallest total (0-based)."""
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return self.bucket_value(index)
+        raise IndexError("rank out of range")
+
+    def median(self) -> float:
+        """Same definition as statistics.median."""
+        n = self.count
+        if n % 2:
+            return self.value_at_rank(n // 2)
+        return (self.value_at_rank(n // 2 - 1) + self.value_at_rank(n // 2)) / 2
+
+    def p95(self) -> float:
+        """Same index rule as the original sort-based P95."""
+        n = self.count
+        return self.value_at_rank(min(int(n * 0.95), n - 1))
+
+    def to_dict(self) -> Dict[str, int]:
+        return {str(k): v for k, v in self.buckets.items()}
+
+    @classmethod
+    def from_totals(cls, totals: List[float]) -> "QuoteTotalHistogram":
+        histogram = cls()
+        for total in totals:
+            if _is_indexable(total):
+                histogram.add(total)
+        return histogram
+
+
+async def _scan_totals(
+    session: AsyncSession,
+    contractor_id: str,
+    category: str,
+) -> List[float]:
+    query = select(Quote.total).where(
+        Quote.contractor_id == contractor_id,
+        Quote.total.isnot(None),
+        Quote.total > 0,
+    )
+    if category != ALL_CATEGORIES:
+        query = query.where(Quote.job_type == category)
+    result = await session.execute(query)
+    return [row[0] for row in result.fetchall()]
+
+
+async def _get_summary_row(
+    session: AsyncSession,
+    contractor_id: str,
+    category: str,
+    for_update: bool = False,
+) -> Optional[QuoteTotalSummary]:
+    query = select(QuoteTotalSummary).where(
+        QuoteTotalSummary.contractor_id == contractor_id,
+        QuoteTotalSummary.category == category,
+    )
+    if for_update:
+        query = query.with_for_update()
+    result = await session.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def get_quote_total_histogram(
+    session: AsyncSession,
+    contractor_id: str,
+    category: Optional[str] = None,
+) -> Optional[QuoteTotalHistogram]:
+    """
+    Read the maintained histogram for a contractor/category.
+
+    Returns None if no summary row exists yet (contractors whose quotes
+    predate the index); the row is built on their next quote write.
+    """
+    row = await _get_summary_row(session, contractor_id, category or ALL_CATEGORIES)
+    if row is None:
+        return None
+    return QuoteTotalHistogram(row.buckets)
+
+
+async def apply_quote_total_change(
+    session: AsyncSession,
+    contractor_id: str,
+    old: Optional[Tuple[Optional[str], Optional[float]]] = None,
+    new: Optional[Tuple[Optional[str], Optional[float]]] = None,
+) -> None:
+    """
+    Fold one quote's (job_type, total) change into the summaries.
+
+    Call inside the session that writes the quote, before commit:
+    - create: old=None, new=(job_type, total)
+    - update: old and new
+    - delete: old=(job_type, total), new=None
+
+    A missing summary row is initialized from a full scan of the
+    (already flushed) quotes, so it includes this change.
+    """
+    if old == new:
+        return
+
+    # category -> list of (weight, total)
+    deltas: Dict[str, List[Tuple[int, float]]] = {}
+    for weight, entry in ((-1, old), (1, new)):
+        if entry is None:
+            continue
+        category, total = entry
+        if not _is_indexable(total):
+            continue
+        for key in {ALL_CATEGORIES, category} - {None}:
+            deltas.setdefault(key, []).append((weight, total))
+
+    if not deltas:
+        return
+
+    await session.flush()
+
+    for category, changes in deltas.items():
+        row = await _get_summary_row(session, contractor_id, category, for_update=True)
+
+        if row is None:
+            totals = await _scan_totals(session, contractor_id, category)
+            histogram = QuoteTotalHistogram.from_totals(totals)
+            try:
+                async with session.begin_nested():
+                    session.add(QuoteTotalSummary(
+                        contractor_id=contractor_id,
+                        category=category,
+                        count=histogram.count,
+                        buckets=histogram.to_dict(),
+                    ))
+                continue
+            except IntegrityError:
+                # Another request created the row first; apply our delta to it
+                row = await _get_summary_row(session, contractor_id, category, for_update=True)
+                if row is None:
+                    continue
+
+        histogram = QuoteTotalHistogram(row.buckets)
+        for weight, total in changes:
+            histogram.add(total, weight=weight)
+        row.buckets = histogram.to_dict()
+        row.count = histogram.count
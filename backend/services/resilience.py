@@ -1,8 +1,8 @@
 """
 Resilience Service for Quoted (INFRA-006, INFRA-009).
 
-Provides retry logic with exponential backoff and circuit breakers
-for external service calls.
+Provides retry logic with exponential backoff, circuit breakers and
+rate limiters for external service calls.
 """
 
 import asyncio
@@ -288,6 +288,54 @@ def retry_with_backoff(
     return decorator
 
 
+class RateLimiter:
+    """
+    Rate limiter (token bucket) for calls to an external service from this process.
+
+    acquire() reserves the next free slot and sleeps until it comes up, so
+    concurrent callers are spaced out in arrival order. backoff() pushes all
+    later slots back when the provider pushes back (HTTP 429), so every
+    caller in the process slows down, not just the one that was rejected.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = 1):
+        self.name = name
+        self.rate = rate  # Calls per second
+        self.burst = max(1, burst)  # Calls allowed back to back after idling
+        self._next_slot = 0.0
+        self.throttled = 0  # 429s seen since this process started
+
+    def configure(self, rate: float, burst: Optional[int] = None) -> None:
+        self.rate = rate
+        if burst is not None:
+            self.burst = max(1, burst)
+
+    async def acquire(self) -> None:
+        """Wait until this process may make the next call."""
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        slot = max(self._next_slot, now - (self.burst - 1) / self.rate)
+        self._next_slot = slot + 1 / self.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def backoff(self, seconds: float) -> None:
+        """Hand out no slots for the next `seconds` (provider rate limit hit)."""
+        self.throttled += 1
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+        logger.warning(f"Rate limiter {self.name} backing off for {seconds:.1f}s")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "delay": round(max(0.0, self._next_slot - time.monotonic()), 2),
+            "throttled": self.throttled,
+        }
+
+
 # =============================================================================
 # Pre-configured Circuit Breakers for External Services
 # =============================================================================
@@ -333,6 +381,15 @@ resend_circuit = CircuitBreaker(
 )
 
 
+# =============================================================================
+# Pre-configured Rate Limiters
+# =============================================================================
+
+# Resend allows 2 requests/sec per account; the email dispatcher sets this
+# process's share from settings when it starts
+resend_rate_limiter = RateLimiter("resend", rate=2.0)
+
+
 # =============================================================================
 # Pre-configured Retry Configs
 # =============================================================================
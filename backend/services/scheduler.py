@@ -10,7 +10,6 @@ Handles:
 Cost: $0 additional (runs in FastAPI process, no external services)
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -20,7 +19,9 @@ from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy import select, and_
 
 from .logging import get_logger
+from ..config import settings
 from .advisory_locks import wrap_with_lock
+from .job_shards import Shard, shard_filter, wrap_sharded
 
 logger = get_logger("quoted.scheduler")
 
@@ -28,75 +29,84 @@ logger = get_logger("quoted.scheduler")
 scheduler: Optional[AsyncIOScheduler] = None
 
 
-async def check_task_reminders():
+async def check_task_reminders(shard: Optional[Shard] = None):
     """
     Check for tasks with reminder_time in the past and notification_sent=False.
     Runs every 5 minutes.
+
+    Due tasks and their contractors are loaded in one joined query, reminders
+    are sent with bounded concurrency, and the sent flags commit together.
     """
     from ..models.database import Task, Contractor
     from .database import async_session_factory
     from .email import EmailService
-    from .logging import get_logger
-    job_logger = get_logger("quoted.scheduler.task_reminders")
+    from .fan_out import fan_out
 
     logger.info("Running task reminder check")
 
     try:
         async with async_session_factory() as db:
-            # Find tasks with due reminders
+            # Find tasks with due reminders (and their contractor, same query)
             now = datetime.utcnow()
             result = await db.execute(
-                select(Task).where(
+                select(Task, Contractor)
+                .outerjoin(Contractor, Contractor.id == Task.contractor_id)
+                .where(
                     and_(
                         Task.reminder_time <= now,
                         Task.notification_sent == False,
-                        Task.status == "pending"
+                        Task.status == "pending",
+                        shard_filter(shard, Task.contractor_id),
                     )
                 )
             )
-            due_tasks = result.scalars().all()
+            due = result.all()
 
-            if not due_tasks:
+            if not due:
                 logger.debug("No task reminders due")
                 return
 
-            logger.info(f"Found {len(due_tasks)} task reminders to send")
+            logger.info(f"Found {len(due)} task reminders to send")
             email_service = EmailService()
 
-            for task in due_tasks:
-                try:
-                    # Get contractor email
-                    contractor = await db.get(Contractor, task.contractor_id)
-                    if not contractor or not contractor.email:
-                        logger.warning(f"No email for contractor {task.contractor_id}")
-                        continue
-
-                    # Send reminder email
-                    await email_service.send_task_reminder_email(
-                        to_email=contractor.email,
-                        contractor_name=contractor.owner_name or contractor.business_name,
-                        task_title=task.title,
-                        task_description=task.description,
-                        due_date=task.due_date,
-                        customer_name=None,  # Could fetch if needed
-                    )
-
-                    # Mark as sent
-                    task.notification_sent = True
-                    task.notification_sent_at = datetime.utcnow()
-
-                    logger.info(f"Sent reminder for task {task.id}")
+            sendable = []
+            for task, contractor in due:
+                if not contractor or not contractor.email:
+                    logger.warning(f"No email for contractor {task.contractor_id}")
+                    continue
+                sendable.append((task, {
+                    "to_email": contractor.email,
+                    "contractor_name": contractor.owner_name or contractor.business_name,
+                    "task_title": task.title,
+                    "task_description": task.description,
+                    "due_date": task.due_date,
+                    "customer_name": None,  # Could fetch if needed
+                }))
+
+            results = await fan_out(
+                sendable,
+                lambda item: email_service.send_task_reminder_email(**item[1]),
+            )
 
-                except Exception as e:
-                    logger.error(f"Failed to send reminder for task {task.id}: {e}")
+            sent_at = datetime.utcnow()
+            for (task, _), error in results:
+                if error is not None:
+                    logger.error(f"Failed to send reminder for task {task.id}: {error}")
+                    continue
+                # Mark as sent
+                task.notification_sent = True
+                task.notification_sent_at = sent_at
+                logger.info(f"Sent reminder for task {task.id}")
 
             await db.commit()
 
     except Exception as e:
         logger.error(f"Error in check_task_reminders: {e}")
+        if shard is not None:
+            raise  # run_shard records the failure so the shard is retried
 
 
-async def run_smart_followups():
+async def run_smart_followups(shard: Optional[Shard] = None):
     """
     INNOV-3: Smart Follow-Up Engine.
 
@@ -115,7 +125,7 @@ async def run_smart_followups():
     try:
         from .database import async_session_factory
         async with async_session_factory() as db:
-            processed = await FollowUpService.process_due_followups(db)
+            processed = await FollowUpService.process_due_followups(db, shard=shard)
             if processed > 0:
                 logger.info(f"Smart follow-up engine: Processed {processed} follow-ups")
             else:
@@ -123,6 +133,8 @@ async def run_smart_followups():
 
     except Exception as e:
         logger.error(f"Error in run_smart_followups: {e}")
+        if shard is not None:
+            raise  # run_shard records the failure so the shard is retried
 
 
 async def run_marketing_report():
@@ -201,7 +213,8 @@ async def run_feedback_drip():
     - Day 3: First impressions
     - Day 7: Workflow integration
 
-    Runs daily at 2pm UTC (9am EST) - during work hours.
+    Runs daily at 2pm UTC (9am EST) - during work hours. Sends only queue
+    the emails; the email dispatcher batches and paces delivery.
     """
     from ..models.database import Contractor
     from .database import async_session_factory
@@ -259,8 +272,6 @@ async def run_feedback_drip():
                     )
                     contractor.feedback_email_sent = 3
                     emails_sent += 1
-                    # Rate limit protection: Resend allows 2 req/sec
-                    await asyncio.sleep(0.6)
                 except Exception as e:
                     logger.warning(f"Failed to send day-3 feedback to {contractor.email}: {e}")
 
@@ -276,8 +287,6 @@ async def run_feedback_drip():
                     )
                     contractor.feedback_email_sent = 7
                     emails_sent += 1
-                    # Rate limit protection: Resend allows 2 req/sec
-                    await asyncio.sleep(0.6)
                 except Exception as e:
                     logger.warning(f"Failed to send day-7 feedback to {contractor.email}: {e}")
 
@@ -291,7 +300,7 @@ async def run_feedback_drip():
         logger.error(f"Error in run_feedback_drip: {e}")
 
 
-async def check_trial_reminders():
+async def check_trial_reminders(shard: Optional[Shard] = None):
     """
     DISC-161: Trial System Reminder Emails.
 
@@ -299,15 +308,40 @@ async def check_trial_reminders():
     - 3 days before trial ends: Send trial ending reminder (once)
     - Day of expiration: Send trial expired email
 
+    Users are loaded together with their contractor, emails go out with
+    bounded concurrency (rate limited for Resend) and flags commit once.
+
     Runs daily at 11am UTC (6am EST) - during morning hours.
     """
     from ..models.database import User, Contractor
     from .database import async_session_factory
     from .email import EmailService
-    from sqlalchemy import select, and_
+    from .fan_out import fan_out
 
     logger.info("Running trial reminder check")
 
+    def track(user, event_name: str, properties: dict) -> None:
+        # PostHog tracking
+        try:
+            from .posthog import track_event
+            track_event(user.id, event_name, properties)
+        except Exception as ph_error:
+            logger.debug(f"PostHog tracking failed: {ph_error}")
+
+    async def users_with_contractors(db, *conditions):
+        result = await db.execute(
+            select(User, Contractor)
+            .outerjoin(Contractor, Contractor.user_id == User.id)
+            .where(and_(*conditions), shard_filter(shard, Contractor.id))
+        )
+        rows = []
+        for user, contractor in result.all():
+            if not contractor:
+                logger.warning(f"No contractor found for user {user.id}")
+                continue
+            rows.append((user, contractor))
+        return rows
+
     try:
         async with async_session_factory() as db:
             now = datetime.utcnow()
@@ -320,127 +354,71 @@ async def check_trial_reminders():
             reminder_start = now + timedelta(days=3)
             reminder_end = now + timedelta(days=4)
 
-            reminder_result = await db.execute(
-                select(User).where(
-                    and_(
-                        User.trial_ends_at >= reminder_start,
-                        User.trial_ends_at < reminder_end,
-                        User.plan_tier == "trial",
-                        User.trial_reminder_sent == False
-                    )
-                )
+            reminder_users = await users_with_contractors(
+                db,
+                User.trial_ends_at >= reminder_start,
+                User.trial_ends_at < reminder_end,
+                User.plan_tier == "trial",
+                User.trial_reminder_sent == False,
             )
-            reminder_users = reminder_result.scalars().all()
 
-            for user in reminder_users:
-                try:
-                    # Get contractor for business name and quote count
-                    contractor_result = await db.execute(
-                        select(Contractor).where(Contractor.user_id == user.id)
-                    )
-                    contractor = contractor_result.scalar_one_or_none()
-
-                    if not contractor:
-                        logger.warning(f"No contractor found for user {user.id}")
-                        continue
-
-                    # Calculate days left
-                    days_left = (user.trial_ends_at - now).days
-
-                    # Count quotes generated
-                    quotes_generated = user.quotes_used or 0
+            async def send_reminder(row):
+                user, contractor = row
+                await email_service.send_trial_ending_reminder(
+                    to_email=user.email,
+                    business_name=contractor.business_name,
+                    days_left=(user.trial_ends_at - now).days,
+                    quotes_generated=user.quotes_used or 0,
+                )
 
-                    await email_service.send_trial_ending_reminder(
-                        to_email=user.email,
-                        business_name=contractor.business_name,
-                        days_left=days_left,
-                        quotes_generated=quotes_generated
-                    )
+            for (user, _), error in await fan_out(reminder_users, send_reminder):
+                if error is not None:
+                    logger.warning(f"Failed to send trial reminder to {user.email}: {error}")
+                    continue
 
-                    # Mark reminder as sent
-                    user.trial_reminder_sent = True
-                    reminders_sent += 1
-
-                    # PostHog tracking
-                    try:
-                        from .posthog import track_event
-                        track_event(
-                            user.id,
-                            "trial_reminder_sent",
-                            {
-                                "days_left": days_left,
-                                "quotes_generated": quotes_generated,
-                                "email": user.email
-                            }
-                        )
-                    except Exception as ph_error:
-                        logger.debug(f"PostHog tracking failed: {ph_error}")
-
-                    logger.info(f"Sent trial reminder to {user.email} ({days_left} days left)")
-                    # Rate limit protection: Resend allows 2 req/sec
-                    await asyncio.sleep(0.6)
+                # Mark reminder as sent
+                user.trial_reminder_sent = True
+                reminders_sent += 1
 
-                except Exception as e:
-                    logger.warning(f"Failed to send trial reminder to {user.email}: {e}")
+                days_left = (user.trial_ends_at - now).days
+                track(user, "trial_reminder_sent", {
+                    "days_left": days_left,
+                    "quotes_generated": user.quotes_used or 0,
+                    "email": user.email
+                })
+                logger.info(f"Sent trial reminder to {user.email} ({days_left} days left)")
 
             # --- Expiration email: Users whose trial ended today ---
             # Window: trial_ends_at between yesterday and now
             expiry_start = now - timedelta(days=1)
             expiry_end = now
 
-            expiry_result = await db.execute(
-                select(User).where(
-                    and_(
-                        User.trial_ends_at >= expiry_start,
-                        User.trial_ends_at < expiry_end,
-                        User.plan_tier == "trial"  # Still on trial tier (didn't upgrade)
-                    )
-                )
+            expiry_users = await users_with_contractors(
+                db,
+                User.trial_ends_at >= expiry_start,
+                User.trial_ends_at < expiry_end,
+                User.plan_tier == "trial",  # Still on trial tier (didn't upgrade)
             )
-            expiry_users = expiry_result.scalars().all()
-
-            for user in expiry_users:
-                try:
-                    # Get contractor for business name
-                    contractor_result = await db.execute(
-                        select(Contractor).where(Contractor.user_id == user.id)
-                    )
-                    contractor = contractor_result.scalar_one_or_none()
 
-                    if not contractor:
-                        logger.warning(f"No contractor found for user {user.id}")
-                        continue
-
-                    quotes_generated = user.quotes_used or 0
-
-                    await email_service.send_trial_expired_email(
-                        to_email=user.email,
-                        business_name=contractor.business_name,
-                        quotes_generated=quotes_generated
-                    )
+            async def send_expired(row):
+                user, contractor = row
+                await email_service.send_trial_expired_email(
+                    to_email=user.email,
+                    business_name=contractor.business_name,
+                    quotes_generated=user.quotes_used or 0,
+                )
 
-                    expiry_emails_sent += 1
-
-                    # PostHog tracking
-                    try:
-                        from .posthog import track_event
-                        track_event(
-                            user.id,
-                            "trial_expired",
-                            {
-                                "quotes_generated": quotes_generated,
-                                "email": user.email
-                            }
-                        )
-                    except Exception as ph_error:
-                        logger.debug(f"PostHog tracking failed: {ph_error}")
-
-                    logger.info(f"Sent trial expired email to {user.email}")
-                    # Rate limit protection: Resend allows 2 req/sec
-                    await asyncio.sleep(0.6)
+            for (user, _), error in await fan_out(expiry_users, send_expired):
+                if error is not None:
+                    logger.warning(f"Failed to send trial expired email to {user.email}: {error}")
+                    continue
 
-                except Exception as e:
-                    logger.warning(f"Failed to send trial expired email to {user.email}: {e}")
+                expiry_emails_sent += 1
+                track(user, "trial_expired", {
+                    "quotes_generated": user.quotes_used or 0,
+                    "email": user.email
+                })
+                logger.info(f"Sent trial expired email to {user.email}")
 
             if reminders_sent > 0 or expiry_emails_sent > 0:
                 await db.commit()
@@ -450,6 +428,8 @@ async def check_trial_reminders():
 
     except Exception as e:
         logger.error(f"Error in check_trial_reminders: {e}")
+        if shard is not None:
+            raise  # run_shard records the failure so the shard is retried
 
 
 async def run_daily_health_check():
@@ -519,7 +499,7 @@ async def run_daily_health_check():
         logger.error(f"Error in run_daily_health_check: {e}")
 
 
-async def check_invoice_reminders():
+async def check_invoice_reminders(shard: Optional[Shard] = None):
     """
     INNOV-6: Invoice Automation - Payment Reminders.
 
@@ -536,7 +516,7 @@ async def check_invoice_reminders():
     try:
         from .database import async_session_factory
         async with async_session_factory() as db:
-            reminders_sent = await InvoiceAutomationService.check_payment_reminders(db)
+            reminders_sent = await InvoiceAutomationService.check_payment_reminders(db, shard=shard)
             if reminders_sent > 0:
                 logger.info(f"Invoice reminders: Sent {reminders_sent} reminders")
             else:
@@ -544,121 +524,128 @@ async def check_invoice_reminders():
 
     except Exception as e:
         logger.error(f"Error in check_invoice_reminders: {e}")
+        if shard is not None:
+            raise  # run_shard records the failure so the shard is retried
 
 
-async def check_quote_followups():
+async def check_quote_followups(shard: Optional[Shard] = None):
     """
     Check for quotes needing follow-up.
     Creates auto-tasks for:
     - Sent quotes not viewed after 3 days
     - Viewed quotes not accepted/rejected after 7 days
 
+    Each rule is one anti-join query (stale quotes without a pending task for
+    that trigger) followed by one bulk insert, however many quotes match.
+
     Runs daily at 9am UTC.
     """
-    from ..models.database import Quote, Task, Customer
+    from sqlalchemy import insert, exists
+    from ..models.database import Quote, Task
     from .database import async_session_factory
 
     logger.info("Running quote follow-up check")
 
+    async def stale_quotes(db, trigger_type: str, *conditions):
+        # Anti-join: skip quotes that already have a pending follow-up task
+        has_task = exists().where(
+            Task.quote_id == Quote.id,
+            Task.trigger_type == trigger_type,
+            Task.status == "pending",
+        )
+        result = await db.execute(
+            select(
+                Quote.id,
+                Quote.contractor_id,
+                Quote.customer_id,
+                Quote.customer_name,
+                Quote.sent_at,
+                Quote.first_viewed_at,
+                Quote.view_count,
+            ).where(and_(*conditions), ~has_task, shard_filter(shard, Quote.contractor_id))
+        )
+        return result.all()
+
+    def follow_up_task(quote, trigger_type: str, title: str, description: str, now: datetime) -> dict:
+        return {
+            "contractor_id": quote.contractor_id,
+            "quote_id": quote.id,
+            "customer_id": quote.customer_id,
+            "title": title,
+            "description": description,
+            "due_date": now,
+            "priority": "high",
+            "task_type": "follow_up",
+            "auto_generated": True,
+            "trigger_type": trigger_type,
+            "trigger_entity_id": quote.id,
+        }
+
     try:
         async with async_session_factory() as db:
             now = datetime.utcnow()
             three_days_ago = now - timedelta(days=3)
             seven_days_ago = now - timedelta(days=7)
 
-            # Find sent quotes not viewed after 3 days
-            stale_sent = await db.execute(
-                select(Quote).where(
-                    and_(
-                        Quote.status == "sent",
-                        Quote.sent_at < three_days_ago,
-                        Quote.view_count == 0
-                    )
-                )
+            # Sent quotes not viewed after 3 days
+            stale_sent_quotes = await stale_quotes(
+                db,
+                "quote_not_viewed_3d",
+                Quote.status == "sent",
+                Quote.sent_at < three_days_ago,
+                Quote.view_count == 0,
             )
-            stale_sent_quotes = stale_sent.scalars().all()
 
-            # Find viewed quotes not acted on after 7 days
-            stale_viewed = await db.execute(
-                select(Quote).where(
-                    and_(
-                        Quote.status == "viewed",
-                        Quote.first_viewed_at < seven_days_ago
-                    )
-                )
+            # Viewed quotes not acted on after 7 days
+            stale_viewed_quotes = await stale_quotes(
+                db,
+                "quote_viewed_no_action_7d",
+                Quote.status == "viewed",
+                Quote.first_viewed_at < seven_days_ago,
             )
-            stale_viewed_quotes = stale_viewed.scalars().all()
-
-            tasks_created = 0
-
-            for quote in stale_sent_quotes:
-                # Check if follow-up task already exists
-                existing = await db.execute(
-                    select(Task).where(
-                        and_(
-                            Task.quote_id == quote.id,
-                            Task.trigger_type == "quote_not_viewed_3d",
-                            Task.status == "pending"
-                        )
-                    )
-                )
-                if existing.scalars().first():
-                    continue  # Already have a follow-up task
-
-                task = Task(
-                    contractor_id=quote.contractor_id,
-                    quote_id=quote.id,
-                    customer_id=quote.customer_id,
-                    title=f"Follow up: Quote for {quote.customer_name} not viewed",
-                    description=f"Quote sent {quote.sent_at.strftime('%b %d')} hasn't been viewed yet. Consider resending or calling the customer.",
-                    due_date=now,
-                    priority="high",
-                    task_type="follow_up",
-                    auto_generated=True,
-                    trigger_type="quote_not_viewed_3d",
-                    trigger_entity_id=quote.id,
-                )
-                db.add(task)
-                tasks_created += 1
-
-            for quote in stale_viewed_quotes:
-                # Check if follow-up task already exists
-                existing = await db.execute(
-                    select(Task).where(
-                        and_(
-                            Task.quote_id == quote.id,
-                            Task.trigger_type == "quote_viewed_no_action_7d",
-                            Task.status == "pending"
-                        )
-                    )
-                )
-                if existing.scalars().first():
-                    continue
 
-                task = Task(
-                    contractor_id=quote.contractor_id,
-                    quote_id=quote.id,
-                    customer_id=quote.customer_id,
-                    title=f"Follow up: {quote.customer_name} viewed quote but hasn't responded",
-                    description=f"Quote viewed on {quote.first_viewed_at.strftime('%b %d')} ({quote.view_count} views) but no decision yet. Time to check in!",
-                    due_date=now,
-                    priority="high",
-                    task_type="follow_up",
-                    auto_generated=True,
-                    trigger_type="quote_viewed_no_action_7d",
-                    trigger_entity_id=quote.id,
+            new_tasks = [
+                follow_up_task(
+                    quote,
+                    "quote_not_viewed_3d",
+                    f"Follow up: Quote for {quote.customer_name} not viewed",
+                    f"Quote sent {quote.sent_at.strftime('%b %d')} hasn't been viewed yet. Consider resending or calling the customer.",
+                    now,
                 )
-                db.add(task)
-                tasks_created += 1
+                for quote in stale_sent_quotes
+            ] + [
+                follow_up_task(
+                    quote,
+                    "quote_viewed_no_action_7d",
+                    f"Follow up: {quote.customer_name} viewed quote but hasn't responded",
+                    f"Quote viewed on {quote.first_viewed_at.strftime('%b %d')} ({quote.view_count} views) but no decision yet. Time to check in!",
+                    now,
+                )
+                for quote in stale_viewed_quotes
+            ]
 
-            if tasks_created > 0:
+            if new_tasks:
+                await db.execute(insert(Task), new_tasks)
                 await db.commit()
-                logger.info(f"Created {tasks_created} follow-up tasks")
+                logger.info(f"Created {len(new_tasks)} follow-up tasks")
             else:
                 logger.debug("No follow-up tasks needed")
 
     except Exception as e:
         logger.error(f"Error in check_quote_followups: {e}")
+        if shard is not None:
+            raise  # run_shard records the failure so the shard is retried
+
+
+def _per_contractor_job(job_name: str, func, period_seconds: int):
+    """
+    Wrap a per-contractor job: partitioned into locked, checkpointed shards
+    that all workers share (scheduler_sharding_enabled), or run by a single
+    worker under one advisory lock.
+    """
+    if settings.scheduler_sharding_enabled:
+        return wrap_sharded(job_name, func, period_seconds)
+    return wrap_with_lock(job_name, func)
 
 
 def start_scheduler():
@@ -669,6 +656,9 @@ def start_scheduler():
     duplicate execution when running with multiple workers (--workers 4).
     Each job acquires a lock before execution; if another worker already
     holds the lock, the job is skipped.
+
+    Per-contractor jobs (reminders, follow-ups) are partitioned instead: each
+    shard has its own lock, so every worker can take a share of the run.
     """
     global scheduler
 
@@ -677,11 +667,13 @@ def start_scheduler():
         return
 
     scheduler = AsyncIOScheduler()
+    sharded_jobs = {}
 
     # Task reminders - every 5 minutes
-    # P0-1: Wrapped with advisory lock to prevent duplicate execution
+    # P0-1: Partitioned by contractor, one advisory lock per shard
+    sharded_jobs["task_reminders"] = _per_contractor_job("task_reminders", check_task_reminders, 5 * 60)
     scheduler.add_job(
-        wrap_with_lock("task_reminders", check_task_reminders),
+        sharded_jobs["task_reminders"],
         trigger=IntervalTrigger(minutes=5),
         id="task_reminders",
         replace_existing=True,
@@ -689,9 +681,10 @@ def start_scheduler():
     )
 
     # Quote follow-ups - daily at 9am UTC (4am EST)
-    # P0-1: Wrapped with advisory lock to prevent duplicate execution
+    # P0-1: Partitioned by contractor, one advisory lock per shard
+    sharded_jobs["quote_followups"] = _per_contractor_job("quote_followups", check_quote_followups, 24 * 3600)
     scheduler.add_job(
-        wrap_with_lock("quote_followups", check_quote_followups),
+        sharded_jobs["quote_followups"],
         trigger=CronTrigger(hour=9, minute=0),
         id="quote_followups",
         replace_existing=True,
@@ -699,9 +692,10 @@ def start_scheduler():
     )
 
     # INNOV-3: Smart follow-up engine - every 15 minutes
-    # P0-1: Wrapped with advisory lock to prevent duplicate execution
+    # P0-1: Partitioned by contractor, one advisory lock per shard
+    sharded_jobs["smart_followups"] = _per_contractor_job("smart_followups", run_smart_followups, 15 * 60)
     scheduler.add_job(
-        wrap_with_lock("smart_followups", run_smart_followups),
+        sharded_jobs["smart_followups"],
         trigger=IntervalTrigger(minutes=15),
         id="smart_followups",
         replace_existing=True,
@@ -709,9 +703,10 @@ def start_scheduler():
     )
 
     # INNOV-6: Invoice payment reminders - daily at 10am UTC
-    # P0-1: Wrapped with advisory lock to prevent duplicate execution
+    # P0-1: Partitioned by contractor, one advisory lock per shard
+    sharded_jobs["invoice_reminders"] = _per_contractor_job("invoice_reminders", check_invoice_reminders, 24 * 3600)
     scheduler.add_job(
-        wrap_with_lock("invoice_reminders", check_invoice_reminders),
+        sharded_jobs["invoice_reminders"],
         trigger=CronTrigger(hour=10, minute=0),
         id="invoice_reminders",
         replace_existing=True,
@@ -759,9 +754,10 @@ def start_scheduler():
     )
 
     # DISC-161: Trial reminders - daily at 11am UTC (6am EST)
-    # P0-1: Wrapped with advisory lock to prevent duplicate execution
+    # P0-1: Partitioned by contractor, one advisory lock per shard
+    sharded_jobs["trial_reminders"] = _per_contractor_job("trial_reminders", check_trial_reminders, 24 * 3600)
     scheduler.add_job(
-        wrap_with_lock("trial_reminders", check_trial_reminders),
+        sharded_jobs["trial_reminders"],
         trigger=CronTrigger(hour=11, minute=0),
         id="trial_reminders",
         replace_existing=True,
@@ -814,6 +810,12 @@ def start_scheduler():
         max_instances=1,
     )
 
+    # Finish any partitioned run a crash or deploy interrupted this period
+    for job_name, job in sharded_jobs.items():
+        resume = getattr(job, "resume", None)
+        if resume is not None:
+            scheduler.add_job(resume, id=f"{job_name}_resume", replace_existing=True)
+
     scheduler.start()
     logger.info("Background scheduler started with jobs: task_reminders (5min), quote_followups (daily 9am UTC), smart_followups (15min), invoice_reminders (daily 10am UTC), marketing_report (daily 8am UTC), exit_survey_digest (daily 8:30am UTC), traffic_spike_check (hourly :30), feedback_drip (daily 2pm UTC), trial_reminders (daily 11am UTC), daily_health_check (daily 6am UTC), monitoring_critical_health (15min), monitoring_business_metrics (hourly :45), monitoring_daily_summary (daily 8:15am UTC)")
 
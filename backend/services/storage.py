@@ -2,17 +2,26 @@
 Storage Service for Quoted (INFRA-001).
 
 Provides unified file storage abstraction supporting:
-- Local filesystem (development)
+- Local filesystem (development, and the stand-in for S3 in tests)
 - S3-compatible storage (production)
 
 All operations are async and handle errors gracefully.
+
+boto3 is synchronous, so every S3 call runs on a dedicated thread pool
+sized to the client's connection pool (storage_max_connections) instead of
+blocking the event loop. Large uploads use S3 multipart uploads, and
+download_stream() returns an async iterator of chunks so callers can relay
+big files without holding them in memory.
 """
 
-import os
+import asyncio
+import functools
+import io
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 import aiofiles
 from pathlib import Path
-from typing import Optional, BinaryIO, Union
-from datetime import datetime
+from typing import Optional, BinaryIO, Union, AsyncIterator
 
 from ..config import settings
 from .logging import get_logger
@@ -23,6 +32,61 @@ logger = get_logger("quoted.storage")
 _s3_client = None
 _s3_available = None
 
+# Threads that run blocking boto3 calls (one per pooled connection)
+_s3_executor: Optional[ThreadPoolExecutor] = None
+
+# S3 rejects multipart parts under 5 MB (except the last)
+S3_MIN_PART_BYTES = 5 * 1024 * 1024
+
+
+def _get_s3_executor() -> ThreadPoolExecutor:
+    global _s3_executor
+    if _s3_executor is None:
+        _s3_executor = ThreadPoolExecutor(
+            max_workers=settings.storage_max_connections,
+            thread_name_prefix="s3",
+        )
+    return _s3_executor
+
+
+async def _run_s3(func, *args, **kwargs):
+    """Run a blocking boto3 call on the S3 thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_s3_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def _transfer_config():
+    """Multipart settings for boto3's managed uploads."""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=settings.storage_multipart_threshold_bytes,
+        multipart_chunksize=max(settings.storage_multipart_chunk_bytes, S3_MIN_PART_BYTES),
+        max_concurrency=settings.storage_multipart_concurrency,
+    )
+
+
+def _build_s3_client():
+    """Create the S3 client and check the bucket (blocking)."""
+    import boto3
+    from botocore.config import Config
+
+    client = boto3.client(
+        "s3",
+        aws_access_key_id=settings.aws_access_key,
+        aws_secret_access_key=settings.aws_secret_key,
+        config=Config(
+            signature_version="s3v4",
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            max_pool_connections=settings.storage_max_connections,
+        ),
+    )
+    # Test connection by checking bucket exists
+    client.head_bucket(Bucket=settings.s3_bucket)
+    return client
+
 
 async def _get_s3_client():
     """Get S3 client, initializing if needed."""
@@ -49,20 +113,7 @@ async def _get_s3_client():
 
     # Try to connect
     try:
-        import boto3
-        from botocore.config import Config
-
-        _s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.aws_access_key,
-            aws_secret_access_key=settings.aws_secret_key,
-            config=Config(
-                signature_version="s3v4",
-                retries={"max_attempts": 3, "mode": "adaptive"},
-            ),
-        )
-        # Test connection by checking bucket exists
-        _s3_client.head_bucket(Bucket=settings.s3_bucket)
+        _s3_client = await _run_s3(_build_s3_client)
         _s3_available = True
         logger.info(f"S3 connected successfully to bucket: {settings.s3_bucket}")
         return _s3_client
@@ -76,11 +127,21 @@ async def _get_s3_client():
         return None
 
 
+def shutdown_storage_executor() -> None:
+    """Stop the S3 thread pool (app shutdown)."""
+    global _s3_executor
+    if _s3_executor is not None:
+        _s3_executor.shutdown(wait=False, cancel_futures=True)
+        _s3_executor = None
+
+
 class StorageService:
     """
     Unified storage service with S3 and local filesystem support.
 
     Automatically falls back to local storage when S3 is unavailable.
+    Pass local_base (and use_s3=False) to get a purely local instance,
+    e.g. a temp directory in tests.
     """
 
     # Storage paths
@@ -88,8 +149,9 @@ class StorageService:
     UPLOADS_PATH = "uploads"
     LOGOS_PATH = "logos"
 
-    def __init__(self):
-        self.local_base = Path(settings.storage_path).parent  # ./data
+    def __init__(self, local_base: Optional[Union[str, Path]] = None, use_s3: bool = True):
+        self.local_base = Path(local_base) if local_base else Path(settings.storage_path).parent  # ./data
+        self.use_s3 = use_s3
         self._ensure_local_dirs()
 
     def _ensure_local_dirs(self):
@@ -98,14 +160,25 @@ class StorageService:
             path = self.local_base / subdir
             path.mkdir(parents=True, exist_ok=True)
 
+    async def _s3(self):
+        return await _get_s3_client() if self.use_s3 else None
+
     def _local_path(self, key: str) -> Path:
         """Get local filesystem path for a key."""
         return self.local_base / key
 
+    def _local_path_for(self, key: str) -> Path:
+        """Local path for a key or an absolute path returned by upload()."""
+        return self._local_path(key) if not key.startswith("/") else Path(key)
+
     def _s3_key(self, key: str) -> str:
         """Get S3 key (add environment prefix for isolation)."""
         return f"{settings.environment}/{key}"
 
+    def _s3_key_from_url(self, url: str) -> str:
+        """S3 key from an s3:// URL returned by upload()."""
+        return url.replace(f"s3://{settings.s3_bucket}/", "")
+
     async def upload(
         self,
         key: str,
@@ -115,6 +188,9 @@ class StorageService:
         """
         Upload file to storage.
 
+        Bytes over storage_multipart_threshold_bytes and file objects go
+        through boto3's managed (multipart) upload.
+
         Args:
             key: Storage path (e.g., "pdfs/quote-123.pdf")
             data: File content as bytes or file-like object
@@ -123,26 +199,30 @@ class StorageService:
         Returns:
             URL or path to access the file
         """
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
 
         if s3:
             try:
                 s3_key = self._s3_key(key)
 
                 # Handle both bytes and file objects
-                if isinstance(data, bytes):
-                    s3.put_object(
+                if isinstance(data, bytes) and len(data) <= settings.storage_multipart_threshold_bytes:
+                    await _run_s3(
+                        s3.put_object,
                         Bucket=settings.s3_bucket,
                         Key=s3_key,
                         Body=data,
                         ContentType=content_type,
                     )
                 else:
-                    s3.upload_fileobj(
-                        data,
+                    fileobj = io.BytesIO(data) if isinstance(data, bytes) else data
+                    await _run_s3(
+                        s3.upload_fileobj,
+                        fileobj,
                         settings.s3_bucket,
                         s3_key,
                         ExtraArgs={"ContentType": content_type},
+                        Config=_transfer_config(),
                     )
 
                 logger.debug(f"Uploaded to S3: {s3_key}")
@@ -150,6 +230,8 @@ class StorageService:
             except Exception as e:
                 logger.error(f"S3 upload failed, falling back to local: {e}")
                 # Fall through to local storage
+                if not isinstance(data, bytes) and data.seekable():
+                    data.seek(0)
 
         # Local storage fallback
         local_path = self._local_path(key)
@@ -159,14 +241,99 @@ class StorageService:
             async with aiofiles.open(local_path, "wb") as f:
                 await f.write(data)
         else:
-            # Read from file object and write
-            content = data.read()
-            async with aiofiles.open(local_path, "wb") as f:
-                await f.write(content)
+            # Copy from the file object in chunks, off the event loop
+            def copy():
+                with open(local_path, "wb") as f:
+                    shutil.copyfileobj(data, f)
+            await asyncio.to_thread(copy)
 
         logger.debug(f"Stored locally: {local_path}")
         return str(local_path)
 
+    async def upload_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Upload from an async iterator of chunks (e.g. a request body).
+
+        On S3 this is a multipart upload with parts of
+        storage_multipart_chunk_bytes, so memory stays at about one part
+        regardless of file size; a failed upload is aborted. Unlike upload(),
+        a failed S3 stream can't fall back to local storage (the chunks are
+        consumed), so errors propagate.
+
+        Returns:
+            URL or path to access the file
+        """
+        s3 = await self._s3()
+
+        if not s3:
+            local_path = self._local_path(key)
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(local_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+            logger.debug(f"Stored locally: {local_path}")
+            return str(local_path)
+
+        s3_key = self._s3_key(key)
+        part_size = max(settings.storage_multipart_chunk_bytes, S3_MIN_PART_BYTES)
+        upload = await _run_s3(
+            s3.create_multipart_upload,
+            Bucket=settings.s3_bucket,
+            Key=s3_key,
+            ContentType=content_type,
+        )
+        upload_id = upload["UploadId"]
+        parts = []
+
+        async def send_part(body: bytes) -> None:
+            number = len(parts) + 1
+            response = await _run_s3(
+                s3.upload_part,
+                Bucket=settings.s3_bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": number})
+
+        try:
+            buffer = bytearray()
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                if len(buffer) >= part_size:
+                    await send_part(bytes(buffer))
+                    buffer.clear()
+            if buffer or not parts:
+                await send_part(bytes(buffer))
+
+            await _run_s3(
+                s3.complete_multipart_upload,
+                Bucket=settings.s3_bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                await _run_s3(
+                    s3.abort_multipart_upload,
+                    Bucket=settings.s3_bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to abort S3 multipart upload {upload_id}: {e}")
+            raise
+
+        logger.debug(f"Uploaded to S3 in {len(parts)} parts: {s3_key}")
+        return f"s3://{settings.s3_bucket}/{s3_key}"
+
     async def upload_file(
         self,
         key: str,
@@ -184,16 +351,18 @@ class StorageService:
         Returns:
             URL or path to access the file
         """
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
 
         if s3:
             try:
                 s3_key = self._s3_key(key)
-                s3.upload_file(
+                await _run_s3(
+                    s3.upload_file,
                     file_path,
                     settings.s3_bucket,
                     s3_key,
                     ExtraArgs={"ContentType": content_type},
+                    Config=_transfer_config(),
                 )
                 logger.debug(f"Uploaded file to S3: {s3_key}")
                 return f"s3://{settings.s3_bucket}/{s3_key}"
@@ -204,12 +373,76 @@ class StorageService:
         # or copy if different location needed
         local_path = self._local_path(key)
         if str(local_path) != file_path:
-            import shutil
             local_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, local_path)
+            await asyncio.to_thread(shutil.copy2, file_path, local_path)
 
         return str(local_path)
 
+    async def _s3_body(self, s3, s3_key: str):
+        """StreamingBody for an S3 object, or None if it doesn't exist."""
+        try:
+            response = await _run_s3(s3.get_object, Bucket=settings.s3_bucket, Key=s3_key)
+            return response["Body"]
+        except s3.exceptions.NoSuchKey:
+            return None
+
+    async def _iter_s3_body(self, body, chunk_size: int) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                chunk = await _run_s3(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    async def _iter_local_file(self, path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+        async with aiofiles.open(path, "rb") as f:
+            while True:
+                chunk = await f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    async def download_stream(
+        self,
+        key: str,
+        chunk_size: Optional[int] = None,
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Open a file for streaming download.
+
+        Accepts what upload() returned (s3:// URL or local path) or a plain
+        key as used by download_key().
+
+        Returns:
+            Async iterator of chunks, or None if not found
+        """
+        chunk_size = chunk_size or settings.storage_stream_chunk_bytes
+        s3 = await self._s3()
+
+        if s3 and not key.startswith("/"):
+            s3_key = self._s3_key_from_url(key) if key.startswith("s3://") else self._s3_key(key)
+            try:
+                body = await self._s3_body(s3, s3_key)
+                if body is not None:
+                    return self._iter_s3_body(body, chunk_size)
+            except Exception as e:
+                logger.warning(f"S3 download failed: {e}")
+            if key.startswith("s3://"):
+                return None
+            # upload() falls back to local storage when S3 fails, so check there too
+
+        local_path = self._local_path_for(key)
+        if not local_path.exists():
+            return None
+        return self._iter_local_file(local_path, chunk_size)
+
+    async def _read_all(self, chunks: Optional[AsyncIterator[bytes]]) -> Optional[bytes]:
+        if chunks is None:
+            return None
+        return b"".join([chunk async for chunk in chunks])
+
     async def download(self, key: str) -> Optional[bytes]:
         """
         Download file from storage.
@@ -220,20 +453,52 @@ class StorageService:
         Returns:
             File content as bytes, or None if not found
         """
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
 
         if s3 and key.startswith("s3://"):
             try:
-                # Parse S3 URL
-                s3_key = key.replace(f"s3://{settings.s3_bucket}/", "")
-                response = s3.get_object(Bucket=settings.s3_bucket, Key=s3_key)
-                return response["Body"].read()
+                body = await self._s3_body(s3, self._s3_key_from_url(key))
+                if body is None:
+                    return None
+                return await _run_s3(body.read)
             except Exception as e:
                 logger.warning(f"S3 download failed: {e}")
                 return None
 
         # Local storage
-        local_path = self._local_path(key) if not key.startswith("/") else Path(key)
+        local_path = self._local_path_for(key)
+        if not local_path.exists():
+            return None
+
+        async with aiofiles.open(local_path, "rb") as f:
+            return await f.read()
+
+    async def download_key(self, key: str) -> Optional[bytes]:
+        """
+        Download a file by the key it was uploaded under.
+
+        Unlike download(), this doesn't need the s3:// URL returned by
+        upload(), so callers with deterministic keys (e.g. content-addressed
+        caches) can look files up directly. A missing file is not an error.
+
+        Args:
+            key: Storage path (e.g., "pdfs/cache/abc123.pdf")
+
+        Returns:
+            File content as bytes, or None if not found
+        """
+        s3 = await self._s3()
+
+        if s3:
+            try:
+                body = await self._s3_body(s3, self._s3_key(key))
+                if body is not None:
+                    return await _run_s3(body.read)
+            except Exception as e:
+                logger.warning(f"S3 download failed: {e}")
+            # upload() falls back to local storage when S3 fails, so check there too
+
+        local_path = self._local_path(key)
         if not local_path.exists():
             return None
 
@@ -250,12 +515,12 @@ class StorageService:
         Returns:
             True if deleted, False if not found or error
         """
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
 
         if s3 and key.startswith("s3://"):
             try:
-                s3_key = key.replace(f"s3://{settings.s3_bucket}/", "")
-                s3.delete_object(Bucket=settings.s3_bucket, Key=s3_key)
+                s3_key = self._s3_key_from_url(key)
+                await _run_s3(s3.delete_object, Bucket=settings.s3_bucket, Key=s3_key)
                 logger.debug(f"Deleted from S3: {s3_key}")
                 return True
             except Exception as e:
@@ -263,7 +528,7 @@ class StorageService:
                 return False
 
         # Local storage
-        local_path = self._local_path(key) if not key.startswith("/") else Path(key)
+        local_path = self._local_path_for(key)
         if local_path.exists():
             local_path.unlink()
             logger.debug(f"Deleted locally: {local_path}")
@@ -272,19 +537,36 @@ class StorageService:
 
     async def exists(self, key: str) -> bool:
         """Check if file exists in storage."""
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
 
         if s3 and key.startswith("s3://"):
             try:
-                s3_key = key.replace(f"s3://{settings.s3_bucket}/", "")
-                s3.head_object(Bucket=settings.s3_bucket, Key=s3_key)
+                s3_key = self._s3_key_from_url(key)
+                await _run_s3(s3.head_object, Bucket=settings.s3_bucket, Key=s3_key)
                 return True
             except Exception:
                 return False
 
         # Local storage
-        local_path = self._local_path(key) if not key.startswith("/") else Path(key)
-        return local_path.exists()
+        return self._local_path_for(key).exists()
+
+    async def exists_key(self, key: str) -> bool:
+        """
+        Check if a file exists by the key it was uploaded under.
+
+        The download_key() counterpart of exists(): no s3:// URL needed.
+        """
+        s3 = await self._s3()
+
+        if s3:
+            try:
+                await _run_s3(s3.head_object, Bucket=settings.s3_bucket, Key=self._s3_key(key))
+                return True
+            except Exception:
+                pass
+            # upload() falls back to local storage when S3 fails, so check there too
+
+        return self._local_path(key).exists()
 
     async def get_url(self, key: str, expires_in: int = 3600) -> Optional[str]:
         """
@@ -300,12 +582,13 @@ class StorageService:
         Returns:
             URL string or None if file doesn't exist
         """
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
 
         if s3 and key.startswith("s3://"):
             try:
-                s3_key = key.replace(f"s3://{settings.s3_bucket}/", "")
-                url = s3.generate_presigned_url(
+                s3_key = self._s3_key_from_url(key)
+                url = await _run_s3(
+                    s3.generate_presigned_url,
                     "get_object",
                     Params={"Bucket": settings.s3_bucket, "Key": s3_key},
                     ExpiresIn=expires_in,
@@ -316,7 +599,7 @@ class StorageService:
                 return None
 
         # Local storage - return path (endpoint must serve it)
-        local_path = self._local_path(key) if not key.startswith("/") else Path(key)
+        local_path = self._local_path_for(key)
         if local_path.exists():
             return str(local_path)
         return None
@@ -328,10 +611,10 @@ class StorageService:
             "local_path": str(self.local_base),
         }
 
-        s3 = await _get_s3_client()
+        s3 = await self._s3()
         if s3:
             try:
-                s3.head_bucket(Bucket=settings.s3_bucket)
+                await _run_s3(s3.head_bucket, Bucket=settings.s3_bucket)
                 result["s3_available"] = True
                 result["s3_bucket"] = settings.s3_bucket
             except Exception as e:
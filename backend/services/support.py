@@ -15,9 +15,8 @@ from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-import anthropic
-
 from ..config import settings
+from .claude_client import get_async_claude_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +30,7 @@ class SupportService:
             logger.warning("Anthropic API key not configured - support classification disabled")
             self.client = None
         else:
-            self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+            self.client = get_async_claude_client()
 
     async def classify_email(
         self,
@@ -122,7 +121,7 @@ Respond in JSON format:
 }}"""
 
             # Call Claude API
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=settings.claude_model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}]
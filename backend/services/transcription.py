@@ -4,15 +4,308 @@ Supports OpenAI Whisper and Deepgram.
 
 This is the first step in the pipeline:
 Voice Audio → Transcription → Quote Generation
+
+Audio is streamed to the provider: uploads are read in chunks and piped
+straight into the outgoing request body (multipart for Whisper, raw for
+Deepgram) over one pooled HTTP client per worker. Nothing is written to
+disk, and memory per request stays at about one chunk regardless of
+recording length. Uploads over transcription_max_upload_bytes are rejected
+with AudioTooLargeError.
+
+Long recordings (10-30 minute site walks) are the exception. Uploads over
+transcription_long_audio_bytes (just under the provider's 25MB limit) are
+buffered and decoded with pydub (ffmpeg for anything but WAV; installed by
+nixpacks.toml), split near silences into overlapping ~2 minute segments,
+transcribed concurrently (bounded by transcription_max_parallel_segments per
+worker) and stitched back together with timestamps shifted onto the original
+timeline. Latency drops roughly by the fan-out factor, and no single request
+nears the provider's limit. If the audio can't be decoded (e.g. no ffmpeg) but
+still fits in one provider request, it is sent whole instead.
 """
 
-import os
-import tempfile
-from typing import Optional
+import asyncio
+import io
+import uuid
+from dataclasses import dataclass
+from typing import Optional, AsyncIterator, Iterable, List
 from pathlib import Path
+import aiofiles
 import httpx
 
 from ..config import settings
+from .logging import get_logger
+
+logger = get_logger("quoted.transcription")
+
+OPENAI_TRANSCRIPTION_URL = "https://api.openai.com/v1/audio/transcriptions"
+DEEPGRAM_LISTEN_URL = "https://api.deepgram.com/v1/listen"
+
+# Largest body a single provider request accepts (Whisper's limit)
+PROVIDER_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+AUDIO_CONTENT_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".mp4": "audio/mp4",
+    ".webm": "audio/webm",
+    ".ogg": "audio/ogg",
+}
+
+
+class AudioTooLargeError(ValueError):
+    """The audio upload exceeds transcription_max_upload_bytes."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        super().__init__(f"Audio file is too large (limit {limit // (1024 * 1024)} MB)")
+
+
+def audio_content_type(filename: str) -> str:
+    """Content type for an audio filename (defaults to audio/mpeg)."""
+    return AUDIO_CONTENT_TYPES.get(Path(filename).suffix.lower(), "audio/mpeg")
+
+
+async def iter_audio_chunks(reader, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+    """
+    Read an async file-like object (e.g. FastAPI's UploadFile) in chunks.
+    """
+    chunk_size = chunk_size or settings.transcription_chunk_bytes
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def _iter_file_chunks(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as audio_file:
+        while True:
+            chunk = await audio_file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+async def _iter_bytes(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _limit_size(chunks: AsyncIterator[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    """Pass chunks through, raising AudioTooLargeError past max_bytes."""
+    total = 0
+    async for chunk in chunks:
+        total += len(chunk)
+        if total > max_bytes:
+            raise AudioTooLargeError(max_bytes)
+        yield chunk
+
+
+class _MultipartAudioBody:
+    """
+    Streaming multipart/form-data body: text fields plus one audio file part.
+
+    httpx only streams multipart files from sync file objects, so the body
+    is framed by hand around the async audio chunks.
+    """
+
+    def __init__(self, fields: dict, filename: str, content_type: str, chunks: AsyncIterator[bytes]):
+        self.boundary = uuid.uuid4().hex
+        head = b"".join(
+            (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode()
+            for name, value in fields.items()
+        )
+        safe_filename = filename.replace('"', "")
+        head += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{safe_filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self.head = head
+        self.tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self.chunks = chunks
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def content_length(self, audio_size: Optional[int]) -> Optional[int]:
+        if audio_size is None:
+            return None
+        return len(self.head) + audio_size + len(self.tail)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.head
+        async for chunk in self.chunks:
+            yield chunk
+        yield self.tail
+
+
+@dataclass
+class AudioChunk:
+    """
+    One segment of a long recording, in milliseconds.
+
+    start/end is the audio sent for transcription (including overlap with
+    its neighbours); own_start/own_end is the span this chunk is
+    authoritative for when stitching.
+    """
+    start: int
+    end: int
+    own_start: int
+    own_end: int
+
+
+def plan_audio_chunks(
+    audio,
+    segment_ms: int,
+    overlap_ms: int,
+    search_ms: Optional[int] = None,
+    min_silence_ms: int = 400,
+) -> List[AudioChunk]:
+    """
+    Split a pydub AudioSegment into ~segment_ms chunks, cutting at the
+    silence closest to each target boundary (within search_ms, default a
+    quarter segment), or at the target itself when there is none. Only the
+    search windows are scanned for silence, so this stays cheap on long
+    recordings.
+    """
+    from pydub.silence import detect_silence
+
+    search_ms = search_ms or segment_ms // 4
+    length = len(audio)
+    # Relative to the recording's loudness; fixed floor for silent audio
+    silence_thresh = audio.dBFS - 16 if audio.dBFS != float("-inf") else -50
+
+    cuts = [0]
+    while length - cuts[-1] > segment_ms + search_ms:
+        target = cuts[-1] + segment_ms
+        window_start = target - search_ms
+        silences = detect_silence(
+            audio[window_start:target + search_ms],
+            min_silence_len=min_silence_ms,
+            silence_thresh=silence_thresh,
+            seek_step=10,
+        )
+        if silences:
+            midpoints = [window_start + (start + end) // 2 for start, end in silences]
+            cuts.append(min(midpoints, key=lambda point: abs(point - target)))
+        else:
+            cuts.append(target)
+    cuts.append(length)
+
+    return [
+        AudioChunk(
+            start=max(0, own_start - overlap_ms),
+            end=min(length, own_end + overlap_ms),
+            own_start=own_start,
+            own_end=own_end,
+        )
+        for own_start, own_end in zip(cuts, cuts[1:])
+    ]
+
+
+def stitch_transcripts(chunks: List[AudioChunk], results: List[dict], duration: float) -> dict:
+    """
+    Merge per-chunk transcription results into one.
+
+    Segment (Whisper) and word (Deepgram) timestamps are shifted by the
+    chunk's start; each one is kept only by the chunk that owns its
+    midpoint, so text in the overlaps isn't duplicated.
+    """
+    merged = {"text": "", "duration": duration}
+    timed_key = None
+    timed: List[dict] = []
+    texts: List[str] = []
+    confidences: List[float] = []
+
+    for index, (chunk, result) in enumerate(zip(chunks, results)):
+        if result.get("confidence") is not None:
+            confidences.append(result["confidence"])
+        key = "segments" if result.get("segments") else "words" if result.get("words") else None
+        if key is None:
+            # No timing information to dedupe the overlap with
+            if result.get("text", "").strip():
+                texts.append(result["text"].strip())
+            continue
+        timed_key = timed_key or key
+
+        offset = chunk.start / 1000
+        is_last = index == len(chunks) - 1
+        for entry in result[key]:
+            start = entry.get("start", 0) + offset
+            end = entry.get("end", 0) + offset
+            midpoint_ms = (start + end) / 2 * 1000
+            if midpoint_ms < chunk.own_start:
+                continue
+            if midpoint_ms >= chunk.own_end and not is_last:
+                continue
+            shifted = dict(entry, start=round(start, 3), end=round(end, 3))
+            if key == "segments":
+                shifted["id"] = len(timed)
+                texts.append(entry.get("text", "").strip())
+            else:
+                texts.append(entry.get("punctuated_word") or entry.get("word", ""))
+            timed.append(shifted)
+
+    merged["text"] = " ".join(text for text in texts if text)
+    if timed_key:
+        merged[timed_key] = timed
+    if confidences:
+        merged["confidence"] = sum(confidences) / len(confidences)
+    return merged
+
+
+def _decode_audio(audio_bytes: bytes, filename: str):
+    from pydub import AudioSegment
+
+    # WAV decodes in pure Python; everything else is probed by ffmpeg
+    audio_format = "wav" if Path(filename).suffix.lower() == ".wav" else None
+    return AudioSegment.from_file(io.BytesIO(audio_bytes), format=audio_format)
+
+
+def _export_chunk(audio, chunk: AudioChunk) -> bytes:
+    # 16 kHz mono WAV: what speech models use anyway, and needs no encoder
+    buffer = io.BytesIO()
+    audio[chunk.start:chunk.end].set_channels(1).set_frame_rate(16000).export(buffer, format="wav")
+    return buffer.getvalue()
+
+
+# Shared HTTP client (initialized lazily, one per worker process)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_transcription_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client used for all transcription requests."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.transcription_max_connections,
+                max_keepalive_connections=settings.transcription_max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(settings.transcription_timeout_seconds, connect=10.0),
+        )
+    return _http_client
+
+
+async def close_transcription_http_client() -> None:
+    """Close the shared client and release pooled connections (app shutdown)."""
+    global _http_client
+    if _http_client is None:
+        return
+    try:
+        await _http_client.aclose()
+    except Exception as e:
+        logger.warning(f"Error closing transcription HTTP client: {e}")
+    finally:
+        _http_client = None
 
 
 class TranscriptionService:
@@ -25,6 +318,10 @@ class TranscriptionService:
         self.provider = settings.transcription_provider
         self.openai_key = settings.openai_api_key
         self.deepgram_key = settings.deepgram_api_key
+        self.max_upload_bytes = settings.transcription_max_upload_bytes
+        self.long_audio_bytes = settings.transcription_long_audio_bytes
+        # Per worker, shared by all requests, so fan-out can't swamp the provider
+        self._segment_semaphore = asyncio.Semaphore(settings.transcription_max_parallel_segments)
 
     async def transcribe(
         self,
@@ -44,16 +341,71 @@ class TranscriptionService:
                 - confidence: Confidence score (if available)
                 - duration: Audio duration in seconds
         """
+        audio_path = Path(audio_file_path)
+        try:
+            size = (await asyncio.to_thread(audio_path.stat)).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        return await self.transcribe_stream(
+            _iter_file_chunks(audio_path, settings.transcription_chunk_bytes),
+            filename=audio_path.name,
+            size=size,
+            language=language,
+        )
+
+    async def transcribe_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str = "audio.mp3",
+        size: Optional[int] = None,
+        language: str = "en",
+    ) -> dict:
+        """
+        Transcribe audio streamed in chunks (e.g. iter_audio_chunks(upload)).
+
+        Args:
+            chunks: Async iterator of audio bytes
+            filename: Original filename (used for the content type)
+            size: Total size in bytes if known; oversize audio is rejected
+                before anything is sent, and the request gets a Content-Length
+            language: Language code (default: English)
+
+        Uploads over transcription_long_audio_bytes go through transcribe_long.
+
+        Raises:
+            AudioTooLargeError: The audio exceeds transcription_max_upload_bytes
+        """
+        if size is not None and size > self.max_upload_bytes:
+            raise AudioTooLargeError(self.max_upload_bytes)
+
+        if size is not None and size > self.long_audio_bytes:
+            audio_bytes = b"".join([chunk async for chunk in _limit_size(chunks, self.max_upload_bytes)])
+            return await self.transcribe_long(audio_bytes, filename, language)
+
+        # One request: also bounded by what the provider accepts
+        chunks = _limit_size(chunks, min(self.max_upload_bytes, PROVIDER_MAX_UPLOAD_BYTES))
+        return await self._transcribe_single(chunks, filename, size, language)
+
+    async def _transcribe_single(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        size: Optional[int],
+        language: str,
+    ) -> dict:
         if self.provider == "openai":
-            return await self._transcribe_openai(audio_file_path, language)
+            return await self._transcribe_openai(chunks, filename, size, language)
         elif self.provider == "deepgram":
-            return await self._transcribe_deepgram(audio_file_path, language)
+            return await self._transcribe_deepgram(chunks, filename, size, language)
         else:
             raise ValueError(f"Unknown transcription provider: {self.provider}")
 
     async def _transcribe_openai(
         self,
-        audio_file_path: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        size: Optional[int],
         language: str
     ) -> dict:
         """
@@ -63,50 +415,47 @@ class TranscriptionService:
         if not self.openai_key:
             raise ValueError("OpenAI API key not configured")
 
-        url = "https://api.openai.com/v1/audio/transcriptions"
-
-        # Read the audio file
-        audio_path = Path(audio_file_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
-
-        # Prepare the request
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            with open(audio_path, "rb") as audio_file:
-                files = {
-                    "file": (audio_path.name, audio_file, "audio/mpeg"),
-                }
-                data = {
-                    "model": "whisper-1",
-                    "language": language,
-                    "response_format": "verbose_json",
-                }
-                headers = {
-                    "Authorization": f"Bearer {self.openai_key}",
-                }
-
-                response = await client.post(
-                    url,
-                    files=files,
-                    data=data,
-                    headers=headers,
-                )
-
-                if response.status_code != 200:
-                    raise Exception(f"Transcription failed: {response.text}")
-
-                result = response.json()
-
-                return {
-                    "text": result.get("text", ""),
-                    "duration": result.get("duration", 0),
-                    "language": result.get("language", language),
-                    "segments": result.get("segments", []),
-                }
+        body = _MultipartAudioBody(
+            fields={
+                "model": "whisper-1",
+                "language": language,
+                "response_format": "verbose_json",
+            },
+            filename=filename,
+            content_type=audio_content_type(filename),
+            chunks=chunks,
+        )
+        headers = {
+            "Authorization": f"Bearer {self.openai_key}",
+            "Content-Type": body.content_type,
+        }
+        content_length = body.content_length(size)
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+
+        response = await get_transcription_http_client().post(
+            OPENAI_TRANSCRIPTION_URL,
+            content=body,
+            headers=headers,
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Transcription failed: {response.text}")
+
+        result = response.json()
+
+        return {
+            "text": result.get("text", ""),
+            "duration": result.get("duration", 0),
+            "language": result.get("language", language),
+            "segments": result.get("segments", []),
+        }
 
     async def _transcribe_deepgram(
         self,
-        audio_file_path: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        size: Optional[int],
         language: str
     ) -> dict:
         """
@@ -116,7 +465,6 @@ class TranscriptionService:
         if not self.deepgram_key:
             raise ValueError("Deepgram API key not configured")
 
-        url = "https://api.deepgram.com/v1/listen"
         params = {
             "model": "nova-2",
             "language": language,
@@ -124,49 +472,89 @@ class TranscriptionService:
             "punctuate": "true",
             "diarize": "false",  # Speaker detection off for single speaker
         }
+        headers = {
+            "Authorization": f"Token {self.deepgram_key}",
+            "Content-Type": audio_content_type(filename),
+        }
+        if size is not None:
+            headers["Content-Length"] = str(size)
+
+        response = await get_transcription_http_client().post(
+            DEEPGRAM_LISTEN_URL,
+            params=params,
+            content=chunks,
+            headers=headers,
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Transcription failed: {response.text}")
+
+        result = response.json()
+        channel = result.get("results", {}).get("channels", [{}])[0]
+        alternative = channel.get("alternatives", [{}])[0]
+
+        return {
+            "text": alternative.get("transcript", ""),
+            "confidence": alternative.get("confidence", 0),
+            "duration": result.get("metadata", {}).get("duration", 0),
+            "words": alternative.get("words", []),
+        }
 
-        audio_path = Path(audio_file_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+    async def transcribe_long(
+        self,
+        audio_bytes: bytes,
+        filename: str = "audio.mp3",
+        language: str = "en",
+    ) -> dict:
+        """
+        Transcribe a long recording as concurrent segments split on silence.
 
-        # Determine content type
-        suffix = audio_path.suffix.lower()
-        content_types = {
-            ".mp3": "audio/mpeg",
-            ".wav": "audio/wav",
-            ".m4a": "audio/mp4",
-            ".webm": "audio/webm",
-            ".ogg": "audio/ogg",
-        }
-        content_type = content_types.get(suffix, "audio/mpeg")
-
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            with open(audio_path, "rb") as audio_file:
-                headers = {
-                    "Authorization": f"Token {self.deepgram_key}",
-                    "Content-Type": content_type,
-                }
-
-                response = await client.post(
-                    url,
-                    params=params,
-                    content=audio_file.read(),
-                    headers=headers,
+        Recordings that turn out to fit in one segment, or that can't be
+        decoded but fit in one provider request, are sent as-is.
+        """
+        try:
+            audio = await asyncio.to_thread(_decode_audio, audio_bytes, filename)
+        except Exception as e:
+            # pydub raises CouldntDecodeError, or OSError when ffmpeg is missing
+            if len(audio_bytes) > PROVIDER_MAX_UPLOAD_BYTES:
+                raise
+            logger.warning(
+                f"Could not decode {filename} for splitting, sending it whole: {e}",
+                extra={"size": len(audio_bytes)},
+            )
+            return await self._transcribe_single(
+                _iter_bytes([audio_bytes]), filename, len(audio_bytes), language
+            )
+        chunks = await asyncio.to_thread(
+            plan_audio_chunks,
+            audio,
+            int(settings.transcription_segment_seconds * 1000),
+            int(settings.transcription_segment_overlap_seconds * 1000),
+        )
+
+        if len(chunks) == 1 and len(audio_bytes) <= PROVIDER_MAX_UPLOAD_BYTES:
+            return await self._transcribe_single(
+                _iter_bytes([audio_bytes]), filename, len(audio_bytes), language
+            )
+
+        async def transcribe_chunk(index: int, chunk: AudioChunk) -> dict:
+            async with self._segment_semaphore:
+                wav_bytes = await asyncio.to_thread(_export_chunk, audio, chunk)
+                return await self._transcribe_single(
+                    _iter_bytes([wav_bytes]), f"segment_{index}.wav", len(wav_bytes), language
                 )
 
-                if response.status_code != 200:
-                    raise Exception(f"Transcription failed: {response.text}")
-
-                result = response.json()
-                channel = result.get("results", {}).get("channels", [{}])[0]
-                alternative = channel.get("alternatives", [{}])[0]
+        results = await asyncio.gather(*(
+            transcribe_chunk(index, chunk) for index, chunk in enumerate(chunks)
+        ))
+        logger.info(
+            f"Transcribed {len(audio) / 1000:.0f}s recording in {len(chunks)} segments",
+            extra={"segments": len(chunks)},
+        )
 
-                return {
-                    "text": alternative.get("transcript", ""),
-                    "confidence": alternative.get("confidence", 0),
-                    "duration": result.get("metadata", {}).get("duration", 0),
-                    "words": alternative.get("words", []),
-                }
+        merged = stitch_transcripts(chunks, results, duration=len(audio) / 1000)
+        merged.setdefault("language", results[0].get("language", language))
+        return merged
 
     async def transcribe_from_bytes(
         self,
@@ -176,22 +564,13 @@ class TranscriptionService:
     ) -> dict:
         """
         Transcribe from audio bytes (for direct uploads).
-        Saves to temp file, transcribes, then cleans up.
         """
-        # Save to temp file
-        suffix = Path(filename).suffix or ".mp3"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            tmp.write(audio_bytes)
-            tmp_path = tmp.name
-
-        try:
-            # Transcribe
-            result = await self.transcribe(tmp_path, language)
-            return result
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return await self.transcribe_stream(
+            _iter_bytes([audio_bytes]),
+            filename=filename,
+            size=len(audio_bytes),
+            language=language,
+        )
 
 
 # Singleton instance
@@ -0,0 +1,196 @@
+"""
+Write-coalescing view tracking for shared quotes (KI-004).
+
+Every load of /api/quotes/shared/{token} used to write view_count and
+last_viewed_at back to the quotes row, so a customer refreshing the page
+or a link-preview crawler produced one UPDATE per hit.
+
+Views are now split in two:
+- The first view of a quote is written straight away with one conditional
+  UPDATE (only matches while view_count is still 0). Exactly one request
+  wins it, across all uvicorn workers, and only that request sends the
+  first-view email and moves the quote from "sent" to "viewed".
+- Later views are counted in this worker's ViewBuffer and flushed every
+  share_view_flush_interval_seconds as one increment per quote.
+
+Flushes add to view_count rather than overwrite it, so the buffers of the
+four uvicorn workers combine correctly. Views buffered when a worker dies
+without shutting down cleanly (at most one flush interval) are lost; the
+counts are engagement signals, not billing data.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, case, func, update
+
+from ..config import settings
+from ..models.database import Quote
+from .logging import get_logger
+
+logger = get_logger("quoted.view_tracking")
+
+_quotes = Quote.__table__
+
+
+async def record_first_view(session, quote_id: str, now: Optional[datetime] = None) -> bool:
+    """
+    Claim the first view of a quote.
+
+    Returns True for exactly one caller per quote: the one whose UPDATE
+    found view_count still at 0. That caller owns the first-view side effects.
+    """
+    now = now or datetime.utcnow()
+    result = await session.execute(
+        update(Quote)
+        .where(Quote.id == quote_id, func.coalesce(Quote.view_count, 0) == 0)
+        .values(
+            view_count=1,
+            first_viewed_at=now,
+            last_viewed_at=now,
+            status=case((Quote.status == "sent", "viewed"), else_=Quote.status),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount == 1
+
+
+class ViewBuffer:
+    """Per-worker counts of repeat views, flushed to quotes in batches."""
+
+    def __init__(self, session_factory, flush_interval: float = 5.0):
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        # quote_id -> (views since last flush, latest view time)
+        self._pending: Dict[str, Tuple[int, datetime]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # Since this process started
+        self.recorded = 0
+        self.flushed_views = 0
+        self.flushes = 0
+
+    def record(self, quote_id: str, now: Optional[datetime] = None) -> None:
+        """Count a repeat view (no database write)."""
+        self._add(quote_id, 1, now or datetime.utcnow())
+        self.recorded += 1
+
+    def _add(self, quote_id: str, count: int, last: datetime) -> None:
+        current, current_last = self._pending.get(quote_id, (0, last))
+        self._pending[quote_id] = (current + count, max(current_last, last))
+
+    async def flush(self) -> int:
+        """Write buffered views as one batched UPDATE; returns quotes updated."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+
+        rows = [
+            {"quote_id": quote_id, "views": count, "viewed_at": last}
+            for quote_id, (count, last) in pending.items()
+        ]
+        statement = (
+            update(_quotes)
+            .where(_quotes.c.id == bindparam("quote_id"))
+            .values(
+                view_count=func.coalesce(_quotes.c.view_count, 0) + bindparam("views"),
+                # Never move last_viewed_at backwards (another worker may have flushed later views)
+                last_viewed_at=case(
+                    (_quotes.c.last_viewed_at > bindparam("viewed_at"), _quotes.c.last_viewed_at),
+                    else_=bindparam("viewed_at"),
+                ),
+            )
+        )
+        try:
+            async with self._session_factory() as session:
+                await session.execute(statement, rows)
+                await session.commit()
+        except Exception:
+            # Put the counts back so the next flush retries them
+            for quote_id, (count, last) in pending.items():
+                self._add(quote_id, count, last)
+            raise
+
+        self.flushes += 1
+        self.flushed_views += sum(row["views"] for row in rows)
+        return len(rows)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop(), name="view-buffer-flush")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final view flush failed: {e}")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"View flush failed: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "pending_quotes": len(self._pending),
+            "recorded": self.recorded,
+            "flushed_views": self.flushed_views,
+            "flushes": self.flushes,
+        }
+
+
+async def track_view(quote_id: str, view_count: Optional[int]) -> bool:
+    """
+    Record a view of a shared quote; True if it was the quote's first view.
+
+    view_count is the count read with the quote: only quotes that looked
+    unviewed try to claim the first view, every other hit is buffered.
+    """
+    now = datetime.utcnow()
+    if not view_count:
+        from .database import async_session_factory
+        async with async_session_factory() as session:
+            if await record_first_view(session, quote_id, now):
+                return True
+    get_view_buffer().record(quote_id, now)
+    return False
+
+
+# Singleton buffer (one per uvicorn worker)
+_view_buffer: Optional[ViewBuffer] = None
+
+
+def get_view_buffer() -> ViewBuffer:
+    """Get this process's view buffer."""
+    global _view_buffer
+    if _view_buffer is None:
+        from .database import async_session_factory
+        _view_buffer = ViewBuffer(
+            session_factory=async_session_factory,
+            flush_interval=settings.share_view_flush_interval_seconds,
+        )
+    return _view_buffer
+
+
+def start_view_buffer() -> None:
+    """Start periodic view flushes in this process (call from lifespan)."""
+    get_view_buffer().start()
+
+
+async def stop_view_buffer() -> None:
+    global _view_buffer
+    if _view_buffer is not None:
+        await _view_buffer.stop()
+        _view_buffer = None
@@ -17,9 +17,8 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 from dataclasses import dataclass
 
-import anthropic
-
 from ..config import settings
+from .claude_client import get_async_claude_client
 from .logging import get_logger
 
 logger = get_logger("quoted.voice_commands")
@@ -169,7 +168,7 @@ class VoiceCommandService:
     }
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_async_claude_client()
         self.model = "claude-sonnet-4-20250514"
 
     def _quick_pattern_match(self, text: str) -> Optional[str]:
@@ -232,7 +231,7 @@ Voice input: "{transcription}"
 Determine command type and extract parameters."""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=500,
                 tools=[VOICE_COMMAND_TOOL],
@@ -331,6 +330,8 @@ Determine command type and extract parameters."""
     ) -> VoiceCommandResult:
         """Handle quote management voice commands."""
         from ..models.database import Quote
+        from .quote_total_index import apply_quote_total_change
+        from .quote_stats import apply_quote_stats_change, quote_stats_entry
         from sqlalchemy import select, desc
 
         if command_type == VoiceCommandType.QUOTE_RECENT:
@@ -402,8 +403,12 @@ Determine command type and extract parameters."""
                 )
 
             # Mark as won
+            old_stats_entry = quote_stats_entry(quote)
             quote.status = "won"
             quote.outcome = "won"
+            await apply_quote_stats_change(
+                db, contractor_id, old=old_stats_entry, new=quote_stats_entry(quote)
+            )
             await db.commit()
 
             return VoiceCommandResult(
@@ -425,9 +430,13 @@ Determine command type and extract parameters."""
                 )
 
             # Mark as lost
+            old_stats_entry = quote_stats_entry(quote)
             quote.status = "lost"
             quote.outcome = "lost"
             quote.outcome_notes = data.get("loss_reason")
+            await apply_quote_stats_change(
+                db, contractor_id, old=old_stats_entry, new=quote_stats_entry(quote)
+            )
             await db.commit()
 
             return VoiceCommandResult(
@@ -465,6 +474,10 @@ Determine command type and extract parameters."""
                 duplicate_source_quote_id=quote.id,
             )
             db.add(new_quote)
+            await apply_quote_total_change(
+                db, contractor_id, new=(new_quote.job_type, new_quote.total)
+            )
+            await apply_quote_stats_change(db, contractor_id, new=quote_stats_entry(new_quote))
             await db.commit()
             await db.refresh(new_quote)
 
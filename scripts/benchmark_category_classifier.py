@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local category fast path.
+
+Builds a contractor with 8 categories and synthetic past quotes, trains a
+CategoryClassifier on them, then classifies held-out voice notes:
+- in-domain notes: how many the fast path answers, and how many correctly
+- out-of-domain notes (work the contractor has never quoted): these must
+  fall back to Claude rather than be forced into an existing category
+
+Also times build and lookup (the Claude call it replaces takes ~1s).
+Runs via: python scripts/benchmark_category_classifier.py [quotes_per_category]
+"""
+import random
+import statistics
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.services.category_classifier import CategoryClassifier
+
+CATEGORIES = {
+    "deck_build": ("Deck Build", ["deck", "composite", "joist", "railing", "trex", "footing", "ledger", "stair"]),
+    "deck_repair": ("Deck Repair", ["deck", "rotten", "board", "replace", "stain", "refinish", "repair", "loose"]),
+    "fence_installation": ("Fence Installation", ["fence", "post", "cedar", "picket", "gate", "linear", "privacy", "panel"]),
+    "interior_painting": ("Interior Painting", ["paint", "wall", "ceiling", "trim", "bedroom", "primer", "coat", "drywall"]),
+    "exterior_painting": ("Exterior Painting", ["paint", "siding", "exterior", "scrape", "power", "wash", "shutter", "house"]),
+    "bathroom_remodel": ("Bathroom Remodel", ["bathroom", "tile", "vanity", "shower", "toilet", "tub", "grout", "fixture"]),
+    "kitchen_cabinets": ("Kitchen Cabinets", ["kitchen", "cabinet", "countertop", "hardware", "door", "drawer", "island", "backsplash"]),
+    "drywall_repair": ("Drywall Repair", ["drywall", "patch", "hole", "mud", "tape", "texture", "sand", "crack"]),
+}
+FILLER = ["customer", "wants", "the", "job", "about", "square", "feet", "by", "next", "week", "and", "maybe", "also", "some"]
+UNSEEN = [
+    "roof", "shingle", "gutter", "chimney", "flashing", "skylight", "solar", "panel",
+    "landscaping", "sod", "irrigation", "sprinkler", "mulch", "hedge", "tree", "stump",
+]
+
+
+def voice_note(words, rng):
+    picked = rng.sample(words, 4) + rng.sample(FILLER, 5)
+    rng.shuffle(picked)
+    return f"{' '.join(picked)} {rng.randint(10, 400)}"
+
+
+def main():
+    per_category = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    rng = random.Random(42)
+
+    examples = [
+        (voice_note(words, rng), key)
+        for key, (_, words) in CATEGORIES.items()
+        for _ in range(per_category)
+    ]
+    held_out = [
+        (voice_note(words, rng), key)
+        for key, (_, words) in CATEGORIES.items()
+        for _ in range(50)
+    ]
+    unseen = [voice_note(UNSEEN, rng) for _ in range(200)]
+
+    start = time.perf_counter()
+    classifier = CategoryClassifier({k: name for k, (name, _) in CATEGORIES.items()}, examples)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    times = []
+    answered = correct = 0
+    for note, expected in held_out:
+        start = time.perf_counter()
+        category, _, confident = classifier.classify(note)
+        times.append((time.perf_counter() - start) * 1_000_000)
+        if confident:
+            answered += 1
+            correct += category == expected
+
+    forced = sum(classifier.classify(note)[2] for note in unseen)
+
+    ordered = sorted(times)
+    print(f"Categories: {len(CATEGORIES)}   training quotes: {len(examples):,}   build: {build_ms:.1f} ms")
+    print(f"Lookup: median {statistics.median(ordered):.1f} us   p95 {ordered[int(len(ordered) * 0.95)]:.1f} us")
+    print(
+        f"In-domain: fast path answered {answered}/{len(held_out)} ({answered / len(held_out):.0%}), "
+        f"correct {correct}/{answered} ({correct / max(answered, 1):.1%})"
+    )
+    print(f"Out-of-domain: answered locally {forced}/{len(unseen)} (should be ~0; rest go to Claude)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark indexed vs full-scan customer matching (DISC-126).
+
+Builds 10k synthetic customers for one contractor, then times
+find_customer_matches-style scoring two ways:
+- full scan: score every customer (the old behavior)
+- indexed: score only CustomerMatchIndex candidates
+
+Also checks both paths return the same top matches.
+Runs via: python scripts/benchmark_customer_matching.py [num_customers]
+"""
+import random
+import statistics
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.services.customer_match_index import CustomerMatchIndex
+from backend.services.customer_service import CustomerService
+
+FIRST_NAMES = [
+    "james", "john", "robert", "michael", "william", "david", "richard", "joseph",
+    "thomas", "charles", "mary", "patricia", "jennifer", "linda", "elizabeth",
+    "barbara", "susan", "jessica", "sarah", "karen", "nancy", "lisa", "maria",
+    "daniel", "matthew", "anthony", "mark", "donald", "steven", "paul", "andrew",
+]
+LAST_NAMES = [
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis",
+    "rodriguez", "martinez", "hernandez", "lopez", "gonzalez", "wilson", "anderson",
+    "thomas", "taylor", "moore", "jackson", "martin", "lee", "perez", "thompson",
+    "white", "harris", "sanchez", "clark", "ramirez", "lewis", "robinson", "walker",
+    "young", "allen", "king", "wright", "scott", "torres", "nguyen", "hill", "flores",
+]
+STREETS = ["Main St", "Oak Ave", "Pine Rd", "Maple Dr", "Cedar Ln", "Elm Ct", "Lake Blvd", "Hill Pl"]
+
+
+def typo(text: str, rng: random.Random) -> str:
+    """Introduce one random edit."""
+    i = rng.randrange(len(text))
+    op = rng.choice(["sub", "del", "ins"])
+    letter = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    if op == "sub":
+        return text[:i] + letter + text[i + 1:]
+    if op == "del":
+        return text[:i] + text[i + 1:]
+    return text[:i] + letter + text[i:]
+
+
+def build(num_customers: int, rng: random.Random):
+    customers = []
+    for i in range(num_customers):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if rng.random() < 0.5:
+            name += f" {rng.choice(LAST_NAMES)}"  # Make names more distinct
+        phone = f"{rng.randint(200, 999)}{rng.randint(200, 999)}{rng.randint(1000, 9999)}"
+        address = f"{rng.randint(1, 9999)} {rng.choice(STREETS)}"
+        customers.append((f"cust-{i}", name.title(), phone, address))
+    return customers
+
+
+def full_scan(index: CustomerMatchIndex, normalized_name, normalized_phone, normalized_addr, limit=5):
+    scored = []
+    for candidate in index.customers.values():
+        confidence, reasons = CustomerService._score_match(
+            normalized_name=normalized_name,
+            normalized_phone=normalized_phone,
+            normalized_addr=normalized_addr,
+            candidate=candidate,
+        )
+        if confidence >= 0.40:
+            scored.append((confidence, candidate.id))
+    scored.sort(reverse=True)
+    return scored[:limit]
+
+
+def indexed(index: CustomerMatchIndex, normalized_name, normalized_phone, normalized_addr, limit=5):
+    scored = []
+    for candidate in index.candidates(normalized_name, normalized_phone):
+        confidence, reasons = CustomerService._score_match(
+            normalized_name=normalized_name,
+            normalized_phone=normalized_phone,
+            normalized_addr=normalized_addr,
+            candidate=candidate,
+        )
+        if confidence >= 0.40:
+            scored.append((confidence, candidate.id))
+    scored.sort(reverse=True)
+    return scored[:limit]
+
+
+def main():
+    num_customers = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = random.Random(42)
+    customers = build(num_customers, rng)
+
+    start = time.perf_counter()
+    index = CustomerMatchIndex(normalize_address=CustomerService._normalize_address)
+    for customer_id, name, phone, address in customers:
+        index.upsert(
+            customer_id,
+            name,
+            CustomerService.normalize_name(name),
+            CustomerService.normalize_phone(phone),
+            address,
+        )
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Queries: typo'd names of existing customers, some with phone/address
+    queries = []
+    for _ in range(100):
+        _, name, phone, address = rng.choice(customers)
+        queries.append((
+            CustomerService.normalize_name(typo(name, rng)),
+            CustomerService.normalize_phone(phone) if rng.random() < 0.3 else None,
+            CustomerService._normalize_address(address) if rng.random() < 0.5 else None,
+        ))
+
+    scan_times, index_times, mismatches = [], [], 0
+    for query in queries:
+        start = time.perf_counter()
+        expected = full_scan(index, *query)
+        scan_times.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        actual = indexed(index, *query)
+        index_times.append((time.perf_counter() - start) * 1000)
+
+        if [cid for _, cid in expected] != [cid for _, cid in actual]:
+            # Ties at equal confidence may order differently; compare scores
+            if [c for c, _ in expected] != [c for c, _ in actual]:
+                mismatches += 1
+
+    def summary(times):
+        ordered = sorted(times)
+        return f"median {statistics.median(ordered):7.2f} ms   p95 {ordered[int(len(ordered) * 0.95)]:7.2f} ms"
+
+    print(f"Customers: {num_customers:,}   index build: {build_ms:.0f} ms")
+    print(f"Full scan: {summary(scan_times)}")
+    print(f"Indexed:   {summary(index_times)}")
+    print(f"Result mismatches: {mismatches}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    main()
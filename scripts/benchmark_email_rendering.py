@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark email HTML rendering for scheduler drips.
+
+Renders the feedback-request email (the DISC-147 drip) for N recipients
+three ways:
+- legacy: f-string body substituted into the layout string per message
+  (the pre-template EmailService behavior)
+- uncompiled: Jinja2 templates parsed and compiled for every message
+- compiled: EmailTemplates, compiled once, layout pre-rendered
+
+Also checks the compiled output is a complete email.
+Runs via: python scripts/benchmark_email_rendering.py [num_recipients]
+"""
+import statistics
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from backend.services.email_templates import EmailTemplates, TEMPLATE_DIR, format_money
+
+QUESTIONS = [
+    "Was the setup process smooth?",
+    "Did the AI understand your pricing well?",
+    "Any features you wish existed?",
+]
+BODY_INTRO = "You've had a few days to try Quoted, and I'd love to hear your honest first impressions."
+
+
+def recipients(count: int):
+    return [f"Owner {i}" for i in range(count)]
+
+
+def legacy_render(layout: str, owner_name: str) -> str:
+    greeting = f"Hi {owner_name},"
+    questions = "".join(f"\n                    <li>{q}</li>" for q in QUESTIONS)
+    content = f"""
+            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
+                {greeting}
+            </p>
+
+            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
+                {BODY_INTRO}
+            </p>
+
+            <ul style="color: #e0e0e0; line-height: 2;">{questions}
+            </ul>
+
+            <p style="color: #e0e0e0; font-size: 16px; line-height: 1.7;">
+                Just hit reply - I read every response personally. Your feedback directly shapes what we build next.
+            </p>
+        """
+    return layout.replace('{content}', content)
+
+
+def uncompiled_render(owner_name: str) -> str:
+    # A fresh environment has an empty template cache: parse + compile each time
+    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), autoescape=select_autoescape(["html"]))
+    env.filters["money"] = format_money
+    body = env.get_template("feedback_request.html").render(
+        greeting=f"Hi {owner_name},", body_intro=BODY_INTRO, questions=QUESTIONS,
+    )
+    return env.get_template("base.html").render(content=body)
+
+
+def time_per_message(render, names):
+    times = []
+    for name in names:
+        start = time.perf_counter()
+        render(name)
+        times.append((time.perf_counter() - start) * 1_000_000)
+    return times
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    names = recipients(count)
+
+    with open(TEMPLATE_DIR / "base.html") as f:
+        layout = f.read()
+    legacy_layout = layout[layout.index("<!DOCTYPE"):].replace("{{ content }}", "{content}")
+
+    start = time.perf_counter()
+    templates = EmailTemplates()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    def compiled_render(owner_name):
+        return templates.render(
+            "feedback_request.html",
+            greeting=f"Hi {owner_name},", body_intro=BODY_INTRO, questions=QUESTIONS,
+        )
+
+    results = {
+        "Legacy f-strings": time_per_message(lambda n: legacy_render(legacy_layout, n), names),
+        "Uncompiled Jinja": time_per_message(uncompiled_render, names[: min(count, 500)]),
+        "Compiled":         time_per_message(compiled_render, names),
+    }
+
+    def summary(times):
+        ordered = sorted(times)
+        return (
+            f"median {statistics.median(ordered):8.1f} us   "
+            f"p95 {ordered[int(len(ordered) * 0.95)]:8.1f} us   "
+            f"total {sum(ordered) / 1000:8.1f} ms ({len(ordered):,} msgs)"
+        )
+
+    print(f"Recipients: {count:,}   templates compiled: {len(templates.names)} in {compile_ms:.0f} ms")
+    for label, times in results.items():
+        print(f"{label:17} {summary(times)}")
+
+    sample = compiled_render("Sample")
+    assert "Hi Sample," in sample and sample.count("<html") == 1
+    print("Feedback request renders OK")
+
+
+if __name__ == "__main__":
+    main()
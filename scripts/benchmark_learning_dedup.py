@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark near-duplicate checks for learning statements.
+
+Builds a category with N existing statements (some of them rewordings) and
+checks a correction's worth of incoming statements against it:
+- pairwise: the old _statements_similar approach, both word sets rebuilt
+  for every (incoming, existing) pair
+- index: learning_dedup.StatementIndex, existing statements indexed once
+  (tokens and MinHash signatures memoized per worker), LSH candidates
+  confirmed with exact Jaccard
+
+Also reports how many of the duplicates learning_dedup.similar finds
+pairwise (same key facts required) the index found.
+Runs via: python scripts/benchmark_learning_dedup.py [existing_statements]
+"""
+import random
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.services import learning_dedup
+
+VOCABULARY = (
+    "add charge extra premium percent second story access demolition railing composite cedar "
+    "stairs permit haul away disposal labor helper weekend rush travel minimum deck fence paint "
+    "primer trim ceiling drywall patch repair materials markup customers repeat hourly footing "
+    "ledger joist board stain seal gate post concrete excavation grading irrigation"
+).split()
+
+INCOMING = 20
+
+
+def statement(rng):
+    return " ".join(rng.sample(VOCABULARY, 10))
+
+
+def reword(text, rng):
+    words = text.split()
+    words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return " ".join(words)
+
+
+def pairwise_similar(statement1, statement2, threshold=0.6):
+    """The original DatabaseService._statements_similar."""
+    words1 = set(word.lower() for word in statement1.split() if len(word) > 2)
+    words2 = set(word.lower() for word in statement2.split() if len(word) > 2)
+    if not words1 or not words2:
+        return False
+    return len(words1 & words2) / len(words1 | words2) >= threshold
+
+
+def main():
+    existing_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(42)
+
+    existing = [statement(rng) for _ in range(existing_count)]
+    incoming = [
+        reword(rng.choice(existing), rng) if i % 2 else statement(rng)
+        for i in range(INCOMING)
+    ]
+
+    start = time.perf_counter()
+    for new in incoming:
+        any(pairwise_similar(new, old) for old in existing)
+    pairwise_ms = (time.perf_counter() - start) * 1000
+
+    expected = [any(learning_dedup.similar(new, old) for old in existing) for new in incoming]
+
+    for memo in (learning_dedup.tokens, learning_dedup.key_facts, learning_dedup.signature, learning_dedup.band_keys):
+        memo.cache_clear()
+    start = time.perf_counter()
+    index = learning_dedup.StatementIndex.from_statements(existing)
+    cold_build_ms = (time.perf_counter() - start) * 1000
+
+    # Later corrections: signatures of existing statements are memoized
+    start = time.perf_counter()
+    index = learning_dedup.StatementIndex.from_statements(existing)
+    found = [index.find(new) is not None for new in incoming]
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    duplicates = sum(expected)
+    recalled = sum(e and f for e, f in zip(expected, found))
+    false_positives = sum(f and not e for e, f in zip(expected, found))
+    print(f"Existing statements: {existing_count:,}   incoming: {INCOMING}   duplicates: {duplicates}")
+    print(f"Pairwise:            {pairwise_ms:8.2f} ms per correction")
+    print(f"Index (first build): {cold_build_ms:8.2f} ms (once per worker)")
+    print(f"Index (memoized):    {warm_ms:8.2f} ms per correction (rebuild + lookups)")
+    print(f"Found {recalled}/{duplicates} duplicates, {false_positives} false positives")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark quote prompt assembly with and without memoized fragments.
+
+Builds pricing knowledge with 10, 100 and 500 categories (each with a
+tailored prompt and 20 learned adjustments) and times build_quote_prompt
+two ways:
+- uncached: every fragment rendered from the pricing_knowledge JSON
+  (the previous behavior)
+- memoized: catalog, tailored section and correction examples served from
+  PromptFragmentCache (warm; one snapshot version)
+
+Also checks both produce the same prompt.
+Runs via: python scripts/benchmark_prompt_assembly.py [iterations]
+"""
+import random
+import statistics
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import backend.services  # noqa: F401  (prompts import services; load them first)
+from backend.prompts.quote_generation import build_quote_prompt
+
+TRADES = ["deck", "fence", "paint", "drywall", "tile", "roof", "gutter", "siding", "cabinet", "floor"]
+WORK = ["install", "repair", "replace", "build", "refinish"]
+
+
+def pricing_model(num_categories: int, rng: random.Random) -> dict:
+    categories = {}
+    for i in range(num_categories):
+        trade, work = TRADES[i % len(TRADES)], WORK[(i // len(TRADES)) % len(WORK)]
+        key = f"{trade}_{work}_{i}"
+        categories[key] = {
+            "display_name": f"{trade.title()} {work.title()} {i}",
+            "typical_price_range": [rng.randint(500, 2000), rng.randint(3000, 15000)],
+            "base_rate": rng.randint(20, 120),
+            "pricing_unit": "sqft",
+            "notes": f"Prices {trade} {work} work by the square foot, minimum one day.",
+            "confidence": round(rng.uniform(0.4, 0.95), 2),
+            "samples": rng.randint(1, 40),
+            "tailored_prompt": f"For {trade} {work} jobs, start from the base rate, "
+                               f"add access and disposal, and round up to the nearest $50. " * 3,
+            "learned_adjustments": [
+                f"Increase {trade} {work} labor by {rng.randint(5, 25)}% when access is difficult ({j})"
+                for j in range(20)
+            ],
+        }
+    return {
+        "labor_rate_hourly": 85,
+        "pricing_philosophy": "Premium work at fair prices; never race to the bottom.",
+        "pricing_knowledge": {"categories": categories, "global_rules": ["Minimum job $500"]},
+        "version": "2026-01-01T00:00:00",
+    }
+
+
+CORRECTIONS = [
+    {
+        "job_type": "deck",
+        "original_line_items": [{"name": "Demolition", "amount": 800}, {"name": "Framing", "amount": 2400}],
+        "final_line_items": [{"name": "Demolition", "amount": 1200}, {"name": "Framing", "amount": 2600}],
+    }
+] * 5
+
+
+def time_builds(model, category, contractor_id, iterations):
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        build_quote_prompt(
+            transcription="Replace the rotten deck boards and add a railing, about 300 square feet",
+            contractor_name="Acme",
+            pricing_model=model,
+            correction_examples=CORRECTIONS,
+            detected_category=category,
+            contractor_id=contractor_id,
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(7)
+
+    for num_categories in (10, 100, 500):
+        model = pricing_model(num_categories, rng)
+        category = next(iter(model["pricing_knowledge"]["categories"]))
+
+        uncached = time_builds(model, category, None, iterations)
+        time_builds(model, category, f"bench-{num_categories}", 1)  # Warm the cache
+        memoized = time_builds(model, category, f"bench-{num_categories}", iterations)
+
+        def summary(times):
+            ordered = sorted(times)
+            return f"median {statistics.median(ordered):7.3f} ms   p95 {ordered[int(len(ordered) * 0.95)]:7.3f} ms"
+
+        print(f"{num_categories:4} categories   uncached: {summary(uncached)}   memoized: {summary(memoized)}")
+
+        # The selected learnings are per request; everything else must match
+        kwargs = dict(
+            transcription="Replace deck boards", contractor_name="Acme", pricing_model=model,
+            correction_examples=CORRECTIONS, detected_category=category,
+        )
+        assert build_quote_prompt(**kwargs).text == build_quote_prompt(
+            **kwargs, contractor_id=f"bench-{num_categories}"
+        ).text
+
+    print("Memoized prompts match uncached prompts")
+
+
+if __name__ == "__main__":
+    main()
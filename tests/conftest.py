@@ -0,0 +1,85 @@
+"""
+Shared fixtures for the backend test suite.
+
+Service tests run against a throwaway SQLite database per test
+(session_factory) instead of Postgres.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Accepts the pool arguments backend.services.database passes at import; never connected to
+IMPORT_DATABASE_URL = "postgresql+asyncpg://u:p@localhost/db"
+
+# Lets any test module import backend.services on its own; the default
+# SQLite URL rejects the engine's pool settings
+os.environ.setdefault("DATABASE_URL", IMPORT_DATABASE_URL)
+
+
+@pytest.fixture
+def make_session_factory(tmp_path):
+    """
+    Build async session factories, each on a new SQLite file under tmp_path.
+
+    Tables are created up front and connections are not pooled, so one
+    factory can be used from several asyncio.run() calls. The engine is
+    factory.kw["bind"].
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+    from backend.models.database import Base
+
+    def make(name="test.db"):
+        path = tmp_path / name
+        sync_engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(sync_engine)
+        sync_engine.dispose()
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+        return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    return make
+
+
+@pytest.fixture
+def session_factory(make_session_factory):
+    """Async session factory on a fresh SQLite database with every table."""
+    return make_session_factory()
+
+
+@pytest.fixture
+def database_module():
+    """
+    A private import of backend.services.database.
+
+    The module builds a pooled engine at import, so it is imported against
+    IMPORT_DATABASE_URL and left out of sys.modules; tests patch its
+    async_session_factory with session_factory.
+    """
+    from unittest.mock import patch
+    from backend.config import settings
+
+    with patch.dict(sys.modules), patch.object(settings, "database_url", IMPORT_DATABASE_URL):
+        sys.modules.pop("backend.services.database", None)
+        import backend.services.database as database_module
+    return database_module
+
+
+@pytest.fixture
+def quote_generator():
+    """A private import of backend.services.quote_generator (see database_module)."""
+    from unittest.mock import patch
+    from backend.config import settings
+
+    with patch.dict(sys.modules), patch.object(settings, "database_url", IMPORT_DATABASE_URL):
+        # Other test modules may have left stub packages behind
+        for name in ("backend.prompts", "backend.services", "backend.services.quote_generator"):
+            sys.modules.pop(name, None)
+        import backend.services.quote_generator as quote_generator
+    return quote_generator
@@ -0,0 +1,128 @@
+"""
+Tests for the local category classifier in front of Claude.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Category Fast Path Tests
+# =============================================================================
+
+class TestCategoryFastPath:
+    """Tests for the local category classifier in front of Claude."""
+
+    PRICING_KNOWLEDGE = {"categories": {
+        "deck_build": {"display_name": "Deck Build"},
+        "fence_installation": {"display_name": "Fence Installation"},
+        "interior_painting": {"display_name": "Interior Painting"},
+    }}
+    EXAMPLES = [
+        ("New composite deck with railing and stairs, about 300 square feet", "deck_build"),
+        ("Build a trex deck off the back door with footings and a ledger board", "deck_build"),
+        ("Pressure treated deck, 12 by 16, joists and composite boards", "deck_build"),
+        ("Cedar privacy fence along the back, 120 linear feet with a gate", "fence_installation"),
+        ("Replace the picket fence posts and add a double gate", "fence_installation"),
+        ("Six foot vinyl privacy fence around the yard, two gates", "fence_installation"),
+        ("Paint two bedrooms, walls and ceiling, one coat of primer", "interior_painting"),
+        ("Interior paint for the living room walls and trim", "interior_painting"),
+    ]
+
+    def test_classifier_only_answers_confident_matches(self):
+        """Familiar work is answered locally; unfamiliar or thinly-trained work is not."""
+        from backend.services.category_classifier import CategoryClassifier, category_names
+
+        classifier = CategoryClassifier(category_names(self.PRICING_KNOWLEDGE), self.EXAMPLES)
+
+        category, similarity, confident = classifier.classify(
+            "Customer wants a composite deck with stairs and a railing"
+        )
+        assert (category, confident) == ("deck_build", True)
+        assert classifier.result(category)["source"] == "local"
+
+        # Different trade: shares no vocabulary worth trusting
+        assert classifier.classify("Replace the roof shingles and gutters on a ranch house")[2] is False
+        # Interior painting has only 2 training quotes (< min examples)
+        category, _, confident = classifier.classify("Paint the bedroom walls and ceiling trim")
+        assert (category, confident) == ("interior_painting", False)
+
+    def test_detect_skips_claude_on_fast_path_hits(self, session_factory, quote_generator):
+        """Confident matches never call Claude; the rest fall back and are compared."""
+        import json
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from backend.config import settings
+        from backend.models.database import Quote
+        from backend.services.category_classifier import CategoryClassifierCache
+
+        async def run():
+            async with session_factory() as session:
+                for i, (transcription, job_type) in enumerate(self.EXAMPLES):
+                    session.add(Quote(
+                        id=f"q-{i}", contractor_id="c-1", transcription=transcription, job_type=job_type,
+                    ))
+                await session.commit()
+
+            cache = CategoryClassifierCache(session_factory=session_factory)
+            service = quote_generator.QuoteGenerationService.__new__(quote_generator.QuoteGenerationService)
+            service._audit_tasks = set()
+            service.client = MagicMock()
+            service.client.messages.create = AsyncMock(return_value=SimpleNamespace(content=[
+                SimpleNamespace(text=json.dumps({
+                    "category": "roof_repair", "is_new": True, "display_name": "Roof Repair",
+                    "category_confidence": 95, "suggested_new_category": None,
+                })),
+            ]))
+
+            with patch.object(quote_generator, "get_category_classifier_cache", return_value=cache), \
+                    patch.object(settings, "category_fast_path_audit_rate", 0.0):
+                local = await service.detect_or_create_category(
+                    "Twelve by sixteen composite deck with a railing",
+                    self.PRICING_KNOWLEDGE, contractor_id="c-1",
+                )
+                calls_after_local = service.client.messages.create.await_count
+                remote = await service.detect_or_create_category(
+                    "Tear off and replace the roof shingles",
+                    self.PRICING_KNOWLEDGE, contractor_id="c-1",
+                )
+            return local, calls_after_local, remote, service.client.messages.create.await_count, cache
+
+        local, calls_after_local, remote, calls, cache = asyncio.run(run())
+
+        assert local["category"] == "deck_build" and local["is_new"] is False
+        assert calls_after_local == 0
+        assert remote["category"] == "roof_repair" and calls == 1
+        stats = cache.get_stats()
+        assert (stats["fast_path_hits"], stats["fallbacks"], stats["hit_rate"]) == (1, 1, 0.5)
+        assert stats["builds"] == 1  # Second lookup reused the classifier
+
+    def test_fast_path_quotes_are_not_training_examples(self, session_factory):
+        """Quotes categorized by the classifier itself never become its labels."""
+        from backend.models.database import Quote
+        from backend.services.category_classifier import CategoryClassifierCache
+
+        async def run():
+            async with session_factory() as session:
+                for i, source in enumerate([None, "claude", "local"]):
+                    session.add(Quote(
+                        id=f"q-{i}", contractor_id="c-1", transcription=f"deck job {i}",
+                        job_type="deck_build", category_source=source,
+                    ))
+                await session.commit()
+
+            return await CategoryClassifierCache(session_factory=session_factory)._load_examples(
+                "c-1", ["deck_build"]
+            )
+
+        examples = asyncio.run(run())
+
+        assert sorted(transcription for transcription, _ in examples) == ["deck job 0", "deck job 1"]
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,42 @@
+"""
+Tests for the shared async Claude client.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Shared Claude Client Tests
+# =============================================================================
+
+class TestClaudeClient:
+    """Tests for the shared async Claude client."""
+
+    def test_client_is_async_and_shared(self):
+        """All callers get the same pooled AsyncAnthropic instance."""
+        import anthropic
+        from backend.services.claude_client import get_async_claude_client
+
+        client = get_async_claude_client()
+        assert isinstance(client, anthropic.AsyncAnthropic)
+        assert get_async_claude_client() is client
+
+    def test_close_resets_client(self):
+        """Closing the client releases it so a fresh one is built next time."""
+        from backend.services.claude_client import (
+            get_async_claude_client,
+            close_async_claude_client,
+        )
+
+        first = get_async_claude_client()
+        asyncio.run(close_async_claude_client())
+        assert get_async_claude_client() is not first
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,85 @@
+"""
+Tests for the indexed fuzzy customer matcher.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Customer Match Index Tests
+# =============================================================================
+
+class TestCustomerMatchIndex:
+    """Tests for the indexed fuzzy customer matcher."""
+
+    def test_soundex(self):
+        """Phonetic keys group common spelling variants."""
+        from backend.services.customer_match_index import soundex, phonetic_key
+
+        assert soundex("robert") == soundex("rupert") == "R163"
+        assert phonetic_key("jon smyth") == phonetic_key("john smith")
+
+    def test_candidates_find_fuzzy_and_phone_matches(self):
+        """Typos, phonetic variants and partial phones surface as candidates."""
+        from backend.services.customer_match_index import CustomerMatchIndex
+
+        index = CustomerMatchIndex()
+        index.upsert("c-1", "John Smith", "john smith", "5551234567", None)
+        index.upsert("c-2", "Maria Garcia", "maria garcia", "", None)
+        index.upsert("c-3", "Zed Quinn", "zed quinn", "9998887777", None)
+
+        def ids(**kwargs):
+            return {c.id for c in index.candidates(**kwargs)}
+
+        assert "c-1" in ids(normalized_name="jon smyth")
+        assert "c-2" in ids(normalized_name="maria garcai")
+        assert ids(normalized_phone="4158887777") == {"c-3"}  # Last 7 digits
+        assert "c-3" not in ids(normalized_name="maria garcia")
+
+        index.remove("c-1")
+        assert "c-1" not in ids(normalized_name="john smith")
+
+    def test_find_customer_matches_uses_index(self, session_factory):
+        """End-to-end match against SQLite, including incremental refresh."""
+        from backend.models.database import Customer
+        from backend.services.customer_service import CustomerService
+
+        async def run():
+            async with session_factory() as session:
+                for i, name in enumerate(["John Smith", "Jane Doe", "Bob Jones"]):
+                    session.add(Customer(
+                        contractor_id="c-match", name=name,
+                        normalized_name=CustomerService.normalize_name(name),
+                        normalized_phone=f"555000000{i}",
+                        address="12 Oak Ave",
+                    ))
+                await session.commit()
+
+                result = await CustomerService.find_customer_matches(
+                    session, "c-match", name="Jon Smith", address="12 Oak Avenue"
+                )
+                assert result["matches"][0]["name"] == "John Smith"
+                assert any(r.startswith("address_match") for r in result["matches"][0]["match_reasons"])
+
+                # A customer added later is picked up by the incremental refresh
+                session.add(Customer(
+                    contractor_id="c-match", name="Alice Walker",
+                    normalized_name="alice walker", normalized_phone="5559990000",
+                ))
+                await session.commit()
+                result = await CustomerService.find_customer_matches(
+                    session, "c-match", phone="(555) 999-0000"
+                )
+                assert result["recommendation"] == "auto_link"
+                assert result["exact_match"]["name"] == "Alice Walker"
+
+        asyncio.run(run())
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
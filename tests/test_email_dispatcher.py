@@ -0,0 +1,159 @@
+"""
+Tests for the queued, batched email dispatcher.
+"""
+
+import asyncio
+import pytest
+import sys
+
+
+# =============================================================================
+# Email Dispatcher Tests
+# =============================================================================
+
+class TestEmailDispatcher:
+    """Tests for the queued, batched email dispatcher."""
+
+    @staticmethod
+    def _dispatcher(factory):
+        from backend.services.email_dispatcher import EmailDispatcher
+        from backend.services.resilience import CircuitBreaker, RateLimiter, RetryConfig
+
+        return EmailDispatcher(
+            factory,
+            rate_limiter=RateLimiter("test", rate=0),
+            circuit=CircuitBreaker("test"),
+            retry_config=RetryConfig(max_attempts=1),
+        )
+
+    def test_send_methods_only_enqueue(self, session_factory):
+        """send_* methods store the email and return without calling Resend."""
+        from unittest.mock import MagicMock, patch
+        from sqlalchemy import select
+        from backend.models.database import EmailOutboxMessage
+        from backend.services.email import EmailService
+
+        async def run():
+            with patch.dict(sys.modules, {"backend.services.database": MagicMock(async_session_factory=session_factory)}), \
+                    patch("resend.Emails.send") as send:
+                receipt = await EmailService.send_welcome_email("a@example.com", "Acme Roofing")
+            async with session_factory() as session:
+                rows = (await session.execute(select(EmailOutboxMessage))).scalars().all()
+            return receipt, send.call_count, rows
+
+        receipt, provider_calls, rows = asyncio.run(run())
+
+        assert provider_calls == 0
+        assert receipt["queued"] is True
+        assert [row.id for row in rows] == [receipt["id"]]
+        assert rows[0].params["to"] == "a@example.com"
+        assert rows[0].status == "pending"
+
+    def test_dispatcher_sends_in_batches(self, session_factory):
+        """Plain emails go out 100 per request; attachments are sent alone."""
+        from unittest.mock import patch
+        from sqlalchemy import select, func
+        from backend.models.database import EmailOutboxMessage
+        from backend.services.email_dispatcher import enqueue_email
+
+        async def run():
+            async with session_factory() as session:
+                for i in range(150):
+                    enqueue_email(session, {"from": "q@x.com", "to": f"u{i}@x.com", "subject": "s", "html": "h"})
+                enqueue_email(session, {
+                    "from": "q@x.com", "to": "pdf@x.com", "subject": "s", "html": "h",
+                    "attachments": [{"filename": "quote.pdf", "content": "JVBERi0="}],
+                })
+                await session.commit()
+
+            dispatcher = self._dispatcher(session_factory)
+            with patch("resend.Batch.send", return_value={"data": []}) as batch, \
+                    patch("resend.Emails.send", return_value={"id": "x"}) as single:
+                while True:
+                    emails = await dispatcher.claim()
+                    if not emails:
+                        break
+                    await dispatcher.deliver(emails)
+
+            async with session_factory() as session:
+                left = (await session.execute(select(func.count(EmailOutboxMessage.id)))).scalar()
+            return [len(call.args[0]) for call in batch.call_args_list], single.call_args_list, left, dispatcher
+
+        batch_sizes, single_calls, left, dispatcher = asyncio.run(run())
+
+        assert sum(batch_sizes) == 150 and max(batch_sizes) <= 100
+        assert len(batch_sizes) <= 3
+        assert [call.args[0]["to"] for call in single_calls] == ["pdf@x.com"]
+        assert left == 0
+        assert dispatcher.sent == 151
+
+    def test_rejected_and_failed_emails(self, session_factory):
+        """A rejected batch is split; invalid emails fail, transient errors back off."""
+        from datetime import datetime
+        from unittest.mock import patch
+        from sqlalchemy import select
+        from resend.exceptions import ResendError, ValidationError
+        from backend.models.database import EmailOutboxMessage
+        from backend.services.email_dispatcher import enqueue_email
+
+        def send_one(params):
+            if params["to"] == "bad":
+                raise ValidationError("Invalid `to` field", "validation_error", "422")
+            if params["to"] == "flaky@x.com":
+                raise ResendError("500", "application_error", "Internal error", "")
+            return {"id": "x"}
+
+        async def run():
+            async with session_factory() as session:
+                for to in ("ok1@x.com", "bad", "flaky@x.com", "ok2@x.com"):
+                    enqueue_email(session, {"from": "q@x.com", "to": to, "subject": "s", "html": "h"})
+                await session.commit()
+
+            dispatcher = self._dispatcher(session_factory)
+            rejected = ValidationError("Invalid `to` field", "validation_error", "422")
+            with patch("resend.Batch.send", side_effect=rejected), \
+                    patch("resend.Emails.send", side_effect=send_one):
+                await dispatcher.deliver(await dispatcher.claim())
+
+            async with session_factory() as session:
+                rows = (await session.execute(select(EmailOutboxMessage))).scalars().all()
+            return {row.params["to"]: row for row in rows}
+
+        rows = asyncio.run(run())
+
+        assert set(rows) == {"bad", "flaky@x.com"}
+        assert rows["bad"].status == "failed"
+        assert rows["flaky@x.com"].status == "pending"
+        assert rows["flaky@x.com"].attempts == 1
+        assert rows["flaky@x.com"].run_after > datetime.utcnow()
+
+    def test_rate_limiter_spaces_calls_and_backs_off(self):
+        """Calls are spaced at the configured rate; a 429 pushes later calls back."""
+        import time
+        from backend.services.resilience import RateLimiter
+
+        async def run():
+            limiter = RateLimiter("test", rate=50)
+            start = time.monotonic()
+            for _ in range(5):
+                await limiter.acquire()
+            spaced = time.monotonic() - start
+
+            limiter.backoff(0.1)
+            start = time.monotonic()
+            await limiter.acquire()
+            return spaced, time.monotonic() - start, limiter.throttled
+
+        spaced, after_backoff, throttled = asyncio.run(run())
+
+        assert spaced >= 0.07  # 4 gaps of 20ms
+        assert after_backoff >= 0.09
+        assert throttled == 1
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,59 @@
+"""
+Tests for precompiled email templates.
+"""
+
+import pytest
+
+
+# =============================================================================
+# Email Template Tests
+# =============================================================================
+
+class TestEmailTemplates:
+    """Tests for precompiled email templates."""
+
+    def test_templates_compiled_once(self):
+        """All templates compile up front; renders never parse again."""
+        from unittest.mock import patch
+        from backend.services.email_templates import EmailTemplates
+
+        templates = EmailTemplates()
+        assert "welcome.html" in templates.names
+        assert "base.html" not in templates.names
+
+        with patch.object(templates.env, "get_template", side_effect=AssertionError("recompiled")):
+            html = templates.render("welcome.html", name="Pat")
+        assert html.startswith("<!DOCTYPE html>")
+        assert "Welcome to Quoted, Pat" in html
+        assert html.count("<html") == 1
+
+    def test_values_are_escaped_and_bodies_wrapped(self):
+        """User input is escaped; raw bodies with braces no longer break the layout."""
+        from datetime import datetime
+        from backend.services.email_templates import EmailTemplates
+
+        templates = EmailTemplates()
+        html = templates.render(
+            "task_reminder.html",
+            contractor_name="Pat",
+            task_title="<script>alert(1)</script>",
+            task_description=None,
+            due_date=datetime(2026, 3, 1),
+            customer_name=None,
+        )
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "March 01, 2026" in html
+        assert "Related to:" not in html
+
+        wrapped = templates.wrap("<p>margin: {0}</p>")
+        assert "<p>margin: {0}</p>" in wrapped
+        assert wrapped.rstrip().endswith("</html>")
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
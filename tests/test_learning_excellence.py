@@ -76,7 +76,10 @@ voice_signal_extractor = load_module_directly("voice_signal_extractor", SERVICES
 # acceptance_learning has no internal dependencies
 acceptance_learning = load_module_directly("acceptance_learning", SERVICES_DIR / "acceptance_learning.py", "backend.services")
 
-# contractor_dna depends on learning_quality
+# learning_dedup has no internal dependencies
+learning_dedup = load_module_directly("learning_dedup", SERVICES_DIR / "learning_dedup.py", "backend.services")
+
+# contractor_dna depends on learning_quality and learning_dedup
 contractor_dna = load_module_directly("contractor_dna", SERVICES_DIR / "contractor_dna.py", "backend.services")
 
 # pricing_confidence has no internal dependencies
@@ -1005,6 +1008,121 @@ class TestAcceptanceLearningAdditional:
         assert result is not None
 
 
+# ============================================================================
+# Test Learning Dedup
+# ============================================================================
+
+class TestLearningDedup:
+    """Tests for learning_dedup.py"""
+
+    @staticmethod
+    def _statements(count):
+        import random
+        rng = random.Random(7)
+        vocabulary = [
+            "add", "charge", "extra", "premium", "percent", "second", "story", "access", "demolition",
+            "railing", "composite", "cedar", "stairs", "permit", "haul", "away", "disposal", "labor",
+            "helper", "weekend", "rush", "travel", "minimum", "deck", "fence", "paint", "primer",
+            "trim", "ceiling", "drywall", "patch", "repair", "materials", "markup", "customers", "repeat",
+        ]
+        statements = []
+        for _ in range(count):
+            words = rng.sample(vocabulary, 9)
+            statements.append(" ".join(words))
+            if rng.random() < 0.3:
+                # A rewording: one word swapped
+                reworded = words[:]
+                reworded[rng.randrange(9)] = rng.choice(vocabulary)
+                statements.append(" ".join(reworded))
+        return statements
+
+    def test_index_matches_pairwise_jaccard(self):
+        """LSH lookups find (almost) every near-duplicate pairwise checks find, and nothing else."""
+        statements = self._statements(300)
+        index = learning_dedup.StatementIndex()
+        expected = found = false_positives = 0
+        for statement in statements:
+            has_duplicate = any(learning_dedup.similar(statement, earlier) for earlier in statements[:len(index)])
+            match = index.find(statement)
+            expected += has_duplicate
+            found += has_duplicate and match is not None
+            false_positives += match is not None and not has_duplicate
+            index.add(statement)
+
+        assert expected > 50
+        assert found / expected >= 0.97
+        assert false_positives == 0
+
+    def test_dedupe_keeps_first_wording(self):
+        """Rewordings of a statement are dropped; distinct statements and order are kept."""
+        statements = [
+            "Add 15% for second story decks with difficult access",
+            {"text": "Demolition of old decks runs $1,200 including disposal"},
+            "Add 15% for second story decks with very difficult access",
+            "Charge $85/hour for finish carpentry",
+        ]
+        assert learning_dedup.dedupe(statements) == [statements[0], statements[1], statements[3]]
+        assert learning_dedup.StatementIndex().find("a to b") is None  # No tokens: never a duplicate
+
+    def test_dna_merges_reworded_patterns(self):
+        """DNA keeps one pattern for rewordings of the same learning (dict learnings accepted)."""
+        service = contractor_dna.ContractorDNAService()
+        dna = service.update_dna_from_correction(
+            contractor_dna=service._empty_dna("test-123"),
+            category="deck",
+            new_learnings=[
+                "Add 15% for second story access on every job",
+                {"text": "Add 15% for second story access on nearly every job", "quality_score": 70},
+            ],
+            category_confidence=0.7,
+            category_quote_count=10,
+        )
+        statements = [p["statement"] for p in dna["universal_patterns"] + dna["partial_patterns"]]
+        assert statements == ["Add 15% for second story access on every job"]
+
+    def test_different_amounts_or_materials_are_not_duplicates(self):
+        """Statements differing only in an amount or a material are separate learnings."""
+        pairs = [
+            ("Composite decking runs $45 per square foot installed",
+             "Cedar decking runs $32 per square foot installed"),
+            ("Composite decking runs $45 per square foot installed",
+             "Cedar decking runs $45 per square foot installed"),
+            ("Composite decking runs $45 per square foot installed",
+             "Composite decking runs $52 per square foot installed"),
+            ("Add 15% for second story access", "Add 25% for second story access"),
+            ("Paver patios run $18/sqft with base prep", "Concrete patios run $18/sqft with base prep"),
+        ]
+        for first, second in pairs:
+            assert not learning_dedup.similar(first, second)
+            assert learning_dedup.StatementIndex.from_statements([first]).find(second) is None
+            assert learning_dedup.dedupe([first, second]) == [first, second]
+
+        # Same facts, reworded: still a duplicate
+        assert learning_dedup.similar(
+            "Composite decking runs $45 per square foot installed",
+            "Composite decking runs about $45 per square foot installed",
+        )
+
+    def test_dna_keeps_patterns_with_different_amounts(self):
+        """A changed rate is merged into DNA as its own pattern, not as a revalidation."""
+        service = contractor_dna.ContractorDNAService()
+        dna = service.update_dna_from_correction(
+            contractor_dna=service._empty_dna("test-123"),
+            category="deck",
+            new_learnings=[
+                "Add 15% for second story access on every job",
+                "Add 25% for second story access on every job",
+            ],
+            category_confidence=0.7,
+            category_quote_count=10,
+        )
+        statements = [p["statement"] for p in dna["universal_patterns"] + dna["partial_patterns"]]
+        assert sorted(statements) == [
+            "Add 15% for second story access on every job",
+            "Add 25% for second story access on every job",
+        ]
+
+
 # ============================================================================
 # Run tests
 # ============================================================================
@@ -0,0 +1,129 @@
+"""
+Tests for the post-commit task outbox and DatabaseService's unit of work.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Outbox Tests
+# =============================================================================
+
+class TestOutbox:
+    """Tests for the post-commit task outbox and its worker pool."""
+
+    def test_tasks_retry_then_complete(self, session_factory):
+        """Failed tasks are retried with backoff, then deleted on success."""
+        from sqlalchemy import select
+        from backend.models.database import OutboxTask
+        from backend.services.outbox import (
+            OutboxWorkerPool,
+            enqueue_task,
+            get_queue_stats,
+            register_task_handler,
+        )
+
+        calls = []
+
+        @register_task_handler("test.flaky")
+        async def flaky(payload):
+            calls.append(payload["n"])
+            if len(calls) == 1:
+                raise RuntimeError("transient")
+
+        async def run():
+            pool = OutboxWorkerPool(session_factory, workers=2, max_attempts=3, retry_base_seconds=0)
+
+            async with session_factory() as session:
+                enqueue_task(session, "test.flaky", {"n": 1})
+                enqueue_task(session, "test.unknown", {})
+                await session.commit()
+                assert (await get_queue_stats(session))["pending"] == 2
+
+            # First attempt fails and is rescheduled; unknown types fail permanently
+            for _ in range(2):
+                await pool.run(await pool.claim())
+            async with session_factory() as session:
+                stats = await get_queue_stats(session)
+            assert (stats["pending"], stats["retrying"], stats["failed"]) == (1, 1, 1)
+
+            await pool.run(await pool.claim())
+            assert await pool.claim() is None
+            assert calls == [1, 1]
+            assert (pool.completed, pool.retried, pool.failed) == (1, 1, 1)
+
+            async with session_factory() as session:
+                rows = (await session.execute(select(OutboxTask))).scalars().all()
+            assert [row.task_type for row in rows] == ["test.unknown"]
+
+            # Worker loop drains newly committed tasks when notified
+            pool.start()
+            async with session_factory() as session:
+                enqueue_task(session, "test.flaky", {"n": 2})
+                await session.commit()
+            pool.notify()
+            for _ in range(50):
+                if calls[-1] == 2:
+                    break
+                await asyncio.sleep(0.02)
+            await pool.stop()
+            assert calls == [1, 1, 2]
+
+        asyncio.run(run())
+
+
+# =============================================================================
+# Unit of Work Tests
+# =============================================================================
+
+class TestDatabaseUnitOfWork:
+    """Tests for DatabaseService's ambient unit-of-work session."""
+
+    def test_calls_share_one_commit(self, session_factory, database_module):
+        """Writes inside a unit of work commit once on exit and roll back together."""
+        from unittest.mock import AsyncMock, patch
+        from sqlalchemy import select, func
+        from backend.models.database import Quote
+
+        async def count_quotes():
+            async with session_factory() as session:
+                return (await session.execute(select(func.count(Quote.id)))).scalar()
+
+        async def run():
+            invalidate = AsyncMock()
+
+            with patch.object(database_module, "async_session_factory", session_factory), \
+                    patch.object(database_module.cache_service, "invalidate_quote_context", invalidate):
+                db = database_module.DatabaseService()
+
+                async with db.unit_of_work() as session:
+                    quote = await db.create_quote(contractor_id="c-1", transcription="", job_type="deck", subtotal=100)
+                    assert (await db.get_quote(quote.id)) is quote  # same session
+                    await db.update_quote(quote.id, was_edited=True, edit_details={"x": 1})
+                    assert await count_quotes() == 0  # not committed yet
+                    invalidate.assert_not_called()  # deferred to commit
+
+                assert await count_quotes() == 1
+                invalidate.assert_awaited_once_with("c-1")
+                assert session.in_transaction() is False
+
+                with pytest.raises(RuntimeError):
+                    async with db.unit_of_work():
+                        await db.create_quote(contractor_id="c-1", transcription="")
+                        raise RuntimeError("boom")
+                assert await count_quotes() == 1
+
+                # Outside a unit of work each call still commits on its own
+                await db.create_quote(contractor_id="c-1", transcription="")
+                assert await count_quotes() == 2
+
+        asyncio.run(run())
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,111 @@
+"""
+Tests for the content-addressed PDF cache.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# PDF Cache Tests
+# =============================================================================
+
+class TestPDFCache:
+    """Tests for the content-addressed PDF cache."""
+
+    def _job(self, **overrides):
+        job = {
+            "quote_data": {"id": "q-1", "line_items": [{"name": "Deck", "amount": 100}], "total": 100},
+            "contractor": {"business_name": "Test Co", "logo_hash": None},
+            "terms": {},
+            "watermark": False,
+            "template": "modern",
+            "accent_color": None,
+        }
+        job.update(overrides)
+        return job
+
+    def test_key_tracks_render_inputs(self):
+        """Any change to quote, branding or watermark produces a new key."""
+        from backend.services.pdf_cache import pdf_cache_key
+
+        base = pdf_cache_key(self._job())
+        assert pdf_cache_key(self._job()) == base
+
+        edited = self._job()
+        edited["quote_data"] = {**edited["quote_data"], "total": 150}
+        assert pdf_cache_key(edited) != base
+        assert pdf_cache_key(self._job(accent_color="#ff0000")) != base
+        assert pdf_cache_key(self._job(watermark=True)) != base
+        assert pdf_cache_key(self._job(contractor={"business_name": "Test Co", "logo_hash": "abc"})) != base
+
+    def test_quote_job_is_independent_of_render_time(self):
+        """Date and number come from the quote, so a cached PDF matches a fresh render."""
+        from datetime import datetime
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from backend.services.pdf_cache import pdf_cache_key, quote_pdf_job
+        from backend.services import pdf_generator
+
+        quote = SimpleNamespace(
+            id="q-1", customer_name="Pat", customer_address=None, customer_phone=None,
+            job_description="Deck", line_items=[{"name": "Deck", "amount": 100}],
+            subtotal=100, total=100, estimated_days=2, is_grace_quote=False,
+            created_at=datetime(2026, 3, 4, 5, 6),
+        )
+        contractor = SimpleNamespace(
+            id="c-1", business_name="Test Co", owner_name=None, email=None, phone=None, address=None,
+            logo_hash=None, pdf_template=None, pdf_accent_color=None,
+        )
+        job = quote_pdf_job(quote, contractor)
+        assert job["quote_data"]["quote_date"] == "March 04, 2026"
+        assert job["quote_data"]["quote_number"] == "202603040506"
+
+        title = pdf_generator.PDFGeneratorService()._build_title_section
+        with patch.object(pdf_generator, "datetime") as clock:
+            clock.now.return_value = datetime(2027, 1, 1)
+            subtitle = title(job["quote_data"])[1].text
+        assert "#202603040506" in subtitle and "March 04, 2026" in subtitle
+        assert pdf_cache_key(quote_pdf_job(quote, contractor)) == pdf_cache_key(job)
+
+    def test_renders_once_then_serves_from_cache(self):
+        """Concurrent and repeat requests share one render; storage backs the LRU."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from backend.services.pdf_cache import PDFCacheService
+
+        stored = {}
+        storage = MagicMock()
+        storage.download_key = AsyncMock(side_effect=lambda key: stored.get(key))
+        storage.upload = AsyncMock(side_effect=lambda key, data, **kw: stored.__setitem__(key, data))
+
+        async def slow_render(**job):
+            await asyncio.sleep(0.01)
+            return b"%PDF-rendered"
+
+        pool = MagicMock()
+        pool.render = AsyncMock(side_effect=slow_render)
+
+        async def run(cache):
+            return await asyncio.gather(*[cache.get_or_render(self._job()) for _ in range(3)])
+
+        with patch("backend.services.pdf_cache.storage_service", storage), \
+             patch("backend.services.pdf_cache.get_pdf_render_pool", return_value=pool):
+            cache = PDFCacheService(max_entries=4)
+            results = asyncio.run(run(cache))
+            # A fresh worker (empty LRU) finds it in storage
+            other_worker = PDFCacheService(max_entries=4)
+            from_storage = asyncio.run(other_worker.get_or_render(self._job()))
+
+        assert results == [b"%PDF-rendered"] * 3
+        assert pool.render.await_count == 1
+        assert cache.stats["renders"] == 1
+        assert from_storage == b"%PDF-rendered"
+        assert other_worker.stats["storage_hits"] == 1
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Tests for the bounded PDF render pool.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# PDF Render Pool Tests
+# =============================================================================
+
+class TestPDFRenderPool:
+    """Tests for the bounded PDF render pool."""
+
+    def test_rejects_when_saturated(self):
+        """Renders beyond workers + max_queue fail fast with PDFRenderBusy."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from backend.services.pdf_render_pool import PDFRenderPool, PDFRenderBusy
+
+        release = threading.Event()
+
+        def slow_render(job):
+            release.wait(5)
+            return b"%PDF-" + job["quote_data"]["id"].encode()
+
+        pool = PDFRenderPool(workers=1, max_queue=1)
+        pool._executor = ThreadPoolExecutor(max_workers=1)
+
+        async def run():
+            admitted = [
+                asyncio.ensure_future(pool.render(quote_data={"id": str(i)}, contractor={}))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0.05)
+            with pytest.raises(PDFRenderBusy) as exc_info:
+                await pool.render(quote_data={"id": "x"}, contractor={})
+            release.set()
+            return exc_info.value, await asyncio.gather(*admitted)
+
+        with patch("backend.services.pdf_render_pool._render_in_worker", slow_render):
+            busy, results = asyncio.run(run())
+        pool.shutdown()
+
+        assert busy.retry_after >= 1
+        assert results == [b"%PDF-0", b"%PDF-1"]
+        assert pool.get_stats()["in_flight"] == 0
+        assert pool.get_stats()["rejected"] == 1
+
+    def test_timed_out_render_keeps_its_slot(self):
+        """A render the caller gave up on holds its slot until the worker finishes it."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from backend.services.pdf_render_pool import PDFRenderPool, PDFRenderBusy
+
+        release = threading.Event()
+
+        def slow_render(job):
+            release.wait(5)
+            return b"%PDF-"
+
+        pool = PDFRenderPool(workers=1, max_queue=0, timeout_seconds=0.05)
+        pool._executor = ThreadPoolExecutor(max_workers=1)
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.render(quote_data={"id": "1"}, contractor={})
+            with pytest.raises(PDFRenderBusy):
+                await pool.render(quote_data={"id": "2"}, contractor={})
+            busy_in_flight = pool.get_stats()["in_flight"]
+            release.set()
+            for _ in range(100):
+                if pool.get_stats()["in_flight"] == 0:
+                    break
+                await asyncio.sleep(0.01)
+            return busy_in_flight, await pool.render(quote_data={"id": "3"}, contractor={})
+
+        with patch("backend.services.pdf_render_pool._render_in_worker", slow_render):
+            busy_in_flight, result = asyncio.run(run())
+        pool.shutdown()
+
+        assert busy_in_flight == 1
+        assert result == b"%PDF-"
+        assert pool.get_stats()["in_flight"] == 0
+
+    def test_busy_handler_returns_503_with_retry_after(self):
+        """Saturation is surfaced as a retryable 503."""
+        from backend.services.pdf_render_pool import PDFRenderBusy, pdf_render_busy_handler
+
+        response = asyncio.run(pdf_render_busy_handler(None, PDFRenderBusy(retry_after=4)))
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "4"
+
+    def test_worker_renders_pdf_bytes(self):
+        """The worker entry point renders plain dicts to PDF bytes."""
+        from backend.services.pdf_render_pool import _render_in_worker
+
+        pdf_bytes = _render_in_worker({
+            "quote_data": {"id": "q-1", "customer_name": "Test", "line_items": [], "subtotal": 0},
+            "contractor": {"business_name": "Test Co"},
+            "terms": {},
+        })
+        assert pdf_bytes.startswith(b"%PDF")
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
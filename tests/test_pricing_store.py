@@ -0,0 +1,187 @@
+"""
+Tests for the normalized pricing category store
+(pricing_categories / learning_statements behind the pricing_knowledge view).
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Normalized Pricing Category Store Tests
+# =============================================================================
+
+class TestPricingCategoryStore:
+    """Tests for pricing_categories / learning_statements behind the pricing_knowledge view."""
+
+    LEGACY_KNOWLEDGE = {
+        "categories": {
+            "deck": {
+                "display_name": "Decks",
+                "tailored_prompt": "Price decks by the square foot.",
+                "learned_adjustments": [
+                    "Add 15% for second-story decks",
+                    {
+                        "text": "Demolition runs $1,200 for decks over 300 sqft",
+                        "quality_score": 72.0,
+                        "created_at": "2026-01-02T03:04:05",
+                        "source": "correction",
+                        "outcome_boost": 0.0,
+                    },
+                ],
+                "samples": 3,
+                "quote_count": 7,
+                "confidence": 0.62,
+                "correction_count": 3,
+                "last_acceptance_at": "2026-02-01T00:00:00",
+            },
+        },
+        "global_rules": ["Never quote below $500"],
+    }
+
+    def test_legacy_blob_moves_to_rows_on_first_write(self, session_factory, database_module):
+        """The view keeps the old dict shape before and after a contractor's categories move to rows."""
+        import copy
+        from unittest.mock import AsyncMock, patch
+        from sqlalchemy import select
+        from backend.models.database import LearningStatement, PricingCategory, PricingModel
+
+        async def run():
+            async with session_factory() as session:
+                session.add(PricingModel(contractor_id="c-1", pricing_knowledge=copy.deepcopy(self.LEGACY_KNOWLEDGE)))
+                await session.commit()
+
+            with patch.object(database_module, "async_session_factory", session_factory), \
+                    patch.object(database_module.cache_service, "invalidate_quote_context", AsyncMock()):
+                db = database_module.DatabaseService()
+                before = (await db.get_pricing_model("c-1")).pricing_knowledge
+
+                assert await db.increment_category_quote_count("c-1", "deck")
+                assert await db.ensure_category_exists("c-1", "fence", display_name="Fences")
+                after = (await db.get_pricing_model("c-1")).pricing_knowledge
+
+            async with session_factory() as session:
+                pricing_model = (await session.execute(select(PricingModel))).scalar_one()
+                rows = (await session.execute(select(PricingCategory.key, PricingCategory.quote_count))).all()
+                statements = (await session.execute(select(LearningStatement.text))).scalars().all()
+            return before, after, pricing_model, dict(rows), statements
+
+        before, after, pricing_model, rows, statements = asyncio.run(run())
+
+        assert before == self.LEGACY_KNOWLEDGE  # Not normalized yet: the blob as is
+        assert pricing_model.categories_normalized
+        assert pricing_model.pricing_knowledge == {"global_rules": ["Never quote below $500"]}
+        assert rows == {"deck": 8, "fence": 0}
+        assert len(statements) == 2
+
+        deck = after["categories"]["deck"]
+        legacy_deck = self.LEGACY_KNOWLEDGE["categories"]["deck"]
+        assert deck["learned_adjustments"] == legacy_deck["learned_adjustments"]
+        assert deck["last_acceptance_at"] == legacy_deck["last_acceptance_at"]
+        assert (deck["display_name"], deck["confidence"], deck["quote_count"]) == ("Decks", 0.62, 8)
+        assert after["categories"]["fence"]["display_name"] == "Fences"
+        assert after["global_rules"] == ["Never quote below $500"]
+
+    def test_quote_is_counted_once(self, session_factory, database_module):
+        """A repeated register_category task for the same quote doesn't bump quote_count again."""
+        from unittest.mock import AsyncMock, patch
+        from sqlalchemy import select
+        from backend.models.database import PricingCategory, PricingModel, Quote
+
+        async def run():
+            async with session_factory() as session:
+                session.add(PricingModel(contractor_id="c-1", pricing_knowledge={}, categories_normalized=True))
+                session.add(Quote(id="q-1", contractor_id="c-1", transcription="", job_type="deck"))
+                await session.commit()
+
+            with patch.object(database_module, "async_session_factory", session_factory), \
+                    patch.object(database_module.cache_service, "invalidate_quote_context", AsyncMock()):
+                db = database_module.DatabaseService()
+                for _ in range(3):
+                    assert await db.increment_category_quote_count("c-1", "deck", quote_id="q-1")
+                assert await db.increment_category_quote_count("c-1", "deck", quote_id="q-2")  # Unknown quote
+
+            async with session_factory() as session:
+                count = (await session.execute(select(PricingCategory.quote_count))).scalar_one()
+                counted_at = (await session.execute(select(Quote.category_counted_at))).scalar_one()
+            return count, counted_at
+
+        count, counted_at = asyncio.run(run())
+
+        assert count == 1
+        assert counted_at is not None
+
+    def test_concurrent_category_write_is_retried_not_lost(self, session_factory, database_module):
+        """A write that lost the version check re-reads the row instead of overwriting it."""
+        import copy
+        from unittest.mock import AsyncMock, patch
+        from sqlalchemy import select
+        from backend.models.database import PricingCategory
+
+        pricing_store = database_module.pricing_store
+
+        async def run():
+            real_get_category = pricing_store.get_category
+            calls = []
+
+            async def get_category_then_concurrent_loss(session, pricing_model, key, **kwargs):
+                row, created = await real_get_category(session, pricing_model, key, **kwargs)
+                calls.append(key)
+                if len(calls) == 1:
+                    # Another request records a loss between our read and our write
+                    async with session_factory() as other:
+                        concurrent = (await other.execute(select(PricingCategory))).scalar_one()
+                        concurrent.loss_count = 1
+                        concurrent.confidence = 0.47
+                        await other.commit()
+                return row, created
+
+            with patch.object(database_module, "async_session_factory", session_factory), \
+                    patch.object(database_module.cache_service, "invalidate_quote_context", AsyncMock()):
+                db = database_module.DatabaseService()
+                await db.create_pricing_model("c-1", pricing_knowledge=copy.deepcopy(self.LEGACY_KNOWLEDGE))
+
+                with patch.object(pricing_store, "get_category", get_category_then_concurrent_loss):
+                    result = await db.apply_acceptance_to_pricing_model("c-1", "deck", signal_type="accepted")
+                deck = (await db.get_pricing_model("c-1")).pricing_knowledge["categories"]["deck"]
+            return calls, result, deck
+
+        calls, result, deck = asyncio.run(run())
+
+        assert calls == ["deck", "deck"]  # First attempt hit StaleDataError
+        assert result["old_confidence"] == 0.47  # Retried on the concurrent write's data
+        assert (deck["loss_count"], deck["acceptance_count"]) == (1, 1)
+        assert deck["confidence"] == pytest.approx(0.52)
+
+    def test_full_document_write_keeps_newer_counts(self, session_factory, database_module):
+        """Saving a stale pricing_knowledge dict doesn't undo quote_count increments made since."""
+        import copy
+        from unittest.mock import AsyncMock, patch
+
+        async def run():
+            with patch.object(database_module, "async_session_factory", session_factory), \
+                    patch.object(database_module.cache_service, "invalidate_quote_context", AsyncMock()):
+                db = database_module.DatabaseService()
+                await db.create_pricing_model("c-1", pricing_knowledge=copy.deepcopy(self.LEGACY_KNOWLEDGE))
+                stale = (await db.get_pricing_model("c-1")).pricing_knowledge
+
+                await db.increment_category_quote_count("c-1", "deck")
+                stale["categories"]["deck"]["display_name"] = "Decks & Patios"
+                stale["categories"]["patio"] = {"display_name": "Patios", "quote_count": 3}
+                await db.update_pricing_model("c-1", pricing_knowledge=stale)
+                categories = (await db.get_pricing_model("c-1")).pricing_knowledge["categories"]
+            return categories
+
+        categories = asyncio.run(run())
+
+        assert categories["deck"]["display_name"] == "Decks & Patios"
+        assert categories["deck"]["quote_count"] == 8
+        assert categories["patio"]["quote_count"] == 3  # New rows take the dict's counters
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,67 @@
+"""
+Tests for cached principal resolution in get_current_user.
+"""
+
+import asyncio
+import pytest
+import sys
+
+
+# =============================================================================
+# Principal Cache Tests
+# =============================================================================
+
+class TestPrincipalCache:
+    """Tests for cached principal resolution in get_current_user."""
+
+    def test_cached_principal_skips_db_until_invalidated(self):
+        """A token's second request does no queries; invalidation forces a reload."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock, patch
+        import jose.jwt  # noqa: F401 - keep its crypto backend out of the patched modules
+        from backend.services.cache import cache_service  # the instance auth will use
+
+        with patch.dict(sys.modules, {"backend.services.database": MagicMock()}):
+            sys.modules.pop("backend.services.auth", None)
+            import backend.services.auth as auth
+
+        user = SimpleNamespace(id="u-1", email="a@b.co", is_active=True, is_verified=False)
+        contractor_result = MagicMock()
+        contractor_result.scalar_one_or_none.return_value = "c-1"
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=contractor_result)
+        get_user = AsyncMock(return_value=user)
+
+        token = auth.create_access_token({"sub": "u-1"})
+        payload = auth.decode_access_token(token)
+        assert payload["jti"]
+
+        async def run():
+            with patch.object(auth, "get_user_by_id", get_user):
+                first = await auth._resolve_principal(db, payload)
+                second = await auth._resolve_principal(db, payload)
+                assert get_user.await_count == 1 and db.execute.await_count == 1
+
+                user.is_active = False
+                await cache_service.invalidate_principals("u-1")
+                third = await auth._resolve_principal(db, payload)
+                assert get_user.await_count == 2
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+        assert first == second == {
+            "id": "u-1",
+            "email": "a@b.co",
+            "is_active": True,
+            "is_verified": False,
+            "contractor_id": "c-1",
+        }
+        assert third["is_active"] is False
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,178 @@
+"""
+Tests for the cache-friendly quote prompt layout and memoized prompt fragments.
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Prompt Caching Layout Tests
+# =============================================================================
+
+class TestQuotePromptCaching:
+    """Tests for the cache-friendly quote prompt layout."""
+
+    PRICING_MODEL = {
+        "labor_rate_hourly": 80,
+        "pricing_philosophy": "Price for quality, never race to the bottom.",
+        "pricing_knowledge": {
+            "categories": {
+                "deck": {"display_name": "Decks", "tailored_prompt": "Decks by square foot.",
+                         "learned_adjustments": ["Increase demolition by 10%"]},
+                "fence": {"display_name": "Fences", "tailored_prompt": "Fences by linear foot."},
+            },
+            "global_rules": ["Never quote below $500"],
+        },
+    }
+
+    def test_stable_blocks_are_shared_between_requests(self, quote_generator):
+        """Only the request block differs between two quotes for one contractor."""
+        service = quote_generator.QuoteGenerationService.__new__(quote_generator.QuoteGenerationService)
+        contractor = {"business_name": "Acme Decks"}
+
+        deck, _ = service._build_quote_prompt(
+            "Rush job: tear out and rebuild a 12x16 deck", contractor, self.PRICING_MODEL,
+            terms={"deposit_percent": 40}, detected_category="deck",
+        )
+        fence, _ = service._build_quote_prompt(
+            "120 feet of cedar fence", contractor, self.PRICING_MODEL,
+            terms={"deposit_percent": 40}, detected_category="fence",
+        )
+
+        assert deck.system == fence.system
+        assert [block.get("cache_control") for block in deck.system] == [{"type": "ephemeral"}] * 2
+        assert "Acme Decks" in deck.system[1]["text"]
+        assert "Never quote below $500" in deck.system[1]["text"]
+
+        # Per-request content comes last and is never cached
+        assert deck.messages == [{"role": "user", "content": deck.content}]
+        assert "cache_control" not in deck.content[0]
+        assert "tear out and rebuild" in deck.content[0]["text"]
+        assert "Increase demolition by 10%" in deck.content[0]["text"]
+        assert "Increase demolition" not in "".join(block["text"] for block in deck.system)
+
+    def test_cache_usage_recorded_per_request(self, quote_generator):
+        """Each call sends the blocks and records how much input came from the cache."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock
+
+        stats = quote_generator.prompt_cache_stats
+        service = quote_generator.QuoteGenerationService.__new__(quote_generator.QuoteGenerationService)
+        service.model = "test-model"
+        service.max_tokens = 1024
+        service.client = MagicMock()
+        responses = [
+            SimpleNamespace(input_tokens=300, cache_creation_input_tokens=2700, cache_read_input_tokens=0),
+            SimpleNamespace(input_tokens=300, cache_creation_input_tokens=0, cache_read_input_tokens=2700),
+        ]
+        service.client.messages.create = AsyncMock(side_effect=[
+            SimpleNamespace(
+                usage=usage,
+                content=[SimpleNamespace(type="tool_use", name="generate_quote", input={"job_type": "deck"})],
+            )
+            for usage in responses
+        ])
+        prompt, _ = service._build_quote_prompt("Build a deck", {"business_name": "Acme"}, self.PRICING_MODEL)
+
+        before = stats.get_stats().get("quote_generation", {"requests": 0, "hits": 0, "cache_read_tokens": 0})
+        for _ in responses:
+            assert asyncio.run(service._call_claude_with_tool(prompt)) == {"job_type": "deck"}
+        after = stats.get_stats()["quote_generation"]
+
+        kwargs = service.client.messages.create.call_args.kwargs
+        assert kwargs["system"] == prompt.system
+        assert kwargs["messages"] == prompt.messages
+        assert after["requests"] - before["requests"] == 2
+        assert after["hits"] - before["hits"] == 1
+        assert after["cache_read_tokens"] - before["cache_read_tokens"] == 2700
+        assert stats.record("quote_generation", responses[1]) == 0.9
+
+
+# =============================================================================
+# Prompt Fragment Cache Tests
+# =============================================================================
+
+class TestPromptFragmentCache:
+    """Tests for memoized quote prompt fragments."""
+
+    @staticmethod
+    def _pricing_model(version, tailored="Price decks by the square foot."):
+        return {
+            "labor_rate_hourly": 80,
+            "version": version,
+            "pricing_knowledge": {
+                "categories": {
+                    "deck": {"display_name": "Decks", "tailored_prompt": tailored, "samples": 4},
+                    "fence": {"display_name": "Fences", "samples": 2},
+                },
+                "global_rules": ["Never quote below $500"],
+            },
+        }
+
+    def test_fragments_reused_until_version_changes(self):
+        """Same snapshot version reuses fragments; a new version renders fresh ones."""
+        from unittest.mock import patch
+        import backend.services  # noqa: F401  (prompts import services; load them first)
+        from backend.prompts import quote_generation
+        from backend.services.prompt_fragments import PromptFragmentCache
+
+        cache = PromptFragmentCache()
+        corrections = [{
+            "job_type": "deck",
+            "original_line_items": [{"name": "Demolition", "amount": 800}],
+            "final_line_items": [{"name": "Demolition", "amount": 1200}],
+        }]
+
+        def build(pricing_model, contractor_id="c-1", transcription="Build a deck"):
+            return quote_generation.build_quote_prompt(
+                transcription=transcription, contractor_name="Acme", pricing_model=pricing_model,
+                correction_examples=corrections, detected_category="deck", contractor_id=contractor_id,
+            ).text
+
+        with patch.object(quote_generation, "get_prompt_fragment_cache", return_value=cache):
+            first = build(self._pricing_model("v1"))
+            assert cache.get_stats()["misses"] == 3  # catalog, tailored section, corrections
+            second = build(self._pricing_model("v1"), transcription="Build a bigger deck")
+            assert cache.get_stats()["hits"] == 3
+            assert first == build(self._pricing_model("v1"), contractor_id=None)
+
+            # A learning changed the tailored prompt: the snapshot has a new version
+            updated = build(self._pricing_model("v2", tailored="Price decks per board foot."))
+
+        assert "Build a bigger deck" in second
+        assert "per board foot" in updated and "by the square foot" not in updated
+        assert cache.get_stats()["fragments"] == 3  # v1 fragments were dropped
+
+    def test_pricing_model_writes_drop_fragments(self, session_factory, database_module):
+        """Category edits (update_pricing_model) drop the contractor's fragments in this worker."""
+        from unittest.mock import AsyncMock, patch
+        from backend.services.prompt_fragments import PromptFragmentCache
+
+        cache = PromptFragmentCache()
+
+        async def run():
+            with patch.object(database_module, "async_session_factory", session_factory), \
+                    patch.object(database_module, "get_prompt_fragment_cache", return_value=cache), \
+                    patch.object(database_module.cache_service, "invalidate_quote_context", AsyncMock()):
+                db = database_module.DatabaseService()
+                await db.create_pricing_model("c-1", pricing_knowledge=self._pricing_model("v1")["pricing_knowledge"])
+                cache.get("c-1", "v1", None, "catalog", lambda: "catalog")
+                cache.get("c-2", "v1", None, "catalog", lambda: "other contractor")
+
+                knowledge = self._pricing_model("v1")["pricing_knowledge"]
+                knowledge["categories"]["deck"]["display_name"] = "Composite Decks"
+                await db.update_pricing_model("c-1", pricing_knowledge=knowledge)
+
+        asyncio.run(run())
+
+        stats = cache.get_stats()
+        assert (stats["contractors"], stats["invalidations"]) == (1, 1)  # Only c-1 was dropped
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""
+Tests for the quote context snapshot cache.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+
+
+# =============================================================================
+# Quote Context Cache Tests
+# =============================================================================
+
+class TestQuoteContextCache:
+    """Tests for the quote context snapshot cache."""
+
+    def test_local_ttl_cache_expires_and_evicts(self):
+        """Local fallback tier expires entries and evicts least recently used."""
+        from backend.services.cache import LocalTTLCache
+
+        cache = LocalTTLCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+        cache.set("d", 4, ttl=0)
+        time.sleep(0.01)
+        assert cache.get("d") is None
+
+    def test_snapshot_roundtrip_without_redis(self):
+        """Snapshots are cached in-process and invalidated when Redis is absent."""
+        from backend.services.cache import cache_service
+
+        snapshot = {"contractor": {"id": "c-1"}, "pricing_model": {"pricing_knowledge": {}}}
+
+        async def run():
+            await cache_service.set_quote_context("c-1", snapshot)
+            cached = await cache_service.get_quote_context("c-1")
+            cached["contractor"]["id"] = "mutated"
+            again = await cache_service.get_quote_context("c-1")
+            await cache_service.invalidate_quote_context("c-1")
+            gone = await cache_service.get_quote_context("c-1")
+            return again, gone
+
+        again, gone = asyncio.run(run())
+        assert again == snapshot  # Callers get their own copy
+        assert gone is None
+
+    def test_correction_examples_prefer_job_type(self):
+        """Type-specific correction examples win, with a general fallback."""
+        from unittest.mock import MagicMock, patch
+
+        # Avoid creating the real engine (SQLite rejects the pool settings)
+        with patch.dict(sys.modules, {"backend.services.database": MagicMock()}):
+            sys.modules.pop("backend.services.quote_context", None)
+            from backend.services.quote_context import QuoteContextService
+
+        context = {
+            "correction_examples": {
+                "all": [{"job_type": "fence"}],
+                "by_job_type": {"deck": [{"job_type": "deck"}]},
+            }
+        }
+        service = QuoteContextService()
+
+        assert service.get_correction_examples(context, "deck") == [{"job_type": "deck"}]
+        assert service.get_correction_examples(context, "roof") == [{"job_type": "fence"}]
+
+    def test_snapshot_pool_keeps_older_job_types(self, session_factory, database_module):
+        """A job type edited long ago still gets examples next to a busy one."""
+        from datetime import datetime, timedelta
+        from unittest.mock import patch
+        from backend.models.database import Quote
+
+        async def run():
+            now = datetime.utcnow()
+            async with session_factory() as session:
+                for i in range(60):
+                    session.add(Quote(
+                        contractor_id="c-1", transcription="", job_type="fence", was_edited=True,
+                        total=100 + i, updated_at=now - timedelta(minutes=i),
+                    ))
+                for i in range(2):
+                    session.add(Quote(
+                        contractor_id="c-1", transcription="", job_type="deck", was_edited=True,
+                        total=900 + i, updated_at=now - timedelta(days=30 + i),
+                    ))
+                await session.commit()
+
+            with patch.object(database_module, "async_session_factory", session_factory):
+                examples = await database_module.DatabaseService().get_correction_examples(
+                    "c-1", limit=5, per_job_type=True
+                )
+            return examples
+
+        examples = asyncio.run(run())
+
+        assert [e["final_total"] for e in examples] == [100, 101, 102, 103, 104, 900, 901]
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
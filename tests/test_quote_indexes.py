@@ -0,0 +1,140 @@
+"""
+Tests for the maintained per-contractor quote summaries:
+- Quote total percentile index (pricing sanity check)
+- Quote/edit/outcome counters
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Quote Total Percentile Index Tests
+# =============================================================================
+
+class TestQuoteTotalIndex:
+    """Tests for the incremental percentile index behind the sanity check."""
+
+    def test_histogram_tracks_exact_percentiles(self):
+        """Median/P95 from the histogram stay within 1% of the exact values."""
+        import random
+        import statistics
+        from backend.services.quote_total_index import QuoteTotalHistogram
+
+        rng = random.Random(7)
+        totals = [rng.lognormvariate(8, 0.8) for _ in range(501)]
+        histogram = QuoteTotalHistogram.from_totals(totals)
+
+        exact_sorted = sorted(totals)
+        exact_p95 = exact_sorted[int(len(totals) * 0.95)]
+        assert histogram.median() == pytest.approx(statistics.median(totals), rel=0.01)
+        assert histogram.p95() == pytest.approx(exact_p95, rel=0.01)
+
+        histogram.remove(totals[0])
+        assert histogram.count == 500
+
+    def test_summaries_follow_quote_writes(self, session_factory):
+        """Create/update/delete keep per-category and contractor-wide rows in sync."""
+        from sqlalchemy import select
+        from backend.models.database import Quote, QuoteTotalSummary
+        from backend.services.quote_total_index import (
+            apply_quote_total_change,
+            get_quote_total_histogram,
+        )
+
+        async def run():
+            async with session_factory() as session:
+                # History that predates the index: first write backfills from a scan
+                for total in (1000, 2000):
+                    session.add(Quote(contractor_id="c-1", transcription="", job_type="deck", total=total))
+                await session.commit()
+
+                quote = Quote(contractor_id="c-1", transcription="", job_type="deck", total=3000)
+                session.add(quote)
+                await apply_quote_total_change(session, "c-1", new=("deck", 3000))
+                await session.commit()
+
+                deck = await get_quote_total_histogram(session, "c-1", "deck")
+                assert deck.count == 3
+                assert deck.median() == pytest.approx(2000, rel=0.01)
+
+                # Recategorize and reprice
+                quote.job_type, quote.total = "fence", 500
+                await apply_quote_total_change(session, "c-1", old=("deck", 3000), new=("fence", 500))
+                await session.commit()
+
+                assert (await get_quote_total_histogram(session, "c-1", "deck")).count == 2
+                assert (await get_quote_total_histogram(session, "c-1", "fence")).count == 1
+                assert (await get_quote_total_histogram(session, "c-1")).count == 3
+
+                await session.delete(quote)
+                await apply_quote_total_change(session, "c-1", old=("fence", 500))
+                await session.commit()
+
+                assert (await get_quote_total_histogram(session, "c-1", "fence")).count == 0
+                rows = (await session.execute(select(QuoteTotalSummary))).scalars().all()
+                assert {row.category for row in rows} == {"deck", "fence", "*"}
+
+        asyncio.run(run())
+
+
+class TestQuoteStats:
+    """Tests for the maintained quote/edit/outcome counters."""
+
+    def test_counters_follow_quote_writes(self, session_factory):
+        """Create, edit, outcome and delete keep category and contractor rows in sync."""
+        from backend.models.database import Quote
+        from backend.services.quote_stats import (
+            apply_quote_stats_change,
+            get_quote_stats,
+            quote_stats_entry,
+        )
+
+        async def run():
+            async with session_factory() as session:
+                # History that predates the counters is read by aggregate
+                session.add(Quote(contractor_id="c-1", transcription="", job_type="deck", was_edited=True))
+                session.add(Quote(contractor_id="c-1", transcription="", job_type="deck", outcome="won"))
+                await session.commit()
+                assert (await get_quote_stats(session, "c-1"))["deck"].quotes == 2
+
+                # First maintained write backfills rows
+                quote = Quote(contractor_id="c-1", transcription="", job_type="fence")
+                session.add(quote)
+                await apply_quote_stats_change(session, "c-1", new=quote_stats_entry(quote))
+                await session.commit()
+
+                stats = await get_quote_stats(session, "c-1")
+                assert stats["*"].quotes == 3
+                assert stats["deck"].edit_rate == 50.0
+                assert stats["fence"].quotes == 1
+
+                # Edit and lose the fence quote
+                old = quote_stats_entry(quote)
+                quote.was_edited, quote.outcome = True, "lost"
+                await apply_quote_stats_change(session, "c-1", old=old, new=quote_stats_entry(quote))
+                await session.commit()
+
+                stats = await get_quote_stats(session, "c-1")
+                assert (stats["*"].edits, stats["*"].wins, stats["*"].losses) == (2, 1, 1)
+                assert stats["*"].win_rate == 50.0
+                assert stats["fence"].edits == 1
+
+                old = quote_stats_entry(quote)
+                await session.delete(quote)
+                await apply_quote_stats_change(session, "c-1", old=old)
+                await session.commit()
+
+                stats = await get_quote_stats(session, "c-1")
+                assert stats["fence"].quotes == 0
+                assert (stats["*"].quotes, stats["*"].losses) == (2, 0)
+
+        asyncio.run(run())
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""
+Tests for streaming quote generation (/api/quotes/generate/stream).
+"""
+
+import asyncio
+import pytest
+
+
+# =============================================================================
+# Streaming Quote Generation Tests
+# =============================================================================
+
+class TestQuoteStreaming:
+    """Tests for streaming quote generation (/api/quotes/generate/stream)."""
+
+    def test_line_items_stream_before_final_quote(self, quote_generator):
+        """Completed line items are yielded as the tool input grows, then the validated quote."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock, patch
+
+        items = [
+            {"name": "Demolition", "amount": 499.6},
+            {"name": "Framing", "amount": 1200},
+            {"name": "Decking", "amount": 3000},
+        ]
+        final_input = {
+            "job_type": "deck",
+            "job_description": "New deck",
+            "line_items": items,
+            "subtotal": 1,
+            "confidence": "high",
+        }
+        snapshots = [
+            {"job_description": "New deck"},
+            {"line_items": [{"name": "Demo"}]},
+            {"line_items": [items[0], {"name": "Fra"}]},
+            {"line_items": [items[0], items[1], {"name": "Deck"}]},
+        ]
+
+        class FakeStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def __aiter__(self):
+                yield SimpleNamespace(type="message_start")
+                for snapshot in snapshots:
+                    yield SimpleNamespace(type="input_json", snapshot=snapshot)
+
+            async def get_final_message(self):
+                return SimpleNamespace(content=[
+                    SimpleNamespace(type="tool_use", name="generate_quote", input=final_input),
+                ])
+
+        service = quote_generator.QuoteGenerationService.__new__(quote_generator.QuoteGenerationService)
+        service.client = MagicMock()
+        service.client.messages.stream.return_value = FakeStream()
+        service.model = "test-model"
+        service.max_tokens = 1024
+
+        async def collect():
+            prompt = quote_generator.QuotePrompt(system=[], content=[{"type": "text", "text": "prompt"}])
+            with patch.object(quote_generator, "build_quote_prompt", return_value=prompt):
+                return [
+                    event async for event in service.stream_quote(
+                        transcription="build a deck",
+                        contractor={"business_name": "Acme"},
+                        pricing_model={},
+                    )
+                ]
+
+        events = asyncio.run(collect())
+
+        assert [kind for kind, _ in events] == ["line_item"] * 3 + ["quote"]
+        assert [payload["index"] for _, payload in events[:3]] == [0, 1, 2]
+        # Partial items are never sent; the last one arrives from the final message
+        assert [payload["item"] for _, payload in events[:3]] == items
+        quote = events[-1][1]
+        assert quote["subtotal"] == 4700  # rounded and recalculated
+        assert quote["transcription"] == "build a deck"
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
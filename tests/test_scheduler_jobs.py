@@ -0,0 +1,252 @@
+"""
+Tests for batched and sharded scheduler jobs.
+"""
+
+import asyncio
+import pytest
+import sys
+
+
+# =============================================================================
+# Set-Based Scheduler Job Tests
+# =============================================================================
+
+class TestSetBasedSchedulerJobs:
+    """Tests for batched scheduler jobs and bounded email fan-out."""
+
+    @staticmethod
+    def _count_selects(session_factory):
+        from sqlalchemy import event
+
+        counter = {"selects": 0}
+
+        def before(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                counter["selects"] += 1
+
+        event.listen(session_factory.kw["bind"].sync_engine, "before_cursor_execute", before)
+        return counter
+
+    def test_fan_out_bounds_concurrency_and_reports_errors(self):
+        """At most `concurrency` sends run at once; failures don't stop the rest."""
+        from backend.services.fan_out import fan_out
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def send(n):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if n == 3:
+                raise RuntimeError("bounced")
+
+        results = asyncio.run(fan_out(range(10), send, concurrency=3, min_interval=0))
+
+        assert in_flight["max"] == 3
+        assert [n for n, _ in results] == list(range(10))
+        assert [n for n, error in results if error is not None] == [3]
+
+    def test_quote_followups_anti_join_and_bulk_insert(self, session_factory):
+        """Stale quotes get one task each; quotes with a pending task are skipped."""
+        from datetime import datetime, timedelta
+        from unittest.mock import MagicMock, patch
+        from sqlalchemy import select
+        from backend.models.database import Quote, Task
+        from backend.services.scheduler import check_quote_followups
+
+        async def run():
+            now = datetime.utcnow()
+            async with session_factory() as session:
+                for i in range(4):
+                    session.add(Quote(
+                        id=f"q-{i}", contractor_id="c-1", transcription="", customer_name=f"Customer {i}",
+                        status="sent", sent_at=now - timedelta(days=5), view_count=0,
+                    ))
+                session.add(Quote(
+                    id="q-viewed", contractor_id="c-1", transcription="", customer_name="Viewer",
+                    status="viewed", first_viewed_at=now - timedelta(days=8), view_count=2,
+                ))
+                session.add(Task(
+                    contractor_id="c-1", quote_id="q-0", title="Existing", status="pending",
+                    trigger_type="quote_not_viewed_3d",
+                ))
+                await session.commit()
+
+            counter = self._count_selects(session_factory)
+            with patch.dict(sys.modules, {"backend.services.database": MagicMock(async_session_factory=session_factory)}):
+                await check_quote_followups()
+                await check_quote_followups()  # idempotent: nothing new the second time
+            selects = counter["selects"]
+
+            async with session_factory() as session:
+                tasks = (await session.execute(select(Task).where(Task.auto_generated == True))).scalars().all()
+            return tasks, selects
+
+        tasks, selects = asyncio.run(run())
+
+        assert sorted(task.quote_id for task in tasks) == ["q-1", "q-2", "q-3", "q-viewed"]
+        assert all(task.id and task.status == "pending" for task in tasks)
+        assert selects == 4  # two anti-join queries per run, independent of quote count
+
+    def test_due_followups_query_count_is_flat(self, make_session_factory):
+        """Due sequences load with quote and contractor in one query, any volume."""
+        from datetime import datetime, timedelta
+        from unittest.mock import AsyncMock, patch
+        from sqlalchemy import select
+        from backend.config import settings
+        from backend.models.database import Contractor, Quote, FollowUpSequence, FollowUpEvent
+        from backend.services.follow_up import FollowUpService
+
+        async def run(count):
+            factory = make_session_factory(f"followups-{count}.db")
+            now = datetime.utcnow()
+            async with factory() as session:
+                for i in range(count):
+                    session.add(Contractor(id=f"c-{i}", business_name=f"Co {i}", email=f"c{i}@example.com"))
+                    session.add(Quote(
+                        id=f"q-{i}", contractor_id=f"c-{i}", transcription="", status="sent",
+                        customer_name="Pat", customer_email=f"pat{i}@example.com", view_count=0,
+                    ))
+                    session.add(FollowUpSequence(
+                        quote_id=f"q-{i}", contractor_id=f"c-{i}", status="active",
+                        current_step=0, next_follow_up_at=now - timedelta(minutes=1),
+                    ))
+                await session.commit()
+
+            send = AsyncMock()
+            counter = self._count_selects(factory)
+            async with factory() as session:
+                with patch("backend.services.follow_up.EmailService.send_email", send), \
+                        patch("backend.services.follow_up.analytics_service"), \
+                        patch.object(settings, "scheduler_email_min_interval_seconds", 0):
+                    sent = await FollowUpService.process_due_followups(session)
+            selects = counter["selects"]
+
+            async with factory() as session:
+                events = (await session.execute(select(FollowUpEvent))).scalars().all()
+            return sent, send.await_count, len(events), selects
+
+        small = asyncio.run(run(3))
+        large = asyncio.run(run(12))
+
+        assert small[:3] == (3, 3, 3)
+        assert large[:3] == (12, 12, 12)
+        assert small[3] == large[3] == 1
+
+
+# =============================================================================
+# Sharded Scheduler Tests
+# =============================================================================
+
+class TestShardedScheduler:
+    """Tests for partitioned, checkpointed scheduler runs."""
+
+    def test_shards_partition_contractor_ids(self):
+        """Every id lands in exactly one shard; lock ids are per shard and stable."""
+        import uuid
+        from backend.services.advisory_locks import _job_name_to_lock_id
+        from backend.services.job_shards import Shard
+
+        shards = [Shard(index=i, count=16) for i in range(16)]
+        ids = [str(uuid.uuid4()) for _ in range(2000)] + ["c-1", "", "ZZZ", "ffff"]
+        for contractor_id in ids:
+            assert sum(shard.contains(contractor_id) for shard in shards) == 1
+        sizes = [sum(shard.contains(i) for i in ids[:2000]) for shard in shards]
+        assert min(sizes) > 60  # ~125 each
+
+        lock_ids = {_job_name_to_lock_id("task_reminders", shard.index) for shard in shards}
+        assert len(lock_ids) == 16
+        assert _job_name_to_lock_id("task_reminders") not in lock_ids
+        # Same value in every worker process (str hash() is randomized per process)
+        assert _job_name_to_lock_id("task_reminders", 3) == 1094433715
+
+    def test_interrupted_run_resumes_unfinished_shards(self, session_factory):
+        """Done shards are skipped; a resume run only redoes the failed shard."""
+        from backend.services.job_shards import run_sharded
+
+        calls = []
+
+        async def job(shard):
+            calls.append(shard.index)
+            if shard.index == 2 and calls.count(2) == 1:
+                raise RuntimeError("worker died")
+
+        async def run():
+            first = await run_sharded(session_factory, "test_job", job, 3600, shard_count=4)
+            resumed = await run_sharded(session_factory, "test_job", job, 3600, shard_count=4, resume_only=True)
+            nothing_left = await run_sharded(session_factory, "test_job", job, 3600, shard_count=4, resume_only=True)
+            rerun = await run_sharded(session_factory, "test_job", job, 3600, shard_count=4)
+
+            from backend.services.job_shards import get_shard_progress
+            async with session_factory() as session:
+                progress = await get_shard_progress(session)
+            return first, resumed, nothing_left, rerun, progress
+
+        first, resumed, nothing_left, rerun, progress = asyncio.run(run())
+
+        assert (first, resumed, nothing_left, rerun) == (3, 1, 0, 0)
+        assert sorted(calls) == [0, 1, 2, 2, 3]
+        assert progress["test_job"]["done"] == 4
+
+    def test_sharded_followups_cover_every_contractor_once(self, session_factory):
+        """Running each shard of quote_followups creates each task exactly once."""
+        import uuid
+        from datetime import datetime, timedelta
+        from unittest.mock import MagicMock, patch
+        from sqlalchemy import select
+        from backend.models.database import Quote, Task
+        from backend.services.job_shards import Shard
+        from backend.services.scheduler import check_quote_followups
+
+        async def run():
+            async with session_factory() as session:
+                for i in range(40):
+                    session.add(Quote(
+                        contractor_id=str(uuid.uuid4()), transcription="", customer_name="Pat",
+                        status="sent", sent_at=datetime.utcnow() - timedelta(days=4), view_count=0,
+                    ))
+                await session.commit()
+
+            with patch.dict(sys.modules, {"backend.services.database": MagicMock(async_session_factory=session_factory)}):
+                for index in range(8):
+                    await check_quote_followups(shard=Shard(index=index, count=8))
+
+            async with session_factory() as session:
+                task_quotes = (await session.execute(select(Task.quote_id))).scalars().all()
+            return task_quotes
+
+        task_quotes = asyncio.run(run())
+        assert len(task_quotes) == len(set(task_quotes)) == 40
+
+    def test_failed_shard_is_checkpointed_for_retry(self, session_factory):
+        """A job failing under a shard raises to run_shard; unsharded runs still swallow errors."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from backend.services.job_shards import get_shard_progress, run_sharded
+        from backend.services.scheduler import check_invoice_reminders
+
+        async def run():
+            failing = AsyncMock(side_effect=RuntimeError("smtp down"))
+            with patch.dict(sys.modules, {"backend.services.database": MagicMock(async_session_factory=session_factory)}), \
+                    patch("backend.services.invoice_automation.InvoiceAutomationService.check_payment_reminders", failing):
+                unsharded = await check_invoice_reminders()
+                completed = await run_sharded(session_factory, "invoice_reminders", check_invoice_reminders, 3600, shard_count=2)
+
+            async with session_factory() as session:
+                progress = await get_shard_progress(session)
+            return unsharded, completed, progress
+
+        unsharded, completed, progress = asyncio.run(run())
+
+        assert unsharded is None
+        assert completed == 0
+        assert progress["invoice_reminders"]["done"] == 0
+        assert progress["invoice_reminders"]["errors"] == 2
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
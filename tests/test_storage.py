@@ -0,0 +1,283 @@
+"""
+Tests for the async storage service and content-addressed logo storage.
+"""
+
+import asyncio
+import pytest
+import sys
+
+
+# =============================================================================
+# Storage Tests
+# =============================================================================
+
+class TestStorageService:
+    """Tests for the async storage service."""
+
+    @staticmethod
+    def _import_storage():
+        from unittest.mock import MagicMock, patch
+
+        with patch.dict(sys.modules, {"backend.services.database": MagicMock()}):
+            sys.modules.pop("backend.services.storage", None)
+            import backend.services.storage as storage
+        return storage
+
+    def test_local_stream_roundtrip(self, tmp_path):
+        """The local stand-in streams uploads and downloads in chunks."""
+        storage = self._import_storage()
+        service = storage.StorageService(local_base=tmp_path, use_s3=False)
+        data = bytes(range(256)) * 1000
+
+        async def chunks():
+            for i in range(0, len(data), 10_000):
+                yield data[i:i + 10_000]
+
+        async def run():
+            path = await service.upload_stream("uploads/memo.webm", chunks(), content_type="audio/webm")
+            stream = await service.download_stream("uploads/memo.webm", chunk_size=4096)
+            received = [chunk async for chunk in stream]
+            missing = await service.download_stream("uploads/nope.webm")
+            deleted = await service.delete(path)
+            return received, missing, deleted
+
+        received, missing, deleted = asyncio.run(run())
+        assert b"".join(received) == data
+        assert max(len(chunk) for chunk in received) == 4096
+        assert missing is None
+        assert deleted and not (tmp_path / "uploads" / "memo.webm").exists()
+
+    def test_s3_stream_upload_is_multipart_off_loop(self, tmp_path):
+        """Streamed uploads become 5 MB+ parts sent from the S3 thread pool."""
+        import threading
+        from unittest.mock import MagicMock, patch
+        from backend.config import settings
+
+        storage = self._import_storage()
+        service = storage.StorageService(local_base=tmp_path)
+        threads = set()
+        parts = []
+
+        s3 = MagicMock()
+        s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+
+        def upload_part(**kwargs):
+            threads.add(threading.current_thread().name)
+            parts.append(len(kwargs["Body"]))
+            return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+        s3.upload_part.side_effect = upload_part
+        mb = 1024 * 1024
+
+        async def chunks():
+            for _ in range(11):
+                yield b"x" * mb
+
+        async def get_client():
+            return s3
+
+        async def run():
+            with patch.object(storage, "_get_s3_client", get_client), \
+                    patch.object(settings, "storage_multipart_chunk_bytes", mb):
+                return await service.upload_stream("uploads/long.m4a", chunks())
+
+        url = asyncio.run(run())
+
+        assert url.endswith("/uploads/long.m4a")
+        assert parts == [5 * mb, 5 * mb, mb]  # parts are at least S3's 5 MB minimum
+        assert all(name.startswith("s3") for name in threads)
+        completed = s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert [part["PartNumber"] for part in completed] == [1, 2, 3]
+        s3.abort_multipart_upload.assert_not_called()
+
+
+# =============================================================================
+# Logo Storage Tests
+# =============================================================================
+
+class TestLogoStorage:
+    """Tests for content-addressed logo storage and renditions."""
+
+    @staticmethod
+    def _import_logo_storage():
+        from unittest.mock import MagicMock, patch
+
+        with patch.dict(sys.modules, {"backend.services.database": MagicMock()}):
+            for name in ("backend.services.storage", "backend.services.logo_storage"):
+                sys.modules.pop(name, None)
+            import backend.services.logo_storage as logo_storage
+        return logo_storage
+
+    @staticmethod
+    def _png(width, height):
+        import io
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def test_renditions_rendered_once_and_served_by_hash(self, tmp_path):
+        """Upload renders pre-scaled PNGs once; PDFs get them without decoding."""
+        from unittest.mock import patch
+        from backend.services.pdf_render_pool import _render_in_worker
+
+        logo_storage = self._import_logo_storage()
+        storage = logo_storage.StorageService(local_base=tmp_path, use_s3=False)
+        service = logo_storage.LogoStorageService(storage=storage)
+        original = self._png(1000, 200)
+        renders = []
+        render = logo_storage.render_renditions
+
+        def counting_render(data):
+            renders.append(len(data))
+            return render(data)
+
+        async def run():
+            with patch.object(logo_storage, "render_renditions", counting_render):
+                digest = await service.store(original, "png")
+                assert await service.store(original, "png") == digest
+            # A fresh worker (empty memory tier) reads the stored rendition
+            cold = logo_storage.LogoStorageService(storage=storage)
+            return digest, await cold.pdf_logo(digest), await service.get_original_data_uri(digest)
+
+        digest, pdf_logo, data_uri = asyncio.run(run())
+
+        assert len(renders) == 1
+        assert digest == logo_storage.logo_hash(original)
+        assert (tmp_path / "logos" / digest / "email.png").exists()
+        assert logo_storage.png_size(pdf_logo["logo_png"]) == (240, 48)
+        assert pdf_logo["logo_size"] == (120, 24)
+        assert data_uri.startswith("data:image/png;base64,")
+        # Small logos aren't upscaled in storage but still fill the header box
+        assert logo_storage.fit_pdf_logo(60, 30) == (96, 48)
+        assert logo_storage.fit_pdf_logo(40, 10) == (120, 30)
+
+        pdf_bytes = _render_in_worker({
+            "quote_data": {"id": "q-1", "customer_name": "Test", "line_items": [], "subtotal": 0},
+            "contractor": {"business_name": "Test Co", **pdf_logo},
+            "terms": {},
+        })
+        assert pdf_bytes.startswith(b"%PDF")
+
+    def test_logo_already_in_s3_is_not_rendered_again(self, tmp_path):
+        """With S3 configured, a stored logo is found by key and nothing is re-uploaded."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        logo_storage = self._import_logo_storage()
+        s3 = MagicMock()
+        s3.head_object.return_value = {"ContentLength": 1}
+        storage = logo_storage.StorageService(local_base=tmp_path)
+        storage.upload = AsyncMock()
+        service = logo_storage.LogoStorageService(storage=storage)
+        original = self._png(100, 50)
+        render = MagicMock()
+
+        async def run():
+            with patch.object(storage, "_s3", AsyncMock(return_value=s3)), \
+                    patch.object(logo_storage, "render_renditions", render):
+                return await service.store(original, "png")
+
+        digest = asyncio.run(run())
+
+        assert digest == logo_storage.logo_hash(original)
+        key = s3.head_object.call_args.kwargs["Key"]
+        assert key.endswith(f"logos/{digest}/pdf.png")
+        render.assert_not_called()
+        storage.upload.assert_not_called()
+
+    def test_rejects_undecodable_image(self, tmp_path):
+        """Bytes that only look like a PNG are refused before anything is stored."""
+        logo_storage = self._import_logo_storage()
+        storage = logo_storage.StorageService(local_base=tmp_path, use_s3=False)
+        service = logo_storage.LogoStorageService(storage=storage)
+
+        with pytest.raises(logo_storage.InvalidLogoError):
+            asyncio.run(service.store(b"\x89PNG\r\n\x1a\n" + b"garbage" * 10, "png"))
+        assert not any((tmp_path / "logos").iterdir())
+
+    def test_migrates_legacy_base64_logos(self, tmp_path, session_factory):
+        """Rows holding base64 logos are moved to storage and cleared."""
+        import base64
+        from sqlalchemy import select
+        from backend.models.database import Contractor
+
+        logo_storage = self._import_logo_storage()
+        storage = logo_storage.StorageService(local_base=tmp_path, use_s3=False)
+        service = logo_storage.LogoStorageService(storage=storage)
+        original = self._png(60, 60)
+
+        async def run():
+            async with session_factory() as session:
+                session.add_all([
+                    Contractor(
+                        id="c-1", business_name="Legacy Co", email="legacy@example.com",
+                        logo_data="data:image/png;base64," + base64.b64encode(original).decode(),
+                    ),
+                    Contractor(id="c-2", business_name="Plain Co", email="plain@example.com"),
+                ])
+                await session.commit()
+
+            migrated = await service.migrate_legacy_logos(session_factory)
+            again = await service.migrate_legacy_logos(session_factory)
+
+            async with session_factory() as session:
+                rows = (await session.execute(
+                    select(Contractor.id, Contractor.logo_hash, Contractor.logo_data).order_by(Contractor.id)
+                )).all()
+            return migrated, again, rows
+
+        migrated, again, rows = asyncio.run(run())
+
+        assert (migrated, again) == (1, 0)
+        assert rows[0] == ("c-1", logo_storage.logo_hash(original), None)
+        assert rows[1] == ("c-2", None, None)
+        assert (tmp_path / "logos" / rows[0][1] / "original.png").exists()
+
+    def test_legacy_logo_is_migrated_on_read(self, tmp_path, session_factory):
+        """A contractor the backfill hasn't reached still gets their logo, moved on first read."""
+        import base64
+        from sqlalchemy import select
+        from backend.models.database import Contractor
+
+        logo_storage = self._import_logo_storage()
+        storage = logo_storage.StorageService(local_base=tmp_path, use_s3=False)
+        service = logo_storage.LogoStorageService(storage=storage)
+        original = self._png(60, 60)
+
+        async def run():
+            async with session_factory() as session:
+                session.add_all([
+                    Contractor(
+                        id="c-1", business_name="Legacy Co", email="legacy@example.com",
+                        logo_data=base64.b64encode(original).decode(),
+                    ),
+                    Contractor(id="c-2", business_name="Plain Co", email="plain@example.com"),
+                ])
+                await session.commit()
+
+            first = await service.migrate_contractor_logo(session_factory, "c-1")
+            second = await service.migrate_contractor_logo(session_factory, "c-1")
+            plain = await service.migrate_contractor_logo(session_factory, "c-2")
+            pdf_logo = await service.pdf_logo(first)
+
+            async with session_factory() as session:
+                row = (await session.execute(
+                    select(Contractor.logo_hash, Contractor.logo_data).where(Contractor.id == "c-1")
+                )).one()
+            return first, second, plain, pdf_logo, row
+
+        first, second, plain, pdf_logo, row = asyncio.run(run())
+
+        assert first == second == logo_storage.logo_hash(original)
+        assert plain is None
+        assert pdf_logo["logo_size"] == (48, 48)
+        assert tuple(row) == (first, None)
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,216 @@
+"""
+Tests for streaming audio uploads to the transcription provider.
+"""
+
+import asyncio
+import pytest
+import sys
+
+
+# =============================================================================
+# Streaming Transcription Tests
+# =============================================================================
+
+class TestStreamingTranscription:
+    """Tests for streaming audio uploads to the transcription provider."""
+
+    @staticmethod
+    def _import_transcription():
+        from unittest.mock import MagicMock, patch
+
+        with patch.dict(sys.modules, {"backend.services.database": MagicMock()}):
+            sys.modules.pop("backend.services.transcription", None)
+            import backend.services.transcription as transcription
+        return transcription
+
+    def test_upload_is_streamed_as_multipart(self):
+        """Chunks are framed into one multipart request over the shared client."""
+        import io
+        import httpx
+        from unittest.mock import patch
+
+        transcription = self._import_transcription()
+        audio = b"\x00\x01" * 5000
+        seen = {}
+
+        async def handler(request: httpx.Request):
+            body = await request.aread()
+            seen["content_type"] = request.headers["content-type"]
+            seen["content_length"] = int(request.headers["content-length"])
+            seen["body"] = body
+            return httpx.Response(200, json={"text": "build a deck", "duration": 4.2})
+
+        class Upload:
+            def __init__(self, data):
+                self._file = io.BytesIO(data)
+
+            async def read(self, size=-1):
+                return self._file.read(size)
+
+        async def run():
+            service = transcription.TranscriptionService()
+            service.provider = "openai"
+            service.openai_key = "sk-test"
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(transcription, "_http_client", client):
+                result = await service.transcribe_stream(
+                    transcription.iter_audio_chunks(Upload(audio), chunk_size=1024),
+                    filename="memo.webm",
+                    size=len(audio),
+                )
+            await client.aclose()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result["text"] == "build a deck"
+        boundary = seen["content_type"].split("boundary=")[1]
+        assert seen["content_type"].startswith("multipart/form-data")
+        assert seen["content_length"] == len(seen["body"])
+        assert f'--{boundary}\r\nContent-Disposition: form-data; name="model"\r\n\r\nwhisper-1\r\n'.encode() in seen["body"]
+        assert b'filename="memo.webm"\r\nContent-Type: audio/webm\r\n\r\n' + audio + f"\r\n--{boundary}--\r\n".encode() in seen["body"]
+
+    def test_file_is_read_in_chunks_off_the_loop(self, tmp_path):
+        """transcribe() streams the file through aiofiles with its size known."""
+        from unittest.mock import patch
+
+        transcription = self._import_transcription()
+        path = tmp_path / "memo.wav"
+        path.write_bytes(b"a" * 2500)
+        seen = {}
+
+        async def fake_stream(chunks, filename, size, language):
+            seen["chunks"] = [chunk async for chunk in chunks]
+            seen["size"] = size
+            return {"text": "ok"}
+
+        async def run():
+            service = transcription.TranscriptionService()
+            with patch.object(service, "transcribe_stream", fake_stream), \
+                    patch.object(transcription.settings, "transcription_chunk_bytes", 1000):
+                result = await service.transcribe(str(path))
+                with pytest.raises(FileNotFoundError):
+                    await service.transcribe(str(tmp_path / "missing.wav"))
+            return result
+
+        assert asyncio.run(run()) == {"text": "ok"}
+        assert [len(chunk) for chunk in seen["chunks"]] == [1000, 1000, 500]
+        assert seen["size"] == 2500
+
+    def test_oversize_audio_is_rejected(self):
+        """Audio over the limit fails fast when the size is known, or mid-stream when not."""
+        transcription = self._import_transcription()
+        service = transcription.TranscriptionService()
+        service.max_upload_bytes = 10
+
+        async def chunks():
+            yield b"x" * 8
+            yield b"x" * 8
+
+        async def run():
+            with pytest.raises(transcription.AudioTooLargeError):
+                await service.transcribe_stream(chunks(), size=16)
+            with pytest.raises(transcription.AudioTooLargeError):
+                async for _ in transcription._limit_size(chunks(), 10):
+                    pass
+
+        asyncio.run(run())
+
+    def test_long_audio_is_split_and_stitched(self):
+        """Long recordings are cut at silences, run concurrently and stitched in order."""
+        import io
+        from unittest.mock import patch
+        import warnings
+        from backend.config import settings
+
+        transcription = self._import_transcription()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # no ffmpeg needed for WAV
+            from pydub import AudioSegment
+            from pydub.generators import Sine
+
+        # Five 3s tones separated by 0.6s pauses (~17.4s)
+        tone = Sine(440).to_audio_segment(duration=3000, volume=-10)
+        pause = AudioSegment.silent(duration=600)
+        audio = tone
+        for _ in range(4):
+            audio = audio + pause + tone
+        buffer = io.BytesIO()
+        audio.export(buffer, format="wav")
+
+        active = 0
+        peak = 0
+
+        async def fake_single(chunks, filename, size, language):
+            # One 1s Whisper segment per second of the chunk, timed from its start
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.2)
+            active -= 1
+            segment = AudioSegment.from_file(io.BytesIO(b"".join([c async for c in chunks])), format="wav")
+            seconds = int(len(segment) / 1000)
+            return {
+                "text": " ".join(f"w{i}" for i in range(seconds)),
+                "segments": [{"start": i, "end": i + 1, "text": f"w{i}"} for i in range(seconds)],
+            }
+
+        async def run():
+            service = transcription.TranscriptionService()
+            service._segment_semaphore = asyncio.Semaphore(2)
+            with patch.object(settings, "transcription_segment_seconds", 4.0), \
+                    patch.object(settings, "transcription_segment_overlap_seconds", 0.5), \
+                    patch.object(service, "_transcribe_single", fake_single):
+                return await service.transcribe_long(buffer.getvalue(), "memo.wav")
+
+        chunks = transcription.plan_audio_chunks(audio, segment_ms=4000, overlap_ms=500)
+        result = asyncio.run(run())
+
+        # Every cut but the end lands inside a pause
+        pauses = [(3000 + i * 3600, 3600 + i * 3600) for i in range(4)]
+        for chunk in chunks[:-1]:
+            assert any(start <= chunk.own_end <= end for start, end in pauses)
+        assert len(chunks) >= 3
+        assert peak == 2
+
+        starts = [segment["start"] for segment in result["segments"]]
+        assert starts == sorted(starts)
+        # Overlapping audio is kept once: ~one segment per second of recording
+        assert abs(len(starts) - len(audio) / 1000) <= len(chunks)
+        assert result["duration"] == len(audio) / 1000
+        assert [segment["id"] for segment in result["segments"]] == list(range(len(starts)))
+
+    def test_undecodable_long_audio_falls_back_to_single_request(self):
+        """Audio that can't be decoded for splitting is sent whole if the provider accepts it."""
+        from unittest.mock import patch
+
+        transcription = self._import_transcription()
+        sent = []
+
+        async def fake_single(chunks, filename, size, language):
+            sent.append((filename, size))
+            return {"text": "site walk"}
+
+        def no_ffmpeg(audio_bytes, filename):
+            raise FileNotFoundError("ffmpeg")
+
+        async def run():
+            service = transcription.TranscriptionService()
+            with patch.object(transcription, "_decode_audio", no_ffmpeg), \
+                    patch.object(service, "_transcribe_single", fake_single):
+                result = await service.transcribe_long(b"x" * 1000, "walk.m4a")
+                with patch.object(transcription, "PROVIDER_MAX_UPLOAD_BYTES", 500):
+                    with pytest.raises(FileNotFoundError):
+                        await service.transcribe_long(b"x" * 1000, "walk.m4a")
+            return result
+
+        assert asyncio.run(run()) == {"text": "site walk"}
+        assert sent == [("walk.m4a", 1000)]
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,95 @@
+"""
+Tests for shared quote view tracking.
+"""
+
+import asyncio
+import pytest
+import sys
+
+
+# =============================================================================
+# Shared Quote View Tracking Tests
+# =============================================================================
+
+class TestSharedQuoteViewTracking:
+    """Tests for first-view claiming and batched repeat views."""
+
+    @staticmethod
+    async def _add_sent_quotes(session_factory, quote_ids):
+        from backend.models.database import Quote
+
+        async with session_factory() as session:
+            for quote_id in quote_ids:
+                session.add(Quote(
+                    id=quote_id, contractor_id="c-1", transcription="", status="sent", view_count=0,
+                ))
+            await session.commit()
+
+    def test_first_view_fires_once_under_concurrency(self, session_factory):
+        """Concurrent first hits: one claims the first view, the rest are buffered."""
+        from unittest.mock import MagicMock, patch
+        from backend.models.database import Quote
+        from backend.services import view_tracking
+
+        async def run():
+            await self._add_sent_quotes(session_factory, ["q-1"])
+            buffer = view_tracking.ViewBuffer(session_factory)
+            with patch.dict(sys.modules, {"backend.services.database": MagicMock(async_session_factory=session_factory)}), \
+                    patch.object(view_tracking, "get_view_buffer", return_value=buffer):
+                firsts = await asyncio.gather(*(view_tracking.track_view("q-1", 0) for _ in range(10)))
+                await buffer.flush()
+            async with session_factory() as session:
+                quote = await session.get(Quote, "q-1")
+            return firsts, quote
+
+        firsts, quote = asyncio.run(run())
+
+        assert firsts.count(True) == 1
+        assert quote.view_count == 10
+        assert quote.status == "viewed"
+        assert quote.first_viewed_at is not None
+
+    def test_repeat_views_flush_as_one_batch(self, session_factory):
+        """Many repeat views become one UPDATE statement per flush."""
+        from datetime import datetime, timedelta
+        from sqlalchemy import event
+        from backend.models.database import Quote
+        from backend.services.view_tracking import ViewBuffer
+
+        async def run():
+            await self._add_sent_quotes(session_factory, ["q-1", "q-2"])
+            buffer = ViewBuffer(session_factory)
+            start = datetime(2026, 1, 1, 12, 0)
+            for i in range(30):
+                buffer.record("q-1", start + timedelta(seconds=i))
+            for i in range(5):
+                buffer.record("q-2", start - timedelta(seconds=i))
+
+            statements = []
+            event.listen(
+                session_factory.kw["bind"].sync_engine, "before_cursor_execute",
+                lambda conn, cursor, statement, *args: statements.append(statement),
+            )
+            updated = await buffer.flush()
+            nothing = await buffer.flush()
+
+            async with session_factory() as session:
+                quotes = {q: await session.get(Quote, q) for q in ("q-1", "q-2")}
+            return updated, nothing, statements, quotes, start
+
+        updated, nothing, statements, quotes, start = asyncio.run(run())
+
+        assert (updated, nothing) == (2, 0)
+        assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+        assert quotes["q-1"].view_count == 30
+        assert quotes["q-1"].last_viewed_at == start + timedelta(seconds=29)
+        assert quotes["q-2"].view_count == 5
+        assert quotes["q-1"].status == "sent"  # Repeat views never change status
+
+
+# =============================================================================
+# Run Tests
+# =============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])